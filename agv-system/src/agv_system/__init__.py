@@ -19,17 +19,31 @@ __version__ = "5.0.0"
 __author__ = "Antonio"
 __email__ = "antonio@iabank.com"
 
-# Imports principais para facilitar uso
-from .validator_generator import ModularValidatorGenerator
-from .core.logging_config import get_logger
-from .core.cache_system import get_cache
-from .core.metrics import get_metrics_collector
-from .core.exceptions import (
-    AGVException,
-    BlueprintException,
-    ValidationException,
-    GeneratorException
-)
+import importlib
+
+# Imports principais para facilitar uso, resolvidos sob demanda: validadores gerados
+# importam apenas agv_system.validation_runtime e não devem carregar geradores,
+# logging ou métricas (que criam diretórios de saída na raiz do projeto validado)
+_LAZY_EXPORTS = {
+    "ModularValidatorGenerator": ".validator_generator",
+    "get_logger": ".core.logging_config",
+    "get_cache": ".core.cache_system",
+    "get_metrics_collector": ".core.metrics",
+    "AGVException": ".core.exceptions",
+    "BlueprintException": ".core.exceptions",
+    "ValidationException": ".core.exceptions",
+    "GeneratorException": ".core.exceptions",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
 
 # Configurar logging do pacote
 import logging
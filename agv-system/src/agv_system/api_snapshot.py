@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+API Snapshot AGV - Registro da superfície pública de um projeto em uma referência git.
+
+O snapshot guarda módulos, classes (com métodos públicos) e assinaturas de funções
+extraídos do ast em um arquivo JSON compacto indexado por módulo, com um índice de
+símbolos (nome -> módulos) para localizar componentes sem varrer o projeto. As regras
+de evolução (compatibilidade e refatoração segura) comparam a API atual com o snapshot
+por diff estrutural em vez de buscar `def`/`class` com regex em todos os arquivos.
+
+Uso:
+
+    agv-api-snapshot record --ref v1.2.0            # grava agv-outputs/api_snapshot.json
+    agv-api-snapshot diff                           # quebras da árvore atual vs snapshot
+    agv-api-snapshot diff --ref HEAD~3 --snapshot api.json
+
+Com --ref os arquivos são lidos do objeto git (git ls-tree + um único git cat-file
+--batch), sem checkout e sem tocar na árvore de trabalho.
+"""
+
+import os
+import sys
+import json
+import argparse
+import subprocess
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, List, Any, Optional, Tuple, Union
+
+from .core.logging_config import get_logger
+from .core.exceptions import FileReadError
+from .validation_runtime import (
+    API_SNAPSHOT_FORMAT, API_SNAPSHOT_VERSION, api_surface, diff_public_api, is_api_module, load_api_snapshot,
+)
+
+
+logger = get_logger("api_snapshot")
+
+DEFAULT_SNAPSHOT_PATH = "agv-outputs/api_snapshot.json"
+
+
+def _git(project_root: Path, *args: str, input_data: Optional[bytes] = None) -> bytes:
+    """Executa um comando git na raiz do projeto e retorna a saída (FileReadError em caso de falha)."""
+    try:
+        result = subprocess.run(['git', '-C', str(project_root), *args], input=input_data,
+                                capture_output=True, check=True)
+    except (OSError, subprocess.CalledProcessError) as e:
+        stderr = (getattr(e, 'stderr', b'') or b'').decode(errors='ignore').strip()
+        raise FileReadError(str(project_root), f"git {args[0]} falhou: {stderr or e}") from e
+    return result.stdout
+
+
+def _worktree_sources(project_root: Path) -> Iterator[Tuple[str, str]]:
+    """(caminho relativo, código) dos arquivos .py da API na árvore de trabalho."""
+    for current, dirnames, filenames in os.walk(project_root):
+        dirnames[:] = sorted(d for d in dirnames if not d.startswith('.'))
+        for filename in sorted(filenames):
+            if not filename.endswith('.py'):
+                continue
+            relative = (Path(current) / filename).relative_to(project_root)
+            if is_api_module(relative):
+                yield relative.as_posix(), (Path(current) / filename).read_text(encoding='utf-8', errors='ignore')
+
+
+def _ref_sources(project_root: Path, commit: str) -> Iterator[Tuple[str, str]]:
+    """(caminho relativo, código) dos arquivos .py da API no commit, lidos em lote do banco de objetos."""
+    listing = _git(project_root, 'ls-tree', '-r', '-z', '--name-only', commit, '--', '.')
+    paths = [path for path in listing.decode('utf-8').split('\0')
+             if path.endswith('.py') and is_api_module(path)]
+    if not paths:
+        return
+    requests = ''.join(f"{commit}:./{path}\n" for path in paths).encode('utf-8')
+    output = _git(project_root, 'cat-file', '--batch', input_data=requests)
+
+    offset = 0
+    for path in paths:
+        header_end = output.index(b'\n', offset)
+        header = output[offset:header_end].split()
+        offset = header_end + 1
+        if len(header) < 3 or header[1] != b'blob':
+            continue
+        size = int(header[2])
+        yield path, output[offset:offset + size].decode('utf-8', errors='ignore')
+        offset += size + 1
+
+
+def build_api_snapshot(project_root: Union[str, Path] = '.', ref: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Snapshot da API pública do projeto: na árvore de trabalho ou, com ref, no commit
+    indicado (tag, branch ou hash).
+    """
+    project_root = Path(project_root).resolve()
+    commit = None
+    if ref:
+        commit = _git(project_root, 'rev-parse', '--verify', f"{ref}^{{commit}}").decode().strip()
+        modules = api_surface(_ref_sources(project_root, commit))
+    else:
+        modules = api_surface(_worktree_sources(project_root))
+
+    symbols: Dict[str, List[str]] = {}
+    for module in sorted(modules):
+        for name in (*modules[module]['classes'], *modules[module]['functions']):
+            symbols.setdefault(name, []).append(module)
+
+    logger.info(f"API snapshot of {project_root} at {ref or 'worktree'}: "
+                f"{len(modules)} modules, {len(symbols)} symbols")
+    return {
+        'format': API_SNAPSHOT_FORMAT,
+        'version': API_SNAPSHOT_VERSION,
+        'ref': ref,
+        'commit': commit,
+        'created_at': datetime.now().isoformat(timespec='seconds'),
+        'modules': modules,
+        'symbols': symbols,
+    }
+
+
+def save_api_snapshot(snapshot: Dict[str, Any], output_path: Union[str, Path] = DEFAULT_SNAPSHOT_PATH) -> Path:
+    """Grava o snapshot em JSON compacto (chaves ordenadas, sem espaços) e retorna o caminho."""
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_text(json.dumps(snapshot, sort_keys=True, separators=(',', ':'), ensure_ascii=False),
+                           encoding='utf-8')
+    return output_path
+
+
+def diff_api_snapshot(snapshot: Dict[str, Any], project_root: Union[str, Path] = '.',
+                      ref: Optional[str] = None) -> List[Dict[str, str]]:
+    """Quebras de compatibilidade da API do projeto (árvore de trabalho ou ref) em relação ao snapshot."""
+    current = build_api_snapshot(project_root, ref)
+    return diff_public_api(snapshot['modules'], current['modules'])
+
+
+def main():
+    """CLI de snapshots da API pública."""
+    parser = argparse.ArgumentParser(
+        description="AGV API Snapshot - Superfície pública do projeto para validações de evolução"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    record_parser = subparsers.add_parser("record", help="Grava o snapshot da API pública")
+    record_parser.add_argument("--ref", help="Referência git (tag, branch ou commit); padrão: árvore de trabalho")
+    record_parser.add_argument("--project-root", default=".", help="Raiz do projeto (padrão: diretório atual)")
+    record_parser.add_argument("--output", default=DEFAULT_SNAPSHOT_PATH,
+                               help=f"Arquivo do snapshot (padrão: {DEFAULT_SNAPSHOT_PATH})")
+
+    diff_parser = subparsers.add_parser("diff", help="Lista quebras de compatibilidade em relação ao snapshot")
+    diff_parser.add_argument("--ref", help="Referência git a comparar; padrão: árvore de trabalho")
+    diff_parser.add_argument("--project-root", default=".", help="Raiz do projeto (padrão: diretório atual)")
+    diff_parser.add_argument("--snapshot", default=DEFAULT_SNAPSHOT_PATH,
+                             help=f"Arquivo do snapshot (padrão: {DEFAULT_SNAPSHOT_PATH})")
+
+    args = parser.parse_args()
+
+    if args.command == "record":
+        try:
+            snapshot = build_api_snapshot(args.project_root, args.ref)
+        except FileReadError as e:
+            print(f"[ERRO] {e}")
+            sys.exit(1)
+        saved = save_api_snapshot(snapshot, args.output)
+        print(f"Snapshot da API ({len(snapshot['modules'])} módulos, {len(snapshot['symbols'])} símbolos) "
+              f"salvo em: {saved}")
+        sys.exit(0)
+
+    snapshot = load_api_snapshot(args.snapshot)
+    if snapshot is None:
+        print(f"[ERRO] Snapshot ausente ou inválido: {args.snapshot}")
+        sys.exit(1)
+    try:
+        changes = diff_api_snapshot(snapshot, args.project_root, args.ref)
+    except FileReadError as e:
+        print(f"[ERRO] {e}")
+        sys.exit(1)
+
+    for change in changes:
+        symbol = change['module'] if change['kind'] == 'module_removed' else f"{change['module']}:{change['symbol']}"
+        detail = f" - {change['detail']}" if change['detail'] else ""
+        print(f"[{change['kind']}] {symbol} ({change['path']}){detail}")
+    print(f"{len(changes)} quebras de compatibilidade em relação a {snapshot.get('ref') or 'snapshot'}")
+    sys.exit(1 if changes else 0)
+
+
+if __name__ == "__main__":
+    main()
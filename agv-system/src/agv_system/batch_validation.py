@@ -0,0 +1,527 @@
+#!/usr/bin/env python3
+"""
+Batch Validation AGV v5.0 - Validação de muitos projetos em paralelo.
+
+Recebe um manifesto com entradas (blueprint, raiz do projeto, tipo de validação),
+faz o parsing de cada Blueprint distinto uma única vez, executa as validações em um
+pool de processos limitado e grava um único arquivo consolidado de resultados.
+As especificações chegam aos workers pela memória compartilhada (specs_codec), uma
+cópia por Blueprint em vez de um pickle por entrada.
+
+Formato do manifesto (JSON ou YAML):
+
+    max_workers: 8            # opcional
+    entries:
+      - blueprint: blueprints/iabank.md
+        project_root: repos/iabank
+        type: scaffold
+      - blueprint: blueprints/iabank.md
+        project_root: repos/iabank
+        type: target
+        target_number: 3
+      - blueprint: blueprints/iabank.md
+        project_root: repos/iabank
+        type: targets             # um validador para vários alvos, com score por alvo
+        targets: [1, 2, 3]        # opcional (padrão: Alvos 1-N)
+      - blueprint: blueprints/outro.md
+        project_root: repos/outro
+        type: integration
+        integration_phase: T1
+
+Caminhos relativos são resolvidos a partir do diretório do manifesto.
+
+O subcomando `parse` (e a API parse_many) apenas faz o parsing de muitos Blueprints em
+paralelo, reaproveitando o cache de especificações, e exibe tempos e tamanhos por arquivo.
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import subprocess
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, fields, asdict
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Union
+
+import yaml
+
+from .core.blueprint_parser import AdvancedBlueprintParser, ProjectSpecs
+from .core.specs_cache import SpecsCache
+from .core.specs_codec import decode_specs, encode_specs, load_shared_specs, share_specs
+from .core.logging_config import get_logger
+from .core.exceptions import InvalidConfigurationError, MissingConfigurationError
+from .validator_generator import ModularValidatorGenerator
+
+
+logger = get_logger("batch")
+
+
+@dataclass
+class BatchEntry:
+    """Entrada do manifesto: um projeto a ser validado."""
+    blueprint: str
+    project_root: str
+    validation_type: str
+    target_number: Optional[int] = None
+    integration_phase: Optional[str] = None
+    context: Dict[str, Any] = field(default_factory=dict)
+    name: str = ""
+    target_numbers: List[int] = field(default_factory=list)  # type=targets
+
+    def __post_init__(self):
+        if not self.name:
+            suffix = self.integration_phase or (f"target_{self.target_number}" if self.target_number else "")
+            self.name = f"{Path(self.project_root).name}:{self.validation_type}"
+            if suffix:
+                self.name += f":{suffix}"
+
+
+@dataclass
+class BatchEntryResult:
+    """Resultado da validação de uma entrada do manifesto."""
+    name: str
+    blueprint: str
+    project_root: str
+    validation_type: str
+    status: str  # PASSED, FAILED, ERROR
+    score: float = 0.0
+    total_checks: int = 0
+    passed_checks: int = 0
+    failed_checks: int = 0
+    issues_by_severity: Dict[str, int] = field(default_factory=dict)
+    group_scores: Dict[str, float] = field(default_factory=dict)  # score por alvo (type=targets)
+    duration_ms: float = 0.0
+    validator_path: str = ""
+    results_path: str = ""
+    error: str = ""
+
+
+def load_manifest(manifest_path: Union[str, Path]) -> Dict[str, Any]:
+    """Carrega manifesto JSON/YAML e resolve caminhos relativos ao seu diretório."""
+    manifest_path = Path(manifest_path)
+    if not manifest_path.exists():
+        raise MissingConfigurationError("batch manifest", str(manifest_path))
+
+    text = manifest_path.read_text(encoding='utf-8')
+    if manifest_path.suffix.lower() in ('.yaml', '.yml'):
+        data = yaml.safe_load(text)
+    else:
+        data = json.loads(text)
+
+    # Aceita tanto uma lista de entradas quanto {"entries": [...]}
+    if isinstance(data, list):
+        data = {"entries": data}
+    if not isinstance(data, dict) or not isinstance(data.get("entries"), list):
+        raise InvalidConfigurationError("batch manifest", "lista 'entries'", type(data).__name__)
+
+    base_dir = manifest_path.parent
+    entries = []
+    for index, raw in enumerate(data["entries"]):
+        validation_type = raw.get("type") or raw.get("validation_type")
+        if not raw.get("blueprint") or not raw.get("project_root") or not validation_type:
+            raise InvalidConfigurationError(
+                f"entries[{index}]", "blueprint, project_root e type", ", ".join(sorted(raw))
+            )
+        if validation_type not in ModularValidatorGenerator.VALIDATION_TYPES:
+            raise InvalidConfigurationError(
+                f"entries[{index}].type",
+                " | ".join(ModularValidatorGenerator.VALIDATION_TYPES),
+                validation_type
+            )
+
+        entries.append(BatchEntry(
+            blueprint=str((base_dir / raw["blueprint"]).resolve()),
+            project_root=str((base_dir / raw["project_root"]).resolve()),
+            validation_type=validation_type,
+            target_number=raw.get("target_number"),
+            integration_phase=raw.get("integration_phase"),
+            context=raw.get("context") or {},
+            name=raw.get("name", ""),
+            target_numbers=[int(number) for number in raw.get("targets") or ()]
+        ))
+
+    return {"entries": entries, "max_workers": data.get("max_workers")}
+
+
+# Folga na comparação de mtime para sistemas de arquivos com resolução grosseira
+_MTIME_TOLERANCE = 1.0
+
+# Specs já decodificadas neste processo do pool, por nome do segmento compartilhado
+_worker_specs: Dict[str, ProjectSpecs] = {}
+
+
+def _shared_specs(segment_name: str) -> ProjectSpecs:
+    """Specs do segmento compartilhado, decodificadas uma vez por processo."""
+    specs = _worker_specs.get(segment_name)
+    if specs is None:
+        specs = _worker_specs[segment_name] = load_shared_specs(segment_name)
+    return specs
+
+
+def _run_entry(entry: BatchEntry, specs_segment: str, timeout: Optional[float]) -> BatchEntryResult:
+    """Gera e executa o validador de uma entrada (executado nos processos do pool)."""
+    start = time.perf_counter()
+    result = BatchEntryResult(
+        name=entry.name,
+        blueprint=entry.blueprint,
+        project_root=entry.project_root,
+        validation_type=entry.validation_type,
+        status="ERROR"
+    )
+
+    try:
+        project_root = Path(entry.project_root)
+        if not project_root.is_dir():
+            raise FileNotFoundError(f"Raiz do projeto não encontrada: {project_root}")
+        specs = _shared_specs(specs_segment)
+
+        generator = ModularValidatorGenerator(entry.blueprint, specs=specs, output_root=project_root)
+        paths = generator.build_validator(
+            entry.validation_type,
+            target_number=entry.target_number,
+            integration_phase=entry.integration_phase,
+            context=entry.context,
+            target_numbers=entry.target_numbers
+        )
+
+        # Resultados de uma execução anterior no mesmo segundo não podem passar por desta
+        results_file = project_root / paths['results']
+        if results_file.exists():
+            results_file.unlink()
+        started_at = time.time()
+
+        # Validadores usam caminhos relativos (Path('.')), então rodam na raiz do projeto
+        validator_path = paths['validator'].resolve()
+        process = subprocess.run(
+            [sys.executable, str(validator_path)],
+            capture_output=True, text=True, encoding='utf-8', errors='ignore',
+            cwd=project_root, timeout=timeout,
+            env={**os.environ, 'PYTHONIOENCODING': 'utf-8'}
+        )
+
+        result.validator_path = str(validator_path)
+        # Só vale o arquivo gravado por este processo (outra entrada pode ter gravado o mesmo caminho)
+        if not results_file.exists() or results_file.stat().st_mtime < started_at - _MTIME_TOLERANCE:
+            raise RuntimeError(
+                f"Validador não gerou resultados (exit code {process.returncode}): "
+                f"{process.stderr.strip()[-500:]}"
+            )
+
+        data = json.loads(results_file.read_text(encoding='utf-8'))
+        result.results_path = str(results_file.resolve())
+        result.score = data.get("score", 0.0)
+        result.total_checks = data.get("total_checks", 0)
+        result.passed_checks = data.get("passed_checks", 0)
+        result.failed_checks = data.get("failed_checks", 0)
+        for issue in data.get("issues", []):
+            severity = issue.get("severity", "LOW")
+            result.issues_by_severity[severity] = result.issues_by_severity.get(severity, 0) + 1
+        result.group_scores = {group: summary.get("score", 0.0) for group, summary in data.get("groups", {}).items()}
+        result.status = "PASSED" if process.returncode == 0 else "FAILED"
+
+    except subprocess.TimeoutExpired:
+        result.error = f"Timeout após {timeout}s"
+    except Exception as e:
+        result.error = f"{type(e).__name__}: {e}"
+
+    result.duration_ms = round((time.perf_counter() - start) * 1000, 2)
+    return result
+
+
+@dataclass
+class BlueprintParseResult:
+    """Resultado do parsing de um Blueprint por parse_many."""
+    blueprint: str
+    status: str  # PARSED, CACHED, ERROR
+    duration_ms: float = 0.0
+    size_bytes: int = 0
+    specs_bytes: int = 0  # tamanho das specs codificadas (specs_codec)
+    models: int = 0
+    django_apps: int = 0
+    directory_paths: int = 0
+    error: str = ""
+    specs: Optional[ProjectSpecs] = field(default=None, repr=False)
+
+
+def _parse_one(blueprint: str, cache_dir: Optional[str]) -> Dict[str, Any]:
+    """Faz o parsing de um Blueprint (executado nos processos do pool).
+
+    As specs voltam codificadas (specs_codec) em vez de um pickle do dataclass; em um
+    acerto de cache, a própria entrada do cache é devolvida sem decodificação.
+    """
+    start = time.perf_counter()
+    try:
+        if cache_dir is not None:
+            encoded, from_cache = SpecsCache(cache_dir).load_or_parse_encoded(blueprint)
+        else:
+            encoded, from_cache = encode_specs(AdvancedBlueprintParser(blueprint).parse()), False
+        return {
+            "blueprint": blueprint,
+            "status": "CACHED" if from_cache else "PARSED",
+            "encoded": encoded,
+            "duration_ms": round((time.perf_counter() - start) * 1000, 2)
+        }
+    except Exception as e:
+        return {
+            "blueprint": blueprint,
+            "status": "ERROR",
+            "error": f"{type(e).__name__}: {e}",
+            "duration_ms": round((time.perf_counter() - start) * 1000, 2)
+        }
+
+
+def parse_many(paths: List[Union[str, Path]], max_workers: Optional[int] = None,
+               use_cache: bool = True, cache_dir: Union[str, Path] = ".agv_cache") -> List[BlueprintParseResult]:
+    """Faz o parsing de vários Blueprints em um pool de processos.
+
+    Blueprints inalterados são carregados do cache de especificações (SpecsCache);
+    caminhos repetidos são processados uma única vez. Os resultados seguem a ordem
+    de `paths` (sem repetições).
+    """
+    blueprints = list(dict.fromkeys(str(Path(path).resolve()) for path in paths))
+    if not blueprints:
+        return []
+    workers = max(1, min(max_workers or os.cpu_count() or 1, len(blueprints)))
+    cache = str(cache_dir) if use_cache else None
+
+    if workers == 1:
+        outcomes = [_parse_one(blueprint, cache) for blueprint in blueprints]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            outcomes = list(executor.map(_parse_one, blueprints, [cache] * len(blueprints)))
+
+    results = []
+    for outcome in outcomes:
+        result = BlueprintParseResult(
+            blueprint=outcome["blueprint"],
+            status=outcome["status"],
+            duration_ms=outcome["duration_ms"],
+            error=outcome.get("error", "")
+        )
+        if Path(result.blueprint).exists():
+            result.size_bytes = Path(result.blueprint).stat().st_size
+        if "encoded" in outcome:
+            specs = decode_specs(outcome["encoded"], lazy=True)
+            result.specs = specs
+            result.specs_bytes = len(outcome["encoded"])
+            result.models = len(specs.models)
+            result.django_apps = len(specs.django_apps)
+            result.directory_paths = len(specs.directory_paths)
+        results.append(result)
+
+    logger.info(
+        f"Parsed {len(results)} blueprints",
+        extra={
+            'context': {
+                'blueprints': len(results),
+                'cached': sum(1 for r in results if r.status == "CACHED"),
+                'errors': sum(1 for r in results if r.status == "ERROR"),
+                'max_workers': workers
+            }
+        }
+    )
+    return results
+
+
+def _expand_blueprint_paths(paths: List[str]) -> List[Path]:
+    """Arquivos informados; diretórios contribuem com seus arquivos *.md."""
+    expanded = []
+    for path in map(Path, paths):
+        expanded.extend(sorted(path.glob("*.md")) if path.is_dir() else [path])
+    return expanded
+
+
+class BatchValidator:
+    """Executa validações de muitos projetos em um pool de processos limitado."""
+
+    def __init__(self, entries: List[BatchEntry], max_workers: Optional[int] = None,
+                 timeout: Optional[float] = None, use_cache: bool = True):
+        self.entries = entries
+        self.max_workers = max(1, min(max_workers or os.cpu_count() or 1, len(entries) or 1))
+        self.timeout = timeout
+        self.specs_cache = SpecsCache() if use_cache else None
+        self._specs_by_blueprint: Dict[str, ProjectSpecs] = {}
+        self._blueprint_errors: Dict[str, str] = {}
+
+    def _parse_blueprints(self) -> Dict[str, ProjectSpecs]:
+        """
+        Faz o parsing de cada Blueprint distinto uma única vez (reaproveitando o cache).
+
+        Blueprints ausentes ou ilegíveis não interrompem o lote: o erro fica em
+        _blueprint_errors e as entradas que os usam são marcadas como ERROR.
+        """
+        for entry in self.entries:
+            blueprint = entry.blueprint
+            if blueprint in self._specs_by_blueprint or blueprint in self._blueprint_errors:
+                continue
+            try:
+                if self.specs_cache is not None:
+                    specs, _ = self.specs_cache.load_or_parse(blueprint)
+                else:
+                    specs = AdvancedBlueprintParser(blueprint).parse()
+            except Exception as e:
+                self._blueprint_errors[blueprint] = f"{type(e).__name__}: {e}"
+                logger.error(f"Failed to parse blueprint {blueprint}: {e}")
+                continue
+            self._specs_by_blueprint[blueprint] = specs
+        return self._specs_by_blueprint
+
+    def _blueprint_error_result(self, entry: BatchEntry) -> BatchEntryResult:
+        """Resultado ERROR de uma entrada cujo Blueprint não pôde ser lido."""
+        return BatchEntryResult(
+            name=entry.name,
+            blueprint=entry.blueprint,
+            project_root=entry.project_root,
+            validation_type=entry.validation_type,
+            status="ERROR",
+            error=f"Blueprint inválido: {self._blueprint_errors[entry.blueprint]}"
+        )
+
+    def run(self) -> List[BatchEntryResult]:
+        """Executa todas as entradas e retorna resultados na ordem do manifesto."""
+        specs_by_blueprint = self._parse_blueprints()
+
+        logger.info(
+            f"Batch validation started: {len(self.entries)} entries",
+            extra={
+                'context': {
+                    'entries': len(self.entries),
+                    'blueprints': len(specs_by_blueprint),
+                    'blueprint_errors': len(self._blueprint_errors),
+                    'max_workers': self.max_workers
+                }
+            }
+        )
+
+        # Um segmento por Blueprint; removidos após o término do pool
+        segments = {blueprint: share_specs(specs) for blueprint, specs in specs_by_blueprint.items()}
+        try:
+            with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+                futures = [
+                    executor.submit(_run_entry, entry, segments[entry.blueprint].name, self.timeout)
+                    if entry.blueprint in segments else None
+                    for entry in self.entries
+                ]
+                return [
+                    future.result() if future is not None else self._blueprint_error_result(entry)
+                    for entry, future in zip(self.entries, futures)
+                ]
+        finally:
+            for segment in segments.values():
+                segment.close()
+                segment.unlink()
+
+    @staticmethod
+    def write_results(results: List[BatchEntryResult], output_path: Union[str, Path]) -> Path:
+        """Grava arquivo consolidado com resumo e resultados por entrada."""
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        summary = {
+            "timestamp": datetime.now().isoformat(),
+            "total": len(results),
+            "passed": sum(1 for r in results if r.status == "PASSED"),
+            "failed": sum(1 for r in results if r.status == "FAILED"),
+            "errors": sum(1 for r in results if r.status == "ERROR"),
+            "average_score": round(sum(r.score for r in results) / len(results), 2) if results else 0.0,
+            "total_duration_ms": round(sum(r.duration_ms for r in results), 2)
+        }
+
+        output_path.write_text(
+            json.dumps({"summary": summary, "results": [asdict(r) for r in results]},
+                       indent=2, ensure_ascii=False),
+            encoding='utf-8'
+        )
+        return output_path
+
+
+def _parse_command(args: argparse.Namespace) -> int:
+    """Subcomando parse: tabela de tempos e tamanhos por Blueprint; retorna o exit code."""
+    blueprints = _expand_blueprint_paths(args.blueprints)
+    start = time.perf_counter()
+    results = parse_many(blueprints, args.workers, use_cache=not args.no_cache)
+    total_ms = (time.perf_counter() - start) * 1000
+
+    print(f"{'Blueprint':<40} {'Status':<7} {'Tempo (ms)':>10} {'Tamanho':>9} {'Specs':>8} "
+          f"{'Modelos':>8} {'Apps':>5}")
+    print("-" * 93)
+    for result in results:
+        name = Path(result.blueprint).name
+        if result.status == "ERROR":
+            print(f"{name:<40} {result.status:<7} {result.duration_ms:>10.1f}  {result.error}")
+            continue
+        print(f"{name:<40} {result.status:<7} {result.duration_ms:>10.1f} "
+              f"{result.size_bytes / 1024:>7.0f}KB {result.specs_bytes / 1024:>6.1f}KB "
+              f"{result.models:>8} {result.django_apps:>5}")
+    print("-" * 93)
+    cached = sum(1 for r in results if r.status == "CACHED")
+    errors = sum(1 for r in results if r.status == "ERROR")
+    print(f"{len(results)} Blueprints em {total_ms / 1000:.2f}s ({cached} do cache, {errors} com erro)")
+
+    if args.output:
+        output_path = Path(args.output)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        rows = [{f.name: getattr(r, f.name) for f in fields(r) if f.name != "specs"} for r in results]
+        output_path.write_text(json.dumps(rows, indent=2, ensure_ascii=False), encoding='utf-8')
+        print(f"Resumo salvo em: {output_path}")
+
+    return 1 if errors else 0
+
+
+def main():
+    """CLI de validação em lote."""
+    parser = argparse.ArgumentParser(
+        description="AGV Batch - Validação de múltiplos projetos em paralelo"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    validate_parser = subparsers.add_parser("validate", help="Valida projetos listados em um manifesto")
+    validate_parser.add_argument("manifest", help="Manifesto JSON/YAML com as entradas")
+    validate_parser.add_argument("--workers", type=int, help="Número máximo de processos")
+    validate_parser.add_argument("--timeout", type=float, help="Timeout por validador em segundos")
+    validate_parser.add_argument("--output", help="Arquivo consolidado de resultados (JSON)")
+    validate_parser.add_argument("--no-cache", action="store_true",
+                                 help="Ignora o cache de especificações e refaz o parsing dos Blueprints")
+
+    parse_parser = subparsers.add_parser("parse", help="Faz o parsing de vários Blueprints em paralelo")
+    parse_parser.add_argument("blueprints", nargs="+", help="Arquivos de Blueprint ou diretórios (*.md)")
+    parse_parser.add_argument("--workers", type=int, help="Número máximo de processos")
+    parse_parser.add_argument("--no-cache", action="store_true",
+                              help="Ignora o cache de especificações e refaz o parsing dos Blueprints")
+    parse_parser.add_argument("--output", help="Grava o resumo em JSON")
+
+    args = parser.parse_args()
+
+    if args.command == "parse":
+        sys.exit(_parse_command(args))
+
+    try:
+        manifest = load_manifest(args.manifest)
+    except Exception as e:
+        print(f"[ERRO] Manifesto inválido: {e}")
+        sys.exit(1)
+
+    entries = manifest["entries"]
+    batch = BatchValidator(entries, args.workers or manifest["max_workers"], args.timeout,
+                           use_cache=not args.no_cache)
+    print(f"AGV Batch: {len(entries)} validações com até {batch.max_workers} processos")
+    print("-" * 80)
+
+    results = batch.run()
+    for result in results:
+        detail = result.error if result.status == "ERROR" else f"score {result.score}%"
+        print(f"[{result.status:6}] {result.name} ({result.duration_ms / 1000:.1f}s) - {detail}")
+
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    output_path = args.output or Path(ModularValidatorGenerator.OUTPUT_STRUCTURE['base_dir']) / 'resultados' / f"batch_results_{timestamp}.json"
+    saved = BatchValidator.write_results(results, output_path)
+    print(f"\nResultados consolidados salvos em: {saved}")
+
+    sys.exit(0 if all(r.status == "PASSED" for r in results) else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,23 @@
+"""
+Benchmarks of the AGV Blueprint parser, synthetic Blueprint generation and cache
+eviction policies.
+"""
+
+from .synthetic_blueprint import BlueprintShape, PRESET_SHAPES, generate_blueprint, write_blueprint
+from .parser_benchmark import BenchmarkResult, benchmark_blueprint, run_suite, compare_to_baseline
+from .cache_benchmark import CacheBenchmarkResult, TRACES, simulate, run_hit_rates
+
+__all__ = [
+    'BlueprintShape',
+    'PRESET_SHAPES',
+    'generate_blueprint',
+    'write_blueprint',
+    'BenchmarkResult',
+    'benchmark_blueprint',
+    'run_suite',
+    'compare_to_baseline',
+    'CacheBenchmarkResult',
+    'TRACES',
+    'simulate',
+    'run_hit_rates'
+]
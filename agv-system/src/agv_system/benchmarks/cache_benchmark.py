@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Cache Benchmark - Taxa de acerto e vazão das políticas de evicção do MemoryCache.
+
+Traces sintéticos que reproduzem os padrões de acesso do AGV:
+- zipf: popularidade de cauda longa (parse de Blueprints, specs e templates mais usados)
+- scan: conjunto quente de regras/índices intercalado com varreduras de arquivos do
+  projeto lidos uma única vez por validação (o padrão que derruba LRU e LFU ingênuos)
+- loop: ciclo sobre um pouco mais chaves do que cabem no cache (revalidações completas)
+
+Para cada trace, política e capacidade o cache é simulado com a mesma política usada
+pelo MemoryCache (get; em falta, set). A vazão é medida no próprio MemoryCache cheio,
+onde cada set inclui uma evicção.
+"""
+
+import sys
+import json
+import time
+import random
+import argparse
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Callable, Dict, List, Union
+
+from ..core.cache_policies import EVICTION_POLICIES, create_policy
+from ..core.cache_system import MemoryCache
+
+
+DEFAULT_CAPACITIES = [100, 500, 1000]
+
+
+@dataclass
+class CacheBenchmarkResult:
+    """Taxa de acerto de uma política em um trace, para uma capacidade."""
+    trace: str
+    policy: str
+    capacity: int
+    accesses: int
+    hits: int
+    hit_rate: float
+
+
+def zipf_trace(length: int = 100_000, universe: int = 5_000, skew: float = 1.0, seed: int = 42) -> List[str]:
+    """Chaves com popularidade Zipf (a chave de posição i tem peso 1 / i^skew)."""
+    rng = random.Random(seed)
+    cumulative, total = [], 0.0
+    for rank in range(1, universe + 1):
+        total += 1.0 / rank ** skew
+        cumulative.append(total)
+    return [f"spec:{rank}" for rank in rng.choices(range(universe), cum_weights=cumulative, k=length)]
+
+
+def scan_trace(length: int = 100_000, hot_keys: int = 200, scan_every: int = 5_000,
+               scan_size: int = 2_000, seed: int = 42) -> List[str]:
+    """Conjunto quente (Zipf) interrompido a cada scan_every acessos por uma varredura de arquivos inéditos."""
+    hot = zipf_trace(length, hot_keys, seed=seed)
+    trace: List[str] = []
+    scans = 0
+    for position, key in enumerate(hot):
+        if position and position % scan_every == 0:
+            trace.extend(f"file:{scans}/module_{index}.py" for index in range(scan_size))
+            scans += 1
+        trace.append(key)
+    return trace[:length]
+
+
+def loop_trace(length: int = 100_000, loop_size: int = 1_200) -> List[str]:
+    """Ciclo sequencial sobre loop_size chaves."""
+    return [f"file:module_{position % loop_size}.py" for position in range(length)]
+
+
+TRACES: Dict[str, Callable[[], List[str]]] = {
+    "zipf": zipf_trace,
+    "scan": scan_trace,
+    "loop": loop_trace,
+}
+
+
+def simulate(policy_name: str, capacity: int, trace: List[str]) -> CacheBenchmarkResult:
+    """Reproduz o trace com a política (get e, em falta, set) e conta os acertos."""
+    policy = create_policy(policy_name, capacity)
+    resident = set()
+    hits = 0
+    for key in trace:
+        if key in resident:
+            policy.record_access(key)
+            hits += 1
+            continue
+        policy.record_miss(key)
+        if len(resident) >= capacity:
+            resident.discard(policy.evict())
+        policy.record_insert(key)
+        resident.add(key)
+    return CacheBenchmarkResult(
+        trace="",
+        policy=policy.name,
+        capacity=capacity,
+        accesses=len(trace),
+        hits=hits,
+        hit_rate=round(hits / len(trace), 4) if trace else 0.0
+    )
+
+
+def run_hit_rates(traces: List[str], policies: List[str], capacities: List[int]) -> List[CacheBenchmarkResult]:
+    """Taxa de acerto de cada combinação trace x política x capacidade."""
+    results = []
+    for trace_name in traces:
+        trace = TRACES[trace_name]()
+        for capacity in capacities:
+            for policy_name in policies:
+                result = simulate(policy_name, capacity, trace)
+                result.trace = trace_name
+                results.append(result)
+    return results
+
+
+def set_throughput(policy_name: str, capacity: int = 1000, operations: int = 20_000) -> float:
+    """Sets por segundo no MemoryCache já cheio (cada set novo provoca uma evicção)."""
+    cache = MemoryCache(max_size=capacity, policy=policy_name)
+    for index in range(capacity):
+        cache.set(f"warm:{index}", index)
+    start = time.perf_counter()
+    for index in range(operations):
+        cache.set(f"key:{index}", index)
+    elapsed = time.perf_counter() - start
+    return round(operations / elapsed, 1) if elapsed else 0.0
+
+
+def save_results(results: List[CacheBenchmarkResult], throughput: Dict[str, float],
+                 output_path: Union[str, Path]) -> Path:
+    """Grava taxas de acerto e vazão em JSON."""
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_text(json.dumps({
+        "hit_rates": [asdict(result) for result in results],
+        "set_ops_per_second": throughput
+    }, indent=2, ensure_ascii=False), encoding='utf-8')
+    return output_path
+
+
+def print_hit_rates(results: List[CacheBenchmarkResult], policies: List[str]):
+    """Tabela trace x capacidade com a taxa de acerto de cada política."""
+    print(f"{'Trace':<8} {'Capacidade':>10}" + "".join(f" {policy:>11}" for policy in policies))
+    print("-" * (20 + 12 * len(policies)))
+    rows: Dict[tuple, Dict[str, float]] = {}
+    for result in results:
+        rows.setdefault((result.trace, result.capacity), {})[result.policy] = result.hit_rate
+    for (trace_name, capacity), rates in rows.items():
+        print(f"{trace_name:<8} {capacity:>10}" + "".join(f" {rates[policy]:>10.1%}" for policy in policies))
+
+
+def main():
+    """CLI do benchmark de políticas de cache."""
+    parser = argparse.ArgumentParser(
+        description="AGV Cache Benchmark - Taxa de acerto das políticas de evicção do MemoryCache"
+    )
+    parser.add_argument("--traces", nargs="*", choices=sorted(TRACES), default=list(TRACES),
+                        help="Traces de acesso a simular")
+    parser.add_argument("--policies", nargs="*", choices=list(EVICTION_POLICIES), default=list(EVICTION_POLICIES),
+                        help="Políticas de evicção")
+    parser.add_argument("--capacities", nargs="*", type=int, default=DEFAULT_CAPACITIES,
+                        help="Capacidades (número de entradas) do cache")
+    parser.add_argument("--throughput-ops", type=int, default=20_000,
+                        help="Sets medidos no MemoryCache cheio (0 desativa)")
+    parser.add_argument("--output", help="Grava os resultados em JSON")
+
+    args = parser.parse_args()
+
+    results = run_hit_rates(args.traces, args.policies, args.capacities)
+    print_hit_rates(results, args.policies)
+
+    throughput: Dict[str, float] = {}
+    if args.throughput_ops:
+        print(f"\nSets/s no MemoryCache cheio ({max(args.capacities)} entradas)")
+        for policy_name in args.policies:
+            throughput[policy_name] = set_throughput(policy_name, max(args.capacities), args.throughput_ops)
+            print(f"   {policy_name:<12} {throughput[policy_name]:>12,.0f}")
+
+    if args.output:
+        saved = save_results(results, throughput, args.output)
+        print(f"\nResultados salvos em: {saved}")
+
+    sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
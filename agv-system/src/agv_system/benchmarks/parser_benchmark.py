@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+"""
+Parser Benchmark - Suíte de benchmark do AdvancedBlueprintParser.
+
+Mede, para Blueprints sintéticos (PRESET_SHAPES) e/ou arquivos informados:
+- parse() completo (leitura + índice + extractors), mediana de N execuções
+- vazão em MB/s e pico de memória alocada (tracemalloc)
+- tempo de cada extractor de EXTRACTORS isoladamente (mais leitura, índice e divisão),
+  pelo menor tempo entre as N execuções, menos sensível a ruído em trechos curtos
+
+Os resultados podem ser gravados como baseline e comparados em execuções futuras;
+tempos acima de baseline * (1 + threshold) são reportados como regressão.
+"""
+
+import gc
+import sys
+import json
+import time
+import platform
+import argparse
+import statistics
+import tempfile
+import tracemalloc
+from dataclasses import dataclass, field, asdict
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Any, Optional, Union
+
+from ..core.blueprint_index import BlueprintIndex
+from ..core.blueprint_parser import AdvancedBlueprintParser, EXTRACTOR_WAVES
+from .synthetic_blueprint import BlueprintShape, PRESET_SHAPES, write_blueprint, shape_summary
+
+
+# Extractors mais rápidos que isso variam mais por ruído do que por regressão
+MIN_COMPARABLE_MS = 0.2
+
+
+@dataclass
+class BenchmarkResult:
+    """Medições de um Blueprint."""
+    name: str
+    size_bytes: int
+    repeat: int
+    parse_ms: float                 # mediana do parse() completo
+    parse_min_ms: float
+    throughput_mb_s: float
+    peak_memory_kb: float
+    streaming: bool
+    phases_ms: Dict[str, float] = field(default_factory=dict)      # leitura, índice, divisão
+    extractors_ms: Dict[str, float] = field(default_factory=dict)  # extractor -> menor tempo
+    shape: Optional[Dict[str, Any]] = None
+
+
+def _median_ms(func: Callable[[], Any], repeat: int) -> List[float]:
+    """Tempos (ms) de repeat execuções de func, com GC desligado durante cada uma."""
+    timings = []
+    for _ in range(repeat):
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            func()
+            timings.append((time.perf_counter() - start) * 1000)
+        finally:
+            gc.enable()
+    return timings
+
+
+def time_extractors(blueprint_path: Union[str, Path], repeat: int = 5) -> Dict[str, Dict[str, float]]:
+    """Menor tempo de cada fase e de cada extractor, executados isoladamente.
+
+    Segue as ondas de EXTRACTOR_WAVES em modo sequencial e sem streaming, de modo que
+    cada extractor enxerga as mesmas specs parciais que no parse() real.
+    """
+    phases: Dict[str, List[float]] = {"read": [], "index": [], "split": []}
+    extractors: Dict[str, List[float]] = {}
+
+    for _ in range(repeat):
+        # streaming=True adia leitura e índice, que são medidos como fases separadas
+        parser = AdvancedBlueprintParser(str(blueprint_path), parallel=False, streaming=True)
+        parser.streaming = False
+        gc.collect()
+        gc.disable()
+        try:
+            _time_phases(parser, phases, extractors)
+        finally:
+            gc.enable()
+
+    return {
+        "phases": {name: round(min(values), 3) for name, values in phases.items()},
+        "extractors": {name: round(min(values), 3) for name, values in extractors.items()},
+    }
+
+
+def _time_phases(parser: AdvancedBlueprintParser, phases: Dict[str, List[float]],
+                 extractors: Dict[str, List[float]]):
+    """Uma execução instrumentada: leitura, índice, divisão e cada extractor."""
+    start = time.perf_counter()
+    parser._content = parser._read_blueprint()
+    phases["read"].append((time.perf_counter() - start) * 1000)
+
+    start = time.perf_counter()
+    parser.index = BlueprintIndex.build(parser._content)
+    phases["index"].append((time.perf_counter() - start) * 1000)
+
+    start = time.perf_counter()
+    chunks, hashes = parser._split_sections()
+    phases["split"].append((time.perf_counter() - start) * 1000)
+
+    contributions: Dict[str, Dict[str, Any]] = {}
+    for wave in EXTRACTOR_WAVES:
+        parser.specs = parser._merged_specs(contributions)
+        for extractor in wave:
+            start = time.perf_counter()
+            contribution, _, _, _ = parser._run_extractor(extractor, chunks, hashes, {}, {})
+            extractors.setdefault(extractor.name, []).append((time.perf_counter() - start) * 1000)
+            contributions[extractor.name] = contribution
+
+
+def peak_parse_memory(blueprint_path: Union[str, Path]) -> float:
+    """Pico de memória alocada (KB) durante um parse() completo."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        AdvancedBlueprintParser(str(blueprint_path)).parse()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return round(peak / 1024, 1)
+
+
+def benchmark_blueprint(blueprint_path: Union[str, Path], name: Optional[str] = None,
+                        repeat: int = 5, shape: Optional[BlueprintShape] = None) -> BenchmarkResult:
+    """Executa todas as medições para um Blueprint."""
+    blueprint_path = Path(blueprint_path)
+    size = blueprint_path.stat().st_size
+
+    # Aquecimento (imports, compilação de regex, cache de disco do SO)
+    streaming = AdvancedBlueprintParser(str(blueprint_path)).streaming
+    AdvancedBlueprintParser(str(blueprint_path)).parse()
+
+    timings = _median_ms(lambda: AdvancedBlueprintParser(str(blueprint_path)).parse(), repeat)
+    parse_ms = statistics.median(timings)
+    detail = time_extractors(blueprint_path, repeat)
+
+    return BenchmarkResult(
+        name=name or blueprint_path.stem,
+        size_bytes=size,
+        repeat=repeat,
+        parse_ms=round(parse_ms, 3),
+        parse_min_ms=round(min(timings), 3),
+        throughput_mb_s=round((size / (1024 * 1024)) / (parse_ms / 1000), 2) if parse_ms else 0.0,
+        peak_memory_kb=peak_parse_memory(blueprint_path),
+        streaming=streaming,
+        phases_ms=detail["phases"],
+        extractors_ms=detail["extractors"],
+        shape=shape_summary(shape) if shape else None
+    )
+
+
+def run_suite(presets: List[str], blueprints: List[str], repeat: int = 5,
+              work_dir: Optional[Union[str, Path]] = None) -> List[BenchmarkResult]:
+    """Gera os Blueprints sintéticos pedidos e mede todos os Blueprints."""
+    results = []
+    with tempfile.TemporaryDirectory(prefix="agv-bench-") as tmp:
+        target_dir = Path(work_dir) if work_dir else Path(tmp)
+        for preset in presets:
+            shape = PRESET_SHAPES[preset]
+            path = write_blueprint(target_dir / f"synthetic_{preset}.md", shape)
+            results.append(benchmark_blueprint(path, f"synthetic:{preset}", repeat, shape))
+        for blueprint in blueprints:
+            results.append(benchmark_blueprint(blueprint, repeat=repeat))
+    return results
+
+
+def save_baseline(results: List[BenchmarkResult], output_path: Union[str, Path]) -> Path:
+    """Grava os resultados como baseline (JSON)."""
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_text(json.dumps({
+        "timestamp": datetime.now().isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": {result.name: asdict(result) for result in results}
+    }, indent=2, ensure_ascii=False), encoding='utf-8')
+    return output_path
+
+
+def load_baseline(baseline_path: Union[str, Path]) -> Dict[str, Dict[str, Any]]:
+    """Resultados de uma baseline gravada por save_baseline (nome -> resultado)."""
+    data = json.loads(Path(baseline_path).read_text(encoding='utf-8'))
+    return data.get("results", {})
+
+
+def compare_to_baseline(results: List[BenchmarkResult], baseline: Dict[str, Dict[str, Any]],
+                        threshold: float = 0.2) -> List[Dict[str, Any]]:
+    """Compara parse() e cada extractor com a baseline.
+
+    Retorna uma linha por métrica comparável: {benchmark, metric, baseline_ms, current_ms,
+    change (fração), status: REGRESSION | IMPROVED | OK}.
+    """
+    rows = []
+    for result in results:
+        previous = baseline.get(result.name)
+        if not previous:
+            continue
+
+        metrics = [("parse", previous.get("parse_ms"), result.parse_ms)]
+        metrics += [(f"extractor:{name}", previous.get("extractors_ms", {}).get(name), current)
+                    for name, current in result.extractors_ms.items()]
+        for metric, before, current in metrics:
+            if not before or max(before, current) < MIN_COMPARABLE_MS:
+                continue
+            change = (current - before) / before
+            status = "REGRESSION" if change > threshold else "IMPROVED" if change < -threshold else "OK"
+            rows.append({
+                "benchmark": result.name,
+                "metric": metric,
+                "baseline_ms": before,
+                "current_ms": current,
+                "change": round(change, 3),
+                "status": status
+            })
+    return rows
+
+
+def print_results(results: List[BenchmarkResult]):
+    """Tabela de resultados no terminal."""
+    print(f"{'Blueprint':<28} {'Tamanho':>10} {'parse (ms)':>11} {'MB/s':>8} {'Pico (KB)':>10}  Modo")
+    print("-" * 80)
+    for result in results:
+        mode = "streaming" if result.streaming else "memória"
+        print(f"{result.name:<28} {result.size_bytes / 1024:>8.0f}KB {result.parse_ms:>11.2f} "
+              f"{result.throughput_mb_s:>8.2f} {result.peak_memory_kb:>10.0f}  {mode}")
+
+    for result in results:
+        print(f"\n{result.name} - fases e extractors (ms, melhor de {result.repeat})")
+        timings = {**result.phases_ms, **result.extractors_ms}
+        for name, value in sorted(timings.items(), key=lambda item: item[1], reverse=True):
+            print(f"   {name:<28} {value:>10.3f}")
+
+
+def print_comparison(rows: List[Dict[str, Any]], threshold: float):
+    """Tabela de comparação com a baseline."""
+    print(f"\nComparação com baseline (limite de regressão: +{threshold:.0%})")
+    print("-" * 80)
+    for row in rows:
+        print(f"[{row['status']:10}] {row['benchmark']:<24} {row['metric']:<34} "
+              f"{row['baseline_ms']:>9.2f} -> {row['current_ms']:>9.2f} ({row['change']:+.0%})")
+
+
+def main():
+    """CLI da suíte de benchmark do parser."""
+    parser = argparse.ArgumentParser(
+        description="AGV Benchmark - Desempenho do parser de Blueprints"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    generate_parser = subparsers.add_parser("generate", help="Gera um Blueprint sintético")
+    generate_parser.add_argument("output", help="Arquivo Markdown de saída")
+    generate_parser.add_argument("--preset", choices=sorted(PRESET_SHAPES), default="small",
+                                 help="Forma base (os demais parâmetros a sobrescrevem)")
+    for name, value in asdict(BlueprintShape()).items():
+        generate_parser.add_argument(f"--{name.replace('_', '-')}", dest=name, type=type(value))
+
+    run_parser = subparsers.add_parser("run", help="Executa a suíte de benchmark")
+    run_parser.add_argument("blueprints", nargs="*", help="Blueprints adicionais a medir")
+    run_parser.add_argument("--presets", nargs="*", choices=sorted(PRESET_SHAPES),
+                            default=["small", "medium"], help="Blueprints sintéticos a gerar")
+    run_parser.add_argument("--repeat", type=int, default=5, help="Execuções por medição")
+    run_parser.add_argument("--work-dir", help="Mantém os Blueprints sintéticos neste diretório")
+    run_parser.add_argument("--baseline", help="Baseline JSON para comparação")
+    run_parser.add_argument("--threshold", type=float, default=0.2,
+                            help="Aumento relativo considerado regressão (padrão: 0.2)")
+    run_parser.add_argument("--save-baseline", help="Grava os resultados como nova baseline")
+
+    args = parser.parse_args()
+
+    if args.command == "generate":
+        overrides = {name: value for name, value in vars(args).items()
+                     if name in asdict(BlueprintShape()) and value is not None}
+        shape = BlueprintShape(**{**asdict(PRESET_SHAPES[args.preset]), **overrides})
+        path = write_blueprint(args.output, shape)
+        print(f"Blueprint sintético gerado: {path} ({path.stat().st_size / 1024:.0f} KB, "
+              f"{shape.model_count} modelos)")
+        return
+
+    results = run_suite(args.presets, args.blueprints, args.repeat, args.work_dir)
+    print_results(results)
+
+    regressions = []
+    if args.baseline:
+        rows = compare_to_baseline(results, load_baseline(args.baseline), args.threshold)
+        print_comparison(rows, args.threshold)
+        regressions = [row for row in rows if row["status"] == "REGRESSION"]
+
+    if args.save_baseline:
+        saved = save_baseline(results, args.save_baseline)
+        print(f"\nBaseline salva em: {saved}")
+
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
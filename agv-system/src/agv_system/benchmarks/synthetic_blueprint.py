@@ -0,0 +1,328 @@
+#!/usr/bin/env python3
+"""
+Gerador de Blueprints sintéticos no formato de BLUEPRINT_ARQUITETURAL.md.
+
+Produz documentos determinísticos (mesma forma + mesma seed = mesmo texto) com a mesma
+estrutura de seções que o parser espera: visão geral com stack, modelos Django em blocos
+Python, settings com INSTALLED_APPS, árvore de diretórios, tabelas e blocos de
+dependências, Dockerfiles, CI/CD e seções de texto/código de preenchimento.
+"""
+
+import random
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Any, Dict, List, Union
+
+
+# Vocabulário usado para nomes de apps, modelos e campos
+_WORDS = [
+    "account", "agent", "asset", "audit", "batch", "billing", "branch", "budget", "card",
+    "charge", "claim", "client", "contract", "credit", "debt", "deposit", "document",
+    "entry", "fee", "fund", "invoice", "ledger", "limit", "loan", "member", "notice",
+    "offer", "order", "partner", "payment", "plan", "policy", "portfolio", "profile",
+    "quota", "rate", "receipt", "refund", "report", "risk", "schedule", "score",
+    "segment", "settlement", "statement", "tax", "ticket", "transfer", "wallet",
+]
+_FIELD_TYPES = [
+    "models.CharField(max_length=255)",
+    "models.CharField(max_length=20, null=True, blank=True)",
+    "models.DecimalField(max_digits=12, decimal_places=2)",
+    "models.DateField()",
+    "models.DateTimeField(auto_now_add=True)",
+    "models.BooleanField(default=False)",
+    "models.PositiveSmallIntegerField()",
+    "models.TextField(blank=True)",
+    "models.EmailField(null=True, blank=True)",
+]
+_PYTHON_DEPS = [
+    ("django", "4.2"), ("djangorestframework", "3.14"), ("psycopg2-binary", "2.9.9"),
+    ("django-environ", "0.11.2"), ("celery", "5.3.6"), ("redis", "5.0.1"),
+    ("gunicorn", "21.2.0"), ("structlog", "23.2.0"), ("django-filter", "23.3"),
+    ("djangorestframework-simplejwt", "5.3.0"),
+]
+_DEV_DEPS = [
+    ("pytest", "7.4.3"), ("pytest-django", "4.7.0"), ("factory-boy", "3.3.0"),
+    ("pytest-cov", "4.1.0"), ("black", "23.11.0"), ("ruff", "0.1.6"), ("pre-commit", "3.5.0"),
+]
+_NODE_DEPS = [
+    ("react", "18.2.0"), ("react-dom", "18.2.0"), ("@tanstack/react-query", "5.8.4"),
+    ("axios", "1.6.2"), ("zustand", "4.4.7"), ("react-router-dom", "6.20.0"),
+    ("zod", "3.22.4"), ("react-hook-form", "7.48.2"), ("tailwindcss", "3.3.5"),
+]
+_FILLER_SENTENCES = [
+    "A camada de serviços orquestra os casos de uso e delega regras ao domínio.",
+    "Todos os endpoints seguem o padrão RESTful versionado em api/v1.",
+    "O isolamento por tenant é garantido pelo BaseTenantModel e por middlewares.",
+    "Logs estruturados em JSON são emitidos com structlog e correlacionados por request_id.",
+    "Tarefas assíncronas rodam no Celery com Redis como broker.",
+    "A autenticação usa JWT com tokens de acesso de curta duração.",
+    "Testes unitários cobrem serviços e modelos; testes de integração cobrem fluxos completos.",
+    "O pipeline de CI executa lint, testes e docker build a cada Pull Request.",
+]
+
+
+@dataclass
+class BlueprintShape:
+    """Parâmetros do Blueprint sintético."""
+    apps: int = 4                  # apps Django (iabank/<app>/)
+    models_per_app: int = 3
+    fields_per_model: int = 8
+    tree_depth: int = 4            # profundidade da árvore de diretórios
+    tree_breadth: int = 3          # subdiretórios por nível
+    files_per_dir: int = 3
+    code_blocks: int = 6           # blocos de código de preenchimento (fora dos modelos)
+    dependency_rows: int = 10      # linhas da tabela de dependências
+    filler_sections: int = 8       # seções de texto adicionais
+    paragraphs_per_section: int = 4
+    seed: int = 42
+
+    @property
+    def model_count(self) -> int:
+        return self.apps * self.models_per_app
+
+
+# Formas pré-definidas usadas pela suíte de benchmark
+PRESET_SHAPES: Dict[str, BlueprintShape] = {
+    # Próximo do Blueprint de referência (~60 KB)
+    "small": BlueprintShape(),
+    "medium": BlueprintShape(apps=10, models_per_app=6, tree_depth=5, code_blocks=30,
+                             dependency_rows=40, filler_sections=40),
+    # Acima de STREAMING_MIN_BYTES: exercita o modo streaming
+    "large": BlueprintShape(apps=30, models_per_app=10, fields_per_model=12, tree_depth=5,
+                            code_blocks=1600, dependency_rows=400, filler_sections=1600,
+                            paragraphs_per_section=6),
+}
+
+
+class SyntheticBlueprintGenerator:
+    """Monta o Markdown do Blueprint seção por seção."""
+
+    def __init__(self, shape: BlueprintShape):
+        self.shape = shape
+        self.random = random.Random(shape.seed)
+        self.apps = self._unique_names(shape.apps)
+        self.models_by_app = {
+            app: [self._class_name(app, index) for index in range(shape.models_per_app)]
+            for app in self.apps
+        }
+        self._section = 0
+
+    def _unique_names(self, count: int) -> List[str]:
+        """Nomes distintos combinando palavras do vocabulário."""
+        names: List[str] = []
+        seen = set()
+        while len(names) < count:
+            name = self.random.choice(_WORDS)
+            if name in seen:
+                name = f"{name}_{self.random.choice(_WORDS)}"
+            if name not in seen:
+                seen.add(name)
+                names.append(name)
+        return names
+
+    @staticmethod
+    def _class_name(app: str, index: int) -> str:
+        base = "".join(part.capitalize() for part in app.split("_"))
+        return base if index == 0 else f"{base}Item{index}"
+
+    def _heading(self, title: str) -> str:
+        self._section += 1
+        return f"## {self._section}. {title}\n\n"
+
+    def generate(self) -> str:
+        """Texto completo do Blueprint."""
+        parts = [
+            "# Blueprint Arquitetural: SYNTHBANK (Sintético)\n\n",
+            "Este documento define a arquitetura de alto nível para o sistema sintético SYNTHBANK.\n\n",
+            self._overview(),
+            self._models(),
+            self._settings(),
+        ]
+        # A seção de estrutura precisa ser a de número 7 para o parser encontrá-la
+        while self._section < 6:
+            parts.append(self._filler())
+        parts.append(self._directory_tree())
+        parts.append(self._dependencies())
+        parts.append(self._ci_cd())
+        for _ in range(self.shape.filler_sections):
+            parts.append(self._filler())
+        return "".join(parts)
+
+    def _overview(self) -> str:
+        apps = ", ".join(f"`{app}`" for app in self.apps[:3])
+        return (
+            self._heading("Visão Geral da Arquitetura")
+            + "A arquitetura é um **Monolito Modular** em camadas com backend Django e frontend React.\n"
+            + f"Apps de negócio como {apps} compartilham o banco PostgreSQL (multi-tenant).\n\n"
+            + "- **Backend:** Python 3.11, Django 4.2, Django REST Framework\n"
+            + "- **Frontend:** React 18 com TypeScript e Vite\n"
+            + "- **Autenticação:** JWT (djangorestframework-simplejwt)\n\n"
+        )
+
+    def _models(self) -> str:
+        lines = [
+            "# synthbank/core/models.py (Modelos base)",
+            "from django.db import models",
+            "from django.contrib.auth.models import AbstractUser",
+            "",
+            "class Tenant(models.Model):",
+            "    name = models.CharField(max_length=255)",
+            "",
+            "class BaseTenantModel(models.Model):",
+            "    tenant = models.ForeignKey(Tenant, on_delete=models.CASCADE)",
+            "    created_at = models.DateTimeField(auto_now_add=True)",
+            "",
+            "    class Meta:",
+            "        abstract = True",
+            "",
+        ]
+        previous: List[str] = []
+        for app in self.apps:
+            lines.append(f"# iabank/{app}/models.py")
+            for model in self.models_by_app[app]:
+                lines.append(f"class {model}(BaseTenantModel):")
+                for index in range(self.shape.fields_per_model):
+                    field_name = f"{self.random.choice(_WORDS)}_{index}"
+                    lines.append(f"    {field_name} = {self.random.choice(_FIELD_TYPES)}")
+                if previous:
+                    target = self.random.choice(previous)
+                    lines.append(f"    {target.lower()} = models.ForeignKey({target}, "
+                                 f"on_delete=models.PROTECT, related_name='{model.lower()}s')")
+                lines.append("")
+                lines.append("    def __str__(self):")
+                lines.append("        return str(self.pk)")
+                lines.append("")
+                previous.append(model)
+        return (
+            self._heading("Modelos de Domínio")
+            + "Todos os modelos incluem um campo `tenant` para isolamento de dados.\n\n"
+            + "```python\n" + "\n".join(lines) + "\n```\n\n"
+        )
+
+    def _settings(self) -> str:
+        installed = "\n".join(f"    'iabank.{app}'," for app in self.apps)
+        backend_apps = ", ".join(f"'{app}'" for app in self.apps)
+        return (
+            self._heading("Configuração do Django")
+            + "```python\n# iabank/settings.py\nINSTALLED_APPS = [\n"
+            + "    'django.contrib.admin',\n    'django.contrib.auth',\n    'rest_framework',\n"
+            + installed + "\n]\n```\n\n"
+            + "```yaml\nbackend_apps: [" + backend_apps + "]\n```\n\n"
+        )
+
+    def _directory_tree(self) -> str:
+        lines = ["synthbank/"]
+
+        def add_dir(prefix: str, name: str, depth: int, is_last: bool):
+            connector = "└── " if is_last else "├── "
+            lines.append(f"{prefix}{connector}{name}/")
+            child_prefix = prefix + ("    " if is_last else "│   ")
+            children: List[Any] = [f"module_{index}.py" for index in range(self.shape.files_per_dir)]
+            if depth < self.shape.tree_depth:
+                children += [(f"pkg_{depth}_{index}",) for index in range(self.shape.tree_breadth)]
+            for position, child in enumerate(children):
+                last = position == len(children) - 1
+                if isinstance(child, tuple):
+                    add_dir(child_prefix, child[0], depth + 1, last)
+                else:
+                    lines.append(f"{child_prefix}{'└── ' if last else '├── '}{child}")
+
+        lines.append("├── backend/")
+        lines.append("│   ├── src/")
+        lines.append("│   │   └── iabank/")
+        lines.append("│   │       ├── settings.py")
+        lines.append("│   │       ├── urls.py")
+        for position, app in enumerate(self.apps):
+            add_dir("│   │       ", app, 1, position == len(self.apps) - 1)
+        lines.append("│   ├── manage.py")
+        lines.append("│   ├── Dockerfile")
+        lines.append("│   └── pyproject.toml")
+        lines.append("├── frontend/")
+        lines.append("│   ├── src/")
+        lines.append("│   ├── package.json")
+        lines.append("│   └── vite.config.ts")
+        lines.append("├── docker-compose.yml")
+        lines.append("├── .gitignore")
+        lines.append("└── README.md")
+
+        return (
+            self._heading("Estrutura de Diretórios Proposta (Monorepo)")
+            + "```\n" + "\n".join(lines) + "\n```\n\n"
+        )
+
+    def _dependencies(self) -> str:
+        rows = ["| Dependência | Versão | Uso |", "|---|---|---|"]
+        catalog = _PYTHON_DEPS + _DEV_DEPS
+        for index in range(self.shape.dependency_rows):
+            name, version = catalog[index % len(catalog)]
+            rows.append(f"| `{name}` | {version} | {self.random.choice(_FILLER_SENTENCES)} |")
+
+        toml = ["[tool.poetry.dependencies]", 'python = "^3.11"']
+        toml += [f'{name} = "^{version}"' for name, version in _PYTHON_DEPS]
+        toml += ["", "[tool.poetry.group.dev.dependencies]"]
+        toml += [f'{name} = "^{version}"' for name, version in _DEV_DEPS]
+
+        package = ",\n".join(f'    "{name}": "^{version}"' for name, version in _NODE_DEPS)
+        return (
+            self._heading("Stack Tecnológica e Dependências")
+            + "\n".join(rows) + "\n\n"
+            + "### `pyproject.toml` Proposto\n\n```toml\n" + "\n".join(toml) + "\n```\n\n"
+            + "### `package.json` Proposto\n\n```json\n{\n  \"dependencies\": {\n" + package + "\n  }\n}\n```\n\n"
+        )
+
+    def _ci_cd(self) -> str:
+        return (
+            self._heading("Estratégia de CI/CD")
+            + "O pipeline usa GitHub Actions: lint, testes, docker build e docker push antes do deploy.\n\n"
+            + "### `Dockerfile` Proposto\n\n```dockerfile\nFROM python:3.11-slim\nWORKDIR /app\n"
+            + "COPY pyproject.toml .\nRUN pip install poetry && poetry install --no-root\n"
+            + "COPY src/ .\nCMD [\"gunicorn\", \"iabank.wsgi\"]\n```\n\n"
+            + "Arquivos: `.github/workflows/main.yml`, `docker-compose.yml`, `.env.example`, "
+            + "`README.md`, `CHANGELOG.md`, `CONTRIBUTING.md`.\n\n"
+        )
+
+    def _filler(self) -> str:
+        parts = [self._heading(f"Seção Complementar {self._section + 1}")]
+        for _ in range(self.shape.paragraphs_per_section):
+            parts.append(" ".join(self.random.choice(_FILLER_SENTENCES) for _ in range(4)) + "\n\n")
+
+        # Blocos de código de preenchimento distribuídos entre as seções complementares
+        blocks = max(1, self.shape.code_blocks // max(1, self.shape.filler_sections))
+        for _ in range(blocks):
+            parts.append(self._filler_block())
+        return "".join(parts)
+
+    def _filler_block(self) -> str:
+        kind = self.random.choice(["typescript", "bash", "mermaid", "python"])
+        if kind == "typescript":
+            name = self.random.choice(_WORDS).capitalize()
+            body = f"interface {name}View {{\n  id: string;\n  amount: number;\n  status: '{name.upper()}';\n}}"
+        elif kind == "bash":
+            body = "docker-compose up -d\ndocker-compose exec backend python manage.py migrate\npytest -q"
+        elif kind == "mermaid":
+            a, b = self.random.sample(_WORDS, 2)
+            body = f"graph TD\n    {a.upper()}[{a}] -->|chama| {b.upper()}[{b}]"
+        else:
+            name = self.random.choice(_WORDS)
+            body = (f"# iabank/{self.random.choice(self.apps)}/services.py\n"
+                    f"def process_{name}(tenant_id: int, payload: dict) -> dict:\n"
+                    f"    return {{'status': 'ok', '{name}': payload}}")
+        return f"```{kind}\n{body}\n```\n\n"
+
+
+def generate_blueprint(shape: BlueprintShape) -> str:
+    """Markdown do Blueprint sintético para a forma informada."""
+    return SyntheticBlueprintGenerator(shape).generate()
+
+
+def write_blueprint(path: Union[str, Path], shape: BlueprintShape) -> Path:
+    """Grava o Blueprint sintético em disco."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(generate_blueprint(shape), encoding="utf-8")
+    return path
+
+
+def shape_summary(shape: BlueprintShape) -> Dict[str, Any]:
+    """Parâmetros da forma (para relatórios e baseline)."""
+    return asdict(shape)
@@ -2,13 +2,21 @@
 Core components for AGV validator generator system.
 """
 
-from .blueprint_parser import AdvancedBlueprintParser, ProjectSpecs
+from .blueprint_parser import AdvancedBlueprintParser, ProjectSpecs, LazyProjectSpecs
+from .blueprint_index import BlueprintIndex
+from .specs_cache import SpecsCache
+from .specs_codec import encode_specs, decode_specs
 from .base_generator import BaseGenerator
 from .validation_rules import ValidationRule
 
 __all__ = [
     'AdvancedBlueprintParser',
-    'ProjectSpecs', 
+    'ProjectSpecs',
+    'LazyProjectSpecs',
+    'BlueprintIndex',
+    'SpecsCache',
+    'encode_specs',
+    'decode_specs',
     'BaseGenerator',
     'ValidationRule'
 ]
\ No newline at end of file
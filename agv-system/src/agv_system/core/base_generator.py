@@ -5,10 +5,10 @@ Contém funcionalidades comuns e métodos utilitários reutilizáveis.
 """
 
 import re
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Union
 from abc import ABC, abstractmethod
 
-from .blueprint_parser import ProjectSpecs
+from .blueprint_parser import ProjectSpecs, flatten_directory_structure
 from .validation_rules import ValidationRule
 from .logging_config import get_logger
 from .metrics import get_metrics_collector
@@ -31,56 +31,36 @@ class BaseGenerator(ABC):
         """Método abstrato que cada gerador deve implementar."""
         pass
     
-    def _create_directory_validation_code(self, directory_structure: Dict[str, Any], prefix: str = "") -> str:
-        """Cria código para validação da estrutura de diretórios."""
-        validations = []
+    def _create_directory_validation_code(self, directory_structure: Union[Dict[str, Any], List[str]],
+                                          prefix: str = "") -> str:
+        """Cria código para validação da estrutura de diretórios.
         
-        def collect_validations(struct, current_path=""):
-            for name, content in struct.items():
-                full_path = f"{current_path}/{name}" if current_path else name
-                
-                if content is None:  # Arquivo
-                    validations.append(full_path)
-                elif isinstance(content, dict):  # Diretório
-                    validations.append(full_path + "/")
-                    collect_validations(content, full_path)
-        
-        collect_validations(directory_structure)
+        Aceita a árvore (dict) ou a lista plana de caminhos já calculada pelo parser
+        (ProjectSpecs.directory_paths).
+        """
+        if isinstance(directory_structure, dict):
+            validations = flatten_directory_structure(directory_structure)
+        else:
+            validations = list(directory_structure)
         
         return f"""
 def validate_directory_structure():
     '''Valida estrutura completa de diretórios conforme Blueprint.'''
-    import os
-    from pathlib import Path
-    
     issues = []
-    required_paths = {validations}
     
-    for required_path in required_paths:
+    for required_path in {validations}:
         path = Path(required_path)
-        
         if required_path.endswith('/'):
-            # Diretório
             if not path.is_dir():
-                issues.append(ValidationIssue(
-                    file_path=str(path),
-                    issue_type="missing_directory",
-                    description=f"Diretório obrigatório não encontrado: " + required_path,
-                    expected=f"Diretório " + required_path + " deve existir",
-                    actual="Diretório não existe",
-                    severity="HIGH"
-                ))
-        else:
-            # Arquivo
-            if not path.is_file():
-                issues.append(ValidationIssue(
-                    file_path=str(path),
-                    issue_type="missing_file",
-                    description=f"Arquivo obrigatório não encontrado: " + required_path,
-                    expected=f"Arquivo " + required_path + " deve existir",
-                    actual="Arquivo não existe",
-                    severity="MEDIUM"
+                issues.append(missing_file_issue(
+                    path, "missing_directory", "Diretório obrigatório não encontrado: " + required_path,
+                    "Diretório " + required_path + " deve existir", "HIGH", "Diretório não existe"
                 ))
+        elif not path.is_file():
+            issues.append(missing_file_issue(
+                path, "missing_file", "Arquivo obrigatório não encontrado: " + required_path,
+                "Arquivo " + required_path + " deve existir", "MEDIUM"
+            ))
     
     return issues if issues else None
 """
@@ -92,72 +72,49 @@ def validate_directory_structure():
         for validation in validations:
             if "INSTALLED_APPS" in validation:
                 validation_checks.append(f"""
-            # Verificar INSTALLED_APPS
-            if 'INSTALLED_APPS' in content:
-                for app in {self.specs.django_apps}:
-                    if app not in content:
-                        issues.append(ValidationIssue(
-                            file_path=file_path_str,
-                            issue_type="missing_installed_app",
-                            description=f"App " + app + " não encontrada em INSTALLED_APPS",
-                            expected=f"" + app + " deve estar em INSTALLED_APPS",
-                            actual="App não listada",
-                            severity="HIGH"
-                        ))""")
-            
+        if 'INSTALLED_APPS' in content:
+            issues.extend(issues_for_missing(
+                file_path_obj, content, {self.specs.django_apps}, "missing_installed_app",
+                "App {{item}} não encontrada em INSTALLED_APPS", "{{item}} deve estar em INSTALLED_APPS",
+                "App não listada", "HIGH"
+            ))""")
+
             elif "DATABASE" in validation and "PostgreSQL" in validation:
                 # Validação específica para scaffold: verificar estrutura de configuração
                 validation_checks.append("""
-            # Verificar configuracao PostgreSQL - SCAFFOLD: estrutura apenas
-            if 'DATABASES' in content:
-                # Para scaffold, verificar se usa django-environ ou tem estrutura PostgreSQL
-                if ('env.db()' not in content and 
-                    'postgresql' not in content.lower() and 
-                    'psycopg' not in content.lower()):
-                    issues.append(ValidationIssue(
-                        file_path=file_path_str,
-                        issue_type="wrong_database_config",
-                        description="Database não configurado para PostgreSQL",
-                        expected="ENGINE deve usar PostgreSQL (psycopg2) ou env.db()",
-                        actual="PostgreSQL não detectado",
-                        severity="HIGH"
-                    ))""")
-            
+        # SCAFFOLD: estrutura apenas (django-environ ou PostgreSQL declarado)
+        lowered = content.lower()
+        if 'DATABASES' in content and 'env.db()' not in content and \\
+                'postgresql' not in lowered and 'psycopg' not in lowered:
+            issues.append(ValidationIssue(
+                str(file_path_obj), "wrong_database_config", "Database não configurado para PostgreSQL",
+                "ENGINE deve usar PostgreSQL (psycopg2) ou env.db()", "PostgreSQL não detectado", "HIGH"
+            ))""")
+
             elif "REST_FRAMEWORK" in validation:
                 validation_checks.append("""
-            # Verificar configuracao DRF
-            if 'REST_FRAMEWORK' not in content:
-                issues.append(ValidationIssue(
-                    file_path=file_path_str,
-                    issue_type="missing_drf_config",
-                    description="Configuração REST_FRAMEWORK não encontrada",
-                    expected="REST_FRAMEWORK deve estar configurado",
-                    actual="Configuração ausente",
-                    severity="MEDIUM"
-                ))""")
-        
+        if 'REST_FRAMEWORK' not in content:
+            issues.append(ValidationIssue(
+                str(file_path_obj), "missing_drf_config", "Configuração REST_FRAMEWORK não encontrada",
+                "REST_FRAMEWORK deve estar configurado", "Configuração ausente", "MEDIUM"
+            ))""")
+
+        # Sem verificações de conteúdo a regra só confere a existência do arquivo
+        content_checks = f"""
+    for file_path_obj in file_paths:
+        content = read_project_file(file_path_obj){''.join(validation_checks)}
+""" if validation_checks else ""
+
         return f"""
 def validate_content_{re.sub(r'[^\w]', '_', file_path).strip('_')}():
     '''Valida conteúdo específico de {file_path}.'''
     issues = []
     
-    file_paths = list(Path('.').rglob('**/{file_path}'))
+    file_paths = glob_project('**/{file_path}')
     if not file_paths:
-        return ValidationIssue(
-            file_path="{file_path}",
-            issue_type="missing_file",
-            description="Arquivo {file_path} não encontrado",
-            expected="Arquivo deve existir",
-            actual="Arquivo não existe",
-            severity="HIGH"
-        )
-    
-    for file_path_obj in file_paths:
-        if file_path_obj.exists():
-            file_path_str = str(file_path_obj)
-            content = file_path_obj.read_text(encoding='utf-8', errors='ignore')
-            {''.join(validation_checks)}
-    
+        return missing_file_issue("{file_path}", "missing_file", "Arquivo {file_path} não encontrado",
+                                  "Arquivo deve existir", "HIGH")
+    {content_checks}
     return issues if issues else None
 """
 
@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+"""
+BlueprintIndex - Índice de passada única do Markdown do Blueprint AGV.
+Mapeia seções (headings), blocos de código cercados por linguagem e tokens inline
+para que os extractors do parser consultem apenas o trecho de que precisam.
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Pattern, Tuple, Union
+
+
+# Tokenizers pré-compilados aplicados uma única vez por linha
+_HEADING_RE = re.compile(r'^(#{1,6})[ \t]+(.*?)[ \t]*#*[ \t]*$')
+_FENCE_RE = re.compile(r'^[ \t]*(`{3,}|~{3,})[ \t]*([^`\s]*)[^`]*$')
+_INLINE_CODE_RE = re.compile(r'`([^`\n]+)`')
+
+# Versões em bytes para varrer o Blueprint mapeado em memória (modo streaming)
+_HEADING_BYTES_RE = re.compile(rb'(#{1,6})[ \t]')
+_FENCE_BYTES_RE = re.compile(rb'[ \t]*(`{3,}|~{3,})[ \t]*[^`\s]*[^`]*$')
+
+
+def _iter_lines(text: str):
+    """Linhas do texto (com a quebra final) sem materializar a lista inteira."""
+    offset, size = 0, len(text)
+    while offset < size:
+        newline = text.find('\n', offset)
+        end = size if newline == -1 else newline + 1
+        yield text[offset:end]
+        offset = end
+
+
+def _local_section(section_index: Optional[int], first_section: int) -> Optional[int]:
+    """Índice da seção relativo ao trecho que começa em first_section."""
+    # Seções abertas antes do trecho (ex: o título "# ...") não pertencem a ele
+    if section_index is None or section_index < first_section:
+        return None
+    return section_index - first_section
+
+
+@dataclass
+class Section:
+    """Seção do documento delimitada por um heading."""
+    level: int
+    title: str
+    start: int       # offset do início da linha do heading
+    body_start: int  # offset logo após a linha do heading
+    end: int         # offset do próximo heading de nível igual ou superior (ou EOF)
+    line: int        # número da linha do heading (1-based)
+
+
+@dataclass
+class CodeBlock:
+    """Bloco de código cercado (``` ou ~~~)."""
+    language: str
+    start: int          # offset da linha de abertura
+    content_start: int  # offset do início do conteúdo
+    content_end: int    # offset do fim do conteúdo (sem a quebra de linha final)
+    end: int            # offset logo após a linha de fechamento
+    line: int           # número da linha de abertura (1-based)
+    section: Optional[int] = None  # índice da seção mais interna que contém o bloco
+
+
+@dataclass
+class InlineToken:
+    """Trecho de código inline (`token`) fora de blocos cercados."""
+    text: str
+    start: int
+    section: Optional[int] = None
+
+
+@dataclass
+class BlueprintIndex:
+    """Índice construído em uma única passada sobre o texto do Blueprint."""
+    text: str
+    sections: List[Section] = field(default_factory=list)
+    code_blocks: List[CodeBlock] = field(default_factory=list)
+    inline_tokens: List[InlineToken] = field(default_factory=list)
+    _lower_text: Optional[str] = field(default=None, repr=False)
+    _blocks_by_language: Dict[str, List[CodeBlock]] = field(default_factory=dict, repr=False)
+
+    @classmethod
+    def build(cls, text: str) -> 'BlueprintIndex':
+        """Tokeniza o documento linha a linha, registrando seções, blocos e tokens."""
+        index = cls(text=text)
+        open_sections: List[int] = []  # pilha de índices de seções abertas
+        fence: Optional[str] = None    # marcador do bloco aberto (ex: "```")
+        block: Optional[CodeBlock] = None
+        offset = 0
+
+        for line_number, line in enumerate(_iter_lines(text), 1):
+            stripped = line.rstrip('\r\n')
+            current_section = open_sections[-1] if open_sections else None
+
+            if fence is not None:
+                # Dentro de bloco: só procura o fechamento (mesmo caractere, tamanho >= abertura)
+                candidate = stripped.strip()
+                if candidate and candidate[0] == fence[0] and candidate.startswith(fence) \
+                        and candidate == candidate[0] * len(candidate):
+                    block.content_end = max(block.content_start, offset - 1)
+                    block.end = offset + len(line)
+                    index.code_blocks.append(block)
+                    fence, block = None, None
+            else:
+                fence_match = _FENCE_RE.match(stripped)
+                heading_match = _HEADING_RE.match(stripped) if not fence_match else None
+
+                if fence_match:
+                    fence = fence_match.group(1)
+                    block = CodeBlock(
+                        language=fence_match.group(2).lower(),
+                        start=offset,
+                        content_start=offset + len(line),
+                        content_end=offset + len(line),
+                        end=offset + len(line),
+                        line=line_number,
+                        section=current_section
+                    )
+                elif heading_match:
+                    level = len(heading_match.group(1))
+                    # Fecha seções de nível igual ou mais profundo
+                    while open_sections and index.sections[open_sections[-1]].level >= level:
+                        index.sections[open_sections.pop()].end = offset
+                    index.sections.append(Section(
+                        level=level,
+                        title=heading_match.group(2),
+                        start=offset,
+                        body_start=offset + len(line),
+                        end=len(text),
+                        line=line_number
+                    ))
+                    open_sections.append(len(index.sections) - 1)
+                elif '`' in stripped:
+                    for token in _INLINE_CODE_RE.finditer(stripped):
+                        index.inline_tokens.append(InlineToken(
+                            text=token.group(1),
+                            start=offset + token.start(1),
+                            section=current_section
+                        ))
+
+            offset += len(line)
+
+        # Bloco sem fechamento vai até o fim do documento
+        if block is not None:
+            block.content_end = block.end = len(text)
+            index.code_blocks.append(block)
+
+        return index
+
+    def split(self, max_level: int = 2) -> List['BlueprintIndex']:
+        """Divide o documento em trechos iniciados por headings de nível <= max_level.
+
+        Cada trecho é um índice próprio (offsets relativos ao trecho). O texto antes do
+        primeiro heading forma um trecho separado. Headings dentro de blocos cercados não
+        são headings, então nenhum bloco é cortado entre dois trechos.
+        """
+        bounds = [0] + [s.start for s in self.sections if s.level <= max_level and s.start > 0]
+        bounds.append(len(self.text))
+
+        chunks: List[BlueprintIndex] = []
+        next_section = next_block = next_token = 0
+        for start, end in zip(bounds, bounds[1:]):
+            if end <= start:
+                continue
+            chunk = BlueprintIndex(text=self.text[start:end])
+            first_section = next_section
+
+            while next_section < len(self.sections) and self.sections[next_section].start < end:
+                section = self.sections[next_section]
+                chunk.sections.append(Section(
+                    level=section.level,
+                    title=section.title,
+                    start=section.start - start,
+                    body_start=section.body_start - start,
+                    end=min(section.end, end) - start,
+                    line=section.line
+                ))
+                next_section += 1
+
+            while next_block < len(self.code_blocks) and self.code_blocks[next_block].start < end:
+                block = self.code_blocks[next_block]
+                chunk.code_blocks.append(CodeBlock(
+                    language=block.language,
+                    start=block.start - start,
+                    content_start=block.content_start - start,
+                    content_end=block.content_end - start,
+                    end=block.end - start,
+                    line=block.line,
+                    section=_local_section(block.section, first_section)
+                ))
+                next_block += 1
+
+            while next_token < len(self.inline_tokens) and self.inline_tokens[next_token].start < end:
+                token = self.inline_tokens[next_token]
+                chunk.inline_tokens.append(InlineToken(
+                    text=token.text,
+                    start=token.start - start,
+                    section=_local_section(token.section, first_section)
+                ))
+                next_token += 1
+
+            chunks.append(chunk)
+
+        return chunks
+
+    @staticmethod
+    def section_offsets(buffer, max_level: int = 2) -> List[Tuple[int, int]]:
+        """Intervalos em bytes dos trechos de topo de um buffer (bytes ou mmap).
+
+        Mesma divisão de split(), porém sem decodificar o documento: percorre as linhas
+        do buffer procurando headings de nível <= max_level fora de blocos cercados.
+        """
+        size = len(buffer)
+        bounds = [0]
+        fence: Optional[bytes] = None
+        offset = 0
+
+        while offset < size:
+            newline = buffer.find(b'\n', offset)
+            line_end = size if newline == -1 else newline
+            line = buffer[offset:line_end].rstrip(b'\r')
+
+            if fence is not None:
+                candidate = line.strip()
+                if candidate[:1] == fence[:1] and candidate.startswith(fence) \
+                        and candidate == candidate[:1] * len(candidate):
+                    fence = None
+            else:
+                fence_match = _FENCE_BYTES_RE.match(line)
+                if fence_match:
+                    fence = fence_match.group(1)
+                else:
+                    heading_match = _HEADING_BYTES_RE.match(line)
+                    if heading_match and len(heading_match.group(1)) <= max_level and offset > 0:
+                        bounds.append(offset)
+
+            offset = line_end + 1
+
+        bounds.append(size)
+        return [(start, end) for start, end in zip(bounds, bounds[1:]) if end > start]
+
+    @property
+    def lower_text(self) -> str:
+        """Cópia em minúsculas do documento, criada sob demanda uma única vez."""
+        if self._lower_text is None:
+            self._lower_text = self.text.lower()
+        return self._lower_text
+
+    def contains(self, literal: str) -> bool:
+        """Busca case-insensitive de texto literal (sem regex)."""
+        return literal.lower() in self.lower_text
+
+    def blocks(self, language: Optional[str] = None) -> List[CodeBlock]:
+        """Blocos de código, opcionalmente filtrados por linguagem ('' = sem linguagem)."""
+        if language is None:
+            return self.code_blocks
+        language = language.lower()
+        if language not in self._blocks_by_language:
+            self._blocks_by_language[language] = [b for b in self.code_blocks if b.language == language]
+        return self._blocks_by_language[language]
+
+    def block_content(self, block: CodeBlock) -> str:
+        """Conteúdo de um bloco de código."""
+        return self.text[block.content_start:block.content_end]
+
+    def find_section(self, title_pattern: Union[str, Pattern]) -> Optional[Section]:
+        """Primeira seção cujo título casa com o padrão (case-insensitive)."""
+        pattern = re.compile(title_pattern, re.IGNORECASE) if isinstance(title_pattern, str) else title_pattern
+        for section in self.sections:
+            if pattern.search(section.title):
+                return section
+        return None
+
+    def section_text(self, section: Section) -> str:
+        """Corpo da seção (sem a linha do heading)."""
+        return self.text[section.body_start:section.end]
+
+    def heading_line(self, section: Section) -> str:
+        """Linha original do heading da seção."""
+        return self.text[section.start:section.body_start].rstrip('\r\n')
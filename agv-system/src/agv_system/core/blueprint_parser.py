@@ -4,10 +4,165 @@ AdvancedBlueprintParser - Parser inteligente para extrair especificações do Bl
 Componente core reutilizável para todos os geradores de validação.
 """
 
+import os
 import re
+import sys
+import ast
+import mmap
+import hashlib
+import textwrap
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
 from pathlib import Path
-from typing import Dict, List, Any
-from dataclasses import dataclass
+from typing import Callable, Dict, Iterator, List, Any, Optional, Pattern, Tuple, Union
+from dataclasses import dataclass, field, fields
+
+from .blueprint_index import BlueprintIndex
+
+
+# Versão do formato de ProjectSpecs produzido pelo parser. Incrementar sempre que
+# campos de ProjectSpecs ou a lógica dos extractors mudarem, invalidando caches persistidos.
+PARSER_SCHEMA_VERSION = 5
+
+
+# Padrões pré-compilados usados pelos extractors
+_TITLE_RE = re.compile(r'^#\s*(.+?)(?:\s*\(.*?\))?$')
+_DESCRIPTION_PATTERNS = [
+    re.compile(r'Este documento define.*?para o (.+?)\.', re.IGNORECASE),
+    re.compile(r'O (.+?) é uma plataforma', re.IGNORECASE),
+    re.compile(r'Sistema de (.+?) moderno', re.IGNORECASE),
+]
+_DJANGO_VERSION_RE = re.compile(r'django["\s]*=?\s*["\^~]*([0-9.]+)', re.IGNORECASE)
+_REACT_VERSION_RE = re.compile(r'"react":\s*"[\^~]*([0-9.]+)"', re.IGNORECASE)
+_STRUCTURE_SECTION_RE = re.compile(r'^7\. Estrutura de Diretórios Proposta', re.IGNORECASE)
+_TOML_DEP_RE = re.compile(r'(\w[\w-]*)\s*=\s*["\^~]*([0-9.]+)')
+_TEXT_DEP_RE = re.compile(r'([a-z][\w-]+)\s*[=:]\s*["\^~]*([0-9.]+)')
+_PACKAGE_DEPS_RE = re.compile(r'"dependencies":\s*{([^}]+)}')
+_NODE_DEP_RE = re.compile(r'"([^"]+)":\s*"[\^~]*([0-9.]+)"')
+_API_VERSION_RE = re.compile(r'api/v\d+', re.IGNORECASE)
+
+# Headings de nível <= 2 delimitam as seções de topo usadas no re-parsing incremental
+TOP_LEVEL_HEADING = 2
+
+_VALID_PYTHON_DEPS = {
+    'django', 'djangorestframework', 'psycopg2-binary', 'django-environ',
+    'celery', 'redis', 'gunicorn', 'structlog', 'django-filter',
+    'djangorestframework-simplejwt', 'pytest', 'pytest-django',
+    'factory-boy', 'pytest-cov', 'black', 'ruff', 'pre-commit'
+}
+_CI_CD_PATTERNS = [
+    "github actions", "gitlab ci", "jenkins",
+    "docker build", "docker push", "deploy"
+]
+_MULTI_TENANT_INDICATORS = [
+    'multi-tenant', 'tenant', 'BaseTenantModel', 'tenant_id'
+]
+
+# Extração de modelos via ast
+_TOP_LEVEL_CLASS_RE = re.compile(r'^(?=class\s)', re.MULTILINE)
+_RELATION_FIELDS = {
+    'ForeignKey': 'foreign_key',
+    'OneToOneField': 'one_to_one',
+    'ManyToManyField': 'many_to_many'
+}
+_DJANGO_MODEL_BASES = {'AbstractUser', 'AbstractBaseUser', 'PermissionsMixin'}
+
+# Apps Django: listas backend_apps, INSTALLED_APPS e diretórios do pacote do projeto
+_BACKEND_APPS_RE = re.compile(r'backend_apps.*?\[([^\]]+)\]', re.DOTALL)
+_INSTALLED_APPS_RE = re.compile(r'INSTALLED_APPS\s*\+?=\s*[\[(]([^\])]*)[\])]')
+_INSTALLED_APP_ENTRY_RE = re.compile(r"""['"]([\w.]+)['"]""")
+_PROJECT_APP_DIR_RE = re.compile(r'iabank/(\w+)/')
+_KNOWN_DJANGO_APPS = {'core', 'users', 'customers', 'operations', 'finance'}
+_QUOTED_NAME_RE = re.compile(r"'(\w+)'")
+
+# Árvore de diretórios: prefixo de indentação/símbolos + nome; nomes só com [\w-./]
+_TREE_LINE_RE = re.compile(r'([\s├└│─]*)(.*)')
+_TREE_NAME_RE = re.compile(r'[\w\-./]*')
+_TREE_INVALID_CHARS_RE = re.compile(r'[^\w\-._/]')
+
+_CONFIG_FILE_PATTERNS = [
+    r'\.env(?:\.example)?', r'pyproject\.toml', r'requirements\.txt',
+    r'package\.json', r'package-lock\.json', r'yarn\.lock', r'pnpm-lock\.yaml',
+    r'tsconfig\.json', r'vite\.config\.[jt]s', r'tailwind\.config\.[jt]s',
+    r'settings\.py', r'config\.py', r'wsgi\.py', r'asgi\.py',
+    r'\.gitignore', r'\.pre-commit-config\.yaml',
+    r'docker-compose\.ya?ml', r'Dockerfile', r'\.dockerignore',
+    r'\.github/workflows/.*\.ya?ml'
+]
+_DOC_FILE_PATTERNS = [
+    r'README\.md', r'CHANGELOG\.md', r'CONTRIBUTING\.md',
+    r'LICENSE', r'docs/', r'\.md'
+]
+_DOCKER_FILE_PATTERNS = [
+    r'Dockerfile', r'docker-compose\.ya?ml',
+    r'\.dockerignore'
+]
+
+
+def _build_mention_matcher(pattern: str) -> Union[str, Pattern]:
+    """Padrões sem metacaracteres viram busca literal; os demais, regex pré-compilada."""
+    if re.search(r'[.\[\]()?*+{}|^$]', re.sub(r'\\.', '', pattern)):
+        return re.compile(pattern, re.IGNORECASE)
+    return re.sub(r'\\(.)', r'\1', pattern)
+
+
+_MENTION_MATCHERS = {
+    pattern: _build_mention_matcher(pattern)
+    for pattern in (*_CONFIG_FILE_PATTERNS, *_DOC_FILE_PATTERNS, *_DOCKER_FILE_PATTERNS)
+}
+
+
+def _dotted_name(node: ast.AST) -> str:
+    """Nome pontuado de uma expressão (ex: models.Model); '' se não for Name/Attribute."""
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        parent = _dotted_name(node.value)
+        return f"{parent}.{node.attr}" if parent else ""
+    return ""
+
+
+def _literal_value(node: ast.AST) -> Any:
+    """Valor literal serializável em JSON; expressões não literais viram código-fonte."""
+    try:
+        value = ast.literal_eval(node)
+    except (ValueError, TypeError, SyntaxError, MemoryError, RecursionError):
+        return ast.unparse(node)
+    if isinstance(value, (tuple, set, frozenset)):
+        return list(value)
+    if isinstance(value, (str, int, float, bool, list, dict)) or value is None:
+        return value
+    return ast.unparse(node)
+
+
+def _relation_target(call: ast.Call) -> str:
+    """Modelo alvo de ForeignKey/OneToOneField/ManyToManyField (posicional ou 'to=')."""
+    target = call.args[0] if call.args else next(
+        (keyword.value for keyword in call.keywords if keyword.arg == 'to'), None
+    )
+    if isinstance(target, ast.Constant) and isinstance(target.value, str):
+        return target.value
+    return _dotted_name(target) if target is not None else ""
+
+
+def flatten_directory_structure(structure: Dict[str, Any]) -> List[str]:
+    """Caminhos da árvore em pré-ordem; diretórios terminam com '/'."""
+    paths: List[str] = []
+    stack = [("", iter(structure.items()))]
+    while stack:
+        prefix, entries = stack[-1]
+        for name, content in entries:
+            full_path = f"{prefix}/{name}" if prefix else name
+            if content is None:  # Arquivo
+                paths.append(full_path)
+            elif isinstance(content, dict):  # Diretório: visita os filhos antes dos irmãos
+                paths.append(full_path + "/")
+                stack.append((full_path, iter(content.items())))
+                break
+        else:
+            stack.pop()
+    return paths
 
 
 @dataclass
@@ -37,15 +192,157 @@ class ProjectSpecs:
     base_model_class: str
     specific_dependencies: Dict[str, str]  # nome -> versão
     file_content_validations: Dict[str, List[str]]  # arquivo -> validações
+    # Caminhos da árvore em pré-ordem (diretórios terminam com '/')
+    directory_paths: List[str] = field(default_factory=list)
+
+
+_SPECS_FIELD_NAMES = tuple(spec_field.name for spec_field in fields(ProjectSpecs))
+
+
+class LazyProjectSpecs(ProjectSpecs):
+    """ProjectSpecs cujos campos são extraídos no primeiro acesso e memorizados.
+    
+    Mantém a interface de dataclass (fields, asdict, ==, repr): acessar um campo executa
+    apenas os extractors que o produzem. Pickle e deepcopy geram um ProjectSpecs comum.
+    """
+    
+    def __init__(self, resolver: Callable[[str], None]):
+        self.__dict__['_resolver'] = resolver
+    
+    def __getattr__(self, name: str) -> Any:
+        # Chamado apenas para atributos ainda não definidos, ou seja, campos não extraídos
+        if name in _SPECS_FIELD_NAMES:
+            self._resolver(name)
+            return self.__dict__[name]
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+    
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, ProjectSpecs):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in _SPECS_FIELD_NAMES)
+    
+    def __reduce__(self):
+        return ProjectSpecs, tuple(getattr(self, name) for name in _SPECS_FIELD_NAMES)
+    
+    @property
+    def resolved_fields(self) -> List[str]:
+        """Campos já extraídos."""
+        return [name for name in _SPECS_FIELD_NAMES if name in self.__dict__]
+    
+    def materialize(self) -> ProjectSpecs:
+        """Extrai os campos restantes e retorna um ProjectSpecs comum."""
+        return ProjectSpecs(**{name: getattr(self, name) for name in _SPECS_FIELD_NAMES})
+
+
+@dataclass(frozen=True)
+class ExtractorSpec:
+    """Declaração de um extractor do parser.
+
+    scope:
+        section  - `_scan_<name>(trecho)` roda por seção de topo e `_merge_<name>(parciais)`
+                   combina os resultados em ordem de documento; parciais são reaproveitadas
+                   enquanto o hash da seção não muda
+        document - `_extract_<name>()` lê o documento inteiro
+        specs    - `_extract_<name>()` lê apenas campos já extraídos de ProjectSpecs
+
+    requires: campos de ProjectSpecs lidos pelo extractor; precisam ser produzidos por
+    extractors declarados antes dele. Em extractors de seção, apenas `_merge_<name>` pode
+    lê-los: `_scan_<name>` roda antes das ondas (streaming) e seu resultado é cacheado
+    pelo hash da seção.
+    """
+    name: str
+    fields: Tuple[str, ...]
+    scope: str = "section"
+    requires: Tuple[str, ...] = ()
+
+
+# Ordem de declaração = ordem de merge em ProjectSpecs
+EXTRACTORS: Tuple[ExtractorSpec, ...] = (
+    ExtractorSpec("project_info", ("project_name", "project_description")),
+    ExtractorSpec("technology_stack", ("backend_framework", "frontend_framework", "database",
+                                       "architecture_type", "specific_dependencies")),
+    ExtractorSpec("directory_structure", ("directory_structure", "directory_paths")),
+    ExtractorSpec("configuration_files", ("configuration_files",)),
+    ExtractorSpec("documentation_files", ("documentation_files",)),
+    ExtractorSpec("dependencies", ("dependencies", "specific_dependencies")),
+    ExtractorSpec("models", ("models", "model_relationships")),
+    ExtractorSpec("django_apps", ("django_apps",), requires=("directory_paths",)),
+    ExtractorSpec("api_patterns", ("api_patterns",)),
+    ExtractorSpec("testing_info", ("testing_framework",)),
+    ExtractorSpec("ci_cd_info", ("ci_cd_pipeline",)),
+    ExtractorSpec("docker_files", ("docker_files",)),
+    ExtractorSpec("authentication", ("authentication_method",)),
+    ExtractorSpec("multi_tenancy", ("multi_tenancy", "base_model_class")),
+    ExtractorSpec("file_content_validations", ("file_content_validations",), scope="specs",
+                  requires=("multi_tenancy",)),
+)
+
+
+def _extractor_waves(extractors: Tuple[ExtractorSpec, ...]) -> List[List[ExtractorSpec]]:
+    """Agrupa extractors em ondas: cada onda depende apenas de campos das ondas anteriores."""
+    wave_of: Dict[str, int] = {}
+    produced_by: Dict[str, List[str]] = {}
+    for extractor in extractors:
+        for required in extractor.requires:
+            if required not in produced_by:
+                raise ValueError(f"Extractor {extractor.name} requer '{required}', "
+                                 f"não produzido por extractors declarados antes dele")
+        wave_of[extractor.name] = 1 + max(
+            (wave_of[producer] for required in extractor.requires for producer in produced_by[required]),
+            default=-1
+        )
+        for field_name in extractor.fields:
+            produced_by.setdefault(field_name, []).append(extractor.name)
+
+    waves: List[List[ExtractorSpec]] = [[] for _ in range(max(wave_of.values(), default=-1) + 1)]
+    for extractor in extractors:
+        waves[wave_of[extractor.name]].append(extractor)
+    return waves
+
+
+EXTRACTOR_WAVES = _extractor_waves(EXTRACTORS)
+
+# Execução concorrente dos extractors compensa apenas sem GIL e em Blueprints grandes
+_FREE_THREADED = not getattr(sys, '_is_gil_enabled', lambda: True)()
+PARALLEL_MIN_BYTES = 64 * 1024
+
+# A partir deste tamanho o Blueprint é mapeado em memória e decodificado seção a seção
+STREAMING_MIN_BYTES = 4 * 1024 * 1024
 
 
 class AdvancedBlueprintParser:
     """Parser inteligente e profundo para extrair especificações complexas."""
     
-    def __init__(self, blueprint_path: str):
+    def __init__(self, blueprint_path: str, parallel: Optional[bool] = None,
+                 max_workers: Optional[int] = None, streaming: Optional[bool] = None):
         self.blueprint_path = Path(blueprint_path)
-        self.content = self._read_blueprint()
-        self.specs = ProjectSpecs(
+        if not self.blueprint_path.exists():
+            raise FileNotFoundError(f"Blueprint não encontrado: {self.blueprint_path}")
+        size = self.blueprint_path.stat().st_size
+        
+        # Modo streaming: nada é decodificado aqui; parse() mapeia o arquivo e lê seção a seção
+        self.streaming = streaming if streaming is not None else size >= STREAMING_MIN_BYTES
+        self._content: Optional[str] = None
+        self._buffer: Optional[mmap.mmap] = None
+        self.index: Optional[BlueprintIndex] = None
+        if not self.streaming:
+            self._content = self._read_blueprint()
+            self.index = BlueprintIndex.build(self._content)
+        
+        # None = automático: threads apenas em builds free-threaded e Blueprints grandes
+        self.parallel = parallel if parallel is not None else (
+            _FREE_THREADED and size >= PARALLEL_MIN_BYTES
+        )
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.specs = self._empty_specs()
+        # extractor -> {hash da seção: resultado parcial}; persistido para o próximo parsing
+        self.section_results: Dict[str, Dict[str, Any]] = {}
+        self.parse_stats: Dict[str, int] = {}
+    
+    @staticmethod
+    def _empty_specs() -> ProjectSpecs:
+        """ProjectSpecs com todos os campos vazios."""
+        return ProjectSpecs(
             project_name="",
             project_description="",
             backend_framework="",
@@ -68,7 +365,8 @@ class AdvancedBlueprintParser:
             multi_tenancy=False,
             base_model_class="",
             specific_dependencies={},
-            file_content_validations={}
+            file_content_validations={},
+            directory_paths=[]
         )
     
     def _read_blueprint(self) -> str:
@@ -78,91 +376,452 @@ class AdvancedBlueprintParser:
         
         return self.blueprint_path.read_text(encoding='utf-8')
     
-    def parse(self) -> ProjectSpecs:
-        """Faz o parsing completo e profundo do Blueprint."""
-        self._extract_project_info()
-        self._extract_technology_stack()
-        self._extract_directory_structure()
-        self._extract_configuration_files()
-        self._extract_documentation_files()
-        self._extract_dependencies()
-        self._extract_models_deep()
-        self._extract_django_apps()
-        self._extract_api_patterns()
-        self._extract_testing_info()
-        self._extract_ci_cd_info()
-        self._extract_docker_files()
-        self._extract_authentication()
-        self._extract_multi_tenancy()
-        self._extract_file_content_validations()
+    @property
+    def content(self) -> str:
+        """Texto completo do Blueprint (no modo streaming, decodificado apenas se acessado)."""
+        if self._content is None:
+            self._content = self._read_blueprint()
+        return self._content
+    
+    def _document(self) -> Union[str, mmap.mmap]:
+        """Documento para extractors de escopo 'document': texto ou o mmap durante o streaming."""
+        return self._buffer if self._buffer is not None else self.content
+    
+    @staticmethod
+    def _decode_section(raw: bytes) -> str:
+        """Decodifica uma seção com a mesma normalização de quebras de linha de read_text."""
+        return raw.decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
+    
+    @staticmethod
+    def _mentions(chunk: BlueprintIndex, pattern: str) -> bool:
+        """Verifica (case-insensitive) se o trecho menciona o padrão de arquivo."""
+        matcher = _MENTION_MATCHERS[pattern]
+        if isinstance(matcher, str):
+            return chunk.contains(matcher)
+        return matcher.search(chunk.text) is not None
+    
+    @staticmethod
+    def _literals_found(chunk: BlueprintIndex, literals: List[str]) -> List[str]:
+        """Literais (case-insensitive) presentes no trecho, na ordem informada."""
+        return [literal for literal in literals if chunk.contains(literal)]
+    
+    def parse(self, previous_results: Optional[Dict[str, Dict[str, Any]]] = None,
+              lazy: bool = False) -> ProjectSpecs:
+        """Faz o parsing completo e profundo do Blueprint.
+        
+        Extractors da mesma onda (sem dependência entre si) podem rodar em paralelo; as
+        contribuições são sempre aplicadas na ordem de declaração de EXTRACTORS, então o
+        resultado independe da ordem de conclusão.
+        
+        Args:
+            previous_results: section_results de um parsing anterior do mesmo Blueprint.
+                Extractors de seção só reprocessam seções cujo hash não está nele.
+            lazy: retorna LazyProjectSpecs; cada campo é extraído apenas quando lido.
+        """
+        previous_results = previous_results or {}
+        self.section_results = {}
+        self.parse_stats = {'sections': 0, 'scanned': 0, 'reused': 0}
+        
+        if lazy:
+            return self._lazy_parse(previous_results)
+        
+        if self.streaming:
+            with self._mapped() as buffer:
+                hashes, precomputed = self._stream_sections(buffer, previous_results, EXTRACTORS)
+                return self._parse_sections([None] * len(hashes), hashes, previous_results, precomputed)
         
+        chunks, hashes = self._split_sections()
+        return self._parse_sections(chunks, hashes, previous_results, {})
+    
+    def _split_sections(self) -> Tuple[List[BlueprintIndex], List[str]]:
+        """Seções de topo do índice e seus hashes."""
+        chunks = self.index.split(TOP_LEVEL_HEADING)
+        return chunks, [hashlib.sha1(chunk.text.encode('utf-8')).hexdigest() for chunk in chunks]
+    
+    @contextmanager
+    def _mapped(self) -> Iterator[Optional[mmap.mmap]]:
+        """Mapeia o Blueprint em memória durante o bloco (None para arquivo vazio); reentrante."""
+        if self._buffer is not None:
+            yield self._buffer
+            return
+        
+        with open(self.blueprint_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                yield None
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                self._buffer = buffer
+                try:
+                    yield buffer
+                finally:
+                    self._buffer = None
+    
+    def _lazy_parse(self, previous_results: Dict[str, Dict[str, Any]]) -> LazyProjectSpecs:
+        """Prepara LazyProjectSpecs; extractors rodam no primeiro acesso aos seus campos."""
+        self._lazy_previous = previous_results
+        self._lazy_contributions: Dict[str, Dict[str, Any]] = {}
+        self._lazy_lock = threading.RLock()
+        self._lazy_sections = None if self.streaming else self._split_sections()
+        if self._lazy_sections is not None:
+            self.parse_stats['sections'] = len(self._lazy_sections[1])
+        
+        # Extractors de escopo 'specs' leem self.specs e resolvem suas dependências sob demanda
+        self.specs = LazyProjectSpecs(self._resolve_field)
         return self.specs
     
-    def _extract_project_info(self):
-        """Extrai informações básicas do projeto."""
-        # Nome do projeto
-        title_match = re.search(r'^#\s*(.+?)(?:\s*\(.*?\))?$', self.content, re.MULTILINE)
-        if title_match:
-            self.specs.project_name = title_match.group(1).strip().replace(":", " -")
-        
-        # Descrição mais precisa
-        desc_patterns = [
-            r'Este documento define.*?para o (.+?)\.', 
-            r'O (.+?) é uma plataforma',
-            r'Sistema de (.+?) moderno'
-        ]
+    def _resolve_field(self, field_name: str):
+        """Executa os extractors pendentes que produzem o campo e memoriza os campos completos."""
+        with self._lazy_lock:
+            specs = self.specs
+            if field_name in specs.__dict__:
+                return
+            
+            pending = [extractor for extractor in EXTRACTORS
+                       if field_name in extractor.fields and extractor.name not in self._lazy_contributions]
+            with (self._mapped() if self.streaming else nullcontext()) as buffer:
+                if self._lazy_sections is not None:
+                    chunks, hashes = self._lazy_sections
+                    precomputed: Dict[str, Dict[str, Any]] = {}
+                else:
+                    hashes, precomputed = self._stream_sections(buffer, self._lazy_previous, pending)
+                    chunks = [None] * len(hashes)
+                    self.parse_stats['sections'] = len(hashes)
+                
+                for extractor in pending:
+                    contribution, results, scanned, reused = self._run_extractor(
+                        extractor, chunks, hashes, self._lazy_previous.get(extractor.name, {}),
+                        precomputed.get(extractor.name, {})
+                    )
+                    self._lazy_contributions[extractor.name] = contribution
+                    if results is not None:
+                        self.section_results[extractor.name] = results
+                    self.parse_stats['scanned'] += scanned
+                    self.parse_stats['reused'] += reused
+            
+            # Campos cujos produtores já rodaram todos ficam memorizados
+            merged = self._merged_specs(self._lazy_contributions)
+            for extractor in EXTRACTORS:
+                for produced in extractor.fields:
+                    if produced not in specs.__dict__ and all(
+                        other.name in self._lazy_contributions
+                        for other in EXTRACTORS if produced in other.fields
+                    ):
+                        specs.__dict__[produced] = getattr(merged, produced)
+            
+            # backend_apps não tem extractor: permanece vazio
+            for name in _SPECS_FIELD_NAMES:
+                if name not in specs.__dict__ and not any(name in e.fields for e in EXTRACTORS):
+                    specs.__dict__[name] = getattr(merged, name)
+    
+    def _stream_sections(self, buffer: Optional[mmap.mmap], previous_results: Dict[str, Dict[str, Any]],
+                         extractors: Tuple[ExtractorSpec, ...]) -> Tuple[List[str], Dict[str, Dict[str, Any]]]:
+        """Decodifica uma seção de topo por vez e roda nela os extractors de seção informados.
+        
+        Apenas a seção corrente fica decodificada em memória; seções cujo hash já tem
+        resultados em previous_results nem chegam a ser indexadas.
+        """
+        section_extractors = [extractor for extractor in extractors if extractor.scope == "section"]
+        hashes: List[str] = []
+        precomputed: Dict[str, Dict[str, Any]] = {extractor.name: {} for extractor in section_extractors}
+        if buffer is None:
+            return hashes, precomputed
+        
+        for start, end in BlueprintIndex.section_offsets(buffer, TOP_LEVEL_HEADING):
+            if buffer.find(b'\r', start, end) == -1:
+                # Sem '\r' o texto decodificado reencoda nos mesmos bytes: hash direto do mmap
+                with memoryview(buffer)[start:end] as raw:
+                    digest = hashlib.sha1(raw).hexdigest()
+                    text = str(raw, 'utf-8')
+            else:
+                text = self._decode_section(buffer[start:end])
+                digest = hashlib.sha1(text.encode('utf-8')).hexdigest()
+            hashes.append(digest)
+            
+            pending = [extractor for extractor in section_extractors
+                       if digest not in previous_results.get(extractor.name, {})
+                       and digest not in precomputed[extractor.name]]
+            if not pending:
+                continue
+            
+            chunk = BlueprintIndex.build(text)
+            for extractor in pending:
+                precomputed[extractor.name][digest] = getattr(self, f"_scan_{extractor.name}")(chunk)
+        
+        return hashes, precomputed
+    
+    def _parse_sections(self, chunks: List[Optional[BlueprintIndex]], hashes: List[str],
+                        previous_results: Dict[str, Dict[str, Any]],
+                        precomputed: Dict[str, Dict[str, Any]]) -> ProjectSpecs:
+        """Executa as ondas de extractors sobre as seções já hasheadas."""
+        self.parse_stats['sections'] = len(hashes)
+        contributions: Dict[str, Dict[str, Any]] = {}
+        
+        for wave in EXTRACTOR_WAVES:
+            # Extractors da onda leem campos produzidos pelas ondas anteriores
+            self.specs = self._merged_specs(contributions)
+            tasks = [(extractor, chunks, hashes, previous_results.get(extractor.name, {}),
+                      precomputed.get(extractor.name, {}))
+                     for extractor in wave]
+            
+            if self.parallel and len(tasks) > 1:
+                with ThreadPoolExecutor(max_workers=min(self.max_workers, len(tasks))) as executor:
+                    outcomes = list(executor.map(lambda task: self._run_extractor(*task), tasks))
+            else:
+                outcomes = [self._run_extractor(*task) for task in tasks]
+            
+            for extractor, (contribution, results, scanned, reused) in zip(wave, outcomes):
+                contributions[extractor.name] = contribution
+                if results is not None:
+                    self.section_results[extractor.name] = results
+                self.parse_stats['scanned'] += scanned
+                self.parse_stats['reused'] += reused
+        
+        self.specs = self._merged_specs(contributions)
+        return self.specs
+    
+    def _run_extractor(self, extractor: ExtractorSpec, chunks: List[Optional[BlueprintIndex]],
+                       hashes: List[str], cached: Dict[str, Any], precomputed: Dict[str, Any]
+                       ) -> Tuple[Dict[str, Any], Optional[Dict[str, Any]], int, int]:
+        """Executa um extractor; retorna (contribuição, resultados por seção, escaneadas, reaproveitadas)."""
+        if extractor.scope != "section":
+            return getattr(self, f"_extract_{extractor.name}")(), None, 0, 0
+        
+        results: Dict[str, Any] = {}
+        scanned = reused = 0
+        scan = getattr(self, f"_scan_{extractor.name}")
+        for chunk, digest in zip(chunks, hashes):
+            if digest in results:
+                continue
+            if digest in precomputed:
+                results[digest] = precomputed[digest]
+                scanned += 1
+            elif digest in cached:
+                results[digest] = cached[digest]
+                reused += 1
+            else:
+                results[digest] = scan(chunk)
+                scanned += 1
+        
+        contribution = getattr(self, f"_merge_{extractor.name}")([results[digest] for digest in hashes])
+        return contribution, results, scanned, reused
+    
+    def _merged_specs(self, contributions: Dict[str, Dict[str, Any]]) -> ProjectSpecs:
+        """Aplica as contribuições disponíveis na ordem de declaração (dicts são mesclados)."""
+        specs = self._empty_specs()
+        for extractor in EXTRACTORS:
+            for field_name, value in contributions.get(extractor.name, {}).items():
+                current = getattr(specs, field_name)
+                if isinstance(current, dict) and isinstance(value, dict):
+                    current.update(value)
+                else:
+                    setattr(specs, field_name, value)
+        return specs
+    
+    def _scan_project_info(self, chunk: BlueprintIndex) -> Dict[str, Any]:
+        """Primeiro heading do trecho e primeira ocorrência de cada padrão de descrição."""
+        title = None
+        if chunk.sections:
+            title_match = _TITLE_RE.match(chunk.heading_line(chunk.sections[0]))
+            title = title_match.group(1).strip().replace(":", " -") if title_match else ""
+        
+        descriptions = []
+        for pattern in _DESCRIPTION_PATTERNS:
+            match = pattern.search(chunk.text)
+            descriptions.append(match.group(1).strip() if match else None)
         
-        for pattern in desc_patterns:
-            match = re.search(pattern, self.content, re.IGNORECASE)
-            if match:
-                self.specs.project_description = match.group(1).strip()
+        return {'title': title, 'descriptions': descriptions}
+    
+    def _merge_project_info(self, partials: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Nome do projeto (primeiro heading do documento) e descrição mais precisa."""
+        contributions = {}
+        title = next((p['title'] for p in partials if p['title'] is not None), "")
+        if title:
+            contributions['project_name'] = title
+        
+        for position in range(len(_DESCRIPTION_PATTERNS)):
+            description = next((p['descriptions'][position] for p in partials
+                                if p['descriptions'][position] is not None), None)
+            if description is not None:
+                contributions['project_description'] = description
                 break
+        
+        return contributions
     
-    def _extract_technology_stack(self):
+    def _scan_technology_stack(self, chunk: BlueprintIndex) -> Dict[str, Any]:
+        """Versões e menções de frameworks no trecho."""
+        django_match = _DJANGO_VERSION_RE.search(chunk.text)
+        react_match = _REACT_VERSION_RE.search(chunk.text)
+        return {
+            'django_version': django_match.group(1) if django_match else None,
+            'react_version': react_match.group(1) if react_match else None,
+            'mentions': [name for name in ('Django', 'React') if name in chunk.text],
+            'found': self._literals_found(chunk, ['postgresql', 'monolito', 'monolith'])
+        }
+    
+    def _merge_technology_stack(self, partials: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Extrai stack tecnológica com detalhes específicos."""
-        # Backend framework com versões
-        django_match = re.search(r'django["\s]*=?\s*["\^~]*([0-9.]+)', self.content, re.IGNORECASE)
-        if django_match or 'Django' in self.content:
-            self.specs.backend_framework = "django"
-            if django_match:
-                self.specs.specific_dependencies["django"] = django_match.group(1)
-        
-        # Frontend framework com versões  
-        react_match = re.search(r'"react":\s*"[\^~]*([0-9.]+)"', self.content, re.IGNORECASE)
-        if react_match or 'React' in self.content:
-            self.specs.frontend_framework = "react"
-            if react_match:
-                self.specs.specific_dependencies["react"] = react_match.group(1)
+        contributions: Dict[str, Any] = {'specific_dependencies': {}}
+        mentions = {name for p in partials for name in p['mentions']}
+        found = {literal for p in partials for literal in p['found']}
+        
+        # Backend e frontend com versões (primeira ocorrência no documento)
+        for framework, key, mention in (('django', 'backend_framework', 'Django'),
+                                        ('react', 'frontend_framework', 'React')):
+            version = next((p[f'{framework}_version'] for p in partials if p[f'{framework}_version']), None)
+            if version or mention in mentions:
+                contributions[key] = framework
+                if version:
+                    contributions['specific_dependencies'][framework] = version
         
         # Database
-        if re.search(r'postgresql', self.content, re.IGNORECASE):
-            self.specs.database = "postgresql"
+        if 'postgresql' in found:
+            contributions['database'] = "postgresql"
         
         # Arquitetura
-        if re.search(r'monolito|monolith', self.content, re.IGNORECASE):
-            self.specs.architecture_type = "monolith"
+        if 'monolito' in found or 'monolith' in found:
+            contributions['architecture_type'] = "monolith"
+        
+        return contributions
     
-    def _extract_models_deep(self):
+    def _scan_models(self, chunk: BlueprintIndex) -> Dict[str, Any]:
         """Extrai modelos com análise profunda de campos e relacionamentos."""
-        # Buscar blocos de código Python com modelos
-        python_blocks = re.findall(r'```python\n(.*?)\n```', self.content, re.DOTALL)
+        models: Dict[str, Any] = {}
+        relationships: Dict[str, List[str]] = {}
+        
+        # Apenas blocos de código Python podem conter modelos
+        for python_block in chunk.blocks('python'):
+            block = chunk.block_content(python_block)
+            for segment, tree in self._parse_python_segments(block):
+                if tree is not None:
+                    self._collect_models_ast(tree, models, relationships)
+                else:
+                    self._collect_models_regex(segment, models, relationships)
         
-        for block in python_blocks:
-            # Buscar definições de classe
-            class_matches = re.findall(r'class (\w+)\([^)]*\):\s*\n(.*?)(?=\nclass|\n#|\Z)', block, re.DOTALL)
+        return {'models': models, 'relationships': relationships}
+    
+    @staticmethod
+    def _parse_python_segments(block: str) -> List[Tuple[str, Optional[ast.Module]]]:
+        """Parse do bloco com ast; se inválido, tenta cada classe de topo separadamente.
+        
+        Retorna pares (trecho, árvore); árvore None indica trecho inválido (usa regex).
+        """
+        try:
+            return [(block, ast.parse(textwrap.dedent(block)))]
+        except SyntaxError:
+            pass
+        
+        segments = []
+        for segment in _TOP_LEVEL_CLASS_RE.split(block):
+            if not segment.strip():
+                continue
+            try:
+                segments.append((segment, ast.parse(textwrap.dedent(segment))))
+            except SyntaxError:
+                segments.append((segment, None))
+        return segments
+    
+    def _collect_models_ast(self, tree: ast.Module, models: Dict[str, Any],
+                            relationships: Dict[str, List[str]]):
+        """Coleta modelos Django das classes de topo de uma árvore ast."""
+        for node in tree.body:
+            if not isinstance(node, ast.ClassDef):
+                continue
+            model_info, model_relationships = self._parse_model_class(node, models)
+            if model_info is None:
+                continue
+            models[node.name] = model_info
+            if model_relationships:
+                relationships[node.name] = model_relationships
+    
+    def _parse_model_class(self, node: ast.ClassDef,
+                           known_models: Dict[str, Any]) -> Tuple[Optional[Dict[str, Any]], List[str]]:
+        """Extrai campos, relacionamentos, Meta e métodos em uma única passada pelo corpo da classe.
+        
+        Retorna (None, []) se a classe não for um modelo Django.
+        """
+        bases = [_dotted_name(base) for base in node.bases]
+        model_info = {
+            'fields': [],
+            'field_types': {},
+            'meta': {},
+            'methods': [],
+            'inheritance': ", ".join(base for base in bases if base),
+            'is_abstract': False
+        }
+        relationships: List[str] = []
+        uses_model_fields = False
+        
+        for statement in node.body:
+            if isinstance(statement, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                if not statement.name.startswith('_'):
+                    model_info['methods'].append(statement.name)
+            
+            elif isinstance(statement, ast.ClassDef) and statement.name == 'Meta':
+                for meta_statement in statement.body:
+                    if isinstance(meta_statement, ast.Assign):
+                        for target in meta_statement.targets:
+                            if isinstance(target, ast.Name):
+                                model_info['meta'][target.id] = _literal_value(meta_statement.value)
+                model_info['is_abstract'] = model_info['meta'].get('abstract') is True
             
-            for class_name, class_body in class_matches:
-                if 'models.' in class_body or 'Model' in class_body:
-                    model_info = self._parse_model_details(class_name, class_body)
-                    self.specs.models[class_name] = model_info
-                    
-                    # Extrair relacionamentos
-                    relationships = self._extract_model_relationships(class_body)
-                    if relationships:
-                        self.specs.model_relationships[class_name] = relationships
+            elif isinstance(statement, (ast.Assign, ast.AnnAssign)):
+                targets = statement.targets if isinstance(statement, ast.Assign) else [statement.target]
+                value = statement.value
+                if not (isinstance(value, ast.Call) and isinstance(value.func, ast.Attribute)
+                        and _dotted_name(value.func.value) == 'models'):
+                    continue
+                
+                uses_model_fields = True
+                field_class = value.func.attr
+                relation_kind = _RELATION_FIELDS.get(field_class)
+                field_type = field_class
+                if relation_kind:
+                    target_model = _relation_target(value)
+                    if target_model:
+                        field_type = f"{relation_kind}:{target_model}"
+                        if target_model not in relationships:
+                            relationships.append(target_model)
+                
+                for target in targets:
+                    if isinstance(target, ast.Name):
+                        if target.id not in model_info['field_types']:
+                            model_info['fields'].append(target.id)
+                        model_info['field_types'][target.id] = field_type
+        
+        is_model = uses_model_fields or any(
+            base.startswith('models.') or base in _DJANGO_MODEL_BASES or base in known_models
+            for base in bases
+        )
+        if not is_model:
+            return None, []
+        return model_info, relationships
+    
+    def _collect_models_regex(self, block: str, models: Dict[str, Any],
+                              relationships: Dict[str, List[str]]):
+        """Fallback por regex para trechos que não são Python válido."""
+        # Buscar definições de classe
+        class_matches = re.findall(r'class (\w+)\([^)]*\):\s*\n(.*?)(?=\nclass|\n#|\Z)', block, re.DOTALL)
+        
+        for class_name, class_body in class_matches:
+            if 'models.' in class_body or 'Model' in class_body:
+                models[class_name] = self._parse_model_details(class_name, class_body)
+                
+                # Extrair relacionamentos
+                model_relationships = self._extract_model_relationships(class_body)
+                if model_relationships:
+                    relationships[class_name] = model_relationships
+    
+    def _merge_models(self, partials: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Modelos de todas as seções; redefinições posteriores prevalecem."""
+        models: Dict[str, Any] = {}
+        relationships: Dict[str, List[str]] = {}
+        for partial in partials:
+            models.update(partial['models'])
+            relationships.update(partial['relationships'])
+        return {'models': models, 'model_relationships': relationships}
     
     def _parse_model_details(self, class_name: str, class_body: str) -> Dict[str, Any]:
-        """Parse detalhado de um modelo Django."""
+        """Parse detalhado de um modelo Django (fallback por regex)."""
         model_info = {
             'fields': [],
             'field_types': {},
@@ -206,7 +865,7 @@ class AdvancedBlueprintParser:
         return model_info
     
     def _extract_model_relationships(self, class_body: str) -> List[str]:
-        """Extrai relacionamentos do modelo."""
+        """Extrai relacionamentos do modelo (fallback por regex)."""
         relationships = []
         
         # ForeignKey, OneToOne, ManyToMany
@@ -215,60 +874,72 @@ class AdvancedBlueprintParser:
         
         return list(set(relationships))
     
-    def _extract_django_apps(self):
-        """Extrai apps Django específicas."""
-        # Buscar menções de apps Django
-        app_patterns = [
-            r"'(\w+)'",  # em INSTALLED_APPS
-            r'iabank/(\w+)/',  # estrutura de diretórios
-            r'backend_apps.*?\[([^\]]+)\]'  # lista específica
-        ]
+    def _scan_django_apps(self, chunk: BlueprintIndex) -> Dict[str, Any]:
+        """Lista backend_apps e entradas de INSTALLED_APPS do trecho (apenas onde aparecem)."""
+        backend_apps = None
+        if 'backend_apps' in chunk.text:
+            apps_section = _BACKEND_APPS_RE.search(chunk.text)
+            if apps_section:
+                backend_apps = _QUOTED_NAME_RE.findall(apps_section.group(1))
         
-        apps = set()
-        for pattern in app_patterns:
-            matches = re.findall(pattern, self.content)
-            for match in matches:
-                if isinstance(match, str) and match.isalnum():
-                    apps.add(match)
+        installed = []
+        for python_block in chunk.blocks('python'):
+            block = chunk.block_content(python_block)
+            if 'INSTALLED_APPS' not in block:
+                continue
+            for apps_list in _INSTALLED_APPS_RE.findall(block):
+                for entry in _INSTALLED_APP_ENTRY_RE.findall(apps_list):
+                    # 'iabank.customers' e 'customers.apps.CustomersConfig' -> 'customers'
+                    installed.append(entry.split('.apps.')[0].rsplit('.', 1)[-1])
         
-        # Apps Django padrão conhecidos
-        django_apps = {'core', 'users', 'customers', 'operations', 'finance'}
+        return {'backend_apps': backend_apps, 'installed': installed}
+    
+    def _merge_django_apps(self, partials: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Extrai apps Django específicas."""
+        # Lista específica do Blueprint (primeira do documento) tem prioridade
+        for partial in partials:
+            if partial['backend_apps'] is not None:
+                return {'django_apps': partial['backend_apps']}
         
-        # Extrair apps específicas do Blueprint primeiro
-        apps_section = re.search(r'backend_apps.*?\[([^\]]+)\]', self.content, re.DOTALL)
-        if apps_section:
-            app_names = re.findall(r"'(\w+)'", apps_section.group(1))
-            self.specs.django_apps = app_names
-        else:
-            # Fallback para apps conhecidos encontrados no texto
-            self.specs.django_apps = [app for app in apps if app in django_apps and app.isalnum()]
+        # Fallback: apps conhecidos em INSTALLED_APPS ou como diretórios do pacote do projeto,
+        # na ordem em que aparecem
+        candidates = [app for partial in partials for app in partial['installed']]
+        for path in self.specs.directory_paths:
+            candidates.extend(_PROJECT_APP_DIR_RE.findall(path))
+        return {'django_apps': [app for app in dict.fromkeys(candidates) if app in _KNOWN_DJANGO_APPS]}
     
-    def _extract_authentication(self):
+    def _scan_authentication(self, chunk: BlueprintIndex) -> List[str]:
+        """Indicadores de autenticação no trecho ('jwt' cobre também 'simplejwt')."""
+        return self._literals_found(chunk, ['jwt', 'token'])
+    
+    def _merge_authentication(self, partials: List[List[str]]) -> Dict[str, Any]:
         """Extrai método de autenticação."""
-        if re.search(r'JWT|simplejwt', self.content, re.IGNORECASE):
-            self.specs.authentication_method = "JWT"
-        elif re.search(r'Token', self.content, re.IGNORECASE):
-            self.specs.authentication_method = "Token"
+        found = {literal for partial in partials for literal in partial}
+        if 'jwt' in found:
+            method = "JWT"
+        elif 'token' in found:
+            method = "Token"
         else:
-            self.specs.authentication_method = "Session"
+            method = "Session"
+        return {'authentication_method': method}
+    
+    def _scan_multi_tenancy(self, chunk: BlueprintIndex) -> List[str]:
+        """Indicadores de multi-tenancy no trecho."""
+        # 'ForeignKey.*Tenant' é coberto pelo indicador literal 'tenant'
+        return self._literals_found(chunk, _MULTI_TENANT_INDICATORS)
     
-    def _extract_multi_tenancy(self):
+    def _merge_multi_tenancy(self, partials: List[List[str]]) -> Dict[str, Any]:
         """Detecta se o projeto usa multi-tenancy."""
-        multi_tenant_indicators = [
-            'multi-tenant', 'tenant', 'BaseTenantModel', 
-            'tenant_id', 'ForeignKey.*Tenant'
-        ]
-        
-        for indicator in multi_tenant_indicators:
-            if re.search(indicator, self.content, re.IGNORECASE):
-                self.specs.multi_tenancy = True
-                self.specs.base_model_class = "BaseTenantModel"
-                break
+        if any(partials):
+            return {'multi_tenancy': True, 'base_model_class': "BaseTenantModel"}
+        return {}
     
-    def _extract_file_content_validations(self):
+    def _extract_file_content_validations(self) -> Dict[str, Any]:
         """Extrai validações específicas de conteúdo de arquivos."""
+        validations = {}
+        
         # settings.py validations
-        self.specs.file_content_validations["settings.py"] = [
+        validations["settings.py"] = [
             "INSTALLED_APPS deve incluir apps do projeto",
             "DATABASE deve usar PostgreSQL", 
             "REST_FRAMEWORK deve estar configurado",
@@ -277,193 +948,213 @@ class AdvancedBlueprintParser:
         
         # models.py validations
         if self.specs.multi_tenancy:
-            self.specs.file_content_validations["models.py"] = [
+            validations["models.py"] = [
                 "BaseTenantModel deve estar definido",
                 "Todos os modelos devem herdar de BaseTenantModel",
                 "Campo tenant deve estar presente"
             ]
         
         # pyproject.toml validations
-        self.specs.file_content_validations["pyproject.toml"] = [
+        validations["pyproject.toml"] = [
             "Django versão correta",
             "DRF incluído",
             "PostgreSQL driver incluído",
             "Dependências de desenvolvimento configuradas"
         ]
+        
+        return {'file_content_validations': validations}
     
-    def _extract_directory_structure(self):
-        """Extrai estrutura de diretórios com análise inteligente."""
-        # Buscar seção específica de estrutura
-        structure_section = re.search(
-            r'## 7\. Estrutura de Diretórios Proposta.*?```\s*\n(.*?)```', 
-            self.content, 
-            re.IGNORECASE | re.DOTALL
+    def _scan_directory_structure(self, chunk: BlueprintIndex) -> Optional[Dict[str, Any]]:
+        """Árvore e caminhos do primeiro bloco sem linguagem após a seção de estrutura (None se ausente)."""
+        section = chunk.find_section(_STRUCTURE_SECTION_RE)
+        if section is None:
+            return None
+        
+        structure_block = next(
+            (block for block in chunk.blocks('') if block.start >= section.body_start), None
         )
         
-        if structure_section:
-            structure_text = structure_section.group(1)
+        tree: Dict[str, Any] = {}
+        if structure_block:
+            structure_text = chunk.block_content(structure_block)
             if '├──' in structure_text or '└──' in structure_text or '│' in structure_text:
-                self.specs.directory_structure = self._parse_directory_tree_advanced(structure_text)
+                tree = self._parse_directory_tree_advanced(structure_text)
+        return {'tree': tree, 'paths': flatten_directory_structure(tree)}
+    
+    def _merge_directory_structure(self, partials: List[Optional[Dict[str, Any]]]) -> Dict[str, Any]:
+        """Extrai estrutura de diretórios da primeira seção de estrutura do documento."""
+        structure = next((p for p in partials if p is not None), None)
+        if not structure or not structure['tree']:
+            return {}
+        return {'directory_structure': structure['tree'], 'directory_paths': structure['paths']}
     
     def _parse_directory_tree_advanced(self, tree_text: str) -> Dict[str, Any]:
-        """Parser avançado para árvore de diretórios."""
-        structure = {}
-        lines = [line.rstrip() for line in tree_text.split('\n') if line.strip()]
+        """Parser de árvore de diretórios em passada única com pilha de diretórios abertos.
         
-        current_path = []
+        O nível de cada linha é o tamanho do prefixo de indentação/símbolos (├└│─ e espaços)
+        dividido por 4. A pilha guarda os dicionários dos diretórios abertos, então cada
+        linha é anexada em O(1) ao diretório do seu nível.
+        """
+        structure: Dict[str, Any] = {}
+        stack: List[Dict[str, Any]] = []  # stack[i] = diretório aberto no nível i
         
-        for line in lines:
-            # Determina o nível baseado em indentação
-            original_line = line
-            level = 0
-            
-            # Calcula o nível baseado na indentação total (espaços + símbolos)
-            indent_match = re.match(r'^(\s*[├└│─\s]*)', line)
-            total_indent = len(indent_match.group(1)) if indent_match else 0
-            
-            # Calcula nível baseado na indentação total em múltiplos de 4
-            indent_level = total_indent // 4
+        for line in tree_text.split('\n'):
+            indent, name = _TREE_LINE_RE.match(line).groups()
+            name = name.rstrip()
             
-            # Limpa a linha de forma mais precisa
-            clean_line = re.sub(r'^[├└│\s─]+', '', line).strip()
+            # Ignora linhas vazias e comentários
+            if not name or name.startswith('#') or name.startswith('//'):
+                continue
             
-            # Remove comentários e linhas vazias
-            if not clean_line or clean_line.startswith('#') or clean_line.startswith('//'):
+            # Remove (descrições) finais e # comentários
+            if name.endswith(')'):
+                open_paren = name.find('(')
+                if 0 <= open_paren < len(name) - 1:
+                    name = name[:open_paren].rstrip()
+            comment = name.find('#')
+            if comment >= 0:
+                name = name[:comment].rstrip()
+            # Remove caracteres especiais
+            if not _TREE_NAME_RE.fullmatch(name):
+                name = _TREE_INVALID_CHARS_RE.sub('', name)
+            if not name:
                 continue
-                
-            # Remove caracteres problemáticos e descrições
-            clean_line = re.sub(r'\s*\(.*?\)\s*$', '', clean_line)  # Remove (descrições)
-            clean_line = re.sub(r'\s*#.*$', '', clean_line)  # Remove # comentários
-            clean_line = re.sub(r'[^\w\-._/]', '', clean_line)  # Remove chars especiais
             
-            if clean_line:
-                # Ajusta current_path para o nível correto
-                current_path = current_path[:indent_level]
-                
-                # Adiciona à estrutura
-                current_dict = structure
-                for path_part in current_path:
-                    if path_part in current_dict and isinstance(current_dict[path_part], dict):
-                        current_dict = current_dict[path_part]
-                
-                if clean_line.endswith('/'):
-                    # Diretório
-                    dir_name = clean_line.rstrip('/')
-                    if dir_name and (dir_name.replace('.', '').replace('_', '').replace('-', '').isalnum() or dir_name.startswith('.')):
-                        current_dict[dir_name] = {}
-                        current_path.append(dir_name)
-                else:
-                    # Arquivo - validar extensão
-                    if ('.' in clean_line and len(clean_line) < 100) or clean_line in ['README', 'LICENSE', 'Dockerfile']:
-                        current_dict[clean_line] = None
+            # Volta para o diretório do nível da linha
+            del stack[len(indent) // 4:]
+            current_dict = stack[-1] if stack else structure
+            
+            if name.endswith('/'):
+                # Diretório
+                dir_name = name.rstrip('/')
+                if dir_name and (dir_name.replace('.', '').replace('_', '').replace('-', '').isalnum() or dir_name.startswith('.')):
+                    current_dict[dir_name] = {}
+                    stack.append(current_dict[dir_name])
+            elif ('.' in name and len(name) < 100) or name in ('README', 'LICENSE', 'Dockerfile'):
+                # Arquivo - validar extensão
+                current_dict[name] = None
         
         return structure
     
-    def _extract_configuration_files(self):
+    def _scan_configuration_files(self, chunk: BlueprintIndex) -> List[str]:
+        """Padrões de arquivos de configuração mencionados no trecho."""
+        return [pattern for pattern in _CONFIG_FILE_PATTERNS if self._mentions(chunk, pattern)]
+    
+    def _merge_configuration_files(self, partials: List[List[str]]) -> Dict[str, Any]:
         """Extrai arquivos de configuração com análise detalhada."""
-        config_patterns = [
-            r'\.env(?:\.example)?', r'pyproject\.toml', r'requirements\.txt',
-            r'package\.json', r'package-lock\.json', r'yarn\.lock', r'pnpm-lock\.yaml',
-            r'tsconfig\.json', r'vite\.config\.[jt]s', r'tailwind\.config\.[jt]s',
-            r'settings\.py', r'config\.py', r'wsgi\.py', r'asgi\.py',
-            r'\.gitignore', r'\.pre-commit-config\.yaml',
-            r'docker-compose\.ya?ml', r'Dockerfile', r'\.dockerignore',
-            r'\.github/workflows/.*\.ya?ml'
-        ]
-        
-        for pattern in config_patterns:
-            if re.search(pattern, self.content, re.IGNORECASE):
-                clean_pattern = pattern.replace('\\', '').replace('?', '')
-                if clean_pattern not in self.specs.configuration_files:
-                    self.specs.configuration_files.append(clean_pattern)
+        return {'configuration_files': self._merge_file_patterns(partials, _CONFIG_FILE_PATTERNS, '?')}
     
-    def _extract_documentation_files(self):
+    def _scan_documentation_files(self, chunk: BlueprintIndex) -> List[str]:
+        """Padrões de arquivos de documentação mencionados no trecho."""
+        return [pattern for pattern in _DOC_FILE_PATTERNS if self._mentions(chunk, pattern)]
+    
+    def _merge_documentation_files(self, partials: List[List[str]]) -> Dict[str, Any]:
         """Extrai arquivos de documentação."""
-        doc_patterns = [
-            r'README\.md', r'CHANGELOG\.md', r'CONTRIBUTING\.md',
-            r'LICENSE', r'docs/', r'\.md'
-        ]
-        
-        for pattern in doc_patterns:
-            if re.search(pattern, self.content, re.IGNORECASE):
+        return {'documentation_files': self._merge_file_patterns(partials, _DOC_FILE_PATTERNS, '')}
+    
+    @staticmethod
+    def _merge_file_patterns(partials: List[List[str]], patterns: List[str], strip: str) -> List[str]:
+        """Padrões mencionados em qualquer seção, na ordem declarada e sem escapes."""
+        found = {pattern for partial in partials for pattern in partial}
+        files = []
+        for pattern in patterns:
+            if pattern in found:
                 clean_pattern = pattern.replace('\\', '')
-                if clean_pattern not in self.specs.documentation_files:
-                    self.specs.documentation_files.append(clean_pattern)
+                if strip:
+                    clean_pattern = clean_pattern.replace(strip, '')
+                if clean_pattern not in files:
+                    files.append(clean_pattern)
+        return files
     
-    def _extract_dependencies(self):
-        """Extrai dependências com versões específicas."""
-        # Dependências Python
-        python_deps = {}
-        
-        # Lista de dependências válidas para filtrar ruído
-        valid_python_deps = {
-            'django', 'djangorestframework', 'psycopg2-binary', 'django-environ',
-            'celery', 'redis', 'gunicorn', 'structlog', 'django-filter',
-            'djangorestframework-simplejwt', 'pytest', 'pytest-django',
-            'factory-boy', 'pytest-cov', 'black', 'ruff', 'pre-commit'
-        }
-        
+    def _scan_dependencies(self, chunk: BlueprintIndex) -> Dict[str, Any]:
+        """Dependências declaradas no trecho (toml, texto e package.json)."""
         # Buscar em blocos de configuração
-        toml_blocks = re.findall(r'```toml\n(.*?)\n```', self.content, re.DOTALL)
-        for block in toml_blocks:
-            deps = re.findall(r'(\w[\w-]*)\s*=\s*["\^~]*([0-9.]+)', block)
-            for dep, version in deps:
-                if dep.lower() in valid_python_deps:
-                    python_deps[dep] = version
+        toml_deps = []
+        for toml_block in chunk.blocks('toml'):
+            for dep, version in _TOML_DEP_RE.findall(chunk.block_content(toml_block)):
+                if dep.lower() in _VALID_PYTHON_DEPS:
+                    toml_deps.append([dep, version])
         
         # Dependências mencionadas no texto (com filtro)
-        text_deps = re.findall(r'([a-z][\w-]+)\s*[=:]\s*["\^~]*([0-9.]+)', self.content)
-        for dep, version in text_deps:
-            if dep.lower() in valid_python_deps:
-                python_deps[dep] = version
-        
-        self.specs.dependencies["backend"] = list(python_deps.keys())
-        self.specs.specific_dependencies.update(python_deps)
+        text_deps = [[dep, version] for dep, version in _TEXT_DEP_RE.findall(chunk.text)
+                     if dep.lower() in _VALID_PYTHON_DEPS]
         
         # Dependências Node.js
-        package_blocks = re.findall(r'```json.*?"dependencies":\s*{([^}]+)}', self.content, re.DOTALL)
-        for block in package_blocks:
-            deps = re.findall(r'"([^"]+)":\s*"[\^~]*([0-9.]+)"', block)
-            node_deps = dict(deps)
-            self.specs.dependencies["frontend"] = list(node_deps.keys())
-            self.specs.specific_dependencies.update(node_deps)
-    
-    def _extract_api_patterns(self):
+        packages = []
+        for json_block in chunk.blocks('json'):
+            package_match = _PACKAGE_DEPS_RE.search(chunk.block_content(json_block))
+            if package_match:
+                packages.append([list(dep) for dep in _NODE_DEP_RE.findall(package_match.group(1))])
+        
+        return {'toml': toml_deps, 'text': text_deps, 'packages': packages}
+    
+    def _merge_dependencies(self, partials: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Extrai dependências com versões específicas."""
+        # Dependências Python: blocos toml primeiro, depois menções no texto
+        python_deps = {}
+        for source in ('toml', 'text'):
+            for partial in partials:
+                for dep, version in partial[source]:
+                    python_deps[dep] = version
+        
+        # Dependências Node.js: o último package.json define a lista do frontend
+        frontend: List[str] = []
+        node_versions = {}
+        for partial in partials:
+            for package in partial['packages']:
+                node_deps = dict(package)
+                frontend = list(node_deps.keys())
+                node_versions.update(node_deps)
+        
+        return {
+            'dependencies': {"backend": list(python_deps.keys()), "frontend": frontend},
+            'specific_dependencies': {**python_deps, **node_versions}
+        }
+    
+    def _scan_api_patterns(self, chunk: BlueprintIndex) -> List[str]:
+        """Padrões de API mencionados no trecho."""
+        found = self._literals_found(chunk, ['rest', 'drf', 'django rest framework'])  # 'rest' cobre 'RESTful'
+        if _API_VERSION_RE.search(chunk.text):
+            found.append('versioned')
+        return found
+    
+    def _merge_api_patterns(self, partials: List[List[str]]) -> Dict[str, Any]:
         """Extrai padrões de API."""
-        if re.search(r'REST|RESTful', self.content, re.IGNORECASE):
-            self.specs.api_patterns.append("REST")
-        if re.search(r'api/v\d+', self.content, re.IGNORECASE):
-            self.specs.api_patterns.append("versioned")
-        if re.search(r'DRF|Django REST Framework', self.content, re.IGNORECASE):
-            self.specs.api_patterns.append("DRF")
-    
-    def _extract_testing_info(self):
+        found = {literal for partial in partials for literal in partial}
+        api_patterns = []
+        if 'rest' in found:
+            api_patterns.append("REST")
+        if 'versioned' in found:
+            api_patterns.append("versioned")
+        if 'drf' in found or 'django rest framework' in found:
+            api_patterns.append("DRF")
+        return {'api_patterns': api_patterns}
+    
+    def _scan_testing_info(self, chunk: BlueprintIndex) -> List[str]:
+        """Frameworks de teste mencionados no trecho."""
+        return self._literals_found(chunk, ['pytest', 'vitest'])
+    
+    def _merge_testing_info(self, partials: List[List[str]]) -> Dict[str, Any]:
         """Extrai informações sobre testes."""
-        if re.search(r'pytest', self.content, re.IGNORECASE):
-            self.specs.testing_framework = "pytest"
-        elif re.search(r'vitest', self.content, re.IGNORECASE):
-            self.specs.testing_framework = "vitest"
+        found = {literal for partial in partials for literal in partial}
+        for framework in ('pytest', 'vitest'):
+            if framework in found:
+                return {'testing_framework': framework}
+        return {}
+    
+    def _scan_ci_cd_info(self, chunk: BlueprintIndex) -> List[str]:
+        """Indicadores de CI/CD mencionados no trecho."""
+        return self._literals_found(chunk, _CI_CD_PATTERNS)
     
-    def _extract_ci_cd_info(self):
+    def _merge_ci_cd_info(self, partials: List[List[str]]) -> Dict[str, Any]:
         """Extrai informações sobre CI/CD."""
-        ci_patterns = [
-            "github actions", "gitlab ci", "jenkins",
-            "docker build", "docker push", "deploy"
-        ]
-        
-        for pattern in ci_patterns:
-            if re.search(pattern, self.content, re.IGNORECASE):
-                self.specs.ci_cd_pipeline.append(pattern)
+        found = {literal for partial in partials for literal in partial}
+        return {'ci_cd_pipeline': [pattern for pattern in _CI_CD_PATTERNS if pattern in found]}
+    
+    def _scan_docker_files(self, chunk: BlueprintIndex) -> List[str]:
+        """Padrões de arquivos Docker mencionados no trecho."""
+        return [pattern for pattern in _DOCKER_FILE_PATTERNS if self._mentions(chunk, pattern)]
     
-    def _extract_docker_files(self):
+    def _merge_docker_files(self, partials: List[List[str]]) -> Dict[str, Any]:
         """Extrai informações sobre Docker."""
-        docker_patterns = [
-            r'Dockerfile', r'docker-compose\.ya?ml',
-            r'\.dockerignore'
-        ]
-        
-        for pattern in docker_patterns:
-            if re.search(pattern, self.content, re.IGNORECASE):
-                clean_pattern = pattern.replace('\\', '').replace('?', '')
-                if clean_pattern not in self.specs.docker_files:
-                    self.specs.docker_files.append(clean_pattern)
\ No newline at end of file
+        return {'docker_files': self._merge_file_patterns(partials, _DOCKER_FILE_PATTERNS, '?')}
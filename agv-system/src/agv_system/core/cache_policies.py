@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+"""
+Políticas de evicção do MemoryCache.
+
+Cada política acompanha apenas as chaves (os valores ficam no cache) e responde em
+O(1) amortizado a acessos, inserções, remoções e à escolha da vítima:
+
+- LRU: OrderedDict em ordem de uso; a vítima é a chave usada há mais tempo.
+- LFU: buckets de frequência (frequência -> OrderedDict); a vítima é a chave menos
+  frequente e, entre as empatadas, a usada há mais tempo.
+- W-TinyLFU: janela LRU pequena (1%) na frente de um SLRU (probation/protected),
+  com admissão por frequência estimada em um Count-Min Sketch com envelhecimento.
+  Itens vistos uma única vez (varreduras de arquivos) não expulsam o conjunto quente.
+"""
+
+from collections import OrderedDict
+from typing import Dict, Hashable, List, Optional, Type, Union
+
+from .exceptions import InvalidConfigurationError
+
+
+class EvictionPolicy:
+    """Interface das políticas: o cache informa os eventos e pede a vítima quando está cheio."""
+
+    name = "base"
+
+    def __init__(self, capacity: int):
+        self.capacity = max(1, capacity)
+
+    def record_access(self, key: Hashable) -> None:
+        """Acerto (get) ou atualização (set) de uma chave presente."""
+
+    def record_miss(self, key: Hashable) -> None:
+        """Falta no cache (usado por políticas que estimam frequência)."""
+
+    def record_insert(self, key: Hashable) -> None:
+        """Nova chave armazenada."""
+
+    def remove(self, key: Hashable) -> None:
+        """Chave removida pelo cache (delete, expiração) fora da evicção."""
+
+    def evict(self) -> Optional[Hashable]:
+        """Escolhe e esquece a vítima; o cache remove o valor correspondente."""
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        """Esquece todas as chaves."""
+
+
+class LRUPolicy(EvictionPolicy):
+    """Least Recently Used: OrderedDict em ordem de uso (mais antigo primeiro)."""
+
+    name = "lru"
+
+    def __init__(self, capacity: int):
+        super().__init__(capacity)
+        self._order: "OrderedDict[Hashable, None]" = OrderedDict()
+
+    def record_access(self, key):
+        if key in self._order:
+            self._order.move_to_end(key)
+
+    def record_insert(self, key):
+        self._order[key] = None
+        self._order.move_to_end(key)
+
+    def remove(self, key):
+        self._order.pop(key, None)
+
+    def evict(self):
+        if not self._order:
+            return None
+        return self._order.popitem(last=False)[0]
+
+    def clear(self):
+        self._order.clear()
+
+
+class LFUPolicy(EvictionPolicy):
+    """Least Frequently Used com desempate por LRU (buckets de frequência, O(1))."""
+
+    name = "lfu"
+
+    def __init__(self, capacity: int):
+        super().__init__(capacity)
+        self._frequency: Dict[Hashable, int] = {}
+        self._buckets: Dict[int, "OrderedDict[Hashable, None]"] = {}
+        self._min_frequency = 0
+
+    def _unlink(self, key, frequency: int):
+        bucket = self._buckets[frequency]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[frequency]
+
+    def record_access(self, key):
+        frequency = self._frequency.get(key)
+        if frequency is None:
+            return
+        self._unlink(key, frequency)
+        if frequency == self._min_frequency and frequency not in self._buckets:
+            self._min_frequency = frequency + 1
+        self._frequency[key] = frequency + 1
+        self._buckets.setdefault(frequency + 1, OrderedDict())[key] = None
+
+    def record_insert(self, key):
+        if key in self._frequency:
+            self.record_access(key)
+            return
+        self._frequency[key] = 1
+        self._buckets.setdefault(1, OrderedDict())[key] = None
+        self._min_frequency = 1
+
+    def remove(self, key):
+        frequency = self._frequency.pop(key, None)
+        if frequency is not None:
+            self._unlink(key, frequency)
+
+    def evict(self):
+        if not self._frequency:
+            return None
+        if self._min_frequency not in self._buckets:
+            # Remoções fora da evicção podem esvaziar o bucket mínimo
+            self._min_frequency = min(self._buckets)
+        key, _ = self._buckets[self._min_frequency].popitem(last=False)
+        if not self._buckets[self._min_frequency]:
+            del self._buckets[self._min_frequency]
+        del self._frequency[key]
+        return key
+
+    def clear(self):
+        self._frequency.clear()
+        self._buckets.clear()
+        self._min_frequency = 0
+
+
+class FrequencySketch:
+    """
+    Count-Min Sketch de 4 linhas com contadores saturados em 15. A cada sample_size
+    incrementos todos os contadores são divididos por 2 (envelhecimento), para que a
+    popularidade antiga não proteja chaves que deixaram de ser usadas.
+    """
+
+    _SEEDS = (0x9E3779B1, 0x85EBCA77, 0xC2B2AE3D, 0x27D4EB2F)
+    _MAX_COUNT = 15
+
+    def __init__(self, capacity: int):
+        width = 1
+        while width < max(16, capacity):
+            width <<= 1
+        self._mask = width - 1
+        self._table: List[int] = [0] * (width * len(self._SEEDS))
+        self._width = width
+        self._sample_size = 10 * max(16, capacity)
+        self._additions = 0
+
+    def _indexes(self, key):
+        item_hash = hash(key)
+        return [
+            row * self._width + (((item_hash ^ (item_hash >> 17)) * seed >> 7) & self._mask)
+            for row, seed in enumerate(self._SEEDS)
+        ]
+
+    def frequency(self, key) -> int:
+        """Frequência estimada (mínimo entre as linhas)."""
+        table = self._table
+        return min(table[index] for index in self._indexes(key))
+
+    def increment(self, key) -> None:
+        """Registra uma ocorrência da chave."""
+        table = self._table
+        added = False
+        for index in self._indexes(key):
+            if table[index] < self._MAX_COUNT:
+                table[index] += 1
+                added = True
+        if added:
+            self._additions += 1
+            if self._additions >= self._sample_size:
+                self._table = [count >> 1 for count in table]
+                self._additions //= 2
+
+
+class WTinyLFUPolicy(EvictionPolicy):
+    """
+    Window TinyLFU: novas chaves entram na janela LRU; quando o cache enche, a chave mais
+    antiga da janela (candidata) disputa com a vítima do segmento principal e fica quem
+    tiver maior frequência estimada. O segmento principal é um SLRU: chaves acessadas de
+    novo em probation sobem para protected (80% do principal).
+    """
+
+    name = "w-tinylfu"
+
+    def __init__(self, capacity: int, window_fraction: float = 0.01):
+        super().__init__(capacity)
+        self.window_capacity = max(1, int(self.capacity * window_fraction))
+        main_capacity = max(1, self.capacity - self.window_capacity)
+        self.protected_capacity = max(1, int(main_capacity * 0.8))
+        self._window: "OrderedDict[Hashable, None]" = OrderedDict()
+        self._probation: "OrderedDict[Hashable, None]" = OrderedDict()
+        self._protected: "OrderedDict[Hashable, None]" = OrderedDict()
+        self._sketch = FrequencySketch(self.capacity)
+
+    def record_access(self, key):
+        self._sketch.increment(key)
+        if key in self._window:
+            self._window.move_to_end(key)
+        elif key in self._protected:
+            self._protected.move_to_end(key)
+        elif key in self._probation:
+            del self._probation[key]
+            self._protected[key] = None
+            if len(self._protected) > self.protected_capacity:
+                demoted, _ = self._protected.popitem(last=False)
+                self._probation[demoted] = None
+
+    def record_miss(self, key):
+        self._sketch.increment(key)
+
+    def record_insert(self, key):
+        self._window[key] = None
+        if len(self._window) > self.window_capacity:
+            # Cache ainda com espaço: a chave mais antiga da janela segue para probation
+            candidate, _ = self._window.popitem(last=False)
+            self._probation[candidate] = None
+
+    def remove(self, key):
+        for segment in (self._window, self._probation, self._protected):
+            if key in segment:
+                del segment[key]
+                return
+
+    def _main_victim(self) -> Optional[Hashable]:
+        for segment in (self._probation, self._protected):
+            if segment:
+                return next(iter(segment))
+        return None
+
+    def evict(self):
+        victim = self._main_victim()
+        if self._window and (len(self._window) >= self.window_capacity or victim is None):
+            candidate = next(iter(self._window))
+            if victim is None or self._sketch.frequency(candidate) <= self._sketch.frequency(victim):
+                del self._window[candidate]
+                return candidate
+            # Candidata admitida: entra em probation no lugar da vítima
+            del self._window[candidate]
+            self._probation[candidate] = None
+        if victim is None:
+            return None
+        if victim in self._probation:
+            del self._probation[victim]
+        else:
+            del self._protected[victim]
+        return victim
+
+    def clear(self):
+        self._window.clear()
+        self._probation.clear()
+        self._protected.clear()
+
+
+EVICTION_POLICIES: Dict[str, Type[EvictionPolicy]] = {
+    policy.name: policy for policy in (LRUPolicy, LFUPolicy, WTinyLFUPolicy)
+}
+
+
+def create_policy(policy: Union[str, EvictionPolicy], capacity: int) -> EvictionPolicy:
+    """Instancia a política pelo nome (lru, lfu, w-tinylfu) ou retorna a instância recebida."""
+    if isinstance(policy, EvictionPolicy):
+        return policy
+    policy_class = EVICTION_POLICIES.get(str(policy).lower())
+    if policy_class is None:
+        raise InvalidConfigurationError("cache eviction policy", " | ".join(EVICTION_POLICIES), str(policy))
+    return policy_class(capacity)
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Estimativa de tamanho dos valores do MemoryCache.
+
+estimate_size percorre o valor com sys.getsizeof (contêineres, __dict__ e __slots__),
+contando objetos compartilhados uma única vez, com limites de profundidade, de itens
+por contêiner e de objetos visitados: coleções maiores que max_items são amostradas e
+o restante é extrapolado pela média da amostra; esgotado max_nodes, os objetos
+seguintes entram apenas com o tamanho raso. O custo fica limitado mesmo para ProjectSpecs ou
+índices de arquivos grandes, e nenhum valor é serializado para medir tamanho.
+
+Quem conhece a forma dos próprios valores pode passar um sizer (callable valor -> bytes)
+ao MemoryCache no lugar da estimativa genérica.
+"""
+
+import sys
+from itertools import islice
+from typing import Any, Callable, Set
+
+Sizer = Callable[[Any], int]
+
+DEFAULT_MAX_DEPTH = 8
+DEFAULT_MAX_ITEMS = 128
+DEFAULT_MAX_NODES = 4096
+
+# Tipos sem referências internas relevantes: getsizeof já é o tamanho completo
+_ATOMIC_TYPES = frozenset((str, bytes, bytearray, int, float, complex, bool, type(None), range))
+
+
+def estimate_size(value: Any, max_depth: int = DEFAULT_MAX_DEPTH, max_items: int = DEFAULT_MAX_ITEMS,
+                  max_nodes: int = DEFAULT_MAX_NODES) -> int:
+    """Tamanho aproximado em bytes de value e dos objetos alcançáveis a partir dele."""
+    return _Walk(max_items, max_nodes).estimate(value, max_depth)
+
+
+class _Walk:
+    """Estado de uma estimativa: objetos já contados e limites."""
+
+    def __init__(self, max_items: int, max_nodes: int):
+        self.max_items = max_items
+        self.max_nodes = max_nodes
+        self.seen: Set[int] = set()
+
+    def estimate(self, value: Any, depth: int) -> int:
+        seen = self.seen
+        if id(value) in seen:
+            return 0
+        seen.add(id(value))
+        size = sys.getsizeof(value, 0)
+        if type(value) in _ATOMIC_TYPES or depth <= 0 or len(seen) > self.max_nodes:
+            return size
+
+        depth -= 1
+        estimate = self.estimate
+        if isinstance(value, dict):
+            total = measured = 0
+            for key, item in islice(value.items(), self.max_items):
+                total += estimate(key, depth) + estimate(item, depth)
+                measured += 1
+            return size + _extrapolate(total, measured, len(value))
+        if isinstance(value, (list, tuple, set, frozenset)):
+            total = measured = 0
+            for item in islice(value, self.max_items):
+                if type(item) in _ATOMIC_TYPES:
+                    # Caminho rápido para listas de números e strings
+                    if id(item) not in seen:
+                        seen.add(id(item))
+                        total += sys.getsizeof(item)
+                else:
+                    total += estimate(item, depth)
+                measured += 1
+            return size + _extrapolate(total, measured, len(value))
+
+        attributes = getattr(value, '__dict__', None)
+        if isinstance(attributes, dict):
+            size += estimate(attributes, depth)
+        for slot in getattr(type(value), '__slots__', ()):
+            if slot not in ('__dict__', '__weakref__') and hasattr(value, slot):
+                size += estimate(getattr(value, slot), depth)
+        return size
+
+
+def _extrapolate(total: int, measured: int, count: int) -> int:
+    """Soma dos itens medidos, extrapolada pela média para os count itens do contêiner."""
+    if measured and count > measured:
+        return total * count // measured
+    return total
@@ -5,18 +5,23 @@ Implementa cache em memória e disco para otimizar performance em projetos grand
 """
 
 import hashlib
+import heapq
 import json
 import pickle
+import sys
 import time
+import weakref
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, Optional, Union, Callable, Tuple
+from typing import Any, Dict, List, Optional, Union, Callable, Tuple
 from dataclasses import dataclass, asdict
 from functools import wraps
 import threading
 
 from .logging_config import get_logger
 from .exceptions import AGVException, ErrorContext
+from .cache_policies import EvictionPolicy, create_policy
+from .cache_sizing import Sizer, estimate_size
 
 
 logger = get_logger("cache")
@@ -40,6 +45,13 @@ class CacheEntry:
             return False
         return time.time() - self.timestamp > self.ttl
     
+    @property
+    def expires_at(self) -> Optional[float]:
+        """Instante (time.time) a partir do qual a entrada expira."""
+        if self.ttl is None:
+            return None
+        return self.timestamp + self.ttl
+    
     @property
     def age_seconds(self) -> float:
         """Idade da entrada em segundos."""
@@ -81,78 +93,214 @@ class CacheStats:
         }
 
 
+class ExpirationQueue:
+    """
+    Min-heap de (instante de expiração, chave) para expirar entradas sem varrer o cache.
+    
+    Reagendar ou descartar uma chave não reorganiza o heap: o prazo vigente fica em
+    _deadlines e itens que não conferem com ele são ignorados ao chegar ao topo. Quando
+    os itens obsoletos passam a dominar, o heap é reconstruído (O(n) amortizado).
+    """
+    
+    def __init__(self):
+        self._heap: List[Tuple[float, str]] = []
+        self._deadlines: Dict[str, float] = {}
+    
+    def __len__(self) -> int:
+        return len(self._deadlines)
+    
+    def schedule(self, key: str, expires_at: Optional[float]) -> None:
+        """Agenda (ou reagenda) a expiração da chave; None cancela."""
+        if expires_at is None:
+            self.discard(key)
+            return
+        self._deadlines[key] = expires_at
+        heapq.heappush(self._heap, (expires_at, key))
+        self._compact()
+    
+    def discard(self, key: str) -> None:
+        """Cancela a expiração agendada da chave."""
+        if self._deadlines.pop(key, None) is not None:
+            self._compact()
+    
+    def pop_due(self, now: float) -> List[str]:
+        """Remove e retorna as chaves com prazo vencido em now (O(log n) por item)."""
+        heap = self._heap
+        due = []
+        while heap and heap[0][0] < now:
+            expires_at, key = heapq.heappop(heap)
+            if self._deadlines.get(key) == expires_at:
+                del self._deadlines[key]
+                due.append(key)
+        return due
+    
+    def next_deadline(self) -> Optional[float]:
+        """Próximo prazo agendado (pode ser de um item obsoleto), ou None."""
+        return self._heap[0][0] if self._heap else None
+    
+    def clear(self) -> None:
+        """Cancela todas as expirações."""
+        self._heap.clear()
+        self._deadlines.clear()
+    
+    def _compact(self):
+        if len(self._heap) > 2 * len(self._deadlines) + 64:
+            self._heap = [(expires_at, key) for key, expires_at in self._deadlines.items()]
+            heapq.heapify(self._heap)
+
+
+class ExpiryReaper:
+    """
+    Thread daemon que chama purge_expired() do cache a cada interval segundos.
+    
+    Guarda apenas uma referência fraca ao cache: se o cache for coletado, a thread
+    termina no tick seguinte.
+    """
+    
+    def __init__(self, cache: Any, interval: float):
+        self.interval = interval
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run,
+            args=(weakref.ref(cache),),
+            name=f"agv-cache-reaper-{type(cache).__name__}",
+            daemon=True
+        )
+        self._thread.start()
+    
+    def _run(self, cache_ref):
+        while not self._stop_event.wait(self.interval):
+            cache = cache_ref()
+            if cache is None:
+                return
+            try:
+                cache.purge_expired()
+            except Exception as e:
+                logger.error(f"Cache reaper failed: {e}")
+            del cache
+    
+    def stop(self):
+        """Interrompe a thread (aguarda o tick em andamento)."""
+        self._stop_event.set()
+        if self._thread is not threading.current_thread():
+            self._thread.join(timeout=max(1.0, self.interval))
+
+
 class MemoryCache:
-    """Cache em memória thread-safe com LRU eviction."""
+    """
+    Cache em memória thread-safe com política de evicção plugável.
+    
+    policy: "lru" (padrão), "lfu", "w-tinylfu" (resistente a varreduras) ou uma instância
+    de EvictionPolicy; get, set e evicção são O(1) em qualquer política.
+    
+    Expiração: get verifica apenas a entrada lida; set remove as entradas vencidas pelo
+    ExpirationQueue (O(log n) por entrada expirada). Com reaper_interval, uma thread
+    daemon também as remove periodicamente, liberando memória em cargas só de leitura.
+    
+    Orçamento em bytes: com max_bytes, set também evicta (pela mesma política) até o
+    total estimado caber no orçamento; valores maiores que o orçamento não são
+    armazenados. O tamanho de cada valor é medido uma vez no set por sizer (padrão:
+    estimate_size, sem serialização) e o total é mantido incrementalmente.
+    """
     
-    def __init__(self, max_size: int = 1000, default_ttl: Optional[float] = None):
+    def __init__(self, max_size: int = 1000, default_ttl: Optional[float] = None,
+                 policy: Union[str, EvictionPolicy] = "lru", reaper_interval: Optional[float] = None,
+                 max_bytes: Optional[int] = None, sizer: Optional[Sizer] = None):
         self.max_size = max_size
+        self.max_bytes = max_bytes
         self.default_ttl = default_ttl
+        self._sizer = sizer or estimate_size
+        self._bytes = 0
         self._cache: Dict[str, CacheEntry] = {}
+        self._policy = create_policy(policy, max_size)
+        self._expirations = ExpirationQueue()
         self._stats = CacheStats()
         self._lock = threading.RLock()
+        self._reaper = ExpiryReaper(self, reaper_interval) if reaper_interval else None
         
         logger.info(
             "Memory cache initialized",
             extra={
                 'context': {
                     'max_size': max_size,
-                    'default_ttl': default_ttl
+                    'max_bytes': max_bytes,
+                    'default_ttl': default_ttl,
+                    'policy': self._policy.name,
+                    'reaper_interval': reaper_interval
                 }
             }
         )
     
-    def _cleanup_expired(self):
-        """Remove entradas expiradas."""
-        expired_keys = [
-            key for key, entry in self._cache.items()
-            if entry.is_expired
-        ]
-        
-        for key in expired_keys:
-            del self._cache[key]
-            self._stats.evictions += 1
-        
-        if expired_keys:
-            logger.debug(
-                f"Cleaned up {len(expired_keys)} expired cache entries",
-                extra={'context': {'expired_count': len(expired_keys)}}
-            )
-    
-    def _evict_lru(self):
-        """Remove entrada menos recentemente usada."""
-        if not self._cache:
-            return
-        
-        # Encontrar entrada com menor access_count e mais antiga
-        lru_key = min(
-            self._cache.keys(),
-            key=lambda k: (self._cache[k].access_count, self._cache[k].timestamp)
-        )
+    @property
+    def policy(self) -> str:
+        """Nome da política de evicção em uso."""
+        return self._policy.name
+    
+    def _remove(self, key: str):
+        """Remove a entrada do dicionário, da política e da fila de expiração."""
+        self._bytes -= self._cache.pop(key).size_bytes
+        self._policy.remove(key)
+        self._expirations.discard(key)
+    
+    def purge_expired(self) -> int:
+        """Remove as entradas vencidas e retorna quantas foram removidas."""
+        with self._lock:
+            expired_keys = self._expirations.pop_due(time.time())
+            
+            for key in expired_keys:
+                self._bytes -= self._cache.pop(key).size_bytes
+                self._policy.remove(key)
+                self._stats.evictions += 1
+            
+            if expired_keys:
+                logger.debug(
+                    f"Cleaned up {len(expired_keys)} expired cache entries",
+                    extra={'context': {'expired_count': len(expired_keys)}}
+                )
+            return len(expired_keys)
+    
+    def _evict(self) -> Optional[str]:
+        """Remove a entrada escolhida pela política de evicção e retorna sua chave."""
+        victim = self._policy.evict()
+        if victim is None:
+            return None
         
-        del self._cache[lru_key]
+        self._bytes -= self._cache.pop(victim).size_bytes
+        self._expirations.discard(victim)
         self._stats.evictions += 1
         
         logger.debug(
-            f"Evicted LRU cache entry: {lru_key}",
-            extra={'context': {'evicted_key': lru_key}}
+            f"Evicted cache entry ({self._policy.name}): {victim}",
+            extra={'context': {'evicted_key': victim, 'policy': self._policy.name}}
         )
+        return victim
+    
+    def _measure(self, value: Any) -> int:
+        """Tamanho estimado do valor pelo sizer configurado."""
+        try:
+            return max(0, int(self._sizer(value)))
+        except Exception as e:
+            logger.warning(f"Cache sizer failed, using shallow size: {e}")
+            return sys.getsizeof(value, 0)
     
     def get(self, key: str) -> Optional[Any]:
         """Recupera valor do cache."""
         with self._lock:
-            self._cleanup_expired()
-            
             if key not in self._cache:
+                self._policy.record_miss(key)
                 self._stats.misses += 1
                 return None
             
             entry = self._cache[key]
             if entry.is_expired:
-                del self._cache[key]
+                self._remove(key)
+                self._stats.evictions += 1
+                self._policy.record_miss(key)
                 self._stats.misses += 1
                 return None
             
             entry.access_count += 1
+            self._policy.record_access(key)
             self._stats.hits += 1
             
             logger.debug(
@@ -171,17 +319,22 @@ class MemoryCache:
     def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
         """Armazena valor no cache."""
         with self._lock:
-            self._cleanup_expired()
+            self.purge_expired()
             
             # Usar TTL padrão se não especificado
             if ttl is None:
                 ttl = self.default_ttl
             
-            # Calcular tamanho aproximado
-            try:
-                size_bytes = len(pickle.dumps(value))
-            except:
-                size_bytes = 0
+            size_bytes = self._measure(value)
+            if self.max_bytes is not None and size_bytes > self.max_bytes:
+                # Não cabe nem com o cache vazio: descarta também o valor antigo
+                if key in self._cache:
+                    self._remove(key)
+                logger.warning(
+                    f"Cache value exceeds byte budget, not stored: {key}",
+                    extra={'context': {'key': key, 'size_bytes': size_bytes, 'max_bytes': self.max_bytes}}
+                )
+                return
             
             entry = CacheEntry(
                 key=key,
@@ -191,11 +344,28 @@ class MemoryCache:
                 size_bytes=size_bytes
             )
             
-            # Evict if needed
-            while len(self._cache) >= self.max_size:
-                self._evict_lru()
+            previous = self._cache.get(key)
+            if self.max_bytes is not None:
+                while self._bytes - (previous.size_bytes if previous else 0) + size_bytes > self.max_bytes:
+                    victim = self._evict()
+                    if victim is None:
+                        break
+                    if victim == key:
+                        # A política escolheu a própria chave atualizada: reentra como nova
+                        previous = None
+            
+            if previous is not None:
+                # Atualização: substitui o valor sem evicção por contagem
+                self._bytes -= previous.size_bytes
+                self._policy.record_access(key)
+            else:
+                while self._cache and len(self._cache) >= self.max_size:
+                    self._evict()
+                self._policy.record_insert(key)
             
             self._cache[key] = entry
+            self._bytes += size_bytes
+            self._expirations.schedule(key, entry.expires_at)
             self._stats.sets += 1
             
             logger.debug(
@@ -213,7 +383,7 @@ class MemoryCache:
         """Remove entrada do cache."""
         with self._lock:
             if key in self._cache:
-                del self._cache[key]
+                self._remove(key)
                 self._stats.deletes += 1
                 logger.debug(f"Cache delete: {key}")
                 return True
@@ -224,6 +394,9 @@ class MemoryCache:
         with self._lock:
             count = len(self._cache)
             self._cache.clear()
+            self._policy.clear()
+            self._expirations.clear()
+            self._bytes = 0
             logger.info(f"Cache cleared: {count} entries removed")
     
     def get_stats(self) -> CacheStats:
@@ -234,26 +407,52 @@ class MemoryCache:
         """Retorna número de entradas no cache."""
         with self._lock:
             return len(self._cache)
+    
+    def get_size_bytes(self) -> int:
+        """Retorna o total estimado, em bytes, dos valores no cache."""
+        with self._lock:
+            return self._bytes
+    
+    def close(self):
+        """Interrompe o reaper em segundo plano, se houver."""
+        if self._reaper:
+            self._reaper.stop()
+            self._reaper = None
 
 
 class DiskCache:
-    """Cache persistente em disco."""
+    """
+    Cache persistente em disco.
+    
+    A expiração usa um ExpirationQueue montado a partir dos metadados: get apenas
+    verifica a chave lida (sem varrer metadados nem apagar arquivos), e as entradas
+    vencidas são removidas em lote em set, em purge_expired() ou pelo reaper opcional.
+    """
     
-    def __init__(self, cache_dir: Union[str, Path] = ".agv_cache", max_size_mb: int = 100):
+    def __init__(self, cache_dir: Union[str, Path] = ".agv_cache", max_size_mb: int = 100,
+                 reaper_interval: Optional[float] = None):
         self.cache_dir = Path(cache_dir)
         self.max_size_mb = max_size_mb
         self.cache_dir.mkdir(exist_ok=True)
+        self._lock = threading.RLock()
         
         # Arquivo de metadados
         self.metadata_file = self.cache_dir / "metadata.json"
         self.metadata = self._load_metadata()
+        self._metadata_dirty = False
+        
+        self._expirations = ExpirationQueue()
+        for key, meta in self.metadata.items():
+            self._expirations.schedule(key, self._expires_at(meta))
+        self._reaper = ExpiryReaper(self, reaper_interval) if reaper_interval else None
         
         logger.info(
             "Disk cache initialized",
             extra={
                 'context': {
                     'cache_dir': str(self.cache_dir),
-                    'max_size_mb': max_size_mb
+                    'max_size_mb': max_size_mb,
+                    'reaper_interval': reaper_interval
                 }
             }
         )
@@ -274,6 +473,7 @@ class DiskCache:
         try:
             with open(self.metadata_file, 'w', encoding='utf-8') as f:
                 json.dump(self.metadata, f, indent=2)
+            self._metadata_dirty = False
         except Exception as e:
             logger.error(f"Failed to save cache metadata: {e}")
     
@@ -282,19 +482,25 @@ class DiskCache:
         key_hash = hashlib.md5(key.encode()).hexdigest()
         return self.cache_dir / f"{key_hash}.cache"
     
-    def _cleanup_expired(self):
-        """Remove arquivos expirados."""
-        current_time = time.time()
-        expired_keys = []
-        
-        for key, meta in self.metadata.items():
-            if meta.get('ttl') and current_time - meta['timestamp'] > meta['ttl']:
-                expired_keys.append(key)
-        
-        for key in expired_keys:
-            self._delete_cache_file(key)
+    @staticmethod
+    def _expires_at(meta: Dict[str, Any]) -> Optional[float]:
+        """Instante de expiração registrado nos metadados (ttl 0 ou ausente: nunca)."""
+        if not meta.get('ttl'):
+            return None
+        return meta['timestamp'] + meta['ttl']
     
-    def _delete_cache_file(self, key: str):
+    def purge_expired(self) -> int:
+        """Remove os arquivos vencidos (uma única gravação de metadados) e retorna quantos."""
+        with self._lock:
+            expired_keys = self._expirations.pop_due(time.time())
+            for key in expired_keys:
+                self._delete_cache_file(key, save=False)
+            if expired_keys:
+                self._save_metadata()
+                logger.debug(f"Cleaned up {len(expired_keys)} expired disk cache entries")
+            return len(expired_keys)
+    
+    def _delete_cache_file(self, key: str, save: bool = True):
         """Remove arquivo de cache."""
         cache_file = self._get_cache_file(key)
         try:
@@ -302,79 +508,92 @@ class DiskCache:
                 cache_file.unlink()
             if key in self.metadata:
                 del self.metadata[key]
-            self._save_metadata()
+            self._expirations.discard(key)
+            if save:
+                self._save_metadata()
         except Exception as e:
             logger.error(f"Failed to delete cache file {key}: {e}")
     
     def get(self, key: str) -> Optional[Any]:
         """Recupera valor do cache em disco."""
-        self._cleanup_expired()
-        
-        if key not in self.metadata:
-            return None
-        
-        meta = self.metadata[key]
-        if meta.get('ttl') and time.time() - meta['timestamp'] > meta['ttl']:
-            self._delete_cache_file(key)
-            return None
-        
-        cache_file = self._get_cache_file(key)
-        if not cache_file.exists():
-            # Metadata inconsistente
-            if key in self.metadata:
-                del self.metadata[key]
-                self._save_metadata()
-            return None
-        
-        try:
-            with open(cache_file, 'rb') as f:
-                value = pickle.load(f)
+        with self._lock:
+            if key not in self.metadata:
+                return None
             
-            # Atualizar contadores
-            meta['access_count'] = meta.get('access_count', 0) + 1
-            self._save_metadata()
+            meta = self.metadata[key]
+            expires_at = self._expires_at(meta)
+            if expires_at is not None and time.time() > expires_at:
+                # Vencida: a remoção fica para purge_expired()
+                return None
             
-            logger.debug(f"Disk cache hit: {key}")
-            return value
-        
-        except Exception as e:
-            logger.error(f"Failed to load from disk cache {key}: {e}")
-            self._delete_cache_file(key)
-            return None
+            cache_file = self._get_cache_file(key)
+            if not cache_file.exists():
+                # Metadata inconsistente
+                self._delete_cache_file(key)
+                return None
+            
+            try:
+                with open(cache_file, 'rb') as f:
+                    value = pickle.load(f)
+                
+                # Contadores são gravados junto com a próxima alteração (ou em close())
+                meta['access_count'] = meta.get('access_count', 0) + 1
+                self._metadata_dirty = True
+                
+                logger.debug(f"Disk cache hit: {key}")
+                return value
+            
+            except Exception as e:
+                logger.error(f"Failed to load from disk cache {key}: {e}")
+                self._delete_cache_file(key)
+                return None
     
     def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
         """Armazena valor no cache em disco."""
-        cache_file = self._get_cache_file(key)
-        
-        try:
-            with open(cache_file, 'wb') as f:
-                pickle.dump(value, f)
-            
-            # Atualizar metadados
-            self.metadata[key] = {
-                'timestamp': time.time(),
-                'ttl': ttl,
-                'size_bytes': cache_file.stat().st_size,
-                'access_count': 0
-            }
+        with self._lock:
+            expired_keys = self._expirations.pop_due(time.time())
+            for expired_key in expired_keys:
+                self._delete_cache_file(expired_key, save=False)
+            if expired_keys:
+                # Gravados junto com o novo item logo abaixo
+                self._metadata_dirty = True
             
-            self._save_metadata()
-            logger.debug(f"Disk cache set: {key}")
+            cache_file = self._get_cache_file(key)
             
-        except Exception as e:
-            logger.error(f"Failed to save to disk cache {key}: {e}")
+            try:
+                with open(cache_file, 'wb') as f:
+                    pickle.dump(value, f)
+                
+                # Atualizar metadados
+                self.metadata[key] = {
+                    'timestamp': time.time(),
+                    'ttl': ttl,
+                    'size_bytes': cache_file.stat().st_size,
+                    'access_count': 0
+                }
+                self._expirations.schedule(key, self._expires_at(self.metadata[key]))
+                
+                self._save_metadata()
+                logger.debug(f"Disk cache set: {key}")
+                
+            except Exception as e:
+                logger.error(f"Failed to save to disk cache {key}: {e}")
     
     def delete(self, key: str) -> bool:
         """Remove entrada do cache em disco."""
-        if key in self.metadata:
-            self._delete_cache_file(key)
-            return True
-        return False
+        with self._lock:
+            if key in self.metadata:
+                self._delete_cache_file(key)
+                return True
+            return False
     
     def clear(self):
         """Limpa todo o cache em disco."""
-        for key in list(self.metadata.keys()):
-            self._delete_cache_file(key)
+        with self._lock:
+            for key in list(self.metadata.keys()):
+                self._delete_cache_file(key, save=False)
+            self._expirations.clear()
+            self._save_metadata()
     
     def get_size_mb(self) -> float:
         """Retorna tamanho do cache em MB."""
@@ -383,6 +602,15 @@ class DiskCache:
             for meta in self.metadata.values()
         )
         return total_bytes / (1024 * 1024)
+    
+    def close(self):
+        """Interrompe o reaper e grava contadores de acesso pendentes."""
+        if self._reaper:
+            self._reaper.stop()
+            self._reaper = None
+        with self._lock:
+            if self._metadata_dirty:
+                self._save_metadata()
 
 
 class AGVCache:
@@ -393,10 +621,15 @@ class AGVCache:
         memory_max_size: int = 1000,
         memory_ttl: Optional[float] = 3600,  # 1 hora
         disk_max_size_mb: int = 100,
-        cache_dir: Union[str, Path] = ".agv_cache"
+        cache_dir: Union[str, Path] = ".agv_cache",
+        memory_policy: Union[str, EvictionPolicy] = "lru",
+        reaper_interval: Optional[float] = None,
+        memory_max_bytes: Optional[int] = None,
+        memory_sizer: Optional[Sizer] = None
     ):
-        self.memory_cache = MemoryCache(memory_max_size, memory_ttl)
-        self.disk_cache = DiskCache(cache_dir, disk_max_size_mb)
+        self.memory_cache = MemoryCache(memory_max_size, memory_ttl, memory_policy, reaper_interval,
+                                        memory_max_bytes, memory_sizer)
+        self.disk_cache = DiskCache(cache_dir, disk_max_size_mb, reaper_interval)
         
         logger.info(
             "AGV Cache system initialized",
@@ -404,7 +637,10 @@ class AGVCache:
                 'context': {
                     'memory_max_size': memory_max_size,
                     'memory_ttl': memory_ttl,
-                    'disk_max_size_mb': disk_max_size_mb
+                    'memory_policy': self.memory_cache.policy,
+                    'memory_max_bytes': memory_max_bytes,
+                    'disk_max_size_mb': disk_max_size_mb,
+                    'reaper_interval': reaper_interval
                 }
             }
         )
@@ -445,9 +681,16 @@ class AGVCache:
         self.memory_cache.clear()
         self.disk_cache.clear()
     
+    def close(self):
+        """Interrompe os reapers e grava metadados pendentes do disco."""
+        self.memory_cache.close()
+        self.disk_cache.close()
+    
     def get_stats(self) -> Dict[str, Any]:
         """Retorna estatísticas combinadas."""
         memory_stats = self.memory_cache.get_stats().to_dict()
+        memory_stats['entries'] = self.memory_cache.get_size()
+        memory_stats['size_bytes'] = self.memory_cache.get_size_bytes()
         disk_size_mb = self.disk_cache.get_size_mb()
         
         return {
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+SpecsCache - Cache persistente de ProjectSpecs por hash do Blueprint.
+Evita re-parsing a cada invocação de CLI/hook quando o Blueprint não mudou.
+
+As entradas ficam no diretório do cache em disco (.agv_cache/specs) no formato binário
+de specs_codec, sob a chave (sha256 do conteúdo do Blueprint, PARSER_SCHEMA_VERSION).
+Não usa pickle: o arquivo só pode reconstruir um ProjectSpecs, e os campos são
+decodificados apenas quando lidos.
+
+Para cada caminho de Blueprint também são guardados os resultados parciais por seção de
+topo (.agv_cache/specs/sections): após uma edição, apenas as seções alteradas são
+reprocessadas pelos extractors e o resultado é mesclado em um novo ProjectSpecs.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Union
+
+from .blueprint_parser import AdvancedBlueprintParser, ProjectSpecs, PARSER_SCHEMA_VERSION
+from .specs_codec import decode_specs, encode_specs, read_metadata
+from .logging_config import get_logger
+
+
+logger = get_logger("cache.specs")
+
+
+def blueprint_digest(blueprint_path: Union[str, Path]) -> str:
+    """Hash sha256 do conteúdo do Blueprint."""
+    digest = hashlib.sha256()
+    with open(blueprint_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class SpecsCache:
+    """Armazena ProjectSpecs serializadas em disco, uma entrada por (hash, versão do schema)."""
+
+    def __init__(self, cache_dir: Union[str, Path] = ".agv_cache",
+                 schema_version: int = PARSER_SCHEMA_VERSION):
+        self.cache_dir = Path(cache_dir) / "specs"
+        self.schema_version = schema_version
+
+    def _entry_file(self, digest: str) -> Path:
+        """Caminho da entrada para o hash informado."""
+        return self.cache_dir / f"{digest}.v{self.schema_version}.agvs"
+
+    def _sections_file(self, blueprint_path: Union[str, Path]) -> Path:
+        """Caminho dos resultados por seção de um Blueprint (chaveado pelo caminho absoluto)."""
+        path_hash = hashlib.sha256(str(Path(blueprint_path).resolve()).encode('utf-8')).hexdigest()
+        return self.cache_dir / "sections" / f"{path_hash}.v{self.schema_version}.json"
+
+    def _write_json(self, target: Path, payload: Dict[str, Any]) -> None:
+        """Grava JSON compacto de forma atômica (arquivo temporário + rename)."""
+        self._write_bytes(target, json.dumps(payload, ensure_ascii=False, separators=(',', ':')).encode('utf-8'))
+
+    def _write_bytes(self, target: Path, data: bytes) -> None:
+        """Grava o conteúdo de forma atômica (arquivo temporário + rename)."""
+        tmp_file = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+        try:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file.write_bytes(data)
+            os.replace(tmp_file, target)
+        except Exception as e:
+            logger.error(f"Failed to save specs cache entry {target.name}: {e}")
+            try:
+                tmp_file.unlink()
+            except OSError:
+                pass
+
+    def get_encoded(self, digest: str) -> Optional[bytes]:
+        """Entrada codificada (specs_codec) do cache; entradas inválidas são descartadas."""
+        entry_file = self._entry_file(digest)
+        if not entry_file.exists():
+            return None
+
+        try:
+            data = entry_file.read_bytes()
+            metadata = read_metadata(data)
+            if metadata.get("schema") != self.schema_version or metadata.get("blueprint_sha256") != digest:
+                raise ValueError("schema/hash mismatch")
+            logger.debug(f"Specs cache hit: {digest[:12]}")
+            return data
+        except Exception as e:
+            logger.warning(f"Discarding invalid specs cache entry {entry_file.name}: {e}")
+            try:
+                entry_file.unlink()
+            except OSError:
+                pass
+            return None
+
+    def get(self, digest: str) -> Optional[ProjectSpecs]:
+        """Recupera ProjectSpecs do cache (campos decodificados sob demanda)."""
+        data = self.get_encoded(digest)
+        return decode_specs(data, lazy=True) if data is not None else None
+
+    def set(self, digest: str, specs: ProjectSpecs) -> bytes:
+        """Grava ProjectSpecs no cache (escrita atômica); retorna a entrada codificada."""
+        data = encode_specs(specs, {"blueprint_sha256": digest}, schema_version=self.schema_version)
+        self._write_bytes(self._entry_file(digest), data)
+        logger.debug(f"Specs cache set: {digest[:12]}")
+        return data
+
+    def get_section_results(self, blueprint_path: Union[str, Path]) -> Dict[str, Dict[str, Any]]:
+        """Resultados por seção do último parsing deste Blueprint ({} se ausentes)."""
+        sections_file = self._sections_file(blueprint_path)
+        if not sections_file.exists():
+            return {}
+        try:
+            payload = json.loads(sections_file.read_text(encoding='utf-8'))
+            if payload.get("schema") != self.schema_version:
+                return {}
+            return payload.get("extractors", {})
+        except Exception as e:
+            logger.warning(f"Ignoring invalid section results {sections_file.name}: {e}")
+            return {}
+
+    def set_section_results(self, blueprint_path: Union[str, Path],
+                            section_results: Dict[str, Dict[str, Any]]) -> None:
+        """Substitui os resultados por seção (apenas seções do parsing atual são mantidas)."""
+        self._write_json(self._sections_file(blueprint_path), {
+            "schema": self.schema_version,
+            "extractors": section_results
+        })
+
+    def load_or_parse(self, blueprint_path: Union[str, Path]) -> Tuple[ProjectSpecs, bool]:
+        """Retorna (specs, veio_do_cache), fazendo o parsing apenas quando o Blueprint mudou."""
+        digest = blueprint_digest(blueprint_path)
+        specs = self.get(digest)
+        if specs is not None:
+            return specs, True
+        return self._parse_and_store(blueprint_path, digest)[0], False
+
+    def load_or_parse_encoded(self, blueprint_path: Union[str, Path]) -> Tuple[bytes, bool]:
+        """Como load_or_parse, mas retorna as specs codificadas (para enviar a outro processo)."""
+        digest = blueprint_digest(blueprint_path)
+        data = self.get_encoded(digest)
+        if data is not None:
+            return data, True
+        return self._parse_and_store(blueprint_path, digest)[1], False
+
+    def _parse_and_store(self, blueprint_path: Union[str, Path], digest: str) -> Tuple[ProjectSpecs, bytes]:
+        """Faz o parsing (reprocessando apenas seções alteradas) e grava specs e resultados por seção."""
+        parser = AdvancedBlueprintParser(str(blueprint_path))
+        specs = parser.parse(previous_results=self.get_section_results(blueprint_path))
+        data = self.set(digest, specs)
+        self.set_section_results(blueprint_path, parser.section_results)
+        logger.info(
+            "Blueprint parsed",
+            extra={'context': {'blueprint': str(blueprint_path), **parser.parse_stats}}
+        )
+        return specs, data
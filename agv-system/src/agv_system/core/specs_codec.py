@@ -0,0 +1,354 @@
+#!/usr/bin/env python3
+"""
+SpecsCodec - Codificação binária compacta e versionada de ProjectSpecs.
+
+Permite mover ProjectSpecs entre processos (hooks, pools de workers, cache em disco)
+sem re-parsing e sem pickle. O mesmo buffer pode ser gravado em arquivo ou em um
+segmento de memória compartilhada (multiprocessing.shared_memory).
+
+Layout (little-endian):
+
+    cabeçalho    magic "AGVS", versão do formato, versão do schema do parser,
+                 nº de campos, nº de strings, tamanho total, offsets das áreas
+    diretório    por campo: (índice da string com o nome, offset do valor)
+    metadados    valor codificado (dict livre, ex: hash do Blueprint)
+    valores      valores com tag de 1 byte; inteiros e contagens em varint
+    strings      offsets de fim (u32, em caracteres) + strings distintas em UTF-8
+
+Toda string (inclusive nomes de campos e chaves de dict) é gravada uma única vez na
+tabela e referenciada por índice. Campos são identificados pelo nome: ao decodificar,
+campos desconhecidos são ignorados e campos ausentes recebem o default do dataclass,
+então buffers de versões anteriores de ProjectSpecs continuam legíveis.
+
+Com lazy=True a decodificação só lê cabeçalho e diretório; cada campo é decodificado
+no primeiro acesso (LazyProjectSpecs).
+"""
+
+import struct
+from dataclasses import MISSING, fields
+from multiprocessing import shared_memory
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from .blueprint_parser import LazyProjectSpecs, ProjectSpecs, PARSER_SCHEMA_VERSION
+
+
+MAGIC = b"AGVS"
+CODEC_VERSION = 1
+
+# magic, versão do formato, schema do parser, campos, strings, tamanho total,
+# offset dos metadados, offset da tabela de strings
+_HEADER = struct.Struct("<4sHHHIIII")
+_DIRECTORY_ENTRY = struct.Struct("<II")
+_OFFSET = struct.Struct("<I")
+_FLOAT = struct.Struct("<d")
+
+# Tags de valor
+_NONE, _TRUE, _FALSE, _INT, _NEG_INT, _FLOAT_TAG, _STR, _LIST, _DICT, _STR_LIST = range(10)
+
+_SPECS_FIELDS = {spec_field.name: spec_field for spec_field in fields(ProjectSpecs)}
+
+BufferLike = Union[bytes, bytearray, memoryview]
+
+
+def _write_varint(out: bytearray, value: int) -> None:
+    """Inteiro não negativo em varint (7 bits por byte)."""
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(buffer: BufferLike, pos: int) -> Tuple[int, int]:
+    """Lê varint em pos; retorna (valor, próxima posição)."""
+    byte = buffer[pos]
+    if byte < 0x80:
+        return byte, pos + 1
+    value, shift = 0, 0
+    while True:
+        byte = buffer[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+
+
+class _Encoder:
+    """Acumula valores codificados e a tabela de strings internadas."""
+
+    def __init__(self):
+        self.values = bytearray()
+        self.strings: Dict[str, int] = {}
+
+    def intern(self, text: str) -> int:
+        """Índice da string na tabela (adicionada na primeira ocorrência)."""
+        index = self.strings.get(text)
+        if index is None:
+            index = self.strings[text] = len(self.strings)
+        return index
+
+    def value(self, value: Any) -> int:
+        """Codifica um valor JSON-compatível e retorna seu offset na área de valores."""
+        offset = len(self.values)
+        self._write(value)
+        return offset
+
+    def _write(self, value: Any) -> None:
+        out = self.values
+        if value is None:
+            out.append(_NONE)
+        elif value is True:
+            out.append(_TRUE)
+        elif value is False:
+            out.append(_FALSE)
+        elif isinstance(value, int):
+            out.append(_INT if value >= 0 else _NEG_INT)
+            _write_varint(out, value if value >= 0 else -value)
+        elif isinstance(value, float):
+            out.append(_FLOAT_TAG)
+            out += _FLOAT.pack(value)
+        elif isinstance(value, str):
+            out.append(_STR)
+            _write_varint(out, self.intern(value))
+        elif isinstance(value, (list, tuple)) and value and all(type(item) is str for item in value):
+            # Caso mais comum nas specs (apps, arquivos, dependências): só índices
+            out.append(_STR_LIST)
+            _write_varint(out, len(value))
+            for item in value:
+                _write_varint(out, self.intern(item))
+        elif isinstance(value, (list, tuple)):
+            out.append(_LIST)
+            _write_varint(out, len(value))
+            for item in value:
+                self._write(item)
+        elif isinstance(value, dict):
+            out.append(_DICT)
+            _write_varint(out, len(value))
+            for key, item in value.items():
+                self._write(key)
+                self._write(item)
+        else:
+            raise TypeError(f"Unsupported value type for specs codec: {type(value).__name__}")
+
+    def string_table(self) -> bytes:
+        """Offsets de fim (u32, em caracteres) seguidos das strings concatenadas em UTF-8.
+
+        Offsets em caracteres permitem decodificar a tabela inteira com uma única
+        chamada e recortar cada string do texto resultante.
+        """
+        offsets = bytearray()
+        position = 0
+        for text in self.strings:
+            position += len(text)
+            offsets += _OFFSET.pack(position)
+        return bytes(offsets) + "".join(self.strings).encode("utf-8")
+
+
+class _Decoder:
+    """Lê valores de um buffer codificado; valores são decodificados sob demanda."""
+
+    def __init__(self, buffer: BufferLike):
+        header = _read_header(buffer)
+        self.buffer = buffer
+        self.schema_version = header["schema"]
+        self.metadata_offset = header["metadata_offset"]
+        self.strings = _read_strings(buffer, header["strings_offset"], header["strings"], header["size"])
+
+        self.directory: Dict[str, int] = {}
+        position = _HEADER.size
+        for _ in range(header["fields"]):
+            name_index, value_offset = _DIRECTORY_ENTRY.unpack_from(buffer, position)
+            self.directory[self.strings[name_index]] = value_offset
+            position += _DIRECTORY_ENTRY.size
+
+    def value(self, pos: int) -> Tuple[Any, int]:
+        """Decodifica o valor em pos; retorna (valor, próxima posição)."""
+        buffer = self.buffer
+        tag = buffer[pos]
+        pos += 1
+        if tag == _STR:
+            index = buffer[pos]
+            if index < 0x80:
+                return self.strings[index], pos + 1
+            index, pos = _read_varint(buffer, pos)
+            return self.strings[index], pos
+        if tag == _STR_LIST or tag == _LIST or tag == _DICT:
+            count = buffer[pos]
+            if count < 0x80:
+                pos += 1
+            else:
+                count, pos = _read_varint(buffer, pos)
+            if tag == _STR_LIST:
+                strings = self.strings
+                items = []
+                for _ in range(count):
+                    index = buffer[pos]
+                    if index < 0x80:
+                        pos += 1
+                    else:
+                        index, pos = _read_varint(buffer, pos)
+                    items.append(strings[index])
+                return items, pos
+            if tag == _LIST:
+                items = []
+                for _ in range(count):
+                    item, pos = self.value(pos)
+                    items.append(item)
+                return items, pos
+            mapping = {}
+            for _ in range(count):
+                key, pos = self.value(pos)
+                mapping[key], pos = self.value(pos)
+            return mapping, pos
+        if tag == _NONE:
+            return None, pos
+        if tag == _TRUE:
+            return True, pos
+        if tag == _FALSE:
+            return False, pos
+        if tag == _INT or tag == _NEG_INT:
+            number, pos = _read_varint(buffer, pos)
+            return (number if tag == _INT else -number), pos
+        if tag == _FLOAT_TAG:
+            return _FLOAT.unpack_from(buffer, pos)[0], pos + _FLOAT.size
+        raise ValueError(f"Invalid specs codec tag {tag} at offset {pos - 1}")
+
+    def field(self, name: str) -> Any:
+        """Valor do campo; campos ausentes no buffer recebem o default do dataclass."""
+        offset = self.directory.get(name)
+        if offset is not None:
+            return self.value(offset)[0]
+        spec_field = _SPECS_FIELDS[name]
+        if spec_field.default_factory is not MISSING:
+            return spec_field.default_factory()
+        if spec_field.default is not MISSING:
+            return spec_field.default
+        raise ValueError(f"Required ProjectSpecs field '{name}' missing from encoded specs")
+
+    def metadata(self) -> Dict[str, Any]:
+        return self.value(self.metadata_offset)[0]
+
+
+def _read_strings(buffer: BufferLike, offset: int, count: int, size: int) -> List[str]:
+    """Decodifica a tabela de strings inteira (uma decodificação UTF-8 e um recorte por string)."""
+    data_start = offset + count * _OFFSET.size
+    if data_start > size:
+        raise ValueError("Encoded specs truncated or corrupted (string table)")
+    ends = struct.unpack_from(f"<{count}I", buffer, offset)
+    text = str(buffer[data_start:size], "utf-8")
+    starts = (0,) + ends[:-1]
+    return [text[start:end] for start, end in zip(starts, ends)]
+
+
+def _read_header(buffer: BufferLike) -> Dict[str, int]:
+    """Valida o cabeçalho e retorna seus campos."""
+    if len(buffer) < _HEADER.size:
+        raise ValueError("Encoded specs truncated (header)")
+    magic, version, schema, field_count, string_count, total_size, metadata_offset, strings_offset = \
+        _HEADER.unpack_from(buffer, 0)
+    if magic != MAGIC:
+        raise ValueError("Not an encoded ProjectSpecs buffer (bad magic)")
+    if version > CODEC_VERSION:
+        raise ValueError(f"Unsupported specs codec version {version} (max {CODEC_VERSION})")
+    if total_size > len(buffer) or strings_offset > total_size or metadata_offset > strings_offset:
+        raise ValueError("Encoded specs truncated or corrupted")
+    return {
+        "version": version,
+        "schema": schema,
+        "fields": field_count,
+        "strings": string_count,
+        "size": total_size,
+        "metadata_offset": metadata_offset,
+        "strings_offset": strings_offset,
+    }
+
+
+def encode_specs(specs: ProjectSpecs, metadata: Optional[Dict[str, Any]] = None,
+                 schema_version: int = PARSER_SCHEMA_VERSION) -> bytes:
+    """Codifica ProjectSpecs (e metadados opcionais) no formato binário versionado."""
+    encoder = _Encoder()
+    directory = bytearray()
+    for name in _SPECS_FIELDS:
+        directory += _DIRECTORY_ENTRY.pack(encoder.intern(name), encoder.value(getattr(specs, name)))
+    metadata_value = encoder.value(metadata or {})
+    strings = encoder.string_table()
+
+    values_start = _HEADER.size + len(directory)
+    values = bytes(encoder.values)
+    strings_offset = values_start + len(values)
+    total_size = strings_offset + len(strings)
+
+    # Offsets do diretório e dos metadados passam a ser absolutos no buffer
+    absolute = bytearray()
+    for position in range(0, len(directory), _DIRECTORY_ENTRY.size):
+        name_index, value_offset = _DIRECTORY_ENTRY.unpack_from(directory, position)
+        absolute += _DIRECTORY_ENTRY.pack(name_index, values_start + value_offset)
+
+    header = _HEADER.pack(MAGIC, CODEC_VERSION, schema_version, len(_SPECS_FIELDS),
+                          len(encoder.strings), total_size, values_start + metadata_value, strings_offset)
+    return header + bytes(absolute) + values + strings
+
+
+def decode_specs(buffer: BufferLike, lazy: bool = False) -> ProjectSpecs:
+    """Reconstrói ProjectSpecs a partir do buffer.
+
+    Com lazy=True o buffer precisa continuar válido até todos os campos lidos serem
+    acessados; use materialize() antes de liberar memória compartilhada.
+    """
+    decoder = _Decoder(buffer)
+    if not lazy:
+        return ProjectSpecs(**{name: decoder.field(name) for name in _SPECS_FIELDS})
+
+    def resolve(name: str):
+        specs.__dict__[name] = decoder.field(name)
+
+    specs = LazyProjectSpecs(resolve)
+    return specs
+
+
+def read_metadata(buffer: BufferLike) -> Dict[str, Any]:
+    """Metadados gravados junto às specs, mais a versão do schema ('schema')."""
+    decoder = _Decoder(buffer)
+    return {**decoder.metadata(), "schema": decoder.schema_version}
+
+
+def write_specs_file(path: Union[str, Path], specs: ProjectSpecs,
+                     metadata: Optional[Dict[str, Any]] = None) -> Path:
+    """Grava as specs codificadas em arquivo."""
+    path = Path(path)
+    path.write_bytes(encode_specs(specs, metadata))
+    return path
+
+
+def read_specs_file(path: Union[str, Path], lazy: bool = False) -> ProjectSpecs:
+    """Lê specs codificadas de um arquivo."""
+    return decode_specs(Path(path).read_bytes(), lazy=lazy)
+
+
+def share_specs(specs: ProjectSpecs, metadata: Optional[Dict[str, Any]] = None
+                ) -> shared_memory.SharedMemory:
+    """Copia as specs codificadas para um novo segmento de memória compartilhada.
+
+    O chamador é dono do segmento: deve chamar close() e unlink() ao terminar.
+    Outros processos usam load_shared_specs(segmento.name).
+    """
+    payload = encode_specs(specs, metadata)
+    segment = shared_memory.SharedMemory(create=True, size=len(payload))
+    segment.buf[:len(payload)] = payload
+    return segment
+
+
+def load_shared_specs(name: str) -> ProjectSpecs:
+    """Decodifica specs de um segmento de memória compartilhada existente.
+
+    O segmento pode ter sido arredondado para o tamanho de página; apenas os bytes
+    declarados no cabeçalho são copiados antes de desanexar.
+    """
+    segment = shared_memory.SharedMemory(name=name)
+    try:
+        size = _read_header(segment.buf)["size"]
+        payload = bytes(segment.buf[:size])
+    finally:
+        segment.close()
+    return decode_specs(payload)
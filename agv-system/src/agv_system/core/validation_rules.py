@@ -3,7 +3,8 @@
 ValidationRule and validation utilities shared across all generators.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, asdict
+from typing import Optional
 
 
 @dataclass
@@ -13,4 +14,30 @@ class ValidationRule:
     description: str
     code: str
     severity: str  # CRITICAL, HIGH, MEDIUM, LOW
-    category: str  # STRUCTURE, CONTENT, DEPENDENCIES, MODELS, API
\ No newline at end of file
+    category: str  # STRUCTURE, CONTENT, DEPENDENCIES, MODELS, API
+    group: Optional[str] = None  # alvo da regra em validadores multi-alvo (score por grupo)
+
+
+@dataclass
+class SamplingConfig:
+    """
+    Configuração de amostragem para regras que verificam todos os arquivos.
+    
+    Sem fraction/confidence as regras verificam todos os arquivos (modo completo,
+    usado em release gates). Os valores podem ser sobrescritos na execução do
+    validador pelas variáveis AGV_SAMPLE_FRACTION, AGV_SAMPLE_CONFIDENCE,
+    AGV_SAMPLE_MARGIN e AGV_SAMPLE_SEED; AGV_FULL_CHECKS=1 força o modo completo.
+    """
+    fraction: Optional[float] = None    # fração fixa da população (0-1]
+    confidence: Optional[float] = None  # nível de confiança para tamanho de amostra (ex: 0.95)
+    margin: float = 0.05                # margem de erro desejada para a taxa de violação
+    seed: int = 42                      # semente para seleção reprodutível
+
+    @property
+    def enabled(self) -> bool:
+        """Indica se alguma forma de amostragem foi configurada."""
+        return bool(self.fraction or self.confidence)
+
+    def to_dict(self):
+        """Converte para dicionário passado a configure_sampling() no validador gerado."""
+        return asdict(self)
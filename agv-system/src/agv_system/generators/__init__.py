@@ -3,13 +3,14 @@ Specialized generators for different AGV validation types.
 """
 
 from .scaffold_generator import ScaffoldGenerator
-from .target_generator import TargetGenerator  
+from .target_generator import TargetGenerator, MultiTargetGenerator
 from .integration_generator import IntegrationGenerator
 from .evolution_generator import EvolutionGenerator
 
 __all__ = [
     'ScaffoldGenerator',
     'TargetGenerator',
+    'MultiTargetGenerator',
     'IntegrationGenerator', 
     'EvolutionGenerator'
 ]
\ No newline at end of file
@@ -15,6 +15,10 @@ from core.validation_rules import ValidationRule
 from core.blueprint_parser import ProjectSpecs
 
 
+# Snapshot da API pública gravado por `agv-api-snapshot record` (contexto: "api_snapshot")
+API_SNAPSHOT_PATH = "agv-outputs/api_snapshot.json"
+
+
 class EvolutionGenerator(BaseGenerator):
     """Gerador especializado para validação de evolução e manutenção (F7-Evolucionista)."""
     
@@ -56,6 +60,7 @@ class EvolutionGenerator(BaseGenerator):
         """Gera regras para validar compatibilidade com versões anteriores."""
         breaking_changes = self.evolution_context.get('breaking_changes', [])
         deprecated_features = self.evolution_context.get('deprecated_features', [])
+        api_snapshot = self.evolution_context.get('api_snapshot', API_SNAPSHOT_PATH)
         
         rule_code = f"""
 def validate_backward_compatibility():
@@ -64,16 +69,10 @@ def validate_backward_compatibility():
     breaking_changes = {breaking_changes}
     deprecated_features = {deprecated_features}
     
-    python_files = list(Path('.').rglob('**/*.py'))
+    python_files = project_files('*.py')
     
     # Verificar se breaking changes estão documentados
-    changelog_files = list(Path('.').rglob('**/CHANGELOG.md'))
-    changelog_content = ""
-    
-    if changelog_files:
-        for changelog in changelog_files:
-            if changelog.exists():
-                changelog_content += changelog.read_text(encoding='utf-8', errors='ignore')
+    changelog_content = "".join(read_project_file(changelog) for changelog in project_files('CHANGELOG.md'))
     
     for breaking_change in breaking_changes:
         if breaking_change.lower() not in changelog_content.lower():
@@ -88,29 +87,63 @@ def validate_backward_compatibility():
     
     # Verificar se features deprecated têm warnings
     for py_file in python_files:
-        if py_file.exists():
-            content = py_file.read_text(encoding='utf-8', errors='ignore')
+        content = read_project_file(py_file)
+        
+        for deprecated_feature in deprecated_features:
+            if deprecated_feature in content:
+                # Verificar se há warning de depreciação próximo
+                lines = content.split('\\n')
+                for i, line in enumerate(lines):
+                    if deprecated_feature in line:
+                        # Verificar 5 linhas antes e depois
+                        context_start = max(0, i - 5)
+                        context_end = min(len(lines), i + 6)
+                        context = '\\n'.join(lines[context_start:context_end])
+                        
+                        if 'deprecated' not in context.lower() and 'warning' not in context.lower():
+                            issues.append(ValidationIssue(
+                                file_path=str(py_file),
+                                issue_type="missing_deprecation_warning",
+                                description=f"Feature deprecated sem warning: {{deprecated_feature}}",
+                                expected="Features deprecated devem ter warnings",
+                                actual="Warning não encontrado",
+                                severity="MEDIUM"
+                            ))
+    
+    # Diff estrutural da API pública atual contra o snapshot (agv-api-snapshot record)
+    snapshot = load_api_snapshot({api_snapshot!r})
+    if snapshot:
+        baseline_ref = snapshot.get('ref') or 'snapshot'
+        declared = " ".join(breaking_changes).lower()
+        removed_labels = {{'module_removed': 'módulo', 'class_removed': 'classe',
+                          'function_removed': 'função', 'method_removed': 'método'}}
+        
+        for change in diff_public_api(snapshot['modules'], public_api()):
+            # Remoções declaradas como breaking change já são cobradas no CHANGELOG
+            if change['symbol'].lower() in declared:
+                continue
             
-            for deprecated_feature in deprecated_features:
-                if deprecated_feature in content:
-                    # Verificar se há warning de depreciação próximo
-                    lines = content.split('\\n')
-                    for i, line in enumerate(lines):
-                        if deprecated_feature in line:
-                            # Verificar 5 linhas antes e depois
-                            context_start = max(0, i - 5)
-                            context_end = min(len(lines), i + 6)
-                            context = '\\n'.join(lines[context_start:context_end])
-                            
-                            if 'deprecated' not in context.lower() and 'warning' not in context.lower():
-                                issues.append(ValidationIssue(
-                                    file_path=str(py_file),
-                                    issue_type="missing_deprecation_warning",
-                                    description=f"Feature deprecated sem warning: {{deprecated_feature}}",
-                                    expected="Features deprecated devem ter warnings",
-                                    actual="Warning não encontrado",
-                                    severity="MEDIUM"
-                                ))
+            symbol = change['module']
+            if change['kind'] != 'module_removed':
+                symbol += '.' + change['symbol']
+            if change['kind'] == 'signature_changed':
+                issues.append(ValidationIssue(
+                    file_path=change['path'],
+                    issue_type="incompatible_signature_change",
+                    description=f"Assinatura incompatível com {{baseline_ref}}: {{symbol}}",
+                    expected="Assinatura pública deve aceitar as chamadas válidas na versão anterior",
+                    actual=change['detail'],
+                    severity="HIGH"
+                ))
+            else:
+                issues.append(ValidationIssue(
+                    file_path=change['path'],
+                    issue_type="public_api_removed",
+                    description=f"API pública removida desde {{baseline_ref}}: {{removed_labels[change['kind']]}} {{symbol}}",
+                    expected="API pública preservada ou remoção declarada como breaking change",
+                    actual="Símbolo ausente na versão atual",
+                    severity="HIGH"
+                ))
     
     return issues if issues else None
 """
@@ -126,6 +159,7 @@ def validate_backward_compatibility():
     def _generate_refactoring_safety_rules(self):
         """Gera regras para validar segurança de refatorações."""
         refactored_components = self.evolution_context.get('refactored_components', [])
+        api_snapshot = self.evolution_context.get('api_snapshot', API_SNAPSHOT_PATH)
         
         if refactored_components:
             rule_code = f"""
@@ -135,33 +169,53 @@ def validate_refactoring_safety():
     refactored_components = {refactored_components}
     
     # Verificar se componentes refatorados mantêm interfaces públicas
-    python_files = list(Path('.').rglob('**/*.py'))
+    api = public_api()
+    snapshot = load_api_snapshot({api_snapshot!r})
+    baseline = snapshot['modules'] if snapshot else {{}}
+    baseline_symbols = snapshot['symbols'] if snapshot else {{}}
     
     for component in refactored_components:
-        component_found = False
+        # Módulos que definem o componente (classe ou função de nível de módulo)
+        modules = [
+            module for module, module_api in api.items()
+            if component in module_api['classes'] or component in module_api['functions']
+        ]
+        component_found = bool(modules) or any(
+            f'class {{component}}' in content or f'def {{component}}' in content
+            for content in map(read_project_file, project_files('*.py'))
+        )
         
-        for py_file in python_files:
-            if py_file.exists():
-                content = py_file.read_text(encoding='utf-8', errors='ignore')
-                
-                # Buscar definição do componente (classe ou função)
-                if f'class {component}' in content or f'def {component}' in content:
-                    component_found = True
-                    
-                    # Verificar se interface pública está preservada
-                    # (métodos públicos não devem ter mudado)
-                    public_methods = re.findall(r'def ([a-zA-Z][a-zA-Z0-9_]*)', content)
-                    public_methods = [m for m in public_methods if not m.startswith('_')]
-                    
-                    if len(public_methods) == 0:
-                        issues.append(ValidationIssue(
-                            file_path=str(py_file),
-                            issue_type="refactoring_removed_public_interface",
-                            description=f"Componente {{component}} pode ter perdido interface pública",
-                            expected="Interface pública deve ser preservada",
-                            actual="Nenhum método público encontrado",
-                            severity="HIGH"
-                        ))
+        if modules and component in baseline_symbols:
+            # Diff estrutural contra a definição do snapshot (o componente pode ter mudado de módulo)
+            old_module = baseline_symbols[component][0]
+            new_module = old_module if old_module in modules else modules[0]
+            for change in diff_public_api({{old_module: baseline[old_module]}}, {{old_module: api[new_module]}}):
+                if change['symbol'].split('.')[0] != component:
+                    continue
+                issues.append(ValidationIssue(
+                    file_path=change['path'],
+                    issue_type="refactoring_removed_public_interface",
+                    description=f"Componente {{component}} alterou a interface pública: {{change['symbol']}}",
+                    expected=f"Interface pública igual à de {{snapshot.get('ref') or 'snapshot'}}",
+                    actual=change['detail'] or "Símbolo removido",
+                    severity="HIGH"
+                ))
+        elif modules:
+            # Sem snapshot: o módulo do componente deve manter alguma função ou método público
+            module_api = api[modules[0]]
+            public_methods = [
+                method for methods in module_api['classes'].values() for method in methods
+                if not method.startswith('_')
+            ]
+            if not module_api['functions'] and not public_methods:
+                issues.append(ValidationIssue(
+                    file_path=module_api['path'],
+                    issue_type="refactoring_removed_public_interface",
+                    description=f"Componente {{component}} pode ter perdido interface pública",
+                    expected="Interface pública deve ser preservada",
+                    actual="Nenhum método público encontrado",
+                    severity="HIGH"
+                ))
         
         if not component_found:
             issues.append(ValidationIssue(
@@ -483,7 +537,7 @@ def validate_data_migrations():
     data_migrations = {data_migrations}
     
     # Verificar arquivos de migração
-    migration_dirs = list(Path('.').rglob('**/migrations/'))
+    migration_dirs = project_dirs('migrations')
     
     if not migration_dirs:
         issues.append(ValidationIssue(
@@ -496,40 +550,52 @@ def validate_data_migrations():
         ))
         return issues
     
-    migration_files = []
-    for migration_dir in migration_dirs:
-        migration_files.extend(list(migration_dir.rglob('*.py')))
+    graph = migration_graph()
     
-    # Verificar migrações de dados específicas
-    all_migration_content = ""
-    for migration_file in migration_files:
-        if migration_file.exists():
-            all_migration_content += migration_file.read_text(encoding='utf-8', errors='ignore')
+    # Verificar migrações de dados específicas: nome da migração ou alvo de uma operação
+    # (modelo, função do RunPython); o conteúdo dos arquivos só é consultado se o índice não achar
+    indexed_names = set()
+    for migration in graph.nodes.values():
+        indexed_names.add(f"{{migration.app}}.{{migration.name}}")
+        indexed_names.update(target for _, target in migration.operations)
     
     for data_migration in data_migrations:
-        if data_migration not in all_migration_content:
-            issues.append(ValidationIssue(
-                file_path="migrations/",
-                issue_type="missing_data_migration",
-                description=f"Migração de dados não encontrada: {{data_migration}}",
-                expected=f"Migração {{data_migration}} deve existir",
-                actual="Migração não encontrada",
-                severity="HIGH"
-            ))
+        if any(data_migration in name for name in indexed_names):
+            continue
+        if any(data_migration in read_project_file(migration.path) for migration in graph.nodes.values()):
+            continue
+        issues.append(ValidationIssue(
+            file_path="migrations/",
+            issue_type="missing_data_migration",
+            description=f"Migração de dados não encontrada: {{data_migration}}",
+            expected=f"Migração {{data_migration}} deve existir",
+            actual="Migração não encontrada",
+            severity="HIGH"
+        ))
     
-    # Verificar se migrações são reversíveis
-    if 'RunPython' in all_migration_content:
-        # Heurística: se usa RunPython, deveria ter reverse_code
-        if 'reverse_code' not in all_migration_content and 'migrations.RunPython.noop' not in all_migration_content:
+    # Verificar se migrações de dados são reversíveis (RunPython/RunSQL sem reverse_code/reverse_sql)
+    for migration in graph.data_migrations():
+        if migration.irreversible:
             issues.append(ValidationIssue(
-                file_path="migrations/",
+                file_path=str(migration.path),
                 issue_type="non_reversible_migration",
-                description="Migração de dados pode não ser reversível",
-                expected="Migrações RunPython devem ter reverse_code",
-                actual="reverse_code não encontrado",
+                description=f"Migração de dados {{migration.app}}.{{migration.name}} não é reversível",
+                expected="Migrações RunPython/RunSQL devem ter reverse_code/reverse_sql",
+                actual=f"{{', '.join(migration.irreversible)}} sem operação reversa",
                 severity="MEDIUM"
             ))
     
+    # Migrações conflitantes após a evolução (branches com migrações paralelas)
+    for app, leaves in graph.conflicts().items():
+        issues.append(ValidationIssue(
+            file_path=f"{{app}}/migrations/",
+            issue_type="migration_leaf_conflict",
+            description=f"Migrações conflitantes no app {{app}}: {{', '.join(leaves)}}",
+            expected="Uma única migração final por app (makemigrations --merge)",
+            actual=f"{{len(leaves)}} migrações finais",
+            severity="HIGH"
+        ))
+    
     return issues if issues else None
 """
             
@@ -2,6 +2,9 @@
 """
 IntegrationGenerator - Gerador especializado para validação de paradas de testes de integração (T1-TN).
 Foco em validar colaboração entre módulos, interfaces e integrações do sistema.
+
+Integração e comunicação entre módulos são consultas ao grafo de imports do runtime
+(import_graph), construído uma vez a partir dos nós de import do ast.
 """
 
 from typing import List, Dict, Any
@@ -15,6 +18,14 @@ from core.validation_rules import ValidationRule
 from core.blueprint_parser import ProjectSpecs
 
 
+# Bibliotecas cujo import caracteriza cada padrão de comunicação (consultadas no grafo de imports)
+COMMUNICATION_PATTERN_IMPORTS = {
+    'signal': ['django.dispatch', 'django.db.models.signals', 'django.core.signals'],
+    'message_queue': ['celery', 'kombu', 'queue', 'rq', 'pika', 'dramatiq'],
+    'api_call': ['requests', 'httpx', 'aiohttp', 'urllib.request'],
+}
+
+
 class IntegrationGenerator(BaseGenerator):
     """Gerador especializado para validação de testes de integração (T1-TN)."""
     
@@ -60,17 +71,15 @@ def validate_{self.integration_phase.lower()}_module_integration():
     '''Valida integração entre módulos na fase {self.integration_phase}.'''
     issues = []
     modules = {modules}
+    graph = import_graph()
     
     # Verificar se todos os módulos existem
     for module in modules:
-        module_paths = (
-            list(Path('.').rglob(f'**/{module}/__init__.py')) +
-            list(Path('.').rglob(f'**/{module}.py'))
-        )
+        module_paths = project_files(f'{{module}}/__init__.py') + project_files(f'{{module}}.py')
         
         if not module_paths:
             issues.append(ValidationIssue(
-                file_path=f"{module}/",
+                file_path=f"{{module}}/",
                 issue_type="missing_integration_module",
                 description=f"Módulo {{module}} da fase {self.integration_phase} não encontrado",
                 expected=f"Módulo {{module}} deve existir",
@@ -78,31 +87,35 @@ def validate_{self.integration_phase.lower()}_module_integration():
                 severity="HIGH"
             ))
             continue
-            
-        # Verificar imports entre módulos
-        for module_path in module_paths:
-            if module_path.exists():
-                content = module_path.read_text(encoding='utf-8', errors='ignore')
-                
-                # Contar importações de outros módulos da integração
-                other_modules = [m for m in modules if m != module]
-                import_count = 0
-                
-                for other_module in other_modules:
-                    if f'from {other_module}' in content or f'import {other_module}' in content:
-                        import_count += 1
-                
-                # Se há múltiplos módulos mas poucas integrações, pode ser problema
-                if len(other_modules) > 1 and import_count == 0:
-                    issues.append(ValidationIssue(
-                        file_path=str(module_path),
-                        issue_type="missing_module_integration",
-                        description=f"Módulo {{module}} não integra com outros módulos",
-                        expected="Integração com outros módulos",
-                        actual="Nenhuma integração encontrada",
-                        severity="MEDIUM"
-                    ))
+        
+        # Importações de outros módulos da integração (consulta ao grafo de imports)
+        other_modules = [m for m in modules if m != module]
+        import_count = sum(1 for other_module in other_modules if graph.depends_on(module, other_module))
+        
+        # Se há múltiplos módulos mas poucas integrações, pode ser problema
+        if len(other_modules) > 1 and import_count == 0:
+            issues.append(ValidationIssue(
+                file_path=str(module_paths[0]),
+                issue_type="missing_module_integration",
+                description=f"Módulo {{module}} não integra com outros módulos",
+                expected="Integração com outros módulos",
+                actual="Nenhuma integração encontrada",
+                severity="MEDIUM"
+            ))
     
+    # Imports circulares envolvendo módulos da integração
+    integration_modules = {{name for module in modules for name in graph.modules_in(module)}}
+    for cycle in graph.cycles():
+        if integration_modules.intersection(cycle):
+            issues.append(ValidationIssue(
+                file_path=str(graph.files[cycle[0]]),
+                issue_type="circular_module_import",
+                description=f"Import circular entre módulos: {{', '.join(cycle)}}",
+                expected="Dependências entre módulos sem ciclos no carregamento",
+                actual=f"Ciclo com {{len(cycle)}} módulos",
+                severity="MEDIUM"
+            ))
+
     return issues if issues else None
 """
             
@@ -128,16 +141,16 @@ def validate_{self.integration_phase.lower()}_interfaces():
     contracts = {contracts}
     
     # Verificar definições de interfaces
-    python_files = list(Path('.').rglob('**/*.py'))
+    python_files = project_files('*.py')
     found_interfaces = set()
     
     for py_file in python_files:
         if py_file.exists():
-            content = py_file.read_text(encoding='utf-8', errors='ignore')
+            content = read_project_file(py_file)
             
             # Buscar classes abstratas ou interfaces
             for interface in interfaces:
-                if f'class {interface}' in content:
+                if f'class {{interface}}' in content:
                     found_interfaces.add(interface)
                     
                     # Verificar se é abstrata (ABC)
@@ -184,30 +197,20 @@ def validate_{self.integration_phase.lower()}_communication():
     '''Valida padrões de comunicação da fase {self.integration_phase}.'''
     issues = []
     patterns = {communication_patterns}
+    pattern_imports = {COMMUNICATION_PATTERN_IMPORTS}
     
-    # Verificar padrões de comunicação
-    python_files = list(Path('.').rglob('**/*.py'))
+    # Verificar padrões de comunicação: módulos que importam as bibliotecas do padrão
+    graph = import_graph()
     
     for pattern in patterns:
-        pattern_found = False
-        
-        for py_file in python_files:
-            if py_file.exists():
-                content = py_file.read_text(encoding='utf-8', errors='ignore')
-                
-                # Verificar padrões específicos
-                if pattern == 'signal':
-                    if 'django.dispatch' in content or '@receiver' in content:
-                        pattern_found = True
-                elif pattern == 'event':
-                    if 'Event' in content and 'trigger' in content:
-                        pattern_found = True
-                elif pattern == 'message_queue':
-                    if 'celery' in content or 'queue' in content:
-                        pattern_found = True
-                elif pattern == 'api_call':
-                    if 'requests.' in content or 'httpx.' in content:
-                        pattern_found = True
+        if pattern == 'event':
+            # Eventos não dependem de biblioteca específica: busca no conteúdo
+            pattern_found = any(
+                'Event' in content and 'trigger' in content
+                for content in map(read_project_file, project_files('*.py'))
+            )
+        else:
+            pattern_found = bool(graph.importers_of(*pattern_imports.get(pattern, ())))
         
         if not pattern_found:
             issues.append(ValidationIssue(
@@ -242,11 +245,7 @@ def validate_{self.integration_phase.lower()}_database_integration():
     db_operations = {db_operations}
     
     # Verificar migrações para a integração
-    migration_dirs = list(Path('.').rglob('**/migrations/'))
-    migration_files = []
-    
-    for migration_dir in migration_dirs:
-        migration_files.extend(list(migration_dir.rglob('*.py')))
+    migration_files = [path for path in project_files('*.py') if 'migrations' in path.parts[:-1]]
     
     if not migration_files:
         issues.append(ValidationIssue(
@@ -263,7 +262,7 @@ def validate_{self.integration_phase.lower()}_database_integration():
     all_migration_content = ""
     for migration_file in migration_files:
         if migration_file.exists():
-            all_migration_content += migration_file.read_text(encoding='utf-8', errors='ignore')
+            all_migration_content += read_project_file(migration_file)
     
     for operation in db_operations:
         if operation == 'create_table' and 'CreateModel' not in all_migration_content:
@@ -310,12 +309,12 @@ def validate_{self.integration_phase.lower()}_api_integration():
     external_apis = {external_apis or []}
     
     # Verificar endpoints internos
-    urls_files = list(Path('.').rglob('**/urls.py'))
+    urls_files = project_files('urls.py')
     all_urls_content = ""
     
     for urls_file in urls_files:
         if urls_file.exists():
-            all_urls_content += urls_file.read_text(encoding='utf-8', errors='ignore')
+            all_urls_content += read_project_file(urls_file)
     
     for endpoint in api_endpoints:
         if endpoint not in all_urls_content:
@@ -329,14 +328,14 @@ def validate_{self.integration_phase.lower()}_api_integration():
             ))
     
     # Verificar integrações com APIs externas
-    python_files = list(Path('.').rglob('**/*.py'))
+    python_files = project_files('*.py')
     
     for external_api in external_apis:
         api_found = False
         
         for py_file in python_files:
             if py_file.exists():
-                content = py_file.read_text(encoding='utf-8', errors='ignore')
+                content = read_project_file(py_file)
                 if external_api.lower() in content.lower():
                     api_found = True
                     break
@@ -374,9 +373,9 @@ def validate_{self.integration_phase.lower()}_integration_tests():
     
     # Buscar arquivos de teste de integração
     integration_test_files = (
-        list(Path('.').rglob('**/test_integration*.py')) +
-        list(Path('.').rglob('**/integration_test*.py')) +
-        list(Path('.').rglob('**/tests/integration/*.py'))
+        project_files('test_integration*.py') +
+        project_files('integration_test*.py') +
+        project_files('tests/integration/*.py')
     )
     
     if not integration_test_files:
@@ -394,7 +393,7 @@ def validate_{self.integration_phase.lower()}_integration_tests():
     all_test_content = ""
     for test_file in integration_test_files:
         if test_file.exists():
-            all_test_content += test_file.read_text(encoding='utf-8', errors='ignore')
+            all_test_content += read_project_file(test_file)
     
     for scenario in test_scenarios:
         scenario_patterns = [
@@ -438,11 +437,11 @@ def validate_{self.integration_phase.lower()}_configuration():
     config_keys = {config_keys}
     
     # Verificar em settings.py
-    settings_files = list(Path('.').rglob('**/settings.py'))
+    settings_files = project_files('settings.py')
     
     for settings_file in settings_files:
         if settings_file.exists():
-            content = settings_file.read_text(encoding='utf-8', errors='ignore')
+            content = read_project_file(settings_file)
             
             for config_key in config_keys:
                 if config_key not in content:
@@ -456,16 +455,16 @@ def validate_{self.integration_phase.lower()}_configuration():
                     ))
     
     # Verificar variáveis de ambiente
-    env_files = list(Path('.').rglob('**/.env*'))
+    env_files = project_files('.env*')
     
     if env_files:
         for env_file in env_files:
             if env_file.exists():
-                content = env_file.read_text(encoding='utf-8', errors='ignore')
+                content = read_project_file(env_file)
                 
                 for config_key in config_keys:
                     # Buscar por variáveis de ambiente relacionadas
-                    env_var_pattern = f'{config_key.upper()}_'
+                    env_var_pattern = f'{{config_key.upper()}}_'
                     if config_key.upper() not in content and env_var_pattern not in content:
                         issues.append(ValidationIssue(
                             file_path=str(env_file),
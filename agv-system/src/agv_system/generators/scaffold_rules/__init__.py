@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Catálogo de famílias de regras do ScaffoldGenerator.
+
+Cada família declara o módulo que implementa suas regras, os métodos que as geram
+(em ordem de emissão) e as condições do Blueprint em que se aplica. O gerador
+importa apenas os módulos das famílias aplicáveis: um projeto sem frontend não
+carrega nem gera regras de frontend.
+"""
+
+import importlib
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Tuple
+
+
+class ScaffoldRuleSet:
+    """Base dos módulos de regras: compartilha specs, lista de regras e helpers do gerador."""
+
+    def __init__(self, generator):
+        self.generator = generator
+        self.specs = generator.specs
+        self.rules = generator.rules
+
+    def _create_directory_validation_code(self, directories):
+        return self.generator._create_directory_validation_code(directories)
+
+    def _create_content_validation_code(self, file_path, required_content):
+        return self.generator._create_content_validation_code(file_path, required_content)
+
+
+# Condições de aplicabilidade avaliadas sobre ProjectSpecs
+CONDITIONS: Dict[str, Callable] = {
+    "models": lambda specs: bool(specs.models),
+    "django": lambda specs: specs.backend_framework == "django",
+    "frontend": lambda specs: bool(specs.frontend_framework),
+    "docker": lambda specs: bool(specs.docker_files),
+    "multi_tenancy": lambda specs: bool(specs.multi_tenancy),
+}
+
+
+@dataclass(frozen=True)
+class RuleFamily:
+    """Declaração de uma família de regras de scaffold.
+
+    module: submódulo de scaffold_rules com a classe `rule_set`
+    methods: métodos de `rule_set` chamados em ordem para gerar as regras
+    requires: condições de CONDITIONS que precisam valer para a família se aplicar
+    """
+    name: str
+    module: str
+    rule_set: str
+    methods: Tuple[str, ...]
+    requires: Tuple[str, ...] = ()
+
+    def applies_to(self, specs) -> bool:
+        """Indica se a família se aplica ao projeto descrito por specs."""
+        return all(CONDITIONS[condition](specs) for condition in self.requires)
+
+
+# Ordem do catálogo = ordem de emissão das regras no validador gerado
+SCAFFOLD_RULE_FAMILIES: Tuple[RuleFamily, ...] = (
+    RuleFamily("structure", "project", "ProjectRules", ("_generate_structure_rules",)),
+    RuleFamily("configuration", "project", "ProjectRules", ("_generate_configuration_validation_rules",)),
+    RuleFamily("content", "project", "ProjectRules", ("_generate_content_validation_rules",)),
+    RuleFamily("dependencies", "project", "ProjectRules", ("_generate_dependency_validation_rules",)),
+    RuleFamily("django_framework", "django", "DjangoRules", ("_generate_framework_specific_rules",),
+               requires=("django",)),
+    RuleFamily("multi_tenancy", "multi_tenancy", "MultiTenancyRules", ("_generate_multi_tenancy_rules",),
+               requires=("multi_tenancy",)),
+    # FASE 1: validações completas de modelos de domínio
+    RuleFamily("domain_models", "django", "DjangoRules",
+               ("_generate_universal_models_validation", "_generate_model_docstring_validation",
+                "_generate_apps_structure_validation"),
+               requires=("models",)),
+    RuleFamily("ci_cd", "quality", "QualityRules", ("_generate_github_actions_validation",),
+               requires=("models",)),
+    RuleFamily("test_structure", "quality", "QualityRules", ("_generate_complete_test_structure_validation",),
+               requires=("models",)),
+    RuleFamily("django_core_files", "django", "DjangoRules", ("_generate_django_core_files_validation",),
+               requires=("models", "django")),
+    RuleFamily("frontend_dependencies", "frontend", "FrontendRules",
+               ("_generate_frontend_dependencies_complete_validation",),
+               requires=("models", "frontend")),
+    RuleFamily("backend_dependencies", "django", "DjangoRules",
+               ("_generate_backend_dependencies_complete_validation",),
+               requires=("models", "django")),
+    RuleFamily("frontend_core_files", "frontend", "FrontendRules", ("_generate_frontend_core_files_validation",),
+               requires=("models", "frontend")),
+    RuleFamily("docker_complete", "docker", "DockerRules", ("_generate_docker_complete_validation",),
+               requires=("models", "docker")),
+    RuleFamily("project_layout", "quality", "QualityRules",
+               ("_generate_specific_directory_structure_validation", "_generate_ide_configuration_validation",
+                "_generate_security_best_practices_validation", "_generate_code_quality_validation"),
+               requires=("models",)),
+    RuleFamily("documentation", "project", "ProjectRules", ("_generate_documentation_rules",)),
+    RuleFamily("docker", "docker", "DockerRules", ("_generate_docker_rules",), requires=("docker",)),
+    RuleFamily("development_setup", "project", "ProjectRules", ("_generate_development_setup_rules",)),
+    RuleFamily("docstrings", "project", "ProjectRules", ("_generate_docstring_validation_rules",)),
+    # Validações absolutas de estrutura completa
+    RuleFamily("frontend_structure", "frontend", "FrontendRules",
+               ("_generate_detailed_frontend_structure_validation",),
+               requires=("frontend",)),
+    RuleFamily("scaffolder_compliance", "project", "ProjectRules",
+               ("_generate_scaffolder_prompt_compliance_validation",)),
+)
+
+
+def applicable_families(specs) -> List[RuleFamily]:
+    """Famílias do catálogo aplicáveis ao projeto, em ordem de emissão."""
+    return [family for family in SCAFFOLD_RULE_FAMILIES if family.applies_to(specs)]
+
+
+def load_rule_set(family: RuleFamily):
+    """Importa (sob demanda) o módulo da família e retorna sua classe de regras."""
+    module = importlib.import_module(f".{family.module}", __name__)
+    return getattr(module, family.rule_set)
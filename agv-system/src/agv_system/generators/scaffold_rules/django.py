@@ -0,0 +1,371 @@
+#!/usr/bin/env python3
+"""
+DjangoRules - Regras do backend Django: settings, modelos de domínio, apps, arquivos core
+e dependências completas do backend.
+"""
+
+from pathlib import Path
+
+import sys
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from core.validation_rules import ValidationRule
+
+from . import ScaffoldRuleSet
+
+
+class DjangoRules(ScaffoldRuleSet):
+    """Regras específicas do backend Django."""
+    
+    def _generate_framework_specific_rules(self):
+        """Gera regras específicas para Django e React."""
+        # Django settings.py scaffolder validation (apenas estrutura e docstring)
+        if self.specs.backend_framework == "django":
+            rule_code = """
+def validate_django_settings_advanced():
+    '''Valida que settings.py existe com docstring conforme scaffolder.'''
+    settings_files = glob_project('**/settings.py')
+    if not settings_files:
+        return [missing_file_issue("settings.py", "missing_settings_file", "Arquivo settings.py não encontrado",
+                                   "Arquivo settings.py deve existir", "HIGH")]
+    
+    # Para scaffolder, validamos apenas que tem docstring
+    # NÃO validamos configurações implementadas (isso é para fases posteriores)
+    issues = []
+    for settings_file in settings_files:
+        content = read_project_file(settings_file)
+        if not content.strip():
+            issues.append(ValidationIssue(
+                str(settings_file), "empty_settings_file", "Arquivo settings.py está vazio",
+                "Arquivo deve ter pelo menos uma docstring", "Arquivo vazio", "MEDIUM"
+            ))
+        elif not starts_with_docstring(content):
+            issues.append(ValidationIssue(
+                str(settings_file), "missing_scaffold_docstring", "Arquivo settings.py deve começar com docstring",
+                "APENAS docstring conforme agv-scaffolder", "Arquivo não começa com docstring", "MEDIUM"
+            ))
+    
+    return issues if issues else None
+"""
+            
+            self.rules.append(ValidationRule(
+                name="validate_django_settings_advanced",
+                description="Valida settings.py com docstring conforme scaffolder",
+                code=rule_code.strip(),
+                severity="HIGH",
+                category="CONTENT"
+            ))
+    
+    def _generate_universal_models_validation(self):
+        """Valida existência de arquivos models.py com docstrings (escopo scaffolder)."""
+        expected_apps = list(self.specs.django_apps) if self.specs.django_apps else []
+        
+        rule_code = f"""
+def validate_all_blueprint_models():
+    '''Valida que arquivos models.py existem com docstrings conforme scaffolder.'''
+    issues = []
+    
+    # Para scaffolder, validamos que os arquivos models.py existem com docstrings
+    # NÃO validamos classes implementadas (isso é para fases posteriores)
+    for app_name in {expected_apps}:
+        model_files = first_glob([
+            '**/backend/src/*/' + app_name + '/models.py',
+            '**/src/*/' + app_name + '/models.py',
+            '**/' + app_name + '/models.py'
+        ], is_package_file)
+        if not model_files:
+            issues.append(missing_file_issue(
+                app_name + "/models.py", "missing_models_file", "Arquivo models.py não encontrado para app " + app_name,
+                "Arquivo models.py deve existir no app " + app_name, "HIGH"
+            ))
+        
+        for model_file in model_files:
+            content = read_project_file(model_file)
+            if content.strip() and not starts_with_docstring(content):
+                issues.append(ValidationIssue(
+                    str(model_file), "missing_scaffold_docstring",
+                    "Arquivo models.py do app " + app_name + " deve começar com docstring",
+                    "APENAS docstring conforme agv-scaffolder", "Arquivo não começa com docstring", "MEDIUM"
+                ))
+    
+    return issues if issues else None
+"""
+        
+        self.rules.append(ValidationRule(
+            name="validate_all_blueprint_models",
+            description="Valida arquivos models.py com docstrings conforme scaffolder",
+            code=rule_code.strip(),
+            severity="HIGH",
+            category="MODELS"
+        ))
+    
+    def _generate_model_docstring_validation(self):
+        """Valida se arquivos de modelos têm docstrings (escopo scaffolder)."""
+        rule_code = """
+def validate_model_files_docstrings():
+    '''Valida se arquivos models.py têm docstrings de módulo obrigatórias.'''
+    issues = []
+    
+    # Buscar models.py em estruturas Django típicas (cada arquivo uma vez, na ordem dos padrões)
+    django_patterns = [
+        '**/backend/src/*/models.py',
+        '**/backend/src/*/*/models.py', 
+        '**/src/*/models.py',
+        '**/src/*/*/models.py',
+        '**/models.py',
+    ]
+    models_files = list(dict.fromkeys(
+        path for pattern in django_patterns for path in glob_project(pattern) if is_package_file(path)
+    ))
+    
+    # Amostragem opcional para monorepos grandes (AGV_SAMPLE_*)
+    models_files = sample_files('validate_model_files_docstrings', models_files)
+    
+    for model_file in models_files:
+        if not starts_with_docstring(read_project_file(model_file)):
+            issues.append(ValidationIssue(
+                str(model_file), "missing_module_docstring",
+                f"Arquivo models.py sem docstring de módulo: {model_file.name}",
+                "Arquivo deve começar com docstring de módulo explicando seu propósito",
+                "Docstring de módulo não encontrada", "MEDIUM"
+            ))
+    
+    record_sample_result('validate_model_files_docstrings', issues)
+    return issues if issues else None
+"""
+            
+        self.rules.append(ValidationRule(
+            name="validate_model_files_docstrings",
+            description="Valida docstrings obrigatórias em arquivos de modelos",
+            code=rule_code.strip(),
+            severity="MEDIUM",
+            category="CONTENT"
+        ))
+    
+    def _generate_apps_structure_validation(self):
+        """Valida estrutura completa de apps Django - UNIVERSAL."""
+        if not hasattr(self.specs, 'django_apps') or not self.specs.django_apps:
+            return
+            
+        required_apps = list(self.specs.django_apps)
+        
+        rule_code = f"""
+def validate_django_apps_structure():
+    '''Valida estrutura completa de apps Django conforme Blueprint.'''
+    issues = []
+    required_apps = {required_apps}
+    
+    for app_name in required_apps:
+        # Padrões típicos de estrutura Django; apps são diretórios com __init__.py
+        app_dirs = first_glob([
+            '**/backend/src/*/' + app_name + '/',  # iabank/backend/src/iabank/app_name/
+            '**/src/*/' + app_name + '/',          # projeto/src/projeto/app_name/
+            '**/' + app_name + '/',                # projeto/app_name/ (fallback)
+        ], is_package_dir)
+        if not app_dirs:
+            issues.append(ValidationIssue(
+                app_name, "missing_django_app", "App Django não encontrado: " + app_name,
+                "App " + app_name + " deve estar implementado", "App não existe", "HIGH"
+            ))
+        
+        for app_dir in app_dirs:
+            # Arquivos obrigatórios em cada app e diretório de testes
+            for req_file in ['models.py', 'views.py', 'apps.py', '__init__.py']:
+                if not (app_dir / req_file).exists():
+                    issues.append(missing_file_issue(
+                        app_dir / req_file, "missing_app_file",
+                        "Arquivo obrigatório não encontrado em app " + app_name + ": " + req_file,
+                        "Arquivo " + req_file + " deve existir no app Django", "HIGH"
+                    ))
+            if not (app_dir / 'tests').exists():
+                issues.append(missing_file_issue(
+                    app_dir / 'tests', "missing_tests_directory", "Diretório de testes não encontrado no app " + app_name,
+                    "Diretório tests/ deve existir no app", "MEDIUM", "Diretório não existe"
+                ))
+    
+    return issues if issues else None
+"""
+        
+        self.rules.append(ValidationRule(
+            name="validate_django_apps_structure",
+            description="Valida estrutura completa de apps Django",
+            code=rule_code.strip(),
+            severity="HIGH",
+            category="STRUCTURE"
+        ))
+    
+    def _generate_django_core_files_validation(self):
+        """Valida arquivos Python core do Django (asgi.py, wsgi.py, urls.py, manage.py)."""
+        rule_code = """
+def validate_django_core_files():
+    '''Valida existência dos arquivos core do Django com docstrings.'''
+    issues = []
+    
+    # Arquivos core Django obrigatórios
+    core_files = [
+        {
+            'patterns': ['**/backend/src/*/asgi.py', '**/src/*/asgi.py', '**/asgi.py'],
+            'name': 'asgi.py',
+            'description': 'Configuração ASGI para deployment assíncrono'
+        },
+        {
+            'patterns': ['**/backend/src/*/wsgi.py', '**/src/*/wsgi.py', '**/wsgi.py'],
+            'name': 'wsgi.py', 
+            'description': 'Configuração WSGI para deployment'
+        },
+        {
+            'patterns': ['**/backend/src/*/urls.py', '**/src/*/urls.py', '**/urls.py'],
+            'name': 'urls.py',
+            'description': 'Roteamento principal do Django'
+        },
+        {
+            'patterns': ['**/backend/manage.py', '**/manage.py'],
+            'name': 'manage.py',
+            'description': 'Script de gerenciamento Django'
+        }
+    ]
+    
+    def in_django_tree(path):
+        return path.is_file() and any(parent.name in ['iabank', 'backend', 'src'] for parent in path.parents)
+    
+    for file_info in core_files:
+        name, description = file_info['name'], file_info['description']
+        # manage.py pode estar na raiz ou no backend; os demais, dentro da estrutura Django
+        core_paths = first_glob(file_info['patterns'], Path.is_file if name == 'manage.py' else in_django_tree)
+        if not core_paths:
+            issues.append(missing_file_issue(name, "missing_core_file", f"Arquivo Django core não encontrado: {name}",
+                                             f"Arquivo {name} deve existir ({description})", "HIGH"))
+        
+        # Docstring conforme scaffolder (comentário também vale para arquivos de config)
+        for core_file in core_paths:
+            content = read_project_file(core_file)
+            if not content.strip():
+                issues.append(ValidationIssue(
+                    str(core_file), "empty_core_file", f"Arquivo {name} está vazio",
+                    f"{name} deve ter docstring explicando {description}", "Arquivo vazio", "HIGH"
+                ))
+            elif not starts_with_docstring(content, comments=True):
+                issues.append(ValidationIssue(
+                    str(core_file), "missing_core_file_docstring", f"Arquivo {name} deve começar com docstring/comentário",
+                    f"Docstring explicando {description}", "Arquivo não começa com docstring/comentário", "MEDIUM"
+                ))
+    
+    return issues if issues else None
+"""
+        
+        self.rules.append(ValidationRule(
+            name="validate_django_core_files",
+            description="Valida arquivos core do Django (asgi.py, wsgi.py, urls.py, manage.py)",
+            code=rule_code.strip(),
+            severity="HIGH",
+            category="STRUCTURE"
+        ))
+    
+    def _generate_backend_dependencies_complete_validation(self):
+        """Valida dependências backend expandidas (pyproject.toml/requirements.txt) conforme Blueprint."""
+        rule_code = """
+def validate_backend_dependencies_complete():
+    '''Valida dependências backend completas conforme Blueprint Arquitetural.'''
+    # Localizar arquivo de dependências do backend: pyproject.toml antes de requirements.txt,
+    # priorizando arquivos em diretórios backend
+    dep_file = dep_type = None
+    for file_type in ['pyproject.toml', 'requirements.txt']:
+        matches = first_glob(['**/backend/' + file_type, '**/backend/*/' + file_type, '**/' + file_type])
+        if matches:
+            backend_deps = [p for p in matches if any(part in str(p).lower() for part in ['backend', 'api', 'server'])]
+            dep_file, dep_type = (backend_deps or matches)[0], file_type
+            break
+    
+    if not dep_file:
+        return [ValidationIssue(
+            "pyproject.toml|requirements.txt", "missing_dependencies_file", "Arquivo de dependências não encontrado no backend",
+            "pyproject.toml ou requirements.txt deve existir no backend", "Nenhum arquivo de dependências encontrado", "HIGH"
+        )]
+    
+    # Dependências obrigatórias Django expandidas
+    required_deps = {
+        'core_django': {
+            'django': 'Framework web principal',
+            'djangorestframework': 'API REST framework',
+            'django-cors-headers': 'CORS para frontend'
+        },
+        'database': {
+            'psycopg2-binary': 'Driver PostgreSQL (ou sqlite se usando)',
+            'django-extensions': 'Extensões úteis para desenvolvimento'
+        },
+        'authentication': {
+            'djangorestframework-simplejwt': 'JWT authentication',
+            'django-allauth': 'Sistema autenticação completo (opcional)'
+        },
+        'production': {
+            'gunicorn': 'WSGI server para produção',
+            'whitenoise': 'Servir arquivos estáticos',
+            'python-decouple': 'Gerenciamento de configurações'
+        },
+        'development': {
+            'django-debug-toolbar': 'Debug toolbar para desenvolvimento',
+            'pytest': 'Framework de testes',
+            'pytest-django': 'Plugin pytest para Django',
+            'pytest-cov': 'Cobertura de testes'
+        },
+        'api_docs': {
+            'drf-spectacular': 'Documentação automática OpenAPI/Swagger'
+        }
+    }
+    
+    if dep_type == 'pyproject.toml':
+        try:
+            toml_data = load_toml(dep_file)
+        except ImportError:
+            return [ValidationIssue(
+                str(dep_file), "missing_toml_parser", "Parser TOML não disponível (tomli/tomllib)",
+                "tomli ou tomllib deve estar disponível", "Parser TOML não encontrado", "MEDIUM"
+            )]
+        except Exception as e:
+            return [ValidationIssue(
+                str(dep_file), "invalid_pyproject_toml", "pyproject.toml inválido ou corrompido",
+                "TOML válido", f"Erro: {str(e)}", "HIGH"
+            )]
+        dependencies = pyproject_dependencies(toml_data)
+    else:
+        try:
+            dependencies = requirements_dependencies(dep_file.read_text(encoding='utf-8'))
+        except Exception as e:
+            return [ValidationIssue(
+                str(dep_file), "invalid_requirements_txt", "requirements.txt inválido ou ilegível",
+                "Arquivo de texto válido", f"Erro: {str(e)}", "HIGH"
+            )]
+    
+    # Verificar dependências obrigatórias (core_django e database são críticas; as demais, opcionais por projeto)
+    issues = []
+    for category, deps in required_deps.items():
+        issues.extend(issues_for_missing(
+            dep_file, dependencies, deps, "missing_backend_dependency", "Dependência backend não encontrada: {item}",
+            "{item} deve estar nas dependências ({note})", "{item} não encontrado",
+            "HIGH" if category in ['core_django', 'database'] else "MEDIUM"
+        ))
+    
+    # Verificar estrutura do arquivo TOML
+    if dep_type == 'pyproject.toml':
+        if 'project' not in toml_data:
+            issues.append(ValidationIssue(
+                str(dep_file), "missing_project_section", "Seção [project] não encontrada em pyproject.toml",
+                "pyproject.toml deve ter seção [project] com metadados", "Seção [project] não existe", "HIGH"
+            ))
+        else:
+            issues.extend(issues_for_missing(
+                dep_file, toml_data['project'], ['name', 'version', 'description', 'dependencies'],
+                "missing_project_field", "Campo obrigatório não encontrado em [project]: {item}",
+                "Campo '{item}' deve existir em [project]", "Campo '{item}' não encontrado", "MEDIUM"
+            ))
+    
+    return issues if issues else None
+"""
+        
+        self.rules.append(ValidationRule(
+            name="validate_backend_dependencies_complete",
+            description="Valida dependências backend expandidas (pyproject.toml/requirements.txt)",
+            code=rule_code.strip(),
+            severity="HIGH",
+            category="DEPENDENCIES"
+        ))
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+DockerRules - Regras de containerização: arquivos Docker declarados e configuração completa.
+"""
+
+import re
+from pathlib import Path
+
+import sys
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from core.validation_rules import ValidationRule
+
+from . import ScaffoldRuleSet
+
+
+class DockerRules(ScaffoldRuleSet):
+    """Regras aplicadas quando o Blueprint declara arquivos Docker."""
+    
+    def _generate_docker_rules(self):
+        """Gera regras para configuração Docker."""
+        docker_files = ["Dockerfile", "docker-compose.yml", ".dockerignore"]
+        
+        for docker_file in docker_files:
+            if docker_file in self.specs.docker_files:
+                rule_code = f"""
+def validate_{re.sub(r'[^\w]', '_', docker_file).strip('_')}():
+    '''Valida arquivo Docker: {docker_file}.'''
+    if glob_project('**/{docker_file}'):
+        return None
+    return [missing_file_issue("{docker_file}", "missing_docker_file", "Arquivo Docker não encontrado: {docker_file}",
+                               "Arquivo deve existir para containerização", "MEDIUM")]
+"""
+                
+                self.rules.append(ValidationRule(
+                    name=f"validate_{re.sub(r'[^\w]', '_', docker_file).strip('_')}",
+                    description=f"Valida arquivo Docker {docker_file}",
+                    code=rule_code.strip(),
+                    severity="MEDIUM",
+                    category="STRUCTURE"
+                ))
+    
+    def _generate_docker_complete_validation(self):
+        """Valida configuração Docker completa (docker-compose.yml, .dockerignore, etc.)."""
+        rule_code = """
+def validate_docker_complete_configuration():
+    '''Valida configuração Docker completa conforme Blueprint Arquitetural.'''
+    issues = []
+    
+    # Arquivos Docker obrigatórios
+    docker_files = [
+        {
+            'patterns': ['docker-compose.yml', 'docker-compose.yaml'],
+            'name': 'docker-compose',
+            'description': 'Orquestração de containers',
+            'severity': 'HIGH'
+        },
+        {
+            'patterns': ['.dockerignore'],
+            'name': '.dockerignore',
+            'description': 'Exclusões para build Docker',
+            'severity': 'MEDIUM'
+        },
+        {
+            'patterns': ['docker-compose.dev.yml', 'docker-compose.development.yml'],
+            'name': 'docker-compose.dev',
+            'description': 'Configuração Docker para desenvolvimento',
+            'severity': 'MEDIUM'
+        },
+        {
+            'patterns': ['docker-compose.prod.yml', 'docker-compose.production.yml'],
+            'name': 'docker-compose.prod',
+            'description': 'Configuração Docker para produção',
+            'severity': 'MEDIUM'
+        }
+    ]
+    
+    for docker_config in docker_files:
+        name, severity = docker_config['name'], docker_config['severity']
+        docker_file = first_existing('.', docker_config['patterns'])
+        if docker_file is None:
+            if severity == 'HIGH':
+                issues.append(missing_file_issue(
+                    docker_config['patterns'][0], "missing_docker_config", f"Arquivo Docker obrigatório não encontrado: {name}",
+                    f"Arquivo {name} deve existir ({docker_config['description']})", severity
+                ))
+            continue
+        
+        try:
+            content = read_project_file(docker_file).strip()
+        except Exception:
+            issues.append(ValidationIssue(
+                str(docker_file), "unreadable_docker_config", f"Arquivo Docker {name} não pode ser lido",
+                "Arquivo legível", "Erro ao ler arquivo", severity
+            ))
+            continue
+        
+        if not content:
+            issues.append(ValidationIssue(
+                str(docker_file), "empty_docker_config", f"Arquivo Docker {name} está vazio",
+                f"Arquivo deve conter configuração para {docker_config['description']}", "Arquivo vazio", severity
+            ))
+            continue
+        
+        # Validações específicas por tipo
+        if 'docker-compose' in docker_file.name and 'version:' not in content:
+            issues.append(ValidationIssue(
+                str(docker_file), "invalid_docker_compose", "docker-compose.yml sem especificação de versão",
+                "Arquivo deve ter 'version:' especificado", "Versão não encontrada", "MEDIUM"
+            ))
+        if docker_file.name == '.dockerignore':
+            # Entradas importantes no .dockerignore
+            missing_ignores = [ig for ig in ['node_modules', '.git', '*.pyc', '__pycache__', '.env'] if ig not in content]
+            if len(missing_ignores) > 2:
+                issues.append(ValidationIssue(
+                    str(docker_file), "incomplete_dockerignore",
+                    f".dockerignore incompleto - faltam: {', '.join(missing_ignores)}",
+                    "Deve incluir exclusões importantes (node_modules, .git, *.pyc, etc.)",
+                    f"Faltam: {', '.join(missing_ignores)}", "MEDIUM"
+                ))
+    
+    return issues if issues else None
+"""
+        
+        self.rules.append(ValidationRule(
+            name="validate_docker_complete_configuration",
+            description="Valida configuração Docker completa (docker-compose, .dockerignore)",
+            code=rule_code.strip(),
+            severity="HIGH",
+            category="STRUCTURE"
+        ))
@@ -0,0 +1,371 @@
+#!/usr/bin/env python3
+"""
+FrontendRules - Regras do frontend: dependências, arquivos core e estrutura detalhada.
+"""
+
+from pathlib import Path
+
+import sys
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from core.validation_rules import ValidationRule
+
+from . import ScaffoldRuleSet
+
+
+class FrontendRules(ScaffoldRuleSet):
+    """Regras aplicadas quando o Blueprint declara framework frontend."""
+    
+    def _generate_frontend_dependencies_complete_validation(self):
+        """Valida dependências frontend completas (package.json) conforme Blueprint."""
+        rule_code = """
+def validate_frontend_dependencies_complete():
+    '''Valida dependências frontend completas conforme Blueprint Arquitetural.'''
+    # Localizar package.json do frontend, priorizando diretórios frontend
+    matches = first_glob([
+        '**/frontend/package.json',
+        '**/frontend/*/package.json',
+        '**/web/package.json',
+        '**/client/package.json',
+        '**/package.json'  # fallback
+    ])
+    if not matches:
+        return [ValidationIssue(
+            "package.json", "missing_package_json", "Arquivo package.json não encontrado no frontend",
+            "package.json deve existir no diretório frontend", "Arquivo não encontrado", "HIGH"
+        )]
+    frontend_packages = [p for p in matches if any(part in str(p).lower() for part in ['frontend', 'web', 'client'])]
+    package_json_file = (frontend_packages or matches)[0]
+    
+    try:
+        with open(package_json_file, 'r', encoding='utf-8') as f:
+            package_data = json.load(f)
+    except Exception as e:
+        return [ValidationIssue(
+            str(package_json_file), "invalid_package_json", "package.json inválido ou corrompido",
+            "JSON válido", f"Erro: {str(e)}", "HIGH"
+        )]
+    
+    # Dependências obrigatórias conforme análise anterior
+    required_deps = {
+        'dependencies': {
+            'react': 'Framework React principal',
+            'react-dom': 'React DOM para web',
+            '@tanstack/react-query': 'Gerenciamento estado server',
+            'zustand': 'Gerenciamento estado client',
+            'axios': 'Cliente HTTP',
+            'zod': 'Validação schemas',
+            'react-router-dom': 'Roteamento React',
+            'react-hook-form': 'Gerenciamento formulários',
+            '@hookform/resolvers': 'Resolvers para react-hook-form'
+        },
+        'devDependencies': {
+            'typescript': 'Suporte TypeScript',
+            '@types/react': 'Tipos TypeScript para React',
+            '@types/react-dom': 'Tipos TypeScript para React DOM', 
+            'vite': 'Build tool moderno',
+            '@vitejs/plugin-react': 'Plugin React para Vite',
+            'tailwindcss': 'Framework CSS utility-first',
+            'autoprefixer': 'PostCSS plugin',
+            'postcss': 'Processador CSS',
+            'eslint': 'Linter JavaScript/TypeScript',
+            '@typescript-eslint/parser': 'Parser ESLint para TypeScript',
+            '@typescript-eslint/eslint-plugin': 'Plugin ESLint para TypeScript'
+        }
+    }
+    
+    issues = []
+    for dep_type, deps in required_deps.items():
+        if dep_type not in package_data:
+            issues.append(ValidationIssue(
+                str(package_json_file), "missing_dependency_section", f"Seção {dep_type} não encontrada em package.json",
+                f"Seção {dep_type} deve existir", "Seção não existe", "HIGH"
+            ))
+        else:
+            issues.extend(issues_for_missing(
+                package_json_file, package_data[dep_type], deps, "missing_required_dependency",
+                "Dependência obrigatória não encontrada: {item}", "{item} deve estar em " + dep_type + " ({note})",
+                "{item} não está em " + dep_type, "HIGH"
+            ))
+    
+    # Verificar scripts obrigatórios
+    required_scripts = {
+        'dev': 'Script de desenvolvimento',
+        'build': 'Script de build de produção',
+        'lint': 'Script de linting',
+        'preview': 'Script de preview'
+    }
+    
+    if 'scripts' not in package_data:
+        issues.append(ValidationIssue(
+            str(package_json_file), "missing_scripts_section", "Seção scripts não encontrada em package.json",
+            "Seção scripts deve existir com scripts de build e dev", "Seção scripts não existe", "HIGH"
+        ))
+    else:
+        issues.extend(issues_for_missing(
+            package_json_file, package_data['scripts'], required_scripts, "missing_required_script",
+            "Script obrigatório não encontrado: {item}", "Script '{item}' deve existir ({note})",
+            "Script '{item}' não encontrado", "MEDIUM"
+        ))
+    
+    return issues if issues else None
+"""
+        
+        self.rules.append(ValidationRule(
+            name="validate_frontend_dependencies_complete",
+            description="Valida dependências frontend completas (package.json)",
+            code=rule_code.strip(),
+            severity="HIGH",
+            category="DEPENDENCIES"
+        ))
+    
+    def _generate_frontend_core_files_validation(self):
+        """Valida arquivos frontend core (vite.config, tsconfig, tailwind.config, etc.) conforme Blueprint."""
+        rule_code = """
+def validate_frontend_core_files():
+    '''Valida arquivos frontend core conforme Blueprint Arquitetural.'''
+    issues = []
+    
+    # Localizar diretório frontend: o primeiro padrão com um diretório que tenha package.json
+    frontend_dirs = first_glob(
+        ['**/frontend/', '**/web/', '**/client/', '**/ui/', '**/'],  # raiz como fallback
+        lambda path: path.is_dir() and (path / 'package.json').exists()
+    )
+    if not frontend_dirs:
+        return [ValidationIssue(
+            "frontend/", "missing_frontend_directory", "Diretório frontend não encontrado",
+            "Diretório frontend com package.json deve existir", "Nenhum diretório frontend encontrado", "HIGH"
+        )]
+    
+    frontend_dir = frontend_dirs[0]  # Usar o primeiro encontrado
+    
+    # Arquivos de configuração obrigatórios para frontend moderno
+    required_config_files = [
+        {
+            'patterns': ['vite.config.ts', 'vite.config.js'],
+            'name': 'vite.config',
+            'description': 'Configuração do Vite build tool',
+            'severity': 'HIGH'
+        },
+        {
+            'patterns': ['tsconfig.json'],
+            'name': 'tsconfig.json',
+            'description': 'Configuração TypeScript',
+            'severity': 'HIGH'
+        },
+        {
+            'patterns': ['tailwind.config.js', 'tailwind.config.ts'],
+            'name': 'tailwind.config',
+            'description': 'Configuração Tailwind CSS',
+            'severity': 'MEDIUM'  # Opcional se não usar Tailwind
+        },
+        {
+            'patterns': ['postcss.config.js', 'postcss.config.ts'],
+            'name': 'postcss.config',
+            'description': 'Configuração PostCSS',
+            'severity': 'MEDIUM'
+        },
+        {
+            'patterns': ['.eslintrc.js', '.eslintrc.json', '.eslintrc.ts', 'eslint.config.js'],
+            'name': 'eslint config',
+            'description': 'Configuração ESLint',
+            'severity': 'MEDIUM'
+        }
+    ]
+    
+    for config in required_config_files:
+        name, severity = config['name'], config['severity']
+        config_file = first_existing(frontend_dir, config['patterns'])
+        if config_file is None:
+            if severity == 'HIGH':
+                issues.append(missing_file_issue(
+                    f"{frontend_dir}/{config['patterns'][0]}", "missing_config_file",
+                    f"Arquivo de configuração obrigatório não encontrado: {name}",
+                    f"Arquivo {name} deve existir ({config['description']})", severity
+                ))
+            continue
+        
+        try:
+            content = read_project_file(config_file).strip()
+        except Exception:
+            issues.append(ValidationIssue(
+                str(config_file), "unreadable_config_file", f"Arquivo de configuração {name} não pode ser lido",
+                "Arquivo legível", "Erro ao ler arquivo", severity
+            ))
+            continue
+        
+        if not content:
+            issues.append(ValidationIssue(
+                str(config_file), "empty_config_file", f"Arquivo de configuração {name} está vazio",
+                f"Arquivo deve conter configuração para {config['description']}", "Arquivo vazio", severity
+            ))
+        elif name == 'tsconfig.json':
+            try:
+                json.loads(content)
+            except json.JSONDecodeError:
+                issues.append(ValidationIssue(
+                    str(config_file), "invalid_tsconfig_json", "tsconfig.json contém JSON inválido",
+                    "JSON válido", "Erro de sintaxe JSON", "HIGH"
+                ))
+    
+    # Arquivos fonte principais obrigatórios
+    required_source_files = [
+        {
+            'patterns': ['src/main.tsx', 'src/main.ts', 'src/index.tsx', 'src/index.ts'],
+            'name': 'main entry point',
+            'description': 'Ponto de entrada principal da aplicação'
+        },
+        {
+            'patterns': ['src/App.tsx', 'src/App.ts', 'src/app.tsx', 'src/app.ts'],
+            'name': 'App component',
+            'description': 'Componente raiz da aplicação'
+        },
+        {
+            'patterns': ['index.html'],
+            'name': 'index.html',
+            'description': 'Template HTML principal'
+        }
+    ]
+    
+    for source in required_source_files:
+        name = source['name']
+        source_file = first_existing(frontend_dir, source['patterns'])
+        if source_file is None:
+            issues.append(missing_file_issue(
+                f"{frontend_dir}/{source['patterns'][0]}", "missing_source_file",
+                f"Arquivo fonte obrigatório não encontrado: {name}",
+                f"Arquivo {name} deve existir ({source['description']})", "HIGH"
+            ))
+            continue
+        
+        try:
+            content = read_project_file(source_file).strip()
+        except Exception:
+            continue
+        
+        if not content:
+            issues.append(ValidationIssue(
+                str(source_file), "empty_source_file", f"Arquivo fonte {name} está vazio",
+                f"Arquivo deve ter comentário de cabeçalho e {source['description']}", "Arquivo vazio", "HIGH"
+            ))
+        # Fontes .tsx/.ts/.js/.jsx: comentário de cabeçalho nas 5 primeiras linhas (conforme scaffolder)
+        elif source_file.suffix in ['.tsx', '.ts', '.js', '.jsx'] and not any(
+            line.strip().startswith(('/*', '//', '*')) for line in content.split('\\n')[:5]
+        ):
+            issues.append(ValidationIssue(
+                str(source_file), "missing_source_comment", f"Arquivo {name} sem comentário de cabeçalho",
+                "Arquivo deve começar com comentário explicando propósito (conforme scaffolder)",
+                "Comentário de cabeçalho não encontrado", "MEDIUM"
+            ))
+    
+    # Verificar estrutura de diretórios src/
+    src_dir = frontend_dir / 'src'
+    if not src_dir.exists():
+        issues.append(missing_file_issue(
+            src_dir, "missing_src_directory", "Diretório src/ não encontrado no frontend",
+            "Diretório src/ deve conter código fonte da aplicação", "HIGH", "Diretório src/ não existe"
+        ))
+    else:
+        # Subdiretórios recomendados: issue se mais da metade estão faltando
+        missing_dirs = [name for name in ['components', 'pages', 'hooks', 'utils', 'types']
+                        if not (src_dir / name).exists()]
+        if len(missing_dirs) > 3:
+            issues.append(ValidationIssue(
+                str(src_dir), "incomplete_src_structure",
+                f"Estrutura src/ incompleta - faltam diretórios: {', '.join(missing_dirs)}",
+                "Diretório src/ deve ter estrutura organizada (components, pages, hooks, utils, types)",
+                f"Faltam diretórios: {', '.join(missing_dirs)}", "MEDIUM"
+            ))
+    
+    return issues if issues else None
+"""
+        
+        self.rules.append(ValidationRule(
+            name="validate_frontend_core_files",
+            description="Valida arquivos frontend core (vite.config, tsconfig, etc.)",
+            code=rule_code.strip(),
+            severity="HIGH",
+            category="STRUCTURE"
+        ))
+    
+    def _generate_detailed_frontend_structure_validation(self):
+        """Validação DETALHADA da estrutura frontend conforme Blueprint seção 4."""
+        rule_code = """
+def validate_detailed_frontend_structure():
+    '''Valida estrutura frontend COMPLETA conforme Blueprint seção 4 (certeza absoluta).'''
+    issues = []
+    
+    # Buscar diretório frontend: o primeiro src/ com package.json ao lado
+    frontend_src = next((path for path in glob_project('**/src/') if (path.parent / 'package.json').exists()), None)
+    if not frontend_src:
+        return [missing_file_issue(
+            "frontend/src/", "missing_frontend_directory", "Diretório frontend/src/ não encontrado",
+            "Estrutura frontend completa conforme Blueprint seção 4", "CRITICAL", "Diretório frontend não existe"
+        )]
+    
+    # Estrutura EXATA esperada do Blueprint seção 4
+    expected_structure = {
+        'app/': [
+            # Configuração global da aplicação (providers, store, router, styles)
+        ],
+        'pages/': [
+            # Componentes de página, que compõem layouts a partir das features
+        ],
+        'features/': [
+            # Funcionalidades de negócio (ex: loan-list, customer-form)
+            'loan-list/', 'customer-form/'
+        ],
+        'entities/': [
+            # Componentes e lógica de entidades de negócio (ex: LoanCard, CustomerAvatar)
+        ],
+        'shared/': [
+            'api/',      # Configuração do cliente Axios/Fetch global
+            'config/',   # Constantes, configurações de ambiente
+            'lib/',      # Funções utilitárias, helpers, hooks genéricos
+            'ui/'        # Biblioteca de componentes de UI puros (Button, Input, Table)
+        ]
+    }
+    
+    # Validar estrutura principal obrigatória (e os subdiretórios de shared/)
+    for main_dir, sub_dirs in expected_structure.items():
+        dir_path = frontend_src / main_dir
+        if not dir_path.exists():
+            issues.append(missing_file_issue(
+                dir_path, "missing_frontend_main_directory", f"Diretório principal ausente: {main_dir}",
+                f"Diretório '{main_dir}' é OBRIGATÓRIO conforme Blueprint seção 4", "HIGH",
+                "Diretório principal não existe"
+            ))
+        elif main_dir == 'shared/':
+            for sub_dir in sub_dirs:
+                if not (dir_path / sub_dir).exists():
+                    issues.append(missing_file_issue(
+                        dir_path / sub_dir, "missing_frontend_sub_directory", f"Subdiretório shared ausente: {sub_dir}",
+                        f"Subdiretório shared/{sub_dir} conforme Blueprint", "MEDIUM", "Subdiretório não existe"
+                    ))
+    
+    # Arquivos React principais: para scaffolder, conteúdo além de imports/exports exige comentário
+    comment_prefixes = ('//', '/*', '*')
+    for main_file in ['App.tsx', 'main.tsx', 'index.tsx']:
+        file_path = frontend_src / main_file
+        if not file_path.exists():
+            continue
+        lines = [line.strip() for line in read_project_file(file_path).strip().split('\\n')[:5]]
+        has_substantial_content = any(
+            line and not line.startswith(comment_prefixes + ('import', 'export')) for line in lines
+        )
+        if has_substantial_content and not any(line.startswith(comment_prefixes) for line in lines):
+            issues.append(ValidationIssue(
+                str(file_path), "missing_react_header_comment", f"Arquivo React principal sem comentário: {main_file}",
+                "Comentário de cabeçalho conforme prompt scaffolder", "Nenhum comentário encontrado", "MEDIUM"
+            ))
+    
+    return issues if issues else None
+"""
+        
+        self.rules.append(ValidationRule(
+            name="validate_detailed_frontend_structure",
+            description="Valida estrutura frontend detalhada conforme Blueprint seção 4",
+            code=rule_code.strip(),
+            severity="HIGH",
+            category="STRUCTURE"
+        ))
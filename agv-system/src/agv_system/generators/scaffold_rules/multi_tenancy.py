@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+MultiTenancyRules - Regras de multi-tenancy: herança do modelo base de tenant.
+"""
+
+from pathlib import Path
+
+import sys
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from core.validation_rules import ValidationRule
+
+from . import ScaffoldRuleSet
+
+
+class MultiTenancyRules(ScaffoldRuleSet):
+    """Regras aplicadas quando o Blueprint habilita multi-tenancy."""
+    
+    def _generate_multi_tenancy_rules(self):
+        """Gera regras específicas para multi-tenancy no scaffold (apenas estrutura)."""
+        if not self.specs.multi_tenancy:
+            return
+        
+        # Para scaffolder, validamos apenas que arquivos core/models.py existe com docstring
+        # NÃO validamos classes implementadas (isso é para fases posteriores)
+        rule_code = """
+def validate_multi_tenancy_implementation():
+    '''Valida estrutura para multi-tenancy conforme scaffolder (apenas docstring).'''
+    # Verificar que core/models.py existe (onde ficará BaseTenantModel futuramente)
+    core_models_files = glob_project('**/core/models.py')
+    if not core_models_files:
+        return [missing_file_issue("core/models.py", "missing_core_models",
+                                   "Arquivo core/models.py não encontrado para multi-tenancy",
+                                   "Arquivo core/models.py deve existir para estrutura multi-tenant", "HIGH")]
+    
+    # Para scaffolder, validamos apenas que tem docstring
+    issues = []
+    for model_file in core_models_files:
+        content = read_project_file(model_file)
+        if not content.strip():
+            issues.append(ValidationIssue(
+                str(model_file), "empty_core_models", "Arquivo core/models.py está vazio",
+                "Arquivo deve ter docstring para multi-tenancy", "Arquivo vazio", "MEDIUM"
+            ))
+        elif not starts_with_docstring(content):
+            issues.append(ValidationIssue(
+                str(model_file), "missing_scaffold_docstring", "Arquivo core/models.py deve começar com docstring",
+                "APENAS docstring conforme agv-scaffolder", "Arquivo não começa com docstring", "MEDIUM"
+            ))
+    
+    return issues if issues else None
+"""
+        
+        self.rules.append(ValidationRule(
+            name="validate_multi_tenancy_implementation",
+            description="Valida estrutura multi-tenancy conforme scaffolder",
+            code=rule_code.strip(),
+            severity="HIGH",
+            category="MODELS"
+        ))
@@ -0,0 +1,664 @@
+#!/usr/bin/env python3
+"""
+ProjectRules - Regras de projeto aplicáveis a qualquer scaffold: estrutura, configuração,
+conteúdo, dependências base, documentação, setup de desenvolvimento,
+docstrings e conformidade com o prompt do scaffolder.
+"""
+
+import re
+from pathlib import Path
+
+import sys
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from core.validation_rules import ValidationRule
+
+from . import ScaffoldRuleSet
+
+
+class ProjectRules(ScaffoldRuleSet):
+    """Regras de scaffold independentes da stack declarada no Blueprint."""
+    
+    def _generate_structure_rules(self):
+        """Gera regras estruturais profundas para scaffold."""
+        if self.specs.directory_structure:
+            rule_code = self._create_directory_validation_code(
+                self.specs.directory_paths or self.specs.directory_structure
+            )
+            self.rules.append(ValidationRule(
+                name="validate_directory_structure",
+                description="Valida estrutura completa de diretórios conforme Blueprint",
+                code=rule_code,
+                severity="HIGH",
+                category="STRUCTURE"
+            ))
+    
+    def _generate_configuration_validation_rules(self):
+        """Gera regras para validar conteúdo específico dos arquivos de configuração."""
+        
+        # Validação de .gitignore com conteúdo específico
+        self._generate_gitignore_content_validation()
+        
+        # Validação de pyproject.toml com configurações específicas  
+        self._generate_pyproject_content_validation()
+        
+        # Validação de .pre-commit-config.yaml
+        self._generate_precommit_content_validation()
+        
+        # Validação de .env.example
+        self._generate_env_example_validation()
+    
+    def _generate_gitignore_content_validation(self):
+        """Valida conteúdo COMPLETO do .gitignore conforme Blueprint exato."""
+        rule_code = """
+def validate_gitignore_content():
+    '''Valida se .gitignore tem conteúdo EXATO do Blueprint (certeza absoluta).'''
+    gitignore_paths = glob_project('**/.gitignore')
+    if not gitignore_paths:
+        return [missing_file_issue(".gitignore", "missing_gitignore_file", "Arquivo .gitignore não encontrado",
+                                   "Arquivo .gitignore deve existir na raiz", "CRITICAL")]
+    
+    gitignore_file = gitignore_paths[0]
+    content = read_project_file(gitignore_file)
+    
+    # Conteúdo COMPLETO esperado do Blueprint (seção 8)
+    expected_blueprint_sections = [
+        # Byte-compiled / optimized / DLL files
+        '__pycache__/', '*.py[cod]', '*$py.class', '*.so',
+        
+        # Distribution / packaging
+        '.Python', 'build/', 'develop-eggs/', 'dist/', 'downloads/',
+        'eggs/', '.eggs/', 'lib/', 'lib64/', 'parts/', 'sdist/',
+        'var/', 'wheels/', 'share/python-wheels/', '*.egg-info/',
+        '.installed.cfg', '*.egg', 'MANIFEST',
+        
+        # PyInstaller
+        '*.manifest', '*.spec',
+        
+        # Installer logs  
+        'pip-log.txt', 'pip-delete-this-directory.txt',
+        
+        # Unit test / coverage reports
+        'htmlcov/', '.tox/', '.nox/', '.coverage', '.coverage.*',
+        '.cache', 'nosetests.xml', 'coverage.xml', '*.cover',
+        '*.py,cover', '.hypothesis/', '.pytest_cache/', 'cover/',
+        
+        # Translations
+        '*.mo', '*.pot',
+        
+        # Django stuff
+        '*.log', 'local_settings.py', 'db.sqlite3', 'db.sqlite3-journal',
+        
+        # Environments
+        '.env', '.venv', 'env/', 'venv/', 'ENV/', 'env.bak/', 'venv.bak/',
+        
+        # IDE files
+        '.idea/', '.vscode/', '*.swp', '*.swo',
+        
+        # Node.js
+        'node_modules/', 'dist/', 'dist-ssr/', '*.local',
+        'npm-debug.log*', 'yarn-debug.log*', 'yarn-error.log*', 'pnpm-debug.log*',
+        
+        # Docker
+        'docker-compose.override.yml',
+        
+        # OS files
+        '.DS_Store', 'Thumbs.db'
+    ]
+    
+    critical_sections = [
+        '__pycache__/', '*.py[cod]', 'node_modules/', 'dist/',
+        '.env', '.venv', '.idea/', '.vscode/', 'db.sqlite3', '*.log'
+    ]
+    
+    # Validação RIGOROSA: cada seção crítica ausente é um issue
+    issues = issues_for_missing(
+        gitignore_file, content, [section for section in expected_blueprint_sections if section in critical_sections],
+        "missing_critical_gitignore_section", "Seção CRÍTICA ausente no .gitignore: {item}",
+        "Seção '{item}' é OBRIGATÓRIA conforme Blueprint seção 8", "Seção crítica não encontrada", "HIGH"
+    )
+    
+    # Seções opcionais ausentes: um único issue quando faltam muitas
+    missing_optional = [section for section in expected_blueprint_sections
+                        if section not in critical_sections and section not in content]
+    if len(missing_optional) > 5:
+        issues.append(ValidationIssue(
+            str(gitignore_file), "incomplete_gitignore_content",
+            f"Gitignore incompleto: {len(missing_optional)} seções Blueprint ausentes",
+            "Conteúdo completo do Blueprint seção 8 deve estar presente",
+            f"Faltam seções: {', '.join(missing_optional[:3])}...", "MEDIUM"
+        ))
+    
+    return issues if issues else None
+"""
+        
+        self.rules.append(ValidationRule(
+            name="validate_gitignore_content",
+            description="Valida conteúdo específico do arquivo .gitignore",
+            code=rule_code.strip(),
+            severity="MEDIUM",
+            category="CONTENT"
+        ))
+    
+    def _generate_pyproject_content_validation(self):
+        """Valida conteúdo específico do pyproject.toml conforme Blueprint."""
+        rule_code = """
+def validate_pyproject_content():
+    '''Valida se pyproject.toml tem configurações específicas do Blueprint.'''
+    # Arquivos do próprio agv-system não contam
+    pyproject_paths = [path for path in glob_project('**/pyproject.toml') if 'agv-system' not in str(path)]
+    if not pyproject_paths:
+        return [missing_file_issue("pyproject.toml", "missing_pyproject_file", "Arquivo pyproject.toml não encontrado",
+                                   "Arquivo pyproject.toml deve existir no backend", "HIGH")]
+    
+    pyproject_file = pyproject_paths[0]
+    
+    # Configurações obrigatórias do Blueprint
+    required_configs = [
+        '[tool.ruff]',     # Linter configuration
+        '[tool.black]',    # Formatter configuration  
+        'line-length',     # Code style
+        'django',          # Django dependency
+        'djangorestframework', # DRF dependency
+        'psycopg2-binary'  # PostgreSQL driver
+    ]
+    
+    issues = issues_for_missing(
+        pyproject_file, read_project_file(pyproject_file), required_configs, "missing_pyproject_config",
+        "Configuração obrigatória não encontrada: {item}",
+        "Configuração '{item}' deve estar no pyproject.toml conforme Blueprint", "Configuração não encontrada", "MEDIUM"
+    )
+    return issues if issues else None
+"""
+        
+        self.rules.append(ValidationRule(
+            name="validate_pyproject_content",
+            description="Valida configurações específicas do pyproject.toml",
+            code=rule_code.strip(),
+            severity="MEDIUM", 
+            category="CONTENT"
+        ))
+    
+    def _generate_precommit_content_validation(self):
+        """Valida conteúdo específico do .pre-commit-config.yaml."""
+        rule_code = """
+def validate_precommit_config_content():
+    '''Valida se .pre-commit-config.yaml tem configuração específica do Blueprint.'''
+    precommit_paths = glob_project('**/.pre-commit-config.yaml')
+    if not precommit_paths:
+        return [missing_file_issue(".pre-commit-config.yaml", "missing_precommit_config",
+                                   "Arquivo .pre-commit-config.yaml não encontrado",
+                                   "Arquivo deve existir na raiz conforme Blueprint", "MEDIUM")]
+    
+    # Hooks obrigatórios do Blueprint
+    required_hooks = [
+        'pre-commit-hooks',  # Basic hooks
+        'trailing-whitespace', 'end-of-file-fixer',  # File formatting
+        'black',             # Python formatter
+        'ruff'               # Python linter
+    ]
+    
+    issues = issues_for_missing(
+        precommit_paths[0], read_project_file(precommit_paths[0]), required_hooks, "missing_precommit_hook",
+        "Hook obrigatório não encontrado: {item}", "Hook '{item}' deve estar configurado conforme Blueprint",
+        "Hook não encontrado", "MEDIUM"
+    )
+    return issues if issues else None
+"""
+        
+        self.rules.append(ValidationRule(
+            name="validate_precommit_config_content",
+            description="Valida configuração específica do .pre-commit-config.yaml",
+            code=rule_code.strip(),
+            severity="MEDIUM",
+            category="CONTENT"
+        ))
+    
+    def _generate_env_example_validation(self):
+        """Valida arquivo .env.example obrigatório."""
+        rule_code = """
+def validate_env_example_file():
+    '''Valida se .env.example existe conforme escopo scaffolder.'''
+    env_example_paths = glob_project('**/.env.example')
+    if not env_example_paths:
+        return [missing_file_issue(".env.example", "missing_env_example", "Arquivo .env.example não encontrado",
+                                   "Template de variáveis de ambiente deve existir", "MEDIUM")]
+    
+    # Variáveis básicas obrigatórias
+    issues = issues_for_missing(
+        env_example_paths[0], read_project_file(env_example_paths[0]), ['DEBUG', 'SECRET_KEY', 'DATABASE_URL'],
+        "missing_env_variable", "Variável de ambiente obrigatória não encontrada: {item}",
+        "Variável '{item}' deve estar no template", "Variável não encontrada", "LOW"
+    )
+    return issues if issues else None
+"""
+        
+        self.rules.append(ValidationRule(
+            name="validate_env_example_file",
+            description="Valida arquivo template .env.example",
+            code=rule_code.strip(),
+            severity="MEDIUM",
+            category="STRUCTURE"
+        ))
+    
+    def _generate_content_validation_rules(self):
+        """Gera regras para validar conteúdo específico de arquivos."""
+        for file_path, validations in self.specs.file_content_validations.items():
+            rule_code = self._create_content_validation_code(file_path, validations)
+            clean_name = re.sub(r'[^\w]', '_', file_path).strip('_')
+            
+            self.rules.append(ValidationRule(
+                name=f"validate_content_{clean_name}",
+                description=f"Valida conteúdo específico de {file_path}",
+                code=rule_code,
+                severity="HIGH",
+                category="CONTENT"
+            ))
+    
+    def _generate_dependency_validation_rules(self):
+        """Gera regras simples para validação de dependências base (scaffolder)."""
+        # Dependências críticas para scaffold (sem versões específicas)
+        critical_backend_deps = ['django', 'djangorestframework', 'psycopg2-binary']
+        
+        for dep_name in critical_backend_deps:
+            rule_code = self._create_simple_dependency_validation(dep_name)
+            clean_name = re.sub(r'[^\w]', '_', dep_name).strip('_')
+            
+            self.rules.append(ValidationRule(
+                name=f"validate_dependency_{clean_name}",
+                description=f"Valida dependência crítica {dep_name}",
+                code=rule_code,
+                severity="HIGH",
+                category="DEPENDENCIES"
+            ))
+    
+    def _create_simple_dependency_validation(self, dep_name: str) -> str:
+        """Cria validação simples de dependência sem versão específica."""
+        clean_name = re.sub(r'[^\w]', '_', dep_name).strip('_')
+        return f"""
+def validate_dependency_{clean_name}():
+    '''Valida dependência específica {dep_name}.'''
+    # Verificar em pyproject.toml, sem validar as dependências do próprio agv-system
+    pyproject_files = [path for path in glob_project('**/pyproject.toml') if 'agv-system' not in str(path)]
+    if any('""" + dep_name + """' in read_project_file(path) for path in pyproject_files):
+        return None
+    
+    return [ValidationIssue(
+        "pyproject.toml", "missing_critical_dependency", "Dependência crítica não encontrada: """ + dep_name + """",
+        "Dependência """ + dep_name + """ deve estar em pyproject.toml", "Dependência não encontrada", "HIGH"
+    )]
+"""
+    
+    def _generate_documentation_rules(self):
+        """Gera regras para documentação básica."""
+        essential_docs = ["README.md", "LICENSE", "CHANGELOG.md", "CONTRIBUTING.md"]
+        
+        for doc_file in essential_docs:
+            if doc_file in self.specs.documentation_files or doc_file.lower() in [d.lower() for d in self.specs.documentation_files]:
+                rule_code = f"""
+def validate_{re.sub(r'[^\w]', '_', doc_file).strip('_').lower()}():
+    '''Valida existência de {doc_file}.'''
+    # Aceita também o nome em minúsculas
+    if glob_project('**/{doc_file}') or glob_project('**/{doc_file.lower()}'):
+        return None
+    return [missing_file_issue("{doc_file}", "missing_documentation", "Documentação essencial não encontrada: {doc_file}",
+                               "Arquivo deve existir na raiz do projeto", "MEDIUM")]
+"""
+                
+                self.rules.append(ValidationRule(
+                    name=f"validate_{re.sub(r'[^\w]', '_', doc_file).strip('_').lower()}",
+                    description=f"Valida documentação essencial {doc_file}",
+                    code=rule_code.strip(),
+                    severity="MEDIUM",
+                    category="CONTENT"
+                ))
+        
+        # Adicionar validação específica de conteúdo do README.md
+        self._add_readme_content_validation()
+    
+    def _add_readme_content_validation(self):
+        """Validação ULTRA-RIGOROSA do README.md conforme Blueprint seção 9."""
+        rule_code = """
+def validate_readme_content_specific():
+    '''Valida README.md COMPLETO conforme Blueprint seção 9 (certeza absoluta).'''
+    readme_paths = glob_project('**/README.md')
+    if not readme_paths:
+        return None  # Já validado em outra regra
+    
+    readme_file = readme_paths[0]
+    content = read_project_file(readme_file)
+    
+    # Estrutura EXATA esperada do Blueprint seção 9
+    expected_blueprint_structure = [
+        # Título e badges obrigatórios
+        '# IABANK',
+        '[![Status]',
+        '[![CI/CD]', 
+        '[![License]',
+        
+        # Seções estruturais obrigatórias 
+        '## Sobre o Projeto',
+        'Sistema de gestão de empréstimos',
+        'plataforma Web SaaS',
+        'multi-tenant',
+        
+        '## Stack Tecnológica',
+        '**Backend:** Python',
+        '**Frontend:** React',
+        '**Banco de Dados:** PostgreSQL',
+        '**Cache & Fila de Tarefas:** Redis, Celery',
+        '**Containerização:** Docker',
+        
+        '## Como Começar',
+        '### Pré-requisitos',
+        'Docker e Docker Compose',
+        'Node.js e pnpm',
+        'Python e Poetry',
+        
+        '### Instalação e Execução',
+        'git clone',
+        '.env.example',
+        'docker-compose up',
+        'http://localhost:5173',
+        'http://localhost:8000/api/',
+        
+        '## Como Executar os Testes',
+        'docker-compose exec backend',
+        'pytest'
+    ]
+    
+    # Validação CRÍTICA: cada elemento essencial ausente é um issue
+    critical_elements = [
+        '# IABANK', '## Sobre o Projeto', '## Stack Tecnológica', 
+        '## Como Começar', 'Docker', 'docker-compose'
+    ]
+    issues = issues_for_missing(
+        readme_file, content, critical_elements, "missing_critical_readme_element",
+        "Elemento CRÍTICO ausente no README: {item}", "Elemento '{item}' é OBRIGATÓRIO conforme Blueprint seção 9",
+        "Elemento crítico não encontrado", "HIGH"
+    )
+    
+    # Elementos importantes ausentes: um único issue de completude
+    important_elements = [
+        'Python', 'React', 'PostgreSQL', 'Redis', 'git clone',
+        'pytest', '[![', 'multi-tenant', 'SaaS'
+    ]
+    important_missing = [element for element in important_elements if element not in content]
+    if len(important_missing) > 3:
+        issues.append(ValidationIssue(
+            str(readme_file), "incomplete_readme_content",
+            f"README incompleto: {len(important_missing)} elementos Blueprint ausentes",
+            "Conteúdo completo do Blueprint seção 9 deve estar presente",
+            f"Faltam elementos: {', '.join(important_missing[:3])}...", "MEDIUM"
+        ))
+    
+    # Validar estrutura de seções (ordem e hierarquia)
+    lines = content.split('\\n')
+    h2_count = sum(1 for line in lines if line.startswith('## '))
+    if not any(line.startswith('# ') for line in lines):
+        issues.append(ValidationIssue(
+            str(readme_file), "missing_main_title", "README sem título principal (# IABANK)",
+            "Título principal '# IABANK' conforme Blueprint", "Nenhum título H1 encontrado", "HIGH"
+        ))
+    if h2_count < 4:  # Mínimo de seções esperadas
+        issues.append(ValidationIssue(
+            str(readme_file), "insufficient_readme_sections", f"README com poucas seções: {h2_count} encontradas",
+            "Mínimo 4 seções principais conforme Blueprint", f"Apenas {h2_count} seções H2 encontradas", "MEDIUM"
+        ))
+    
+    return issues if issues else None
+"""
+        
+        self.rules.append(ValidationRule(
+            name="validate_readme_content_specific",
+            description="Valida conteúdo específico do README.md conforme Blueprint",
+            code=rule_code.strip(),
+            severity="MEDIUM",
+            category="CONTENT"
+        ))
+    
+    def _generate_development_setup_rules(self):
+        """Gera regras para setup de desenvolvimento."""
+        # Validação de ferramentas de qualidade de código
+        rule_code = """
+def validate_development_quality_tools():
+    '''Valida ferramentas de qualidade de código.'''
+    issues = []
+    if not glob_project('**/.pre-commit-config.yaml'):
+        issues.append(missing_file_issue(".pre-commit-config.yaml", "missing_precommit_config",
+                                         "Configuração pre-commit não encontrada",
+                                         "Arquivo .pre-commit-config.yaml deve existir", "MEDIUM"))
+    if not glob_project('**/.gitignore'):
+        issues.append(missing_file_issue(".gitignore", "missing_gitignore", "Arquivo .gitignore não encontrado",
+                                         "Arquivo .gitignore deve existir", "HIGH"))
+    return issues if issues else None
+"""
+        
+        self.rules.append(ValidationRule(
+            name="validate_development_quality_tools",
+            description="Valida ferramentas de qualidade e setup de desenvolvimento",
+            code=rule_code.strip(),
+            severity="MEDIUM",
+            category="STRUCTURE"
+        ))
+    
+    def _generate_docstring_validation_rules(self):
+        """Gera validações de docstrings/comentários obrigatórios para arquivos de código."""
+        
+        # Validação de docstrings em arquivos Python (views.py, services.py, etc.)
+        self._generate_python_files_docstring_validation()
+    
+    def _generate_python_files_docstring_validation(self):
+        """Validação ULTRA-RIGOROSA de docstrings com QUALIDADE e ADEQUAÇÃO."""
+        rule_code = """
+def validate_python_files_docstrings():
+    '''Valida QUALIDADE de docstrings conforme instruções scaffolder (certeza absoluta).'''
+    issues = []
+    
+    # Tipos de arquivos Python que devem ter docstrings obrigatórias
+    python_file_types = ['views.py', 'services.py', 'serializers.py', 'urls.py', 'apps.py', 'models.py']
+    
+    # Apenas arquivos em apps Django (têm __init__.py no diretório)
+    django_files = [path for file_type in python_file_types
+                    for path in glob_project(f'**/{file_type}') if is_package_file(path)]
+    
+    # Amostragem opcional para monorepos grandes (AGV_SAMPLE_*)
+    django_files = sample_files('validate_python_files_docstrings', django_files)
+    
+    for python_file in django_files:
+        if python_file.exists():
+            content = read_project_file(python_file).strip()
+            
+            # Extrair docstring de módulo
+            lines = content.split('\\n')
+            docstring_content = None
+            docstring_found = False
+            
+            for i, line in enumerate(lines):
+                line = line.strip()
+                if line.startswith(chr(34)*3) or line.startswith(chr(39)*3):
+                    docstring_found = True
+                    # Extrair conteúdo completo da docstring
+                    quote_type = chr(34)*3 if line.startswith(chr(34)*3) else chr(39)*3
+                    docstring_start = i
+                    docstring_lines = []
+                    
+                    # Encontrar fim da docstring
+                    for j in range(i, len(lines)):
+                        if quote_type in lines[j] and j > i:
+                            docstring_lines = lines[docstring_start:j+1]
+                            break
+                    
+                    if docstring_lines:
+                        docstring_content = '\\n'.join(docstring_lines)
+                    break
+                elif (not line.startswith('from ') and 
+                      not line.startswith('import ') and 
+                      not line.startswith('#') and
+                      line):
+                    break  # Chegou ao código, parar de procurar
+            
+            # VALIDAÇÃO 1: Existência da docstring
+            if not docstring_found:
+                issues.append(ValidationIssue(
+                    file_path=str(python_file),
+                    issue_type="missing_python_docstring",
+                    description=f"Arquivo Python sem docstring de módulo: {python_file.name}",
+                    expected="Docstring obrigatória conforme prompt scaffolder: 'explique seu propósito na arquitetura'",
+                    actual="Docstring de módulo não encontrada",
+                    severity="HIGH"
+                ))
+                continue
+            
+            # VALIDAÇÃO 2: Qualidade e adequação da docstring
+            if docstring_content:
+                # Palavras-chave que devem aparecer para explicar propósito arquitetural
+                purpose_keywords = [
+                    'módulo', 'app', 'aplicação', 'sistema', 'componente',
+                    'gerencia', 'controla', 'define', 'implementa', 'contém'
+                ]
+                
+                architecture_keywords = [
+                    'arquitetura', 'estrutura', 'framework', 'Django', 'modelo',
+                    'view', 'serializer', 'service', 'API', 'endpoint'
+                ]
+                
+                docstring_lower = docstring_content.lower()
+                
+                # Verificar se explica propósito
+                has_purpose = any(keyword in docstring_lower for keyword in purpose_keywords)
+                has_architecture_context = any(keyword in docstring_lower for keyword in architecture_keywords)
+                
+                # Verificar tamanho mínimo (deve ser descritiva)
+                word_count = len(docstring_content.split())
+                
+                if word_count < 5:
+                    issues.append(ValidationIssue(
+                        file_path=str(python_file),
+                        issue_type="insufficient_docstring_content",
+                        description=f"Docstring muito curta em {python_file.name}: {word_count} palavras",
+                        expected="Docstring deve explicar propósito na arquitetura conforme scaffolder",
+                        actual=f"Apenas {word_count} palavras, insuficiente",
+                        severity="MEDIUM"
+                    ))
+                
+                if not has_purpose and not has_architecture_context:
+                    issues.append(ValidationIssue(
+                        file_path=str(python_file),
+                        issue_type="inadequate_docstring_content",
+                        description=f"Docstring inadequada em {python_file.name}: não explica propósito arquitetural",
+                        expected="Docstring deve explicar 'seu propósito na arquitetura' conforme prompt scaffolder",
+                        actual="Docstring não menciona propósito ou contexto arquitetural",
+                        severity="MEDIUM"
+                    ))
+            
+            # VALIDAÇÃO 3: Posicionamento correto (primeiro elemento após imports)
+            non_import_lines = [line for line in lines if line.strip() and 
+                              not line.strip().startswith('from ') and 
+                              not line.strip().startswith('import ') and
+                              not line.strip().startswith('#')]
+            
+            if non_import_lines and not non_import_lines[0].strip().startswith(chr(34)*3):
+                if not non_import_lines[0].strip().startswith(chr(39)*3):
+                    issues.append(ValidationIssue(
+                        file_path=str(python_file),
+                        issue_type="misplaced_docstring",
+                        description=f"Docstring mal posicionada em {python_file.name}",
+                        expected="Docstring deve ser primeiro elemento após imports",
+                        actual="Docstring não está no início do código",
+                        severity="MEDIUM"
+                    ))
+    
+    record_sample_result('validate_python_files_docstrings', issues)
+    return issues if issues else None
+"""
+        
+        self.rules.append(ValidationRule(
+            name="validate_python_files_docstrings",
+            description="Valida docstrings obrigatórias em arquivos Python",
+            code=rule_code.strip(),
+            severity="MEDIUM",
+            category="CONTENT"
+        ))
+    
+    def _generate_scaffolder_prompt_compliance_validation(self):
+        """Validação CORRETA de conformidade com prompt do scaffolder."""
+        rule_code = """
+def validate_scaffolder_prompt_compliance():
+    '''Valida conformidade REAL com agv-scaffolder (ZERO implementação).'''
+    issues = []
+    
+    # REGRA 1: Arquivos de código devem ter APENAS docstring
+    critical_files = ['models.py', 'views.py', 'services.py', 'serializers.py']
+    
+    for file_type in critical_files:
+        for python_file in filter(is_package_file, glob_project(f'**/{file_type}')):
+            content = read_project_file(python_file)
+            if not content.strip():
+                continue
+            
+            if not starts_with_docstring(content):
+                issues.append(ValidationIssue(
+                    str(python_file), "missing_scaffold_docstring", f"Arquivo {file_type} deve começar apenas com docstring",
+                    "APENAS docstring de módulo conforme agv-scaffolder", "Arquivo não começa com docstring ou contém código",
+                    "HIGH"
+                ))
+                continue
+            
+            # CRÍTICO: nenhum código após o fim da docstring (linha seguinte com as mesmas aspas)
+            lines = content.strip().split('\\n')
+            quote_type = lines[0].strip()[:3]
+            docstring_end = next((i for i, line in enumerate(lines) if i > 0 and quote_type in line), -1)
+            code_after_docstring = [
+                line for line in lines[docstring_end + 1:] if line.strip() and not line.strip().startswith('#')
+            ] if docstring_end != -1 else []
+            if code_after_docstring:
+                issues.append(ValidationIssue(
+                    str(python_file), "excessive_implementation_for_scaffold",
+                    f"Arquivo {file_type} contém código além da docstring",
+                    "APENAS docstring conforme agv-scaffolder - ZERO implementação",
+                    f"Arquivo contém {len(code_after_docstring)} linhas de código proibido", "HIGH"
+                ))
+    
+    # REGRA 2: README conforme Blueprint seção 9 (NÃO hardcoded)
+    readme_paths = glob_project('**/README.md')
+    if readme_paths:
+        content = read_project_file(readme_paths[0])
+        
+        # Elementos REAIS do Blueprint seção 9 (não hardcoded)
+        blueprint_elements = [
+            '# IABANK',
+            'Sistema de gestão de empréstimos',
+            '## Stack Tecnológica',
+            'Docker',
+            '### Instalação e Execução',  # NÃO 'setup'
+            'docker-compose up',
+            '## Como Executar os Testes'
+        ]
+        
+        missing_elements = [elem for elem in blueprint_elements if elem not in content]
+        
+        if missing_elements:
+            issues.append(ValidationIssue(
+                str(readme_paths[0]), "missing_blueprint_readme_elements",
+                f"README não segue Blueprint seção 9: {len(missing_elements)} elementos ausentes",
+                "README conforme Blueprint seção 9 exato", f"Elementos ausentes: {', '.join(missing_elements[:3])}...",
+                "MEDIUM"
+            ))
+    
+    # REGRA 3: Estrutura de testes deve existir mas sem implementação
+    if not glob_project('**/tests/'):
+        issues.append(missing_file_issue("tests/", "missing_test_structure", "Estrutura de testes não encontrada",
+                                         "Scaffolder deve criar estrutura de testes conforme Blueprint", "MEDIUM",
+                                         "Nenhum diretório tests/ encontrado"))
+    
+    return issues if issues else None
+"""
+        
+        self.rules.append(ValidationRule(
+            name="validate_scaffolder_prompt_compliance",
+            description="Valida conformidade absoluta com instruções do prompt scaffolder",
+            code=rule_code.strip(),
+            severity="HIGH",
+            category="CONTENT"
+        ))
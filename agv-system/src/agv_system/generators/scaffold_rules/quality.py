@@ -0,0 +1,595 @@
+#!/usr/bin/env python3
+"""
+QualityRules - Regras de qualidade do projeto: pipeline CI/CD, estrutura de testes,
+diretórios específicos, configuração de IDE, segurança e qualidade de código.
+"""
+
+from pathlib import Path
+
+import sys
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from core.validation_rules import ValidationRule
+
+from . import ScaffoldRuleSet
+
+
+class QualityRules(ScaffoldRuleSet):
+    """Regras de qualidade aplicadas quando o Blueprint define modelos."""
+    
+    def _generate_github_actions_validation(self):
+        """Valida pipeline CI/CD completo - UNIVERSAL."""
+        
+        rule_code = """
+def validate_github_actions_pipeline():
+    '''Valida pipeline de CI/CD conforme Blueprint.'''
+    # Verificar workflow do GitHub Actions
+    workflow_paths = glob_project('**/.github/workflows/*.yml') + glob_project('**/.github/workflows/*.yaml')
+    
+    if not workflow_paths:
+        return [missing_file_issue(
+            ".github/workflows/", "missing_ci_pipeline", "Pipeline de CI/CD não encontrado",
+            "Workflow GitHub Actions deve estar configurado", "MEDIUM", "Nenhum arquivo de workflow encontrado"
+        )]
+    
+    # Workflow principal: o primeiro que menciona python ou node
+    main_workflow = next((workflow for workflow in workflow_paths
+                          if 'python' in read_project_file(workflow).lower()
+                          or 'node' in read_project_file(workflow).lower()), None)
+    if not main_workflow:
+        return None
+    
+    # Verificar steps essenciais
+    issues = issues_for_missing(
+        main_workflow, read_project_file(main_workflow).lower(), ['test', 'lint', 'build'], "missing_ci_step",
+        "Step essencial não encontrado no pipeline: {item}", "Step '{item}' deve estar configurado no workflow",
+        "Step não configurado", "MEDIUM"
+    )
+    return issues if issues else None
+"""
+        
+        self.rules.append(ValidationRule(
+            name="validate_github_actions_pipeline",
+            description="Valida pipeline de CI/CD completo",
+            code=rule_code.strip(),
+            severity="MEDIUM",
+            category="STRUCTURE"
+        ))
+    
+    def _generate_complete_test_structure_validation(self):
+        """Valida estrutura completa de testes conforme Blueprint."""
+        if not hasattr(self.specs, 'django_apps') or not self.specs.django_apps:
+            return
+            
+        required_apps = list(self.specs.django_apps)
+        
+        rule_code = f"""
+def validate_complete_test_structure():
+    '''Valida estrutura completa de testes conforme Blueprint Arquitetural.'''
+    issues = []
+    required_apps = {required_apps}
+    
+    # Arquivos obrigatórios em cada diretório de testes
+    required_test_files = ['__init__.py', 'factories.py', 'test_models.py', 'test_views.py']
+    
+    # Validar arquivos de teste para cada app Django
+    for app_name in required_apps:
+        test_dirs = first_glob([
+            '**/backend/src/*/' + app_name + '/tests/',
+            '**/src/*/' + app_name + '/tests/',
+            '**/' + app_name + '/tests/'
+        ])
+        if not test_dirs:
+            issues.append(missing_file_issue(
+                app_name + "/tests/", "missing_app_test_directory", "Diretório de testes não encontrado para app " + app_name,
+                "Diretório tests/ deve existir no app " + app_name, "HIGH", "Diretório não existe"
+            ))
+            continue
+        
+        for test_file in required_test_files:
+            file_path = test_dirs[0] / test_file
+            if not file_path.exists():
+                issues.append(missing_file_issue(
+                    file_path, "missing_test_file", "Arquivo de teste obrigatório não encontrado: " + test_file,
+                    "Arquivo " + test_file + " deve existir em tests/ do app " + app_name, "HIGH"
+                ))
+    
+    # Validar testes de integração
+    if not first_glob([
+        'tests/integration/test_full_loan_workflow.py',
+        'backend/tests/integration/test_full_loan_workflow.py',
+        '**/tests/integration/test_full_loan_workflow.py'
+    ]):
+        issues.append(missing_file_issue(
+            "tests/integration/test_full_loan_workflow.py", "missing_integration_test",
+            "Teste de integração principal não encontrado",
+            "Arquivo test_full_loan_workflow.py deve existir em tests/integration/", "MEDIUM"
+        ))
+    
+    return issues if issues else None
+"""
+        
+        self.rules.append(ValidationRule(
+            name="validate_complete_test_structure",
+            description="Valida estrutura completa de testes conforme Blueprint",
+            code=rule_code.strip(),
+            severity="HIGH",
+            category="STRUCTURE"
+        ))
+    
+    def _generate_specific_directory_structure_validation(self):
+        """Valida estruturas específicas de diretórios (static, media, logs, migrations)."""
+        rule_code = """
+def validate_specific_directory_structure():
+    '''Valida estruturas específicas de diretórios conforme Blueprint.'''
+    issues = []
+    
+    # Diretórios específicos obrigatórios para projeto Django
+    backend_dirs = [
+        {
+            'patterns': ['**/backend/static/', '**/static/', 'iabank/backend/static/'],
+            'name': 'static/',
+            'description': 'Arquivos estáticos do Django',
+            'severity': 'MEDIUM'
+        },
+        {
+            'patterns': ['**/backend/media/', '**/media/', 'iabank/backend/media/'],
+            'name': 'media/',
+            'description': 'Upload de arquivos de usuários',
+            'severity': 'MEDIUM'
+        },
+        {
+            'patterns': ['**/logs/', 'logs/', 'backend/logs/'],
+            'name': 'logs/',
+            'description': 'Diretório para logs da aplicação',
+            'severity': 'MEDIUM'
+        },
+        {
+            'patterns': ['**/config/', 'config/', 'backend/config/'],
+            'name': 'config/',
+            'description': 'Configurações por ambiente',
+            'severity': 'MEDIUM'
+        }
+    ]
+    
+    # Verificar diretórios backend (só os de severidade HIGH geram issue)
+    for dir_config in backend_dirs:
+        if dir_config['severity'] == 'HIGH' and not first_glob(dir_config['patterns'], Path.is_dir):
+            issues.append(missing_file_issue(
+                dir_config['name'], "missing_required_directory",
+                f"Diretório obrigatório não encontrado: {dir_config['name']}",
+                f"Diretório {dir_config['name']} deve existir ({dir_config['description']})",
+                dir_config['severity'], "Diretório não existe"
+            ))
+    
+    # Validar estrutura de migrations Django por app
+    django_apps = ['core', 'customers', 'finance', 'operations']  # Apps do Blueprint
+    
+    for app_name in django_apps:
+        migrations_dirs = first_glob([
+            f'**/backend/src/*/{app_name}/migrations/',
+            f'**/src/*/{app_name}/migrations/',
+            f'**/{app_name}/migrations/'
+        ], Path.is_dir)
+        if not migrations_dirs:
+            issues.append(missing_file_issue(
+                f"{app_name}/migrations/", "missing_migrations_directory",
+                f"Diretório migrations não encontrado para app {app_name}",
+                f"App {app_name} deve ter diretório migrations/", "MEDIUM", "Diretório migrations não existe"
+            ))
+            continue
+        
+        # Verificar se tem __init__.py
+        init_file = migrations_dirs[0] / '__init__.py'
+        if not init_file.exists():
+            issues.append(missing_file_issue(
+                init_file, "missing_migrations_init", f"Arquivo __init__.py faltante em migrations do app {app_name}",
+                "Arquivo __init__.py deve existir em diretório migrations", "MEDIUM", "Arquivo __init__.py não encontrado"
+            ))
+    
+    # Validar estrutura de configurações por ambiente
+    config_dirs = first_glob(['config/', 'settings/', '**/config/', '**/settings/'], Path.is_dir)
+    if config_dirs:
+        config_dir = config_dirs[0]
+        missing_configs = [env_config for env_config in ['development.py', 'production.py', 'testing.py']
+                           if not (config_dir / env_config).exists()]
+        if len(missing_configs) > 1:  # Se mais de um arquivo estiver faltando
+            issues.append(ValidationIssue(
+                str(config_dir), "incomplete_environment_configs",
+                f"Configurações de ambiente incompletas - faltam: {', '.join(missing_configs)}",
+                "Deve ter configurações para development, production, testing",
+                f"Faltam: {', '.join(missing_configs)}", "MEDIUM"
+            ))
+    
+    return issues if issues else None
+"""
+        
+        self.rules.append(ValidationRule(
+            name="validate_specific_directory_structure",
+            description="Valida estruturas específicas (static, media, logs, migrations)",
+            code=rule_code.strip(),
+            severity="MEDIUM",
+            category="STRUCTURE"
+        ))
+    
+    def _generate_ide_configuration_validation(self):
+        """Valida arquivos de configuração IDE (.vscode, .editorconfig, etc.)."""
+        rule_code = """
+def validate_ide_configuration_files():
+    '''Valida arquivos de configuração IDE para desenvolvimento.'''
+    issues = []
+    
+    # Configurações IDE importantes
+    ide_configs = [
+        {
+            'patterns': ['.vscode/settings.json'],
+            'name': '.vscode/settings.json',
+            'description': 'Configurações do VS Code',
+            'severity': 'MEDIUM'
+        },
+        {
+            'patterns': ['.vscode/launch.json'],
+            'name': '.vscode/launch.json', 
+            'description': 'Configurações de debug do VS Code',
+            'severity': 'MEDIUM'
+        },
+        {
+            'patterns': ['.vscode/extensions.json'],
+            'name': '.vscode/extensions.json',
+            'description': 'Extensões recomendadas do VS Code',
+            'severity': 'MEDIUM'
+        },
+        {
+            'patterns': ['.editorconfig'],
+            'name': '.editorconfig',
+            'description': 'Configurações de formatação universal',
+            'severity': 'MEDIUM'
+        }
+    ]
+    
+    # Verificar arquivos de configuração IDE
+    for ide_config in ide_configs:
+        config_file = first_existing('.', ide_config['patterns'])
+        if config_file is None:
+            continue
+        
+        try:
+            content = read_project_file(config_file).strip()
+        except Exception:
+            issues.append(ValidationIssue(
+                str(config_file), "unreadable_ide_config", f"Arquivo IDE {ide_config['name']} não pode ser lido",
+                "Arquivo legível", "Erro ao ler arquivo", ide_config['severity']
+            ))
+            continue
+        
+        if not content:
+            issues.append(ValidationIssue(
+                str(config_file), "empty_ide_config", f"Arquivo IDE {ide_config['name']} está vazio",
+                f"Arquivo deve conter configuração para {ide_config['description']}", "Arquivo vazio",
+                ide_config['severity']
+            ))
+        
+        # Validações específicas por tipo
+        elif config_file.name == 'settings.json':
+            try:
+                settings = json.loads(content)
+            except json.JSONDecodeError:
+                issues.append(ValidationIssue(
+                    str(config_file), "invalid_vscode_settings", "settings.json contém JSON inválido",
+                    "JSON válido", "Erro de sintaxe JSON", "MEDIUM"
+                ))
+            else:
+                # Verificar configurações importantes
+                important_settings = ['python.defaultInterpreter', 'editor.formatOnSave', 'files.trimTrailingWhitespace']
+                missing_settings = [s for s in important_settings if s not in settings]
+                if len(missing_settings) > 1:
+                    issues.append(ValidationIssue(
+                        str(config_file), "incomplete_vscode_settings",
+                        f"Configurações VS Code incompletas - faltam: {', '.join(missing_settings)}",
+                        "Deve incluir configurações importantes de formatação e Python",
+                        f"Faltam: {', '.join(missing_settings)}", "MEDIUM"
+                    ))
+        
+        elif config_file.name == 'extensions.json':
+            try:
+                extensions = json.loads(content)
+            except json.JSONDecodeError:
+                issues.append(ValidationIssue(
+                    str(config_file), "invalid_extensions_json", "extensions.json contém JSON inválido",
+                    "JSON válido", "Erro de sintaxe JSON", "MEDIUM"
+                ))
+            else:
+                if 'recommendations' not in extensions:
+                    issues.append(ValidationIssue(
+                        str(config_file), "missing_extension_recommendations",
+                        "extensions.json sem seção 'recommendations'", "Deve ter array 'recommendations' com extensões",
+                        "Seção recommendations não encontrada", "MEDIUM"
+                    ))
+        
+        elif config_file.name == '.editorconfig':
+            # Verificar configurações importantes no .editorconfig
+            missing_configs = [c for c in ['indent_style', 'end_of_line', 'charset'] if c not in content]
+            if len(missing_configs) > 1:
+                issues.append(ValidationIssue(
+                    str(config_file), "incomplete_editorconfig",
+                    f".editorconfig incompleto - faltam: {', '.join(missing_configs)}",
+                    "Deve incluir indent_style, end_of_line, charset", f"Faltam: {', '.join(missing_configs)}", "MEDIUM"
+                ))
+    
+    # Verificar se ao menos uma configuração IDE existe (.editorconfig é a mais universal)
+    if not any(first_existing('.', config['patterns']) for config in ide_configs):
+        issues.append(ValidationIssue(
+            ".editorconfig", "no_ide_configuration", "Nenhuma configuração IDE encontrada",
+            "Ao menos .editorconfig deve existir para formatação consistente",
+            "Nenhum arquivo de configuração IDE encontrado", "MEDIUM"
+        ))
+    
+    return issues if issues else None
+"""
+        
+        self.rules.append(ValidationRule(
+            name="validate_ide_configuration_files",
+            description="Valida arquivos de configuração IDE (.vscode, .editorconfig)",
+            code=rule_code.strip(),
+            severity="MEDIUM",
+            category="CONTENT"
+        ))
+    
+    def _generate_security_best_practices_validation(self):
+        """Valida configurações de segurança e boas práticas."""
+        rule_code = """
+def validate_security_best_practices():
+    '''Valida configurações de segurança e boas práticas.'''
+    issues = []
+    
+    # 1. Validar .env.example completo
+    env_example_file = Path('.') / '.env.example'
+    if env_example_file.is_file():
+        content = read_project_file(env_example_file)
+        
+        # Variáveis de segurança obrigatórias
+        required_security_vars = [
+            'SECRET_KEY',
+            'DATABASE_URL', 
+            'DEBUG',
+            'ALLOWED_HOSTS',
+            'CORS_ALLOWED_ORIGINS',
+            'JWT_SECRET_KEY'
+        ]
+        
+        missing_vars = [var for var in required_security_vars if var not in content]
+        if missing_vars:
+            issues.append(ValidationIssue(
+                str(env_example_file), "incomplete_env_example",
+                f".env.example incompleto - faltam: {', '.join(missing_vars)}",
+                "Deve incluir todas as variáveis de segurança críticas", f"Faltam: {', '.join(missing_vars)}", "HIGH"
+            ))
+        
+        # Verificar se valores não são reais (devem ser placeholders)
+        for pattern in ['password123', 'admin', 'root', 'secret']:
+            if pattern in content.lower():
+                issues.append(ValidationIssue(
+                    str(env_example_file), "dangerous_env_values", f".env.example contém valores perigosos: {pattern}",
+                    "Deve usar apenas placeholders, não valores reais", f"Valor perigoso encontrado: {pattern}", "MEDIUM"
+                ))
+    
+    # 2. Validar configurações de segurança Django (primeiro settings.py de cada padrão)
+    settings_patterns = [
+        '**/backend/src/*/settings.py',
+        '**/src/*/settings.py',
+        '**/settings.py'
+    ]
+    
+    security_checks = [
+        ('SECURE_SSL_REDIRECT', 'Redirecionamento SSL'),
+        ('SECURE_BROWSER_XSS_FILTER', 'Filtro XSS'),
+        ('SECURE_CONTENT_TYPE_NOSNIFF', 'Content Type Nosniff'),
+        ('X_FRAME_OPTIONS', 'Proteção contra clickjacking'),
+        ('CORS_ALLOWED_ORIGINS', 'CORS configurado')
+    ]
+    
+    for pattern in settings_patterns:
+        matches = glob_project(pattern)
+        if not matches:
+            continue
+        settings_file = matches[0]
+        content = read_project_file(settings_file)
+        
+        # Verificar configurações de segurança críticas
+        missing_security = [f"{setting} ({description})" for setting, description in security_checks
+                            if setting not in content]
+        if len(missing_security) > 2:
+            issues.append(ValidationIssue(
+                str(settings_file), "missing_security_settings",
+                f"Configurações de segurança Django faltantes: {len(missing_security)} itens",
+                "Deve incluir configurações de segurança críticas", f"Faltam: {', '.join(missing_security[:3])}...",
+                "HIGH"
+            ))
+        
+        # Verificar se DEBUG não está hardcoded como True
+        if 'DEBUG = True' in content and 'env(' not in content:
+            issues.append(ValidationIssue(
+                str(settings_file), "hardcoded_debug_true", "DEBUG hardcoded como True em settings.py",
+                "DEBUG deve vir de variável de ambiente", "DEBUG = True hardcoded", "HIGH"
+            ))
+        
+        # Verificar SECRET_KEY
+        if 'SECRET_KEY =' in content and 'env(' not in content:
+            issues.append(ValidationIssue(
+                str(settings_file), "hardcoded_secret_key", "SECRET_KEY hardcoded em settings.py",
+                "SECRET_KEY deve vir de variável de ambiente", "SECRET_KEY hardcoded", "HIGH"
+            ))
+    
+    # 3. Validar .gitignore para segurança
+    gitignore_file = Path('.') / '.gitignore'
+    if gitignore_file.is_file():
+        content = read_project_file(gitignore_file)
+        
+        # Arquivos/diretórios sensíveis que devem estar no .gitignore
+        sensitive_patterns = [
+            '.env',
+            '*.key',
+            '*.pem',
+            'secrets/',
+            '.vscode/settings.json' if '.vscode/' not in content else None
+        ]
+        
+        missing_security = [p for p in sensitive_patterns if p and p not in content]
+        if missing_security:
+            issues.append(ValidationIssue(
+                str(gitignore_file), "missing_security_gitignore",
+                f".gitignore sem exclusões de segurança: {', '.join(missing_security)}",
+                "Deve excluir arquivos sensíveis (.env, *.key, etc.)", f"Faltam: {', '.join(missing_security)}", "MEDIUM"
+            ))
+    
+    # 4. Verificar se não há arquivos sensíveis commitados (Path.glob: diretórios como .env também contam)
+    sensitive_files = ['.env', 'id_rsa', '*.key', 'secrets.json']
+    for pattern in sensitive_files:
+        for sensitive_file in filter(Path.exists, Path('.').glob(f'**/{pattern}')):
+            issues.append(ValidationIssue(
+                str(sensitive_file), "sensitive_file_committed",
+                f"Arquivo sensível pode estar no repositório: {sensitive_file.name}",
+                "Arquivos sensíveis devem estar no .gitignore", f"Arquivo sensível encontrado: {sensitive_file.name}",
+                "HIGH"
+            ))
+    
+    return issues if issues else None
+"""
+        
+        self.rules.append(ValidationRule(
+            name="validate_security_best_practices",
+            description="Valida configurações de segurança e boas práticas",
+            code=rule_code.strip(),
+            severity="HIGH",
+            category="CONTENT"
+        ))
+    
+    def _generate_code_quality_validation(self):
+        """Valida arquivos de configuração de qualidade de código."""
+        rule_code = """
+def validate_code_quality_configuration():
+    '''Valida configurações de qualidade de código (linting, formatting, etc.).'''
+    issues = []
+    
+    # Configurações de qualidade Python
+    python_quality_configs = [
+        {
+            'patterns': ['.pylintrc', 'pylintrc', 'pyproject.toml'],
+            'name': 'pylint configuration',
+            'description': 'Configuração do Pylint',
+            'severity': 'MEDIUM',
+            'check_content': 'tool.pylint'
+        },
+        {
+            'patterns': ['mypy.ini', '.mypy.ini', 'pyproject.toml'],
+            'name': 'mypy configuration',
+            'description': 'Configuração do MyPy para tipagem',
+            'severity': 'MEDIUM',
+            'check_content': 'mypy'
+        },
+        {
+            'patterns': ['.coverage', '.coveragerc', 'pyproject.toml'],
+            'name': 'coverage configuration',
+            'description': 'Configuração de cobertura de testes',
+            'severity': 'MEDIUM',
+            'check_content': 'coverage'
+        }
+    ]
+    
+    # Verificar configurações Python: o primeiro arquivo válido de cada ferramenta
+    for config in python_quality_configs:
+        for pattern in config['patterns']:
+            config_file = Path('.') / pattern
+            if not config_file.exists():
+                continue
+            try:
+                content = read_project_file(config_file)
+            except Exception:
+                continue
+            # Para pyproject.toml, só conta se tiver seção específica
+            if pattern == 'pyproject.toml' and config['check_content'] not in content:
+                continue
+            if not content.strip():
+                issues.append(ValidationIssue(
+                    str(config_file), "empty_quality_config", f"Arquivo de qualidade {config['name']} está vazio",
+                    f"Arquivo deve conter {config['description']}", "Arquivo vazio", config['severity']
+                ))
+            break
+    
+    # Configurações de qualidade JavaScript/TypeScript
+    frontend_quality_configs = [
+        {
+            'patterns': ['.eslintrc.js', '.eslintrc.json', '.eslintrc.ts', 'eslint.config.js'],
+            'name': 'ESLint configuration',
+            'description': 'Configuração do ESLint',
+            'severity': 'MEDIUM'
+        },
+        {
+            'patterns': ['.prettierrc', '.prettierrc.json', '.prettierrc.js', 'prettier.config.js'],
+            'name': 'Prettier configuration',
+            'description': 'Configuração do Prettier',
+            'severity': 'MEDIUM'
+        }
+    ]
+    
+    # Buscar diretório frontend primeiro; se não encontrar diretório específico, usar a raiz
+    frontend_dirs = first_glob(
+        ['**/frontend/', '**/web/', '**/client/'],
+        lambda path: path.is_dir() and (path / 'package.json').exists()
+    )
+    frontend_dir = frontend_dirs[0] if frontend_dirs else Path('.')
+    
+    for config in frontend_quality_configs:
+        config_file = first_existing(frontend_dir, config['patterns'])
+        if config_file is None:
+            continue
+        try:
+            content = read_project_file(config_file).strip()
+        except Exception:
+            continue
+        if not content:
+            issues.append(ValidationIssue(
+                str(config_file), "empty_frontend_quality_config", f"Arquivo {config['name']} está vazio",
+                f"Arquivo deve conter {config['description']}", "Arquivo vazio", config['severity']
+            ))
+    
+    # Verificar pre-commit hooks
+    precommit_file = first_existing('.', ['.pre-commit-config.yaml', '.pre-commit-config.yml'])
+    try:
+        precommit_content = read_project_file(precommit_file) if precommit_file is not None else None
+    except Exception:
+        precommit_content = None
+    
+    if precommit_content is not None:
+        # Verificar se tem hooks essenciais
+        essential_hooks = ['trailing-whitespace', 'end-of-file-fixer', 'black', 'flake8']
+        missing_hooks = [hook for hook in essential_hooks if hook not in precommit_content]
+        if len(missing_hooks) > 2:
+            issues.append(ValidationIssue(
+                str(precommit_file), "incomplete_precommit_hooks",
+                f"Pre-commit hooks incompletos - faltam: {', '.join(missing_hooks)}",
+                "Deve incluir hooks essenciais (trailing-whitespace, black, flake8)",
+                f"Faltam: {', '.join(missing_hooks)}", "MEDIUM"
+            ))
+    
+    # Verificar se há pelo menos algumas configurações de qualidade
+    has_python_quality = any(first_existing('.', config['patterns']) for config in python_quality_configs)
+    has_frontend_quality = any(first_existing(frontend_dir, config['patterns']) for config in frontend_quality_configs)
+    
+    if not has_python_quality and not has_frontend_quality and precommit_file is None:
+        issues.append(ValidationIssue(
+            "quality-configs", "no_quality_configuration", "Nenhuma configuração de qualidade de código encontrada",
+            "Deve ter ao menos configurações básicas de linting/formatting",
+            "Nenhuma configuração de qualidade encontrada", "MEDIUM"
+        ))
+    
+    return issues if issues else None
+"""
+        
+        self.rules.append(ValidationRule(
+            name="validate_code_quality_configuration",
+            description="Valida configurações de qualidade de código (linting, formatting)",
+            code=rule_code.strip(),
+            severity="MEDIUM",
+            category="CONTENT"
+        ))
@@ -2,9 +2,13 @@
 """
 TargetGenerator - Gerador especializado para validação de alvos específicos (Alvos 1-N).
 Foco em implementações específicas de funcionalidades conforme Blueprint.
+
+MultiTargetGenerator gera um único validador para vários alvos: a partição de modelos
+por alvo é calculada uma vez e as regras compartilham os índices de arquivos e modelos
+do runtime (project_files, read_project_file, model_definitions), com score por alvo.
 """
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterable, Optional
 from pathlib import Path
 
 import sys
@@ -15,13 +19,28 @@ from core.validation_rules import ValidationRule
 from core.blueprint_parser import ProjectSpecs
 
 
+# Distribuição dos modelos do Blueprint assume até 8 alvos
+MAX_INFERRED_TARGETS = 8
+
+
+def partition_models_by_target(model_names: List[str]) -> Dict[int, List[str]]:
+    """Distribui os modelos pelos alvos 1-N em fatias consecutivas; alvos fora da partição não têm modelos."""
+    models_per_target = max(1, len(model_names) // MAX_INFERRED_TARGETS)
+    return {
+        number: model_names[start:start + models_per_target]
+        for number, start in enumerate(range(0, len(model_names), models_per_target), 1)
+    }
+
+
 class TargetGenerator(BaseGenerator):
     """Gerador especializado para validação de alvos específicos (Alvos 1-N)."""
     
-    def __init__(self, specs: ProjectSpecs, target_number: int, target_context: Dict[str, Any] = None):
+    def __init__(self, specs: ProjectSpecs, target_number: int, target_context: Dict[str, Any] = None,
+                 model_partition: Optional[Dict[int, List[str]]] = None):
         super().__init__(specs)
         self.target_number = target_number
         self.target_context = target_context or {}
+        self.model_partition = model_partition
         
     def generate_rules(self) -> List[ValidationRule]:
         """Gera regras específicas para um alvo particular."""
@@ -56,17 +75,11 @@ class TargetGenerator(BaseGenerator):
     
     def _infer_target_context_from_specs(self):
         """Infere contexto do alvo baseado no Blueprint e número do alvo."""
-        # Criar contexto baseado no que sabemos sobre o projeto
-        models_list = list(self.specs.models.keys()) if self.specs.models else []
-        
-        # Distribuir modelos pelos alvos de forma inteligente
-        if models_list:
-            models_per_target = max(1, len(models_list) // 8)  # Assumindo até 8 alvos
-            start_idx = (self.target_number - 1) * models_per_target
-            end_idx = min(start_idx + models_per_target, len(models_list))
-            target_models = models_list[start_idx:end_idx]
-        else:
-            target_models = []
+        # Distribuir modelos pelos alvos (partição recebida do MultiTargetGenerator ou calculada aqui)
+        if self.model_partition is None:
+            models_list = list(self.specs.models.keys()) if self.specs.models else []
+            self.model_partition = partition_models_by_target(models_list)
+        target_models = self.model_partition.get(self.target_number, [])
         
         # Definir contexto baseado no número do alvo e tipo de sistema
         self.target_context = {
@@ -169,7 +182,7 @@ def validate_target_{self.target_number}_files():
     required_files = {target_files}
     
     for required_file in required_files:
-        file_paths = list(Path('.').rglob(f'**/{{required_file}}'))
+        file_paths = project_files(required_file)
         if not file_paths:
             issues.append(ValidationIssue(
                 file_path=required_file,
@@ -198,7 +211,7 @@ def validate_target_{self.target_number}_files():
         for model_name in target_models:
             if model_name in self.specs.models:
                 model_info = self.specs.models[model_name]
-                rule_code = self._create_specific_model_validation(model_name, model_info)
+                rule_code = self._create_target_model_validation(model_name, model_info)
                 
                 self.rules.append(ValidationRule(
                     name=f"validate_target_{self.target_number}_model_{model_name.lower()}",
@@ -232,12 +245,12 @@ def validate_target_{self.target_number}_api_views():
     issues = []
     required_views = {target_views}
     
-    views_files = list(Path('.').rglob('**/views.py'))
+    views_files = project_files('views.py')
     found_views = set()
     
     for views_file in views_files:
         if views_file.exists():
-            content = views_file.read_text(encoding='utf-8', errors='ignore')
+            content = read_project_file(views_file)
             
             for required_view in required_views:
                 # Buscar definições de classe ou função
@@ -293,7 +306,7 @@ def validate_target_{self.target_number}_templates():
     required_templates = {target_templates}
     
     for required_template in required_templates:
-        template_paths = list(Path('.').rglob(f'**/{required_template}'))
+        template_paths = project_files(required_template)
         if not template_paths:
             issues.append(ValidationIssue(
                 file_path=required_template,
@@ -338,7 +351,7 @@ def validate_target_{self.target_number}_tests():
     issues = []
     
     # Buscar arquivos de teste
-    test_files = list(Path('.').rglob('**/test*.py')) + list(Path('.').rglob('**/*_test.py'))
+    test_files = project_files('test*.py') + project_files('*_test.py')
     
     if not test_files:
         issues.append(ValidationIssue(
@@ -358,7 +371,7 @@ def validate_target_{self.target_number}_tests():
     all_test_content = ""
     for test_file in test_files:
         if test_file.exists():
-            all_test_content += test_file.read_text(encoding='utf-8', errors='ignore')
+            all_test_content += read_project_file(test_file)
     
     # Verificar testes para modelos
     for model in target_models:
@@ -405,7 +418,7 @@ def validate_target_{self.target_number}_migrations():
     '''Valida migrações para modelos do Alvo {self.target_number}.'''
     issues = []
     
-    migration_dirs = list(Path('.').rglob('**/migrations/'))
+    migration_dirs = project_dirs('migrations')
     if not migration_dirs:
         issues.append(ValidationIssue(
             file_path="migrations/",
@@ -418,11 +431,9 @@ def validate_target_{self.target_number}_migrations():
         return issues
     
     # Verificar se existem arquivos de migração
-    migration_files = []
-    for migration_dir in migration_dirs:
-        migration_files.extend(list(migration_dir.rglob('*.py')))
+    graph = migration_graph()
     
-    if not migration_files:
+    if not graph.nodes:
         issues.append(ValidationIssue(
             file_path="migrations/",
             issue_type="no_migration_files",
@@ -431,6 +442,53 @@ def validate_target_{self.target_number}_migrations():
             actual="Nenhuma migração encontrada",
             severity="MEDIUM"
         ))
+        return issues
+    
+    # Cobertura: modelos do alvo já implementados devem ser criados por alguma migração
+    for model in {target_models}:
+        definitions = model_definitions(model)
+        if definitions and not graph.has_model(model):
+            issues.append(ValidationIssue(
+                file_path=str(definitions[0][0]),
+                issue_type="missing_model_migration",
+                description=f"Modelo {{model}} sem migração (CreateModel) no Alvo {self.target_number}",
+                expected="Migração gerada por makemigrations para o modelo",
+                actual="Nenhuma migração cria o modelo",
+                severity="MEDIUM"
+            ))
+    
+    # Conflitos: mais de uma migração final (leaf) no mesmo app
+    for app, leaves in graph.conflicts().items():
+        issues.append(ValidationIssue(
+            file_path=f"{{app}}/migrations/",
+            issue_type="migration_leaf_conflict",
+            description=f"Migrações conflitantes no app {{app}}: {{', '.join(leaves)}}",
+            expected="Uma única migração final por app (makemigrations --merge)",
+            actual=f"{{len(leaves)}} migrações finais",
+            severity="HIGH"
+        ))
+    
+    # Dependências para migrações inexistentes de apps do projeto
+    for migration, dependency in graph.missing:
+        issues.append(ValidationIssue(
+            file_path=str(migration.path),
+            issue_type="missing_migration_dependency",
+            description=f"Migração {{migration.app}}.{{migration.name}} depende de {{dependency[0]}}.{{dependency[1]}}, que não existe",
+            expected="Dependências devem apontar para migrações existentes",
+            actual="Migração de dependência ausente",
+            severity="HIGH"
+        ))
+    
+    cycle = graph.order()[1]
+    if cycle:
+        issues.append(ValidationIssue(
+            file_path=str(graph.nodes[cycle[0]].path),
+            issue_type="migration_dependency_cycle",
+            description=f"Ciclo de dependências entre migrações: {{', '.join('.'.join(key) for key in cycle)}}",
+            expected="Dependências de migrações devem formar um DAG",
+            actual="Dependência circular",
+            severity="HIGH"
+        ))
     
     return issues if issues else None
 """
@@ -454,11 +512,11 @@ def validate_target_{self.target_number}_settings():
     issues = []
     required_settings = {target_settings}
     
-    settings_files = list(Path('.').rglob('**/settings.py'))
+    settings_files = project_files('settings.py')
     
     for settings_file in settings_files:
         if settings_file.exists():
-            content = settings_file.read_text(encoding='utf-8', errors='ignore')
+            content = read_project_file(settings_file)
             
             for required_setting in required_settings:
                 if required_setting not in content:
@@ -482,6 +540,44 @@ def validate_target_{self.target_number}_settings():
                 category="CONTENT"
             ))
     
+    def _create_target_model_validation(self, model_name: str, model_info: Dict[str, Any]) -> str:
+        """Cria validação de modelo do alvo a partir do índice de classes de models.py."""
+        expected_fields = model_info.get('fields', [])
+        
+        return f"""
+def validate_target_{self.target_number}_model_{model_name.lower()}():
+    '''Valida modelo {model_name} do Alvo {self.target_number}.'''
+    issues = []
+    expected_fields = {expected_fields}
+    
+    definitions = model_definitions('{model_name}')
+    
+    for model_file, class_body in definitions:
+        # Verificar campos obrigatórios
+        for expected_field in expected_fields:
+            if f'{{expected_field}} =' not in class_body:
+                issues.append(ValidationIssue(
+                    file_path=str(model_file),
+                    issue_type="missing_model_field",
+                    description=f"Campo {{expected_field}} não encontrado em {model_name}",
+                    expected=f"Campo {{expected_field}} deve estar definido",
+                    actual="Campo não existe",
+                    severity="HIGH"
+                ))
+    
+    if not definitions:
+        issues.append(ValidationIssue(
+            file_path="models.py",
+            issue_type="missing_model_class",
+            description="Modelo {model_name} do Alvo {self.target_number} não encontrado",
+            expected="Classe {model_name} deve estar definida",
+            actual="Modelo não existe",
+            severity="HIGH"
+        ))
+    
+    return issues if issues else None
+"""
+
     def _create_target_model_relationships_validation(self, target_models: List[str]) -> str:
         """Cria validação para relacionamentos entre modelos do alvo."""
         return f"""
@@ -490,33 +586,21 @@ def validate_target_{self.target_number}_model_relationships():
     issues = []
     target_models = {target_models}
     
-    models_files = list(Path('.').rglob('**/models.py'))
-    
-    for model_file in models_files:
-        if model_file.exists():
-            content = model_file.read_text(encoding='utf-8', errors='ignore')
-            
-            # Verificar se relacionamentos estão implementados
-            for model in target_models:
-                # Buscar definição do modelo
-                model_pattern = rf'class {model}\\([^)]*\\):(.*?)(?=^class |^def |\\Z)'
-                model_match = re.search(model_pattern, content, re.MULTILINE | re.DOTALL)
-                
-                if model_match:
-                    model_body = model_match.group(1)
-                    
-                    # Verificar se tem relacionamentos adequados
-                    fk_count = len(re.findall(r'ForeignKey', model_body))
-                    if fk_count == 0 and len(target_models) > 1:
-                        # Se tem múltiplos modelos mas este não tem FK, pode ser um problema
-                        issues.append(ValidationIssue(
-                            file_path=str(model_file),
-                            issue_type="missing_model_relationships",
-                            description=f"Modelo {{model}} pode estar faltando relacionamentos",
-                            expected="Relacionamentos adequados entre modelos",
-                            actual="Poucos ou nenhum relacionamento encontrado",
-                            severity="LOW"
-                        ))
+    # Verificar se relacionamentos estão implementados (índice de classes de models.py)
+    for model in target_models:
+        for model_file, model_body in model_definitions(model):
+            # Verificar se tem relacionamentos adequados
+            fk_count = len(re.findall(r'ForeignKey', model_body))
+            if fk_count == 0 and len(target_models) > 1:
+                # Se tem múltiplos modelos mas este não tem FK, pode ser um problema
+                issues.append(ValidationIssue(
+                    file_path=str(model_file),
+                    issue_type="missing_model_relationships",
+                    description=f"Modelo {{model}} pode estar faltando relacionamentos",
+                    expected="Relacionamentos adequados entre modelos",
+                    actual="Poucos ou nenhum relacionamento encontrado",
+                    severity="LOW"
+                ))
     
     return issues if issues else None
 """
@@ -529,12 +613,12 @@ def validate_target_{self.target_number}_urls():
     issues = []
     required_urls = {target_urls}
     
-    urls_files = list(Path('.').rglob('**/urls.py'))
+    urls_files = project_files('urls.py')
     all_urls_content = ""
     
     for urls_file in urls_files:
         if urls_file.exists():
-            all_urls_content += urls_file.read_text(encoding='utf-8', errors='ignore')
+            all_urls_content += read_project_file(urls_file)
     
     for required_url in required_urls:
         if required_url not in all_urls_content:
@@ -561,10 +645,10 @@ def validate_target_{self.target_number}_components():
     for required_component in required_components:
         # Buscar arquivo do componente (.jsx, .tsx, .js, .ts)
         component_files = (
-            list(Path('.').rglob(f'**/{{required_component}}.jsx')) +
-            list(Path('.').rglob(f'**/{{required_component}}.tsx')) +
-            list(Path('.').rglob(f'**/{{required_component}}.js')) +
-            list(Path('.').rglob(f'**/{{required_component}}.ts'))
+            project_files(f'{{required_component}}.jsx') +
+            project_files(f'{{required_component}}.tsx') +
+            project_files(f'{{required_component}}.js') +
+            project_files(f'{{required_component}}.ts')
         )
         
         if not component_files:
@@ -578,4 +662,35 @@ def validate_target_{self.target_number}_components():
             ))
     
     return issues if issues else None
-"""
\ No newline at end of file
+"""
+
+class MultiTargetGenerator(BaseGenerator):
+    """Gerador de um único validador para vários alvos (Alvos 1-N ou subconjunto), com score por alvo."""
+    
+    def __init__(self, specs: ProjectSpecs, target_numbers: Optional[Iterable[int]] = None,
+                 target_contexts: Optional[Dict[int, Dict[str, Any]]] = None):
+        super().__init__(specs)
+        models_list = list(self.specs.models.keys()) if self.specs.models else []
+        # Partição calculada uma única vez e compartilhada por todos os alvos
+        self.model_partition = partition_models_by_target(models_list)
+        self.target_numbers = list(dict.fromkeys(target_numbers or ())) or self.default_target_numbers()
+        self.target_contexts = target_contexts or {}
+    
+    def default_target_numbers(self) -> List[int]:
+        """Alvos 1-N: todos os alvos com modelos na partição (1-8 quando não há modelos)."""
+        return list(range(1, max(self.model_partition, default=MAX_INFERRED_TARGETS) + 1))
+    
+    def generate_rules(self) -> List[ValidationRule]:
+        """Gera as regras de todos os alvos, marcando cada regra com o grupo do seu alvo."""
+        self.rules = []
+        
+        for target_number in self.target_numbers:
+            generator = TargetGenerator(
+                self.specs, target_number, self.target_contexts.get(target_number),
+                model_partition=self.model_partition
+            )
+            for rule in generator.generate_rules():
+                rule.group = f"Alvo {target_number}"
+                self.rules.append(rule)
+        
+        return self.rules
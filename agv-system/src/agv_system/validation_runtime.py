@@ -0,0 +1,1376 @@
+#!/usr/bin/env python3
+"""
+Runtime compartilhado dos validadores gerados pelo ValidatorGenerator.
+
+Contém tudo que não depende do Blueprint: classes de resultado, amostragem de
+arquivos, execução das regras, cálculo de score, relatório e ponto de entrada.
+Os validadores gerados importam este módulo (compilado uma única vez em
+__pycache__) e definem apenas as regras e a lista de métodos a executar.
+
+Este módulo não importa nada do restante do pacote: validadores rodam na raiz do
+projeto validado e não devem carregar geradores, logging ou métricas do AGV.
+"""
+
+import ast
+import fnmatch
+import math
+import os
+import random
+import re
+import sys
+import json
+import warnings
+from dataclasses import dataclass, asdict, field
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Set, Tuple, Type, Union
+
+
+@dataclass
+class ValidationIssue:
+    """Representa um problema encontrado na validação."""
+    file_path: str
+    issue_type: str
+    description: str
+    expected: str
+    actual: str
+    severity: str  # CRITICAL, HIGH, MEDIUM, LOW
+
+
+@dataclass
+class ValidationResults:
+    """Resultados completos da validação."""
+    total_checks: int
+    passed_checks: int
+    failed_checks: int
+    issues: List[ValidationIssue]
+    score: float
+    categories: Dict[str, int]
+    sampling: Dict[str, Any] = field(default_factory=dict)
+    groups: Dict[str, Dict[str, Any]] = field(default_factory=dict)  # score por alvo (validadores multi-alvo)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Converte para dicionário para serialização JSON."""
+        data = {
+            "total_checks": self.total_checks,
+            "passed_checks": self.passed_checks,
+            "failed_checks": self.failed_checks,
+            "issues": [asdict(issue) for issue in self.issues],
+            "score": self.score,
+            "categories": self.categories,
+            "sampling": self.sampling
+        }
+        if self.groups:
+            data["groups"] = self.groups
+        return data
+
+
+# Amostragem: regras chamam sample_files() antes do loop e record_sample_result() ao final.
+# Os padrões vêm do validador gerado (configure_sampling); variáveis AGV_SAMPLE_* têm prioridade.
+SAMPLING_DEFAULTS: Dict[str, Any] = {'fraction': None, 'confidence': None, 'margin': 0.05, 'seed': 42}
+SAMPLING_REPORT: Dict[str, Dict[str, Any]] = {}
+
+
+def configure_sampling(defaults: Dict[str, Any]) -> None:
+    """Define a configuração de amostragem embutida no validador gerado."""
+    SAMPLING_DEFAULTS.clear()
+    SAMPLING_DEFAULTS.update(defaults)
+
+
+def _sampling_settings():
+    """Resolve configuração de amostragem (variáveis de ambiente têm prioridade)."""
+    settings = dict(SAMPLING_DEFAULTS)
+    if os.environ.get('AGV_FULL_CHECKS', '').lower() in ('1', 'true', 'yes'):
+        return None
+    for key, cast in (('fraction', float), ('confidence', float), ('margin', float), ('seed', int)):
+        value = os.environ.get('AGV_SAMPLE_' + key.upper())
+        if value:
+            settings[key] = cast(value)
+    if not settings.get('fraction') and not settings.get('confidence'):
+        return None
+    return settings
+
+
+def _z_score(confidence):
+    """Quantil bilateral da normal padrão para o nível de confiança."""
+    # Import local: statistics só é necessário no modo amostrado
+    from statistics import NormalDist
+    return NormalDist().inv_cdf((1 + confidence) / 2)
+
+
+def sample_files(rule_name, files):
+    """Seleciona amostra reprodutível de arquivos; retorna todos no modo completo."""
+    settings = _sampling_settings()
+    population = len(files)
+    if settings is None or population == 0:
+        return files
+
+    if settings.get('fraction'):
+        size = math.ceil(population * min(max(settings['fraction'], 0.0), 1.0))
+    else:
+        # Tamanho de Cochran (p=0.5, pior caso) com correção para população finita
+        z = _z_score(settings['confidence'])
+        n0 = (z ** 2) * 0.25 / (settings['margin'] ** 2)
+        size = math.ceil(n0 / (1 + (n0 - 1) / population))
+    size = max(1, min(size, population))
+
+    if size < population:
+        ordered = sorted(files, key=str)
+        rng = random.Random(f"{settings['seed']}:{rule_name}")
+        chosen = set(rng.sample(range(population), size))
+        files = [f for i, f in enumerate(ordered) if i in chosen]
+
+    SAMPLING_REPORT[rule_name] = {
+        'population': population,
+        'sample_size': size,
+        'seed': settings['seed'],
+        'confidence': settings.get('confidence') or 0.95,
+    }
+    return files
+
+
+def record_sample_result(rule_name, issues):
+    """Estima a taxa de violação da população a partir dos arquivos amostrados."""
+    report = SAMPLING_REPORT.get(rule_name)
+    if report is None:
+        return
+
+    population, size = report['population'], report['sample_size']
+    violating = len({issue.file_path for issue in issues})
+    rate = violating / size
+
+    # Intervalo de Wilson (estável com taxas próximas de 0/1); a correção para população
+    # finita entra como tamanho efetivo de amostra n / fpc²
+    z = _z_score(report['confidence'])
+    fpc_squared = (population - size) / (population - 1) if population > 1 else 0.0
+    if fpc_squared > 0:
+        n_eff = size / fpc_squared
+        denominator = 1 + z ** 2 / n_eff
+        center = (rate + z ** 2 / (2 * n_eff)) / denominator
+        half_width = z * math.sqrt(rate * (1 - rate) / n_eff + z ** 2 / (4 * n_eff ** 2)) / denominator
+    else:
+        center, half_width = rate, 0.0
+
+    report.update({
+        'violating_files': violating,
+        'estimated_violation_rate': round(rate, 4),
+        'confidence_interval': [round(max(0.0, center - half_width), 4), round(min(1.0, center + half_width), 4)],
+        'estimated_violating_files': round(rate * population),
+    })
+
+
+# Índices do projeto validado compartilhados pelas regras: uma única varredura da árvore,
+# uma leitura por arquivo e um índice de classes de models.py por processo
+_PROJECT_INDEX: Dict[str, Dict[str, Any]] = {}
+_MODEL_CLASS_HEAD = re.compile(r'class (\w+)\(')
+_MODEL_CLASS_BODY = re.compile(r'class \w+\([^)]*\):(.*?)(?=^class |^def |\Z)', re.MULTILINE | re.DOTALL)
+
+
+def _project_index() -> Dict[str, Any]:
+    """Índice de arquivos e diretórios do diretório atual, construído na primeira chamada."""
+    root = os.getcwd()
+    index = _PROJECT_INDEX.get(root)
+    if index is None:
+        files: List[Path] = []
+        by_name: Dict[str, List[Path]] = {}
+        dirs_by_name: Dict[str, List[Path]] = {}
+        for current, dirnames, filenames in os.walk('.'):
+            base = Path(current)
+            for dirname in dirnames:
+                dirs_by_name.setdefault(dirname, []).append(base / dirname)
+            for filename in filenames:
+                path = base / filename
+                files.append(path)
+                by_name.setdefault(filename, []).append(path)
+        index = _PROJECT_INDEX[root] = {
+            'files': files, 'by_name': by_name, 'dirs_by_name': dirs_by_name, 'contents': {}, 'models': None,
+            'imports': None, 'migrations': None, 'api': None,
+        }
+    return index
+
+
+def _match_suffix(candidates: List[Path], parts: List[str]) -> List[Path]:
+    """Candidatos cujas últimas partes do caminho casam com parts (fnmatch por parte)."""
+    if len(parts) == 1:
+        return list(candidates)
+    return [
+        path for path in candidates
+        if len(path.parts) >= len(parts)
+        and all(fnmatch.fnmatchcase(actual, expected) for actual, expected in zip(path.parts[-len(parts):], parts))
+    ]
+
+
+def project_files(pattern: str) -> List[Path]:
+    """Arquivos do projeto que casam com pattern, como Path('.').rglob(f'**/{pattern}')."""
+    index = _project_index()
+    parts = pattern.split('/')
+    name = parts[-1]
+    if any(char in name for char in '*?['):
+        candidates = [path for path in index['files'] if fnmatch.fnmatchcase(path.name, name)]
+    else:
+        candidates = index['by_name'].get(name, [])
+    return _match_suffix(candidates, parts)
+
+
+def project_dirs(name: str) -> List[Path]:
+    """Diretórios do projeto com o nome informado, como Path('.').rglob(f'**/{name}/')."""
+    return list(_project_index()['dirs_by_name'].get(name, ()))
+
+
+def read_project_file(path: Path) -> str:
+    """Conteúdo do arquivo, lido uma única vez por execução do validador."""
+    contents = _project_index()['contents']
+    content = contents.get(path)
+    if content is None:
+        content = contents[path] = Path(path).read_text(encoding='utf-8', errors='ignore')
+    return content
+
+
+# Helpers das regras de scaffold: busca, leitura e verificações repetidas em quase toda regra,
+# compiladas uma vez aqui em vez de copiadas no corpo de cada validador gerado
+
+def glob_project(pattern: str) -> List[Path]:
+    """Caminhos que casam com pattern, como list(Path('.').glob(pattern)).
+
+    Padrões '**/<partes>' (arquivos) e '**/<partes>/' (diretórios) saem do índice do projeto,
+    sem nova varredura; os demais (ancorados na raiz ou com '**' interno) usam Path('.').glob.
+    """
+    suffix = pattern[3:] if pattern.startswith('**/') else ''
+    name = suffix.rstrip('/').rsplit('/', 1)[-1]
+    if not name or '**' in suffix or (suffix.endswith('/') and any(char in name for char in '*?[')):
+        return list(Path('.').glob(pattern))
+    if not suffix.endswith('/'):
+        return project_files(suffix)
+    return _match_suffix(project_dirs(name), suffix.rstrip('/').split('/'))
+
+
+def first_glob(patterns: List[str], accept=None) -> List[Path]:
+    """Caminhos do primeiro padrão com algum resultado aceito por accept (todos, sem accept)."""
+    for pattern in patterns:
+        matches = [path for path in glob_project(pattern) if accept is None or accept(path)]
+        if matches:
+            return matches
+    return []
+
+
+def first_existing(base: Union[str, Path], names: List[str]) -> Optional[Path]:
+    """Primeiro base/name existente, na ordem de names; None se nenhum existir."""
+    for name in names:
+        path = Path(base) / name
+        if path.exists():
+            return path
+    return None
+
+
+def is_package_file(path: Path) -> bool:
+    """Indica se path é um arquivo dentro de um pacote Python (com __init__.py ao lado)."""
+    return path.is_file() and (path.parent / '__init__.py').exists()
+
+
+def is_package_dir(path: Path) -> bool:
+    """Indica se path é um diretório de pacote Python (com __init__.py)."""
+    return path.is_dir() and (path / '__init__.py').exists()
+
+
+def starts_with_docstring(content: str, comments: bool = False) -> bool:
+    """Indica se a primeira linha não vazia abre uma docstring (ou um comentário, com comments)."""
+    first_line = next((line.strip() for line in content.split('\n') if line.strip()), '')
+    return first_line.startswith(('"""', "'''", '#') if comments else ('"""', "'''"))
+
+
+def missing_file_issue(file_path: str, issue_type: str, description: str, expected: str,
+                       severity: str, actual: str = 'Arquivo não existe') -> ValidationIssue:
+    """ValidationIssue padrão de arquivo (ou diretório) obrigatório ausente."""
+    return ValidationIssue(str(file_path), issue_type, description, expected, actual, severity)
+
+
+def issues_for_missing(file_path: Union[str, Path], content, items, issue_type: str, description: str,
+                       expected: str, actual: str, severity: str) -> List[ValidationIssue]:
+    """Um ValidationIssue por item ausente de content (texto, lista ou dicionário).
+
+    Nos textos, {item} vira o item e {note} o valor associado quando items é um dicionário.
+    """
+    notes = items if isinstance(items, dict) else {}
+    issues = []
+    for item in items:
+        if item not in content:
+            texts = [text.replace('{item}', item).replace('{note}', str(notes.get(item, '')))
+                     for text in (description, expected, actual)]
+            issues.append(ValidationIssue(str(file_path), issue_type, *texts, severity))
+    return issues
+
+
+def load_toml(path: Union[str, Path]) -> Dict[str, Any]:
+    """Conteúdo de um arquivo TOML via tomli ou tomllib; ImportError se nenhum estiver disponível."""
+    try:
+        import tomli as toml_parser
+    except ImportError:
+        import tomllib as toml_parser
+    with open(path, 'rb') as toml_file:
+        return toml_parser.load(toml_file)
+
+
+def _requirement_name(requirement: str) -> str:
+    """Nome do pacote em um requisito como 'django>=4.2'."""
+    return requirement.split('>=')[0].split('==')[0].split('<')[0].split('>')[0].strip()
+
+
+def pyproject_dependencies(toml_data: Dict[str, Any]) -> Dict[str, str]:
+    """Dependências declaradas em um pyproject (PEP 621 e Poetry), mapeadas para o grupo."""
+    dependencies: Dict[str, str] = {}
+    project = toml_data.get('project', {})
+    for requirement in project.get('dependencies', []):
+        dependencies[_requirement_name(requirement)] = 'main'
+    for group, requirements in project.get('optional-dependencies', {}).items():
+        for requirement in requirements:
+            dependencies[_requirement_name(requirement)] = group
+    poetry = toml_data.get('tool', {}).get('poetry', {})
+    for name in poetry.get('dependencies', {}):
+        if name != 'python':
+            dependencies[name] = 'main'
+    for group, group_data in poetry.get('group', {}).items():
+        for name in group_data.get('dependencies', {}):
+            dependencies[name] = group
+    return dependencies
+
+
+def requirements_dependencies(content: str) -> Dict[str, str]:
+    """Dependências de um requirements.txt (linhas não vazias e sem comentário)."""
+    return {
+        _requirement_name(line): 'main'
+        for line in (raw.strip() for raw in content.strip().split('\n'))
+        if line and not line.startswith('#')
+    }
+
+
+def model_definitions(model_name: str) -> List[Tuple[Path, str]]:
+    """(arquivo, corpo da classe) de cada models.py que define model_name.
+
+    Cada models.py é indexado uma vez; o corpo é o mesmo obtido por
+    re.search(rf'class {model_name}\\([^)]*\\):(.*?)(?=^class |^def |\\Z)', ...).
+    """
+    index = _project_index()
+    if index['models'] is None:
+        models: Dict[str, List[Tuple[Path, str]]] = {}
+        for models_file in project_files('models.py'):
+            content = read_project_file(models_file)
+            found = set()
+            for head in _MODEL_CLASS_HEAD.finditer(content):
+                name = head.group(1)
+                if name in found:
+                    continue
+                match = _MODEL_CLASS_BODY.match(content, head.start())
+                if match:
+                    found.add(name)
+                    models.setdefault(name, []).append((models_file, match.group(1)))
+        index['models'] = models
+    return index['models'].get(model_name, [])
+
+
+def _is_type_checking(test: ast.expr) -> bool:
+    """Indica se o teste de um if é TYPE_CHECKING (imports apenas para anotações)."""
+    return (isinstance(test, ast.Name) and test.id == 'TYPE_CHECKING') or \
+        (isinstance(test, ast.Attribute) and test.attr == 'TYPE_CHECKING')
+
+
+def _contains_parts(parts: Tuple[str, ...], name_parts: Tuple[str, ...]) -> bool:
+    """Indica se name_parts aparece como sequência contígua em parts."""
+    size = len(name_parts)
+    return any(parts[i:i + size] == name_parts for i in range(len(parts) - size + 1))
+
+
+# ast.match_case só existe a partir do Python 3.10
+_STATEMENT_NODES = (ast.stmt, ast.excepthandler) + ((ast.match_case,) if hasattr(ast, 'match_case') else ())
+
+
+def _module_parts(path: Path) -> Tuple[Tuple[str, ...], bool]:
+    """Partes do nome do módulo de path e se ele é um pacote (__init__.py)."""
+    parts = Path(path).with_suffix('').parts
+    is_package = parts[-1:] == ('__init__',)
+    return (parts[:-1] if is_package else parts), is_package
+
+
+def _parse_imports(source: str, filename: str) -> ast.Module:
+    """
+    AST suficiente para extrair os imports do arquivo.
+
+    Todo import está no trecho até a última linha que contém 'import'; esse trecho é
+    analisado primeiro (imports costumam ficar no topo) e o arquivo inteiro só quando o
+    corte não é sintaticamente válido (ex: import entre parênteses em várias linhas).
+    """
+    end = source.find('\n', source.rfind('import'))
+    if end != -1:
+        try:
+            return ast.parse(source[:end + 1], filename=filename)
+        except SyntaxError:
+            pass
+    return ast.parse(source, filename=filename)
+
+
+class ImportGraph:
+    """
+    Grafo de imports dos arquivos .py do projeto, construído uma vez a partir dos nós
+    Import/ImportFrom do ast (imports relativos resolvidos para nomes absolutos).
+
+    imports: módulo -> nomes importados; importers: nome importado -> módulos (arestas
+    reversas); edges/reverse: arestas entre módulos do próprio projeto. Ciclos consideram
+    apenas imports executados no carregamento do módulo (fora de funções e de
+    `if TYPE_CHECKING`), que são os que podem falhar por import circular.
+    """
+
+    def __init__(self, files: List[Path]):
+        self.files: Dict[str, Path] = {}
+        self.imports: Dict[str, Set[str]] = {}
+        self.importers: Dict[str, Set[str]] = {}
+        self.edges: Dict[str, Set[str]] = {}
+        self.reverse: Dict[str, Set[str]] = {}
+        self.unparsed: List[Path] = []
+        self._eager: Dict[str, Set[str]] = {}
+        self._by_suffix: Dict[str, Set[str]] = {}
+        self._members: Dict[str, Set[str]] = {}
+        self._dependencies: Dict[str, Tuple[Set[str], Set[str]]] = {}
+
+        parsed = []
+        for path in files:
+            parts, is_package = _module_parts(path)
+            if not parts:
+                continue
+            module = '.'.join(parts)
+            self.files[module] = path
+            for start in range(len(parts)):
+                self._by_suffix.setdefault('.'.join(parts[start:]), set()).add(module)
+            source = read_project_file(path)
+            if 'import' not in source:
+                parsed.append((module, parts, is_package, None))
+                continue
+            try:
+                with warnings.catch_warnings():
+                    # Avisos de sintaxe do projeto validado não fazem parte do relatório
+                    warnings.simplefilter('ignore')
+                    tree = _parse_imports(source, str(path))
+            except (SyntaxError, ValueError):
+                self.unparsed.append(path)
+                continue
+            parsed.append((module, parts, is_package, tree))
+
+        for module, parts, is_package, tree in parsed:
+            self.imports[module] = set()
+            self.edges[module] = set()
+            self._eager[module] = set()
+            if tree is not None:
+                self._collect(module, parts, is_package, tree, lazy=False)
+
+        for module, targets in self.edges.items():
+            for target in targets:
+                self.reverse.setdefault(target, set()).add(module)
+
+    def _collect(self, module: str, parts: Tuple[str, ...], is_package: bool, node: ast.AST, lazy: bool):
+        """Registra os imports do nó e de seus filhos (lazy: dentro de função ou TYPE_CHECKING)."""
+        for child in ast.iter_child_nodes(node):
+            # Imports só aparecem em corpos de instruções: expressões não são percorridas
+            if not isinstance(child, _STATEMENT_NODES):
+                continue
+            if isinstance(child, ast.Import):
+                for alias in child.names:
+                    self._add(module, alias.name, (alias.name,), lazy)
+            elif isinstance(child, ast.ImportFrom):
+                base = child.module or ''
+                if child.level:
+                    # Pacote atual: o próprio módulo se for __init__, senão o pacote que o contém
+                    package = parts if is_package else parts[:-1]
+                    anchor = package[:len(package) - child.level + 1]
+                    base = '.'.join([*anchor, base] if base else anchor)
+                if base:
+                    candidates = [f"{base}.{alias.name}" for alias in child.names if alias.name != '*']
+                    self._add(module, base, (*candidates, base), lazy)
+            elif isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                self._collect(module, parts, is_package, child, lazy=True)
+            elif isinstance(child, ast.If) and _is_type_checking(child.test):
+                self._collect(module, parts, is_package, child, lazy=True)
+            else:
+                self._collect(module, parts, is_package, child, lazy)
+
+    def _add(self, module: str, name: str, candidates: Tuple[str, ...], lazy: bool):
+        """Adiciona a aresta module -> name e, se resolvível, a aresta interna do projeto."""
+        self.imports[module].add(name)
+        self.importers.setdefault(name, set()).add(module)
+        target = self._resolve(module, candidates)
+        if target and target != module:
+            self.edges[module].add(target)
+            if not lazy:
+                self._eager[module].add(target)
+
+    def _resolve(self, module: str, candidates: Tuple[str, ...]):
+        """Módulo do projeto importado (o mais próximo do importador em caso de ambiguidade)."""
+        for candidate in candidates:
+            matches = self._by_suffix.get(candidate)
+            if matches:
+                importer = module.split('.')
+                return max(sorted(matches), key=lambda match: len(os.path.commonprefix([match.split('.'), importer])))
+        return None
+
+    def modules_in(self, name: str) -> Set[str]:
+        """Módulos do projeto pertencentes ao módulo/pacote name (ex: "finance", "core.api")."""
+        members = self._members.get(name)
+        if members is None:
+            name_parts = tuple(name.split('.'))
+            members = self._members[name] = {
+                module for module in self.files if _contains_parts(tuple(module.split('.')), name_parts)
+            }
+        return members
+
+    def importers_of(self, *names: str) -> Set[str]:
+        """Módulos que importam algum dos nomes (ou submódulos deles): consulta às arestas reversas."""
+        found: Set[str] = set()
+        for imported, modules in self.importers.items():
+            if any(imported == name or imported.startswith(name + '.') for name in names):
+                found |= modules
+        return found
+
+    def depends_on(self, source: str, target: str) -> bool:
+        """Indica se algum módulo de source importa target (pelo nome ou por aresta interna)."""
+        dependencies = self._dependencies.get(source)
+        if dependencies is None:
+            internal: Set[str] = set()
+            names: Set[str] = set()
+            for module in self.modules_in(source):
+                internal |= self.edges.get(module, set())
+                names |= self.imports.get(module, set())
+            dependencies = self._dependencies[source] = (internal, names)
+        internal, names = dependencies
+        if not internal.isdisjoint(self.modules_in(target)):
+            return True
+        return any(name == target or name.startswith(target + '.') for name in names)
+
+    def cycles(self) -> List[List[str]]:
+        """Ciclos de import (componentes fortemente conexos de Tarjan, iterativo) entre módulos do projeto."""
+        index_of: Dict[str, int] = {}
+        lowlink: Dict[str, int] = {}
+        stack: List[str] = []
+        on_stack: Set[str] = set()
+        components: List[List[str]] = []
+
+        for root in sorted(self._eager):
+            if root in index_of:
+                continue
+            work = [(root, iter(sorted(self._eager[root])))]
+            index_of[root] = lowlink[root] = len(index_of)
+            stack.append(root)
+            on_stack.add(root)
+            while work:
+                node, successors = work[-1]
+                advanced = False
+                for successor in successors:
+                    if successor not in index_of:
+                        index_of[successor] = lowlink[successor] = len(index_of)
+                        stack.append(successor)
+                        on_stack.add(successor)
+                        work.append((successor, iter(sorted(self._eager.get(successor, ())))))
+                        advanced = True
+                        break
+                    if successor in on_stack:
+                        lowlink[node] = min(lowlink[node], index_of[successor])
+                if advanced:
+                    continue
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+                if lowlink[node] == index_of[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    if len(component) > 1:
+                        components.append(sorted(component))
+
+        return sorted(components)
+
+
+def import_graph() -> ImportGraph:
+    """Grafo de imports do projeto, construído uma única vez por execução do validador."""
+    index = _project_index()
+    if index['imports'] is None:
+        index['imports'] = ImportGraph(project_files('*.py'))
+    return index['imports']
+
+
+# Operações de migração que alteram dados (e o argumento que as torna reversíveis)
+_DATA_OPERATIONS = {'RunPython': ('reverse_code', 1), 'RunSQL': ('reverse_sql', 1)}
+
+# Migrações raramente mudam depois de criadas: o resultado do parsing de cada arquivo é
+# guardado entre execuções, invalidado por mtime e tamanho
+MIGRATION_INDEX_CACHE = Path('agv-outputs') / 'cache' / 'migration_index.json'
+
+
+@dataclass
+class MigrationNode:
+    """Migração Django extraída do ast: dependências e operações declaradas na classe Migration."""
+    app: str
+    name: str
+    path: Path
+    dependencies: List[Tuple[str, str]] = field(default_factory=list)
+    run_before: List[Tuple[str, str]] = field(default_factory=list)
+    replaces: List[Tuple[str, str]] = field(default_factory=list)
+    operations: List[Tuple[str, str]] = field(default_factory=list)  # (operação, modelo/callable)
+    renames: List[Tuple[str, str]] = field(default_factory=list)  # RenameModel (antigo, novo), em ordem
+    irreversible: List[str] = field(default_factory=list)  # RunPython/RunSQL sem reverse
+
+    @property
+    def key(self) -> Tuple[str, str]:
+        return (self.app, self.name)
+
+    @classmethod
+    def from_cache(cls, app: str, path: Path, data: Dict[str, Any]) -> 'MigrationNode':
+        """Reconstrói o nó a partir da entrada do cache (listas JSON voltam a ser tuplas)."""
+        return cls(
+            app=app, name=path.stem, path=path,
+            dependencies=[tuple(pair) for pair in data['dependencies']],
+            run_before=[tuple(pair) for pair in data['run_before']],
+            replaces=[tuple(pair) for pair in data['replaces']],
+            operations=[tuple(operation) for operation in data['operations']],
+            renames=[tuple(pair) for pair in data['renames']],
+            irreversible=list(data['irreversible']),
+        )
+
+    def to_cache(self) -> Dict[str, Any]:
+        """Entrada do cache: apenas o que foi extraído do arquivo."""
+        return {
+            'dependencies': self.dependencies, 'run_before': self.run_before, 'replaces': self.replaces,
+            'operations': self.operations, 'renames': self.renames, 'irreversible': self.irreversible,
+        }
+
+
+def _node_pairs(node: ast.AST) -> List[Tuple[str, str]]:
+    """Pares (app, migração) de uma lista literal; swappable_dependency e afins são ignorados."""
+    pairs = []
+    for element in getattr(node, 'elts', ()):
+        try:
+            value = ast.literal_eval(element)
+        except ValueError:
+            continue
+        if isinstance(value, tuple) and len(value) == 2 and all(isinstance(part, str) for part in value):
+            pairs.append(value)
+    return pairs
+
+
+def _call_name(node: ast.AST) -> str:
+    """Nome da função chamada (ex: migrations.CreateModel -> CreateModel)."""
+    func = getattr(node, 'func', None)
+    if isinstance(func, ast.Attribute):
+        return func.attr
+    return func.id if isinstance(func, ast.Name) else ''
+
+
+def _operation_target(call: ast.Call) -> str:
+    """Modelo (ou callable, em RunPython) afetado pela operação."""
+    keywords = {keyword.arg: keyword.value for keyword in call.keywords}
+    target = keywords.get('model_name') or keywords.get('name') or keywords.get('old_name') \
+        or keywords.get('code') or (call.args[0] if call.args else None)
+    return _literal_name(target)
+
+
+def _literal_name(node: Optional[ast.AST]) -> str:
+    """Texto de uma constante string ou nome de uma referência (função/atributo)."""
+    if isinstance(node, ast.Constant) and isinstance(node.value, str):
+        return node.value
+    if isinstance(node, ast.Name):
+        return node.id
+    return node.attr if isinstance(node, ast.Attribute) else ''
+
+
+def _parse_migration(app: str, path: Path, source: str) -> MigrationNode:
+    """Lê dependencies, run_before, replaces e operations da classe Migration do arquivo."""
+    migration = MigrationNode(app=app, name=path.stem, path=path)
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        tree = ast.parse(source, filename=str(path))
+    for node in tree.body:
+        if not (isinstance(node, ast.ClassDef) and node.name == 'Migration'):
+            continue
+        for statement in node.body:
+            if not (isinstance(statement, ast.Assign) and len(statement.targets) == 1
+                    and isinstance(statement.targets[0], ast.Name)):
+                continue
+            attribute = statement.targets[0].id
+            if attribute in ('dependencies', 'run_before', 'replaces'):
+                setattr(migration, attribute, _node_pairs(statement.value))
+            elif attribute == 'operations':
+                for call in getattr(statement.value, 'elts', ()):
+                    if not isinstance(call, ast.Call):
+                        continue
+                    operation = _call_name(call)
+                    migration.operations.append((operation, _operation_target(call)))
+                    if operation == 'RenameModel':
+                        keywords = {keyword.arg: keyword.value for keyword in call.keywords}
+                        old_name = _literal_name(call.args[0] if call.args else keywords.get('old_name'))
+                        new_name = _literal_name(call.args[1] if len(call.args) > 1 else keywords.get('new_name'))
+                        migration.renames.append((old_name, new_name))
+                    if operation in _DATA_OPERATIONS:
+                        reverse_keyword, reverse_position = _DATA_OPERATIONS[operation]
+                        if not any(keyword.arg == reverse_keyword for keyword in call.keywords) \
+                                and len(call.args) <= reverse_position:
+                            migration.irreversible.append(operation)
+    return migration
+
+
+class MigrationGraph:
+    """
+    DAG das migrações Django do projeto, por app, construído uma vez a partir do ast
+    de cada arquivo em <app>/migrations/.
+
+    nodes: (app, migração) -> MigrationNode; parents/children: arestas de dependência
+    entre migrações do projeto (dependências de apps externos, como auth, ficam de fora;
+    migrações substituídas por um squash são remapeadas para ele). Responde cobertura de
+    modelos, conflitos de leaf (mais de uma migração final por app), dependências
+    ausentes e ciclos sem reler os arquivos.
+    """
+
+    def __init__(self, files: List[Path], cache_path: Optional[Path] = None):
+        self.nodes: Dict[Tuple[str, str], MigrationNode] = {}
+        self.apps: Dict[str, List[str]] = {}
+        self.unparsed: List[Path] = []
+        self._models: Optional[Dict[str, Tuple[str, str]]] = None
+
+        cached = self._load_cache(cache_path)
+        entries: Dict[str, Dict[str, Any]] = {}
+        parsed = 0
+        for path in files:
+            app = path.parts[-3] if len(path.parts) >= 3 else ''
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            stamp = [stat.st_mtime_ns, stat.st_size]
+            entry = cached.get(path.as_posix())
+            if entry and entry.get('stamp') == stamp:
+                migration = MigrationNode.from_cache(app, path, entry)
+            else:
+                try:
+                    migration = _parse_migration(app, path, read_project_file(path))
+                except (SyntaxError, ValueError):
+                    self.unparsed.append(path)
+                    continue
+                parsed += 1
+            entries[path.as_posix()] = {'stamp': stamp, **migration.to_cache()}
+            self.nodes[migration.key] = migration
+            self.apps.setdefault(app, []).append(migration.name)
+        for names in self.apps.values():
+            names.sort()
+        if cache_path and (parsed or len(entries) != len(cached)):
+            self._save_cache(cache_path, entries)
+
+        # Squash: migrações substituídas presentes na árvore passam a ser o próprio squash
+        self.replaced: Dict[Tuple[str, str], Tuple[str, str]] = {}
+        for migration in self.nodes.values():
+            for replaced in migration.replaces:
+                if replaced in self.nodes:
+                    self.replaced[replaced] = migration.key
+
+        self.parents: Dict[Tuple[str, str], Set[Tuple[str, str]]] = {}
+        self.children: Dict[Tuple[str, str], Set[Tuple[str, str]]] = {}
+        self.missing: List[Tuple[MigrationNode, Tuple[str, str]]] = []
+        for key, migration in self.nodes.items():
+            if key in self.replaced:
+                continue
+            self.parents.setdefault(key, set())
+            self.children.setdefault(key, set())
+            for dependency in migration.dependencies:
+                self._link(migration, dependency, key)
+            for successor in migration.run_before:
+                self._link(migration, key, successor)
+
+    @staticmethod
+    def _load_cache(cache_path: Optional[Path]) -> Dict[str, Dict[str, Any]]:
+        """Entradas do cache de parsing (vazio se ausente, corrompido ou desativado)."""
+        if not cache_path:
+            return {}
+        try:
+            data = json.loads(Path(cache_path).read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    @staticmethod
+    def _save_cache(cache_path: Path, entries: Dict[str, Dict[str, Any]]):
+        """Grava o cache de parsing; falhas de escrita apenas desativam o cache."""
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            cache_path.write_text(json.dumps(entries, separators=(',', ':')), encoding='utf-8')
+        except OSError:
+            pass
+
+    def _link(self, migration: MigrationNode, parent: Tuple[str, str], child: Tuple[str, str]):
+        """Aresta parent -> child; registra dependência ausente se o app é do projeto e a migração não existe."""
+        parent, child = self.replaced.get(parent, parent), self.replaced.get(child, child)
+        for node in (parent, child):
+            if node not in self.nodes:
+                if node[0] in self.apps and not node[1].startswith('__'):
+                    self.missing.append((migration, node))
+                return
+        if parent != child:
+            self.parents.setdefault(child, set()).add(parent)
+            self.children.setdefault(parent, set()).add(child)
+
+    def leaves(self, app: str) -> List[str]:
+        """Migrações do app das quais nenhuma outra migração do mesmo app depende."""
+        return sorted(
+            name for name in self.apps.get(app, ())
+            if (app, name) not in self.replaced
+            and not any(child[0] == app for child in self.children.get((app, name), ()))
+        )
+
+    def conflicts(self) -> Dict[str, List[str]]:
+        """Apps com mais de uma migração final (exigem makemigrations --merge)."""
+        conflicts = {app: self.leaves(app) for app in sorted(self.apps)}
+        return {app: leaves for app, leaves in conflicts.items() if len(leaves) > 1}
+
+    def order(self) -> Tuple[List[Tuple[str, str]], List[Tuple[str, str]]]:
+        """Ordem topológica das migrações (Kahn) e migrações presas em ciclos de dependência."""
+        pending = {key: len(parents) for key, parents in self.parents.items()}
+        ready = sorted(key for key, count in pending.items() if count == 0)
+        ordered: List[Tuple[str, str]] = []
+        while ready:
+            key = ready.pop()
+            ordered.append(key)
+            for child in sorted(self.children.get(key, ()), reverse=True):
+                pending[child] -= 1
+                if pending[child] == 0:
+                    ready.append(child)
+        return ordered, sorted(key for key, count in pending.items() if count > 0)
+
+    def model_migrations(self) -> Dict[str, Tuple[str, str]]:
+        """Modelo (minúsculo) -> migração que o cria, após aplicar Create/Rename/DeleteModel em ordem."""
+        if self._models is None:
+            models: Dict[str, Tuple[str, str]] = {}
+            for key in self.order()[0]:
+                migration = self.nodes[key]
+                renames = iter(migration.renames)
+                for operation, target in migration.operations:
+                    if operation == 'CreateModel' and target:
+                        models[target.lower()] = key
+                    elif operation == 'DeleteModel':
+                        models.pop(target.lower(), None)
+                    elif operation == 'RenameModel':
+                        old_name, new_name = next(renames)
+                        if old_name.lower() in models:
+                            models[new_name.lower()] = models.pop(old_name.lower())
+            self._models = models
+        return self._models
+
+    def has_model(self, model_name: str) -> bool:
+        """Indica se alguma migração (ainda vigente) cria o modelo."""
+        return model_name.lower() in self.model_migrations()
+
+    def data_migrations(self) -> List[MigrationNode]:
+        """Migrações com operações de dados (RunPython/RunSQL)."""
+        return [
+            migration for key, migration in sorted(self.nodes.items())
+            if key not in self.replaced and any(operation in _DATA_OPERATIONS for operation, _ in migration.operations)
+        ]
+
+
+def migration_graph() -> MigrationGraph:
+    """
+    Grafo de migrações do projeto, construído uma única vez por execução do validador
+    (arquivos inalterados desde a execução anterior vêm do cache; AGV_NO_CACHE=1 desativa).
+    """
+    index = _project_index()
+    if index['migrations'] is None:
+        disabled = os.environ.get('AGV_NO_CACHE', '').lower() in ('1', 'true', 'yes')
+        cache_path = None if disabled else MIGRATION_INDEX_CACHE
+        index['migrations'] = MigrationGraph([
+            path for path in project_files('*.py')
+            if path.parent.name == 'migrations' and path.name != '__init__.py'
+        ], cache_path)
+    return index['migrations']
+
+
+# Superfície pública do projeto (API): módulo -> {'path', 'classes', 'functions'}, onde
+# classes mapeia classe -> {método: parâmetros} e functions mapeia função -> parâmetros.
+# Parâmetros seguem a notação de inspect: "x", "x=" (com default), "*args", "**kwargs",
+# "/" (fim dos posicionais) e "*" (início dos keyword-only sem *args).
+API_SNAPSHOT_FORMAT = 'agv-api-snapshot'
+API_SNAPSHOT_VERSION = 1
+_API_DUNDERS = ('__init__', '__call__')  # dunders que fazem parte da interface das classes
+_API_EXCLUDED_PARTS = {'tests', 'test', 'migrations'}
+
+
+def _signature(node: ast.AST) -> List[str]:
+    """Parâmetros de uma função/método do ast na notação compacta da API."""
+    args = node.args
+    params: List[str] = []
+    positional = [*args.posonlyargs, *args.args]
+    first_default = len(positional) - len(args.defaults)
+    for position, arg in enumerate(positional):
+        params.append(arg.arg + ('=' if position >= first_default else ''))
+        if position == len(args.posonlyargs) - 1:
+            params.append('/')
+    if args.vararg:
+        params.append('*' + args.vararg.arg)
+    elif args.kwonlyargs:
+        params.append('*')
+    for arg, default in zip(args.kwonlyargs, args.kw_defaults):
+        params.append(arg.arg + ('=' if default is not None else ''))
+    if args.kwarg:
+        params.append('**' + args.kwarg.arg)
+    return params
+
+
+def is_api_module(path: Union[str, Path]) -> bool:
+    """
+    Indica se o arquivo faz parte da API pública: módulos importáveis fora de testes,
+    migrations e módulos privados (diretórios como agv-outputs e site-packages não são
+    nomes de pacote válidos e ficam de fora).
+    """
+    parts, _ = _module_parts(Path(path))
+    return bool(parts) and not any(
+        not part.isidentifier() or part.startswith('_') or part in _API_EXCLUDED_PARTS for part in parts
+    ) and not parts[-1].startswith('test_') and parts[-1] != 'conftest'
+
+
+def module_api(source: str, filename: str = '<module>') -> Dict[str, Dict[str, Any]]:
+    """Classes (com métodos públicos) e funções públicas definidas no nível do módulo."""
+    functions: Dict[str, List[str]] = {}
+    classes: Dict[str, Dict[str, List[str]]] = {}
+    if 'def ' not in source and 'class ' not in source:
+        return {'classes': classes, 'functions': functions}
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        tree = ast.parse(source, filename=filename)
+    for node in tree.body:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) and not node.name.startswith('_'):
+            functions[node.name] = _signature(node)
+        elif isinstance(node, ast.ClassDef) and not node.name.startswith('_'):
+            classes[node.name] = {
+                item.name: _signature(item) for item in node.body
+                if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef))
+                and (not item.name.startswith('_') or item.name in _API_DUNDERS)
+            }
+    return {'classes': classes, 'functions': functions}
+
+
+def api_surface(sources) -> Dict[str, Dict[str, Any]]:
+    """API pública a partir de pares (caminho relativo, código): módulos sem símbolos públicos ficam de fora."""
+    modules: Dict[str, Dict[str, Any]] = {}
+    for path, source in sources:
+        if not is_api_module(path):
+            continue
+        try:
+            api = module_api(source, str(path))
+        except (SyntaxError, ValueError):
+            continue
+        if api['classes'] or api['functions']:
+            modules['.'.join(_module_parts(Path(path))[0])] = {'path': Path(path).as_posix(), **api}
+    return modules
+
+
+def public_api() -> Dict[str, Dict[str, Any]]:
+    """API pública atual do projeto, extraída uma única vez por execução do validador."""
+    index = _project_index()
+    if index['api'] is None:
+        index['api'] = api_surface(
+            (path, read_project_file(path)) for path in project_files('*.py') if is_api_module(path)
+        )
+    return index['api']
+
+
+def load_api_snapshot(path: Union[str, Path]) -> Optional[Dict[str, Any]]:
+    """Snapshot gravado por `agv-api-snapshot record` (None se ausente ou em formato desconhecido)."""
+    try:
+        snapshot = json.loads(Path(path).read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(snapshot, dict) or snapshot.get('format') != API_SNAPSHOT_FORMAT \
+            or snapshot.get('version') != API_SNAPSHOT_VERSION:
+        return None
+    return snapshot
+
+
+def _split_params(params: List[str]) -> Tuple[List[Tuple[str, bool, bool]], Dict[str, bool], bool, bool]:
+    """(posicionais (nome, default, só posicional), keyword-only {nome: default}, *args, **kwargs)."""
+    positional: List[Tuple[str, bool, bool]] = []
+    keyword: Dict[str, bool] = {}
+    varargs = varkw = keyword_only = False
+    for param in params:
+        if param == '/':
+            positional = [(name, default, True) for name, default, _ in positional]
+        elif param == '*':
+            keyword_only = True
+        elif param.startswith('**'):
+            varkw = True
+        elif param.startswith('*'):
+            varargs = keyword_only = True
+        elif keyword_only:
+            keyword[param.rstrip('=')] = param.endswith('=')
+        else:
+            positional.append((param.rstrip('='), param.endswith('='), False))
+    return positional, keyword, varargs, varkw
+
+
+def signature_break(old: List[str], new: List[str]) -> Optional[str]:
+    """Motivo pelo qual chamadas válidas para a assinatura old falham com new (None se compatível)."""
+    old_positional, old_keyword, old_varargs, old_varkw = _split_params(old)
+    new_positional, new_keyword, new_varargs, new_varkw = _split_params(new)
+    new_by_name = {name: default for name, default, only in new_positional if not only}
+    new_by_name.update(new_keyword)
+
+    for position, (name, default, only) in enumerate(old_positional):
+        if position < len(new_positional):
+            new_name, new_default, _ = new_positional[position]
+            if not only and new_name != name and not new_varkw:
+                return f"parâmetro '{name}' renomeado para '{new_name}'"
+            if default and not new_default:
+                return f"parâmetro '{new_name}' passou a ser obrigatório"
+        elif not new_varargs:
+            return f"parâmetro posicional '{name}' removido"
+    for name, default in old_keyword.items():
+        if name not in new_by_name and not new_varkw:
+            return f"parâmetro '{name}' removido"
+        if default and not new_by_name.get(name, True):
+            return f"parâmetro '{name}' passou a ser obrigatório"
+    if old_varargs and not new_varargs:
+        return "*args removido"
+    if old_varkw and not new_varkw:
+        return "**kwargs removido"
+
+    old_names = {name for name, _, _ in old_positional} | set(old_keyword)
+    for name, default, _ in new_positional[len(old_positional):]:
+        if not default:
+            return f"novo parâmetro obrigatório '{name}'"
+    for name, default in new_keyword.items():
+        if not default and name not in old_names:
+            return f"novo parâmetro obrigatório '{name}'"
+    return None
+
+
+def diff_public_api(baseline: Dict[str, Dict[str, Any]],
+                    current: Dict[str, Dict[str, Any]]) -> List[Dict[str, str]]:
+    """
+    Quebras de compatibilidade de current em relação a baseline (ambos no formato de
+    public_api()): módulo, classe, função ou método público removido e assinaturas
+    incompatíveis. Adições e mudanças compatíveis não são reportadas.
+    """
+    changes: List[Dict[str, str]] = []
+
+    def change(kind: str, module: str, symbol: str, detail: str = ''):
+        path = (current.get(module) or baseline[module])['path']
+        changes.append({'kind': kind, 'module': module, 'symbol': symbol, 'path': path, 'detail': detail})
+
+    def compare(module: str, symbol: str, old: List[str], new: Optional[List[str]], removed_kind: str):
+        if new is None:
+            change(removed_kind, module, symbol)
+        else:
+            reason = signature_break(old, new)
+            if reason:
+                change('signature_changed', module, symbol, reason)
+
+    for module in sorted(baseline):
+        old_api = baseline[module]
+        new_api = current.get(module)
+        if new_api is None:
+            change('module_removed', module, module)
+            continue
+        for name in sorted(old_api['functions']):
+            compare(module, name, old_api['functions'][name], new_api['functions'].get(name), 'function_removed')
+        for class_name in sorted(old_api['classes']):
+            new_methods = new_api['classes'].get(class_name)
+            if new_methods is None:
+                change('class_removed', module, class_name)
+                continue
+            old_methods = old_api['classes'][class_name]
+            for method in sorted(old_methods):
+                compare(module, f"{class_name}.{method}", old_methods[method], new_methods.get(method),
+                        'method_removed')
+    return changes
+
+
+class BaseValidator:
+    """
+    Execução, score e relatório comuns a todos os validadores gerados.
+
+    Subclasses geradas definem DESCRIPTION, validation_methods (nomes das funções de
+    regra no módulo do validador) e rule_categories; validadores multi-alvo definem
+    também rule_groups (regra -> alvo), usado para calcular o score de cada alvo.
+    """
+
+    DESCRIPTION = "Validador AGV"
+
+    SEVERITY_WEIGHTS = {
+        "CRITICAL": 15,
+        "HIGH": 8,
+        "MEDIUM": 2,
+        "LOW": 1
+    }
+
+    CATEGORY_WEIGHTS = {
+        "STRUCTURE": 1.0,
+        "CONTENT": 1.5,
+        "MODELS": 2.0,
+        "DEPENDENCIES": 1.2,
+        "API": 1.3
+    }
+
+    validation_methods: List[str] = []
+    rule_categories: Dict[str, str] = {}
+    rule_groups: Dict[str, str] = {}
+
+    def _rule(self, method_name: str):
+        """Função de regra definida no módulo do validador gerado."""
+        return vars(sys.modules[type(self).__module__])[method_name]
+
+    def validate(self) -> ValidationResults:
+        """Executa todas as validações e retorna os resultados."""
+        issues = []
+        total_checks = len(self.validation_methods)
+        failed_validations = 0
+        categories = {"STRUCTURE": 0, "CONTENT": 0, "MODELS": 0, "DEPENDENCIES": 0, "API": 0}
+        rule_issues: Dict[str, List[ValidationIssue]] = {}
+
+        print(f"Executando {total_checks} validações especializadas...")
+        print("Níveis: STRUCTURE | CONTENT | MODELS | DEPENDENCIES | API")
+        print("-" * 80)
+
+        for method_name in self.validation_methods:
+            try:
+                method = self._rule(method_name)
+                result = method()
+
+                category = self.rule_categories.get(method_name, "STRUCTURE")
+                print(f"[{category:12}] {method_name}", end="")
+
+                if result:
+                    failed_validations += 1
+                    rule_issues[method_name] = result if isinstance(result, list) else [result]
+                    if isinstance(result, list):
+                        issues.extend(result)
+                        categories[category] += len(result)
+                        print(f" FALHOU: {len(result)} problemas")
+                    else:
+                        issues.append(result)
+                        categories[category] += 1
+                        print(" FALHOU: 1 problema")
+                else:
+                    print(" OK")
+
+            except Exception as e:
+                failed_validations += 1
+                error_issue = ValidationIssue(
+                    file_path="validator",
+                    issue_type="validation_error",
+                    description=f"Erro na validação {method_name}: {str(e)}",
+                    expected="Validação deve executar sem erros",
+                    actual=f"Erro: {str(e)}",
+                    severity="CRITICAL"
+                )
+                issues.append(error_issue)
+                rule_issues[method_name] = [error_issue]
+                print(f" ERRO: {str(e)}")
+
+        passed_checks = total_checks - failed_validations
+        score = self._calculate_score(total_checks, failed_validations, issues)
+
+        return ValidationResults(
+            total_checks=total_checks,
+            passed_checks=passed_checks,
+            failed_checks=failed_validations,
+            issues=issues,
+            score=score,
+            categories=categories,
+            sampling=dict(SAMPLING_REPORT),
+            groups=self._group_results(rule_issues)
+        )
+
+    def _group_results(self, rule_issues: Dict[str, List[ValidationIssue]]) -> Dict[str, Dict[str, Any]]:
+        """Score de cada grupo (alvo) com as mesmas regras de cálculo do score geral."""
+        groups: Dict[str, Dict[str, Any]] = {}
+        for method_name in self.validation_methods:
+            group = self.rule_groups.get(method_name)
+            if group is None:
+                continue
+            summary = groups.setdefault(group, {"total_checks": 0, "failed_checks": 0, "issues": []})
+            summary["total_checks"] += 1
+            if method_name in rule_issues:
+                summary["failed_checks"] += 1
+                summary["issues"].extend(rule_issues[method_name])
+
+        return {
+            group: {
+                "total_checks": summary["total_checks"],
+                "passed_checks": summary["total_checks"] - summary["failed_checks"],
+                "failed_checks": summary["failed_checks"],
+                "issues": len(summary["issues"]),
+                "score": self._calculate_score(summary["total_checks"], summary["failed_checks"], summary["issues"]),
+            }
+            for group, summary in groups.items()
+        }
+
+    def _calculate_score(self, total_checks: int, failed_validations: int, issues: List[ValidationIssue]) -> float:
+        """Calcula score baseado na severidade e categoria dos problemas."""
+        if failed_validations == 0:
+            return 100.0
+
+        total_penalty = 0
+        for issue in issues:
+            severity_weight = self.SEVERITY_WEIGHTS.get(issue.severity, 1)
+            category_weight = 1.0
+
+            if "model" in issue.issue_type.lower():
+                category_weight = self.CATEGORY_WEIGHTS["MODELS"]
+            elif "content" in issue.issue_type.lower() or "config" in issue.issue_type.lower():
+                category_weight = self.CATEGORY_WEIGHTS["CONTENT"]
+            elif "api" in issue.issue_type.lower():
+                category_weight = self.CATEGORY_WEIGHTS["API"]
+            elif "dependency" in issue.issue_type.lower():
+                category_weight = self.CATEGORY_WEIGHTS["DEPENDENCIES"]
+            else:
+                category_weight = self.CATEGORY_WEIGHTS["STRUCTURE"]
+
+            penalty = severity_weight * category_weight
+            total_penalty += penalty
+
+        base_score = ((total_checks - failed_validations) / total_checks) * 100
+        penalty_factor = min(total_penalty / (failed_validations * 10), 0.5)
+        final_score = max(0, base_score - (base_score * penalty_factor))
+
+        return round(final_score, 2)
+
+    def generate_report(self, results: ValidationResults) -> str:
+        """Gera relatório detalhado dos resultados."""
+        report = []
+        report.append("=" * 100)
+        report.append(f"RELATÓRIO DE VALIDAÇÃO - {self.DESCRIPTION.upper()}")
+        report.append("=" * 100)
+        report.append(f"Data/Hora: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        report.append(f"Validador: {type(self).__name__}")
+        report.append("")
+        report.append("RESULTADOS:")
+        report.append(f"├─ Total de Verificações: {results.total_checks}")
+        report.append(f"├─ Aprovadas: {results.passed_checks}")
+        report.append(f"├─ Reprovadas: {results.failed_checks}")
+        report.append(f"└─ Score Final: {results.score}%")
+        report.append("")
+
+        # Análise por categoria
+        report.append("ANÁLISE POR CATEGORIA:")
+        for category, count in results.categories.items():
+            status = "FALHOU" if count > 0 else "OK"
+            report.append(f"|- {status} {category:12}: {count} problemas")
+        report.append("")
+
+        # Score por alvo (validadores multi-alvo)
+        if results.groups:
+            report.append("SCORE POR ALVO:")
+            for group, summary in results.groups.items():
+                report.append(
+                    f"|- {group:12}: {summary['score']}% "
+                    f"({summary['passed_checks']}/{summary['total_checks']} verificações, "
+                    f"{summary['issues']} problemas)"
+                )
+            report.append("")
+
+        # Regras executadas por amostragem
+        if results.sampling:
+            report.append("AMOSTRAGEM (taxas estimadas):")
+            for rule_name, info in results.sampling.items():
+                rate = info.get('estimated_violation_rate', 0.0) * 100
+                low, high = (bound * 100 for bound in info.get('confidence_interval', [0.0, 0.0]))
+                report.append(
+                    f"|- {rule_name}: {info['sample_size']}/{info['population']} arquivos, "
+                    f"violação estimada {rate:.1f}% (IC {info['confidence']:.0%}: {low:.1f}%-{high:.1f}%) "
+                    f"(~{info.get('estimated_violating_files', 0)} arquivos, seed {info['seed']})"
+                )
+            report.append("")
+
+        # Status
+        if results.score >= 90:
+            report.append("STATUS: EXCELENTE")
+        elif results.score >= 85:
+            report.append("STATUS: APROVADO")
+        elif results.score >= 70:
+            report.append("STATUS: NECESSITA MELHORIAS")
+        else:
+            report.append("STATUS: REJEITADO")
+
+        report.append("")
+
+        if results.issues:
+            # Agrupar por severidade
+            critical_issues = [i for i in results.issues if i.severity == "CRITICAL"]
+            high_issues = [i for i in results.issues if i.severity == "HIGH"]
+            medium_issues = [i for i in results.issues if i.severity == "MEDIUM"]
+            low_issues = [i for i in results.issues if i.severity == "LOW"]
+
+            if critical_issues:
+                report.append("PROBLEMAS CRÍTICOS:")
+                report.append("-" * 60)
+                for i, issue in enumerate(critical_issues, 1):
+                    report.append(f"{i}. {issue.description}")
+                    report.append(f"   Arquivo: {issue.file_path}")
+                    report.append(f"   Esperado: {issue.expected}")
+                    report.append(f"   Encontrado: {issue.actual}")
+                    report.append("")
+
+            if high_issues:
+                report.append("PROBLEMAS DE ALTA PRIORIDADE:")
+                report.append("-" * 60)
+                for i, issue in enumerate(high_issues, 1):
+                    report.append(f"{i}. {issue.description}")
+                    report.append(f"   Arquivo: {issue.file_path}")
+                    report.append("")
+
+            if medium_issues:
+                report.append("PROBLEMAS DE MÉDIA PRIORIDADE:")
+                report.append("-" * 60)
+                for i, issue in enumerate(medium_issues, 1):
+                    report.append(f"{i}. {issue.description}")
+                    report.append("")
+
+            if low_issues:
+                report.append("PROBLEMAS DE BAIXA PRIORIDADE:")
+                report.append("-" * 60)
+                for i, issue in enumerate(low_issues, 1):
+                    report.append(f"{i}. {issue.description}")
+                    report.append("")
+
+        report.append("=" * 100)
+        return "\n".join(report)
+
+
+def run_validator(validator_class: Type[BaseValidator], results_path: Union[str, Path]) -> int:
+    """Executa o validador, exibe o relatório e grava os resultados em JSON."""
+    # Configurar encoding para Windows
+    os.environ['PYTHONIOENCODING'] = 'utf-8'
+    if hasattr(sys.stdout, 'reconfigure'):
+        sys.stdout.reconfigure(encoding='utf-8')
+    if hasattr(sys.stderr, 'reconfigure'):
+        sys.stderr.reconfigure(encoding='utf-8')
+
+    validator = validator_class()
+    results = validator.validate()
+
+    # Gerar e exibir relatório
+    report = validator.generate_report(results)
+    print()
+
+    # Exibir relatório com tratamento de encoding
+    try:
+        print(report)
+    except UnicodeEncodeError:
+        # Fallback para encoding seguro
+        safe_report = report.encode('utf-8', errors='replace').decode('utf-8')
+        print(safe_report)
+
+    # Salvar resultados em JSON
+    results_file = Path(results_path)
+    results_file.parent.mkdir(parents=True, exist_ok=True)
+    results_file.write_text(
+        json.dumps(results.to_dict(), indent=2, ensure_ascii=False),
+        encoding='utf-8'
+    )
+    print(f"\nRelatório detalhado salvo em: {results_file}")
+
+    return 0 if results.score >= 75 else 1
@@ -10,58 +10,113 @@ NOVA ARQUITETURA MODULAR v5.0:
 - Context otimizado para alvos específicos (reduz contexto de 1500+ para ~500 linhas)
 """
 
+import os
 import sys
+import ast
 import json
 import argparse
 import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Any, Optional
-from dataclasses import dataclass, asdict
+from typing import Dict, Iterable, List, Any, Optional, Tuple, Union
+from dataclasses import dataclass, field
 
 # Imports dos components core
+from . import validation_runtime
 from .core.blueprint_parser import AdvancedBlueprintParser, ProjectSpecs
-from .core.validation_rules import ValidationRule
+from .core.specs_cache import SpecsCache
+from .core.validation_rules import ValidationRule, SamplingConfig
 from .core.logging_config import get_logger
 from .core.metrics import get_metrics_collector, measure_performance
 from .core.exceptions import ValidationGenerationError, BlueprintFileNotFoundError, handle_exception
 from .generators.scaffold_generator import ScaffoldGenerator
-from .generators.target_generator import TargetGenerator
+from .generators.target_generator import TargetGenerator, MultiTargetGenerator
 from .generators.integration_generator import IntegrationGenerator
 from .generators.evolution_generator import EvolutionGenerator
 
 
 @dataclass
-class ValidationIssue:
-    """Representa um problema encontrado na validação."""
-    file_path: str
-    issue_type: str
-    description: str
-    expected: str
-    actual: str
-    severity: str  # CRITICAL, HIGH, MEDIUM, LOW
+class GeneratedValidator:
+    """Validador produzido por generate_all() (um por gerador, alvo ou fase)."""
+    label: str  # scaffold, target_<N>, targets, <fase> ou evolution
+    validation_type: str
+    target_number: Optional[int] = None
+    target_numbers: List[int] = field(default_factory=list)  # validador multi-alvo (targets)
+    integration_phase: Optional[str] = None
+    rules_count: int = 0
+    paths: Dict[str, Path] = field(default_factory=dict)
+    error: Optional[str] = None
+    code: str = field(default="", repr=False)
 
+    @property
+    def success(self) -> bool:
+        """Indica se o validador foi gerado sem erros."""
+        return self.error is None
 
-@dataclass
-class ValidationResults:
-    """Resultados completos da validação."""
-    total_checks: int
-    passed_checks: int
-    failed_checks: int
-    issues: List[ValidationIssue]
-    score: float
-    categories: Dict[str, int]
-    
-    def to_dict(self) -> Dict[str, Any]:
-        """Converte para dicionário para serialização JSON."""
-        return {
-            "total_checks": self.total_checks,
-            "passed_checks": self.passed_checks,
-            "failed_checks": self.failed_checks,
-            "issues": [asdict(issue) for issue in self.issues],
-            "score": self.score,
-            "categories": self.categories
-        }
+
+# Nomes do runtime compartilhado usados pelos validadores gerados
+_RUNTIME_IMPORT = (
+    "from agv_system.validation_runtime import (\n"
+    "        ValidationIssue, BaseValidator, configure_sampling, sample_files, record_sample_result, run_validator,\n"
+    "        project_files, project_dirs, read_project_file, model_definitions, import_graph,\n"
+    "        migration_graph, public_api, load_api_snapshot, diff_public_api,\n"
+    "        glob_project, first_glob, first_existing, is_package_file, is_package_dir, starts_with_docstring,\n"
+    "        missing_file_issue, issues_for_missing, load_toml, pyproject_dependencies, requirements_dependencies\n"
+    "    )"
+)
+
+# Mensagem dos validadores gerados quando o agv_system não pode ser importado
+_RUNTIME_MISSING = (
+    "[ERRO] Pacote agv_system não encontrado neste ambiente. ",
+    "Instale o agv_system (pip install agv-system) ou gere o validador com --standalone.",
+)
+
+
+# Trechos fixos dos validadores gerados, montados uma única vez por processo;
+# _generate_validator_code só intercala os trechos que dependem das specs e das regras
+
+# Fim da docstring e imports do módulo
+_VALIDATOR_PROLOGUE = "\n".join([
+    "Gerado automaticamente pelo ValidatorGenerator v3.0 - Sistema Modular AGV",
+    '"""',
+    "",
+    "import os",
+    "import sys",
+    "import json",
+    "import re",
+    "from pathlib import Path",
+    "from typing import Dict, List, Any, Optional, Union",
+    "",
+    "",
+])
+
+# Import do runtime compartilhado; sem agv_system o validador encerra com orientação
+_VALIDATOR_RUNTIME_IMPORT = "\n".join([
+    "try:",
+    f"    {_RUNTIME_IMPORT}",
+    "except ImportError as runtime_error:",
+    "    raise SystemExit(",
+    *(f"        {line!r}" for line in _RUNTIME_MISSING),
+    "    ) from runtime_error",
+])
+
+# Ponto de entrada até o nome da classe do validador
+_VALIDATOR_MAIN_HEAD = "\n".join([
+    "",
+    "",
+    "if __name__ == \"__main__\":",
+    "    sys.exit(run_validator(",
+])
+
+
+@lru_cache(maxsize=1)
+def _runtime_source() -> str:
+    """Código do runtime compartilhado (sem shebang e docstring) para validadores standalone."""
+    source = Path(validation_runtime.__file__).read_text(encoding='utf-8')
+    docstring_end = ast.parse(source).body[0].end_lineno
+    return "\n".join(source.splitlines()[docstring_end:]).strip() + "\n"
 
 
 class ModularValidatorGenerator:
@@ -70,6 +125,7 @@ class ModularValidatorGenerator:
     VALIDATION_TYPES = {
         'scaffold': 'Validação completa de scaffold (Alvo 0)',
         'target': 'Validação de alvo específico (Alvos 1-N)',
+        'targets': 'Validação de vários alvos em um único validador, com score por alvo',
         'integration': 'Validação de teste de integração (T1-TN)',
         'evolution': 'Validação de evolução e manutenção (F7-Evolucionista)'
     }
@@ -85,29 +141,24 @@ class ModularValidatorGenerator:
         }
     }
     
-    SEVERITY_WEIGHTS = {
-        "CRITICAL": 15,
-        "HIGH": 8,
-        "MEDIUM": 2,
-        "LOW": 1
-    }
-    
-    CATEGORY_WEIGHTS = {
-        "STRUCTURE": 1.0,
-        "CONTENT": 1.5,
-        "MODELS": 2.0,
-        "DEPENDENCIES": 1.2,
-        "API": 1.3
-    }
-    
-    def __init__(self, blueprint_path: str):
+    def __init__(self, blueprint_path: str, specs: Optional[ProjectSpecs] = None,
+                 output_root: Union[str, Path] = ".", sampling: Optional[SamplingConfig] = None,
+                 use_cache: bool = True, standalone: bool = False):
         self.blueprint_path = Path(blueprint_path)
+        self.output_root = Path(output_root)
+        self.sampling = sampling or SamplingConfig()
+        # standalone: embute o runtime no validador (portável, sem depender do agv_system)
+        self.standalone = standalone
+        self.specs_cache = SpecsCache() if use_cache else None
         self.logger = get_logger("validator_generator")
         self.metrics = get_metrics_collector()
         
         try:
-            self.parser = AdvancedBlueprintParser(str(self.blueprint_path))
-            self.specs: Optional[ProjectSpecs] = None
+            # Specs já parseadas (ex: modo batch) dispensam nova leitura do Blueprint
+            if specs is None and not self.blueprint_path.exists():
+                raise FileNotFoundError(f"Blueprint não encontrado: {self.blueprint_path}")
+            self.parser: Optional[AdvancedBlueprintParser] = None
+            self.specs: Optional[ProjectSpecs] = specs
             self.logger.info(f"ValidatorGenerator initialized with blueprint: {blueprint_path}")
         except Exception as e:
             agv_exception = handle_exception("__init__", "ModularValidatorGenerator", e)
@@ -117,8 +168,18 @@ class ModularValidatorGenerator:
     def parse_blueprint(self) -> ProjectSpecs:
         """Parse do Blueprint arquitetural."""
         if self.specs is None:
-            print("Analisando Blueprint arquitetural com parser avançado...")
-            self.specs = self.parser.parse()
+            # Blueprint inalterado (mesmo hash e versão do parser) é carregado do cache em disco
+            if self.specs_cache is not None:
+                self.specs, from_cache = self.specs_cache.load_or_parse(self.blueprint_path)
+                if from_cache:
+                    print("Especificações carregadas do cache (Blueprint inalterado)")
+                else:
+                    print("Blueprint analisado com parser avançado e armazenado em cache")
+            else:
+                print("Analisando Blueprint arquitetural com parser avançado...")
+                # Sem cache, cada campo é extraído apenas quando um gerador o lê
+                self.parser = AdvancedBlueprintParser(str(self.blueprint_path))
+                self.specs = self.parser.parse(lazy=True)
             
             print(f"Especificações extraídas do projeto: {self.specs.project_name}")
             print(f"   Framework Backend: {self.specs.backend_framework}")
@@ -186,6 +247,32 @@ class ModularValidatorGenerator:
             print(f"Erro ao gerar validador do Alvo {target_number}: {e}")
             return False
     
+    def generate_targets_validator(self, target_numbers: Optional[Iterable[int]] = None,
+                                   target_contexts: Optional[Dict[int, Dict[str, Any]]] = None,
+                                   output_path: str = None) -> bool:
+        """Gera um único validador para vários alvos (padrão: Alvos 1-N), com score por alvo."""
+        try:
+            rules, class_name, description, default_output = self._build_rules(
+                "targets", context=target_contexts, target_numbers=target_numbers
+            )
+            
+            print(f"Gerando validador multi-alvo com MultiTargetGenerator ({description})...")
+            actual_path = self._generate_validator_file(
+                rules,
+                output_path or default_output,
+                validator_class_name=class_name,
+                validator_description=description,
+                validation_type="targets"
+            )
+            
+            print(f"Validador multi-alvo criado: {actual_path}")
+            print(f"Total de validações: {len(rules)}")
+            return True
+            
+        except Exception as e:
+            print(f"Erro ao gerar validador multi-alvo: {e}")
+            return False
+    
     def generate_integration_validator(self, integration_phase: str, integration_context: Dict[str, Any] = None,
                                      output_path: str = None) -> bool:
         """Gera validador especializado para fase de integração."""
@@ -241,6 +328,147 @@ class ModularValidatorGenerator:
             print(f"Erro ao gerar validador de evolução: {e}")
             return False
     
+    def build_validator(self, validation_type: str, target_number: Optional[int] = None,
+                        integration_phase: Optional[str] = None,
+                        context: Optional[Dict[str, Any]] = None,
+                        output_path: Optional[str] = None,
+                        target_numbers: Optional[Iterable[int]] = None) -> Dict[str, Path]:
+        """
+        Gera o validador do tipo informado sem saída no console.
+        
+        Diferente dos métodos generate_*, propaga exceções e retorna os caminhos
+        organizados (validator, results, log, metrics) para uso programático.
+        """
+        rules, class_name, description, default_output = self._build_rules(
+            validation_type, target_number, integration_phase, context, target_numbers
+        )
+        
+        paths = self._get_output_paths(validation_type, output_path or default_output)
+        paths['results'] = self._named_results_path(paths)
+        code = self._generate_validator_code(rules, class_name, description, str(paths['results']))
+        paths['validator'].write_text(code, encoding='utf-8')
+
+        self.logger.info(f"Validador gerado: {paths['validator']}")
+        return paths
+
+    def generate_all(self, target_numbers: Iterable[int] = (), integration_phases: Iterable[str] = (),
+                     include_scaffold: bool = True, include_evolution: bool = True,
+                     contexts: Optional[Dict[str, Dict[str, Any]]] = None,
+                     max_workers: Optional[int] = None,
+                     combine_targets: bool = False) -> List[GeneratedValidator]:
+        """
+        Gera scaffold, alvos, fases de integração e evolução a partir de um único parsing.
+
+        Os geradores rodam em paralelo em threads que compartilham as mesmas specs (sem
+        serialização entre processos); os arquivos só são gravados ao final, numa única
+        etapa de I/O com timestamp comum. A falha de um gerador não interrompe os demais
+        e fica registrada em GeneratedValidator.error. contexts é indexado pelo label do
+        validador (ex: "target_3", "T1", "evolution"). Com combine_targets os alvos saem
+        em um único validador multi-alvo (label "targets", contexto indexado por número).
+        """
+        self.parse_blueprint()
+        contexts = contexts or {}
+
+        jobs: List[GeneratedValidator] = []
+        if include_scaffold:
+            jobs.append(GeneratedValidator(label="scaffold", validation_type="scaffold"))
+        target_numbers = list(dict.fromkeys(target_numbers))
+        if combine_targets and target_numbers:
+            jobs.append(GeneratedValidator(label="targets", validation_type="targets",
+                                           target_numbers=target_numbers))
+        else:
+            for number in target_numbers:
+                jobs.append(GeneratedValidator(label=f"target_{number}", validation_type="target",
+                                               target_number=number))
+        for phase in dict.fromkeys(integration_phases):
+            jobs.append(GeneratedValidator(label=phase, validation_type="integration",
+                                           integration_phase=phase))
+        if include_evolution:
+            jobs.append(GeneratedValidator(label="evolution", validation_type="evolution"))
+        if not jobs:
+            return jobs
+
+        base_dir = self._create_output_structure()
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+
+        def build(job: GeneratedValidator) -> GeneratedValidator:
+            try:
+                rules, class_name, description, default_output = self._build_rules(
+                    job.validation_type, job.target_number, job.integration_phase, contexts.get(job.label),
+                    job.target_numbers
+                )
+                job.paths = self._output_paths(base_dir, timestamp, job.validation_type, default_output)
+                job.paths['results'] = self._named_results_path(job.paths)
+                job.code = self._generate_validator_code(rules, class_name, description, str(job.paths['results']))
+                job.rules_count = len(rules)
+            except Exception as e:
+                job.error = str(e)
+                self.logger.error(f"Failed to generate {job.label} validator: {e}")
+            return job
+
+        workers = max_workers or min(len(jobs), os.cpu_count() or 1)
+        if workers <= 1:
+            results = [build(job) for job in jobs]
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(build, jobs))
+
+        # Etapa única de gravação, depois que todos os geradores terminaram
+        for result in results:
+            if result.success:
+                result.paths['validator'].write_text(result.code, encoding='utf-8')
+
+        written = sum(1 for result in results if result.success)
+        self.logger.info(f"Generated {written}/{len(results)} validators in {base_dir}")
+        return results
+    
+    def _build_rules(self, validation_type: str, target_number: Optional[int] = None,
+                     integration_phase: Optional[str] = None,
+                     context: Optional[Dict[str, Any]] = None,
+                     target_numbers: Optional[Iterable[int]] = None) -> Tuple[List[ValidationRule], str, str, str]:
+        """Executa o gerador especializado e retorna (regras, classe, descrição, arquivo padrão)."""
+        specs = self.parse_blueprint()
+        project = self._clean_project_name()
+        
+        if validation_type == "scaffold":
+            generator = ScaffoldGenerator(specs)
+            return (generator.generate_rules(), f"{project}ScaffoldValidator",
+                    "Validador especializado para scaffold completo (Alvo 0)", "validate_scaffold.py")
+        
+        if validation_type == "target":
+            if not target_number:
+                raise ValidationGenerationError("target", "target_number é obrigatório")
+            generator = TargetGenerator(specs, target_number, context or {})
+            return (generator.generate_rules(), f"{project}Target{target_number}Validator",
+                    f"Validador especializado para Alvo {target_number}",
+                    f"validate_target_{target_number}.py")
+        
+        if validation_type == "targets":
+            # Contexto indexado por número do alvo (chaves de JSON chegam como texto)
+            target_contexts = {int(number): value for number, value in (context or {}).items()}
+            generator = MultiTargetGenerator(specs, target_numbers, target_contexts)
+            numbers = generator.target_numbers
+            span = f"{numbers[0]}-{numbers[-1]}" if numbers == list(range(numbers[0], numbers[-1] + 1)) \
+                else ",".join(map(str, numbers))
+            return (generator.generate_rules(), f"{project}TargetsValidator",
+                    f"Validador especializado para Alvos {span}", "validate_targets.py")
+        
+        if validation_type == "integration":
+            if not integration_phase:
+                raise ValidationGenerationError("integration", "integration_phase é obrigatório")
+            generator = IntegrationGenerator(specs, integration_phase, context or {})
+            return (generator.generate_rules(), f"{project}{integration_phase}Validator",
+                    f"Validador especializado para fase de integração {integration_phase}",
+                    f"validate_{integration_phase.lower()}.py")
+        
+        if validation_type == "evolution":
+            generator = EvolutionGenerator(specs, context or {})
+            return (generator.generate_rules(), f"{project}EvolutionValidator",
+                    "Validador especializado para evolução e manutenção (F7-Evolucionista)",
+                    "validate_evolution.py")
+        
+        raise ValidationGenerationError(validation_type, "tipo de validação desconhecido")
+    
     def _generate_validator_file(self, rules: List[ValidationRule], output_path: str, 
                                 validator_class_name: str, validator_description: str, validation_type: str = "scaffold"):
         """Gera arquivo de validador com as regras fornecidas usando nova estrutura organizada."""
@@ -262,61 +490,23 @@ class ModularValidatorGenerator:
     
     def _generate_validator_code(self, rules: List[ValidationRule], validator_class_name: str, 
                                 validator_description: str, results_path: str = "validation_results.json") -> str:
-        """Gera código completo do validador."""
-        # Header
+        """
+        Gera código do validador: apenas regras e lista de métodos.
+        
+        Classes de resultado, amostragem, execução, score e relatório vêm do módulo
+        agv_system.validation_runtime (ou são embutidos quando standalone=True).
+        """
         code_parts = [
             "#!/usr/bin/env python3",
             '"""',
-            f"{validator_description}",
-            "Gerado automaticamente pelo ValidatorGenerator v3.0 - Sistema Modular AGV",
-            '"""',
-            "",
-            "import sys",
-            "import json",
-            "import re",
-            "from pathlib import Path",
-            "from typing import Dict, List, Any, Optional, Union",
-            "from dataclasses import dataclass, asdict",
-            "from datetime import datetime",
-            "",
+            validator_description,
+            _VALIDATOR_PROLOGUE + (_runtime_source() if self.standalone else _VALIDATOR_RUNTIME_IMPORT),
         ]
         
-        # ValidationIssue class
         code_parts.extend([
-            "@dataclass",
-            "class ValidationIssue:",
-            '    """Representa um problema encontrado na validação."""',
-            "    file_path: str",
-            "    issue_type: str", 
-            "    description: str",
-            "    expected: str",
-            "    actual: str",
-            "    severity: str  # CRITICAL, HIGH, MEDIUM, LOW",
             "",
-        ])
-        
-        # ValidationResults class
-        code_parts.extend([
-            "@dataclass",
-            "class ValidationResults:",
-            '    """Resultados completos da validação."""',
-            "    total_checks: int",
-            "    passed_checks: int",
-            "    failed_checks: int",
-            "    issues: List[ValidationIssue]",
-            "    score: float",
-            "    categories: Dict[str, int]",
+            f"configure_sampling({self.sampling.to_dict()!r})",
             "",
-            "    def to_dict(self) -> Dict[str, Any]:",
-            '        """Converte para dicionário para serialização JSON."""',
-            "        return {",
-            '            "total_checks": self.total_checks,',
-            '            "passed_checks": self.passed_checks,',
-            '            "failed_checks": self.failed_checks,',
-            '            "issues": [asdict(issue) for issue in self.issues],',
-            '            "score": self.score,',
-            '            "categories": self.categories',
-            "        }",
             "",
         ])
         
@@ -324,269 +514,44 @@ class ModularValidatorGenerator:
         for rule in rules:
             code_parts.extend([
                 rule.code,
-                ""
+                "",
+                "",
             ])
         
         # Validator class
         code_parts.extend([
-            f"class {validator_class_name}:",
+            f"class {validator_class_name}(BaseValidator):",
             f'    """{validator_description}."""',
             "",
-            "    SEVERITY_WEIGHTS = {",
-            '        "CRITICAL": 15,',
-            '        "HIGH": 8,',
-            '        "MEDIUM": 2,',
-            '        "LOW": 1',
-            "    }",
+            f"    DESCRIPTION = {validator_description!r}",
             "",
-            "    CATEGORY_WEIGHTS = {",
-            '        "STRUCTURE": 1.0,',
-            '        "CONTENT": 1.5,',
-            '        "MODELS": 2.0,',
-            '        "DEPENDENCIES": 1.2,',
-            '        "API": 1.3',
-            "    }",
-            "",
-            "    def __init__(self):",
-            "        self.validation_methods = [",
+            "    validation_methods = [",
         ])
-        
-        # Add validation method names
-        for rule in rules:
-            code_parts.append(f'            "{rule.name}",')
-        
+        code_parts.extend(f'        "{rule.name}",' for rule in rules)
         code_parts.extend([
-            "        ]",
+            "    ]",
             "",
-            "        self.rule_categories = {",
+            "    rule_categories = {",
         ])
+        code_parts.extend(f'        "{rule.name}": "{rule.category}",' for rule in rules)
+        code_parts.append("    }")
         
-        # Add rule categories
-        for rule in rules:
-            code_parts.append(f'            "{rule.name}": "{rule.category}",')
-        
-        code_parts.extend([
-            "        }",
-            "",
-            "    def validate(self) -> ValidationResults:",
-            '        """Executa todas as validações e retorna os resultados."""',
-            "        issues = []",
-            "        total_checks = len(self.validation_methods)",
-            "        failed_validations = 0",
-            '        categories = {"STRUCTURE": 0, "CONTENT": 0, "MODELS": 0, "DEPENDENCIES": 0, "API": 0}',
-            "",
-            "        print(f\"Executando {total_checks} validações especializadas...\")",
-            "        print(\"Níveis: STRUCTURE | CONTENT | MODELS | DEPENDENCIES | API\")",
-            "        print(\"-\" * 80)",
-            "",
-            "        for method_name in self.validation_methods:",
-            "            try:",
-            "                method = globals()[method_name]",
-            "                result = method()",
-            "",
-            "                category = self.rule_categories.get(method_name, \"STRUCTURE\")",
-            "                print(f\"[{category:12}] {method_name}\", end=\"\")",
-            "",
-            "                if result:",
-            "                    failed_validations += 1",
-            "                    if isinstance(result, list):",
-            "                        issues.extend(result)",
-            "                        categories[category] += len(result)",
-            "                        print(f\" FALHOU: {len(result)} problemas\")",
-            "                    else:",
-            "                        issues.append(result)",
-            "                        categories[category] += 1",
-            "                        print(\" FALHOU: 1 problema\")",
-            "                else:",
-            "                    print(\" OK\")",
-            "",
-            "            except Exception as e:",
-            "                failed_validations += 1",
-            "                issues.append(ValidationIssue(",
-            '                    file_path="validator",',
-            '                    issue_type="validation_error",',
-            "                    description=f\"Erro na validação {method_name}: {str(e)}\",",
-            '                    expected="Validação deve executar sem erros",',
-            "                    actual=f\"Erro: {str(e)}\",",
-            '                    severity="CRITICAL"',
-            "                ))",
-            "                print(f\" ERRO: {str(e)}\")",
-            "",
-            "        passed_checks = total_checks - failed_validations",
-            "        score = self._calculate_score(total_checks, failed_validations, issues)",
-            "",
-            "        return ValidationResults(",
-            "            total_checks=total_checks,",
-            "            passed_checks=passed_checks,",
-            "            failed_checks=failed_validations,",
-            "            issues=issues,",
-            "            score=score,",
-            "            categories=categories",
-            "        )",
-            "",
-            "    def _calculate_score(self, total_checks: int, failed_validations: int, issues: List[ValidationIssue]) -> float:",
-            '        """Calcula score baseado na severidade e categoria dos problemas."""',
-            "        if failed_validations == 0:",
-            "            return 100.0",
-            "",
-            "        total_penalty = 0",
-            "        for issue in issues:",
-            "            severity_weight = self.SEVERITY_WEIGHTS.get(issue.severity, 1)",
-            "            category_weight = 1.0",
-            "",
-            "            if \"model\" in issue.issue_type.lower():",
-            "                category_weight = self.CATEGORY_WEIGHTS[\"MODELS\"]",
-            "            elif \"content\" in issue.issue_type.lower() or \"config\" in issue.issue_type.lower():",
-            "                category_weight = self.CATEGORY_WEIGHTS[\"CONTENT\"]",
-            "            elif \"api\" in issue.issue_type.lower():",
-            "                category_weight = self.CATEGORY_WEIGHTS[\"API\"]",
-            "            elif \"dependency\" in issue.issue_type.lower():",
-            "                category_weight = self.CATEGORY_WEIGHTS[\"DEPENDENCIES\"]",
-            "            else:",
-            "                category_weight = self.CATEGORY_WEIGHTS[\"STRUCTURE\"]",
-            "",
-            "            penalty = severity_weight * category_weight",
-            "            total_penalty += penalty",
-            "",
-            "        base_score = ((total_checks - failed_validations) / total_checks) * 100",
-            "        penalty_factor = min(total_penalty / (failed_validations * 10), 0.5)",
-            "        final_score = max(0, base_score - (base_score * penalty_factor))",
-            "",
-            "        return round(final_score, 2)",
-            "",
-            "    def generate_report(self, results: ValidationResults) -> str:",
-            '        """Gera relatório detalhado dos resultados."""',
-            "        report = []",
-            "        report.append(\"=\" * 100)",
-            f"        report.append(f\"RELATÓRIO DE VALIDAÇÃO - {validator_description.upper()}\")",
-            "        report.append(\"=\" * 100)",
-            "        report.append(f\"Data/Hora: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\")",
-            f"        report.append(f\"Validador: {validator_class_name}\")",
-            "        report.append(\"\")",
-            "        report.append(\"RESULTADOS:\")",
-            "        report.append(f\"├─ Total de Verificações: {results.total_checks}\")",
-            "        report.append(f\"├─ Aprovadas: {results.passed_checks}\")",
-            "        report.append(f\"├─ Reprovadas: {results.failed_checks}\")",
-            "        report.append(f\"└─ Score Final: {results.score}%\")",
-            "        report.append(\"\")",
-            "",
-            "        # Análise por categoria",
-            "        report.append(\"ANÁLISE POR CATEGORIA:\")",
-            "        for category, count in results.categories.items():",
-            "            status = \"FALHOU\" if count > 0 else \"OK\"",
-            "            report.append(f\"|- {status} {category:12}: {count} problemas\")",
-            "        report.append(\"\")",
-            "",
-            "        # Status",
-            "        if results.score >= 90:",
-            "            report.append(\"STATUS: EXCELENTE\")",
-            "        elif results.score >= 85:",
-            "            report.append(\"STATUS: APROVADO\")",
-            "        elif results.score >= 70:",
-            "            report.append(\"STATUS: NECESSITA MELHORIAS\")",
-            "        else:",
-            "            report.append(\"STATUS: REJEITADO\")",
-            "",
-            "        report.append(\"\")",
-            "",
-            "        if results.issues:",
-            "            # Agrupar por severidade",
-            "            critical_issues = [i for i in results.issues if i.severity == \"CRITICAL\"]",
-            "            high_issues = [i for i in results.issues if i.severity == \"HIGH\"]",
-            "            medium_issues = [i for i in results.issues if i.severity == \"MEDIUM\"]",
-            "            low_issues = [i for i in results.issues if i.severity == \"LOW\"]",
-            "",
-            "            if critical_issues:",
-            "                report.append(\"PROBLEMAS CRÍTICOS:\")",
-            "                report.append(\"-\" * 60)",
-            "                for i, issue in enumerate(critical_issues, 1):",
-            "                    report.append(f\"{i}. {issue.description}\")",
-            "                    report.append(f\"   Arquivo: {issue.file_path}\")",
-            "                    report.append(f\"   Esperado: {issue.expected}\")",
-            "                    report.append(f\"   Encontrado: {issue.actual}\")",
-            "                    report.append(\"\")",
-            "",
-            "            if high_issues:",
-            "                report.append(\"PROBLEMAS DE ALTA PRIORIDADE:\")",
-            "                report.append(\"-\" * 60)",
-            "                for i, issue in enumerate(high_issues, 1):",
-            "                    report.append(f\"{i}. {issue.description}\")",
-            "                    report.append(f\"   Arquivo: {issue.file_path}\")",
-            "                    report.append(\"\")",
-            "",
-            "            if medium_issues:",
-            "                report.append(\"PROBLEMAS DE MÉDIA PRIORIDADE:\")",
-            "                report.append(\"-\" * 60)", 
-            "                for i, issue in enumerate(medium_issues, 1):",
-            "                    report.append(f\"{i}. {issue.description}\")",
-            "                    report.append(\"\")",
-            "",
-            "            if low_issues:",
-            "                report.append(\"PROBLEMAS DE BAIXA PRIORIDADE:\")",
-            "                report.append(\"-\" * 60)",
-            "                for i, issue in enumerate(low_issues, 1):",
-            "                    report.append(f\"{i}. {issue.description}\")",
-            "                    report.append(\"\")",
-            "",
-            "        report.append(\"=\" * 100)",
-            "        return \"\\n\".join(report)",
-            "",
-        ])
+        # Validadores multi-alvo: grupo de cada regra para o score por alvo
+        if any(rule.group for rule in rules):
+            code_parts.extend(["", "    rule_groups = {"])
+            code_parts.extend(f'        "{rule.name}": "{rule.group}",' for rule in rules if rule.group)
+            code_parts.append("    }")
         
-        # Main function
-        code_parts.extend([
-            "def main():",
-            '    """Função principal do validador."""',
-            "    import os",
-            "    import sys",
-            "    ",
-            "    # Configurar encoding para Windows",
-            "    os.environ['PYTHONIOENCODING'] = 'utf-8'",
-            "    if hasattr(sys.stdout, 'reconfigure'):",
-            "        sys.stdout.reconfigure(encoding='utf-8')",
-            "    if hasattr(sys.stderr, 'reconfigure'):",
-            "        sys.stderr.reconfigure(encoding='utf-8')",
-            "",
-            f"    validator = {validator_class_name}()",
-            "    results = validator.validate()",
-            "",
-            "    # Gerar e exibir relatório",
-            "    report = validator.generate_report(results)",
-            "    print()",
-            "    ",
-            "    # Exibir relatório com tratamento de encoding",
-            "    try:",
-            "        print(report)",
-            "    except UnicodeEncodeError:",
-            "        # Fallback para encoding seguro",
-            "        safe_report = report.encode('utf-8', errors='replace').decode('utf-8')",
-            "        print(safe_report)",
-            "",
-            "    # Salvar resultados em JSON",
-            "    results_file = Path(r\"" + results_path + "\")",
-            "    results_file.parent.mkdir(parents=True, exist_ok=True)",
-            "    results_file.write_text(",
-            "        json.dumps(results.to_dict(), indent=2, ensure_ascii=False),", 
-            "        encoding='utf-8'",
-            "    )",
-            "    print(f\"\\nRelatório detalhado salvo em: {results_file}\")",
-            "",
-            "    return 0 if results.score >= 75 else 1",
-            "",
-            "",
-            "if __name__ == \"__main__\":",
-            "    exit_code = main()",
-            "    sys.exit(exit_code)",
-        ])
+        code_parts.append(f"{_VALIDATOR_MAIN_HEAD}{validator_class_name}, r\"{results_path}\"))\n")
         
         return "\n".join(code_parts)
     
     def _create_output_structure(self) -> Path:
         """Cria a estrutura de diretórios de saída organizada."""
-        base_dir = Path(self.OUTPUT_STRUCTURE['base_dir'])
+        base_dir = self.output_root / self.OUTPUT_STRUCTURE['base_dir']
         
         # Criar diretório base
-        base_dir.mkdir(exist_ok=True)
+        base_dir.mkdir(parents=True, exist_ok=True)
         
         # Criar subdiretórios
         for subdir in self.OUTPUT_STRUCTURE['subdirs'].values():
@@ -607,7 +572,11 @@ class ModularValidatorGenerator:
         """Retorna caminhos organizados para os arquivos de saída."""
         base_dir = self._create_output_structure()
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        
+        return self._output_paths(base_dir, timestamp, validation_type, base_filename)
+
+    @staticmethod
+    def _output_paths(base_dir: Path, timestamp: str, validation_type: str, base_filename: str) -> Dict[str, Path]:
+        """Caminhos de saída para diretório base e timestamp já definidos (sem I/O)."""
         # Nome base sem extensão
         if "." in base_filename:
             name, _ = base_filename.rsplit(".", 1)
@@ -622,7 +591,14 @@ class ModularValidatorGenerator:
         }
         
         return paths
-    
+
+    @staticmethod
+    def _named_results_path(paths: Dict[str, Path]) -> Path:
+        """Resultado nomeado a partir do validador para evitar colisões entre alvos/fases."""
+        return paths['results'].with_name(
+            paths['validator'].stem.replace('validate_', 'results_', 1) + '.json'
+        )
+
     def _clean_project_name(self) -> str:
         """Limpa o nome do projeto para usar em nomes de classe."""
         if self.specs:
@@ -636,6 +612,23 @@ class ModularValidatorGenerator:
         return clean_name or "Project"
 
 
+def _parse_target_numbers(spec: str) -> List[int]:
+    """Converte "1-3,7" em [1, 2, 3, 7] (ordem preservada, sem repetições)."""
+    numbers: List[int] = []
+    for part in spec.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        if "-" in part:
+            start, end = (int(bound) for bound in part.split("-", 1))
+            numbers.extend(range(start, end + 1))
+        else:
+            numbers.append(int(part))
+    if not numbers or min(numbers) < 1:
+        raise ValueError(spec)
+    return list(dict.fromkeys(numbers))
+
+
 def main():
     """Função principal do ValidatorGenerator v3.0 - Sistema Modular."""
     parser = argparse.ArgumentParser(
@@ -643,15 +636,36 @@ def main():
     )
     
     parser.add_argument("blueprint", help="Caminho do arquivo Blueprint arquitetural")
-    parser.add_argument("type", choices=ModularValidatorGenerator.VALIDATION_TYPES.keys(),
-                       help="Tipo de validador a ser gerado")
+    parser.add_argument("type", choices=[*ModularValidatorGenerator.VALIDATION_TYPES, "all"],
+                       help="Tipo de validador a ser gerado (all: scaffold, alvos, fases e evolução)")
     
     # Argumentos específicos por tipo
     parser.add_argument("--target-number", type=int, help="Número do alvo (para type=target)")
     parser.add_argument("--integration-phase", help="Fase de integração (para type=integration, ex: T1, T2)")
-    parser.add_argument("--context", help="Arquivo JSON com contexto específico")
+    parser.add_argument("--targets", help="Alvos para type=all ou type=targets (ex: 1-5 ou 1,3,7)")
+    parser.add_argument("--combine-targets", action="store_true",
+                       help="type=all: gera os alvos em um único validador multi-alvo")
+    parser.add_argument("--integration-phases", help="Fases de integração para type=all (ex: T1,T2)")
+    parser.add_argument("--workers", type=int, help="Geradores em paralelo para type=all (padrão: CPUs)")
+    parser.add_argument("--context", help="Arquivo JSON com contexto específico "
+                                          "(type=all: objeto indexado por label, ex: target_3, T1; "
+                                          "type=targets: objeto indexado por número do alvo)")
     parser.add_argument("--output", help="Caminho do arquivo de saída (opcional)")
     
+    # Amostragem para monorepos grandes (padrão: verificação completa)
+    parser.add_argument("--sample-fraction", type=float,
+                       help="Fração de arquivos verificada nas regras por arquivo (ex: 0.1)")
+    parser.add_argument("--sample-confidence", type=float,
+                       help="Nível de confiança para calcular o tamanho da amostra (ex: 0.95)")
+    parser.add_argument("--sample-margin", type=float, default=0.05,
+                       help="Margem de erro da taxa de violação estimada (padrão: 0.05)")
+    parser.add_argument("--sample-seed", type=int, default=42,
+                       help="Semente para seleção reprodutível da amostra (padrão: 42)")
+    parser.add_argument("--no-cache", action="store_true",
+                       help="Ignora o cache de especificações e refaz o parsing do Blueprint")
+    parser.add_argument("--standalone", action="store_true",
+                       help="Embute o runtime no validador (não exige agv_system ao executar)")
+    
     args = parser.parse_args()
     
     # Validar argumentos específicos
@@ -663,6 +677,14 @@ def main():
         print("Erro: --integration-phase é obrigatório para type=integration")
         sys.exit(1)
     
+    target_numbers: List[int] = []
+    if args.targets:
+        try:
+            target_numbers = _parse_target_numbers(args.targets)
+        except ValueError:
+            print(f"Erro: --targets inválido: {args.targets} (use ex: 1-5 ou 1,3,7)")
+            sys.exit(1)
+    
     # Carregar contexto se fornecido
     context = {}
     if args.context:
@@ -676,7 +698,14 @@ def main():
     
     # Criar gerador
     try:
-        generator = ModularValidatorGenerator(args.blueprint)
+        sampling = SamplingConfig(
+            fraction=args.sample_fraction,
+            confidence=args.sample_confidence,
+            margin=args.sample_margin,
+            seed=args.sample_seed
+        )
+        generator = ModularValidatorGenerator(args.blueprint, sampling=sampling, use_cache=not args.no_cache,
+                                              standalone=args.standalone)
     except FileNotFoundError:
         print(f"[ERRO] Arquivo Blueprint não encontrado: {args.blueprint}")
         sys.exit(1)
@@ -685,14 +714,27 @@ def main():
         sys.exit(1)
     
     print("ValidatorGenerator v3.0 - Sistema Modular AGV")
-    print(f"Tipo de validação: {ModularValidatorGenerator.VALIDATION_TYPES[args.type]}")
+    print(f"Tipo de validação: {ModularValidatorGenerator.VALIDATION_TYPES.get(args.type, 'Todos os validadores')}")
     print(f"Blueprint: {args.blueprint}")
+    if generator.sampling.enabled:
+        print(f"Amostragem: {generator.sampling.to_dict()}")
     print("-" * 80)
     
     # Executar geração baseada no tipo
     success = False
     
-    if args.type == "scaffold":
+    if args.type == "all":
+        phases = [phase.strip() for phase in (args.integration_phases or "").split(",") if phase.strip()]
+        results = generator.generate_all(target_numbers, phases, contexts=context, max_workers=args.workers,
+                                         combine_targets=args.combine_targets)
+        for result in results:
+            if result.success:
+                print(f"[OK]   {result.label:12} {result.rules_count:3} regras -> {result.paths['validator']}")
+            else:
+                print(f"[ERRO] {result.label:12} {result.error}")
+        success = all(result.success for result in results)
+        
+    elif args.type == "scaffold":
         output_path = args.output or "validate_scaffold.py"
         success = generator.generate_scaffold_validator(output_path)
         
@@ -703,6 +745,13 @@ def main():
             args.output
         )
         
+    elif args.type == "targets":
+        success = generator.generate_targets_validator(
+            target_numbers or None,
+            context,
+            args.output
+        )
+        
     elif args.type == "integration":
         success = generator.generate_integration_validator(
             args.integration_phase,
@@ -722,6 +771,8 @@ def main():
         print(f"Tipo: {args.type}")
         if args.type == "target":
             print(f"Alvo: {args.target_number}")
+        elif args.type == "targets" and target_numbers:
+            print(f"Alvos: {args.targets}")
         elif args.type == "integration":
             print(f"Fase: {args.integration_phase}")
     else:
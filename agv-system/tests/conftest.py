@@ -0,0 +1,37 @@
+"""Configuração compartilhada dos testes do AGV System."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Layout src/: permite rodar os testes sem instalar o pacote (pip install -e . também funciona)
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+
+@pytest.fixture
+def policy_keys():
+    """Chaves rastreadas por uma EvictionPolicy, lidas da estrutura interna de cada política."""
+    from agv_system.core.cache_policies import LFUPolicy, LRUPolicy, WTinyLFUPolicy
+
+    def keys(policy):
+        if isinstance(policy, LRUPolicy):
+            return set(policy._order)
+        if isinstance(policy, LFUPolicy):
+            bucketed = [key for bucket in policy._buckets.values() for key in bucket]
+            assert len(bucketed) == len(set(bucketed)), "chave em mais de um bucket de frequência"
+            assert set(bucketed) == set(policy._frequency)
+            for frequency, bucket in policy._buckets.items():
+                assert bucket, "bucket vazio não removido"
+                assert all(policy._frequency[key] == frequency for key in bucket)
+            return set(policy._frequency)
+        if isinstance(policy, WTinyLFUPolicy):
+            segments = (policy._window, policy._probation, policy._protected)
+            assert sum(len(segment) for segment in segments) == len(set().union(*segments)), \
+                "chave em mais de um segmento"
+            return set().union(*segments)
+        raise TypeError(f"Política sem inspeção nos testes: {type(policy).__name__}")
+
+    return keys
@@ -0,0 +1,180 @@
+"""Testes das políticas de evicção do MemoryCache (core/cache_policies.py)."""
+
+import random
+
+import pytest
+
+from agv_system.core.cache_policies import (
+    EVICTION_POLICIES, LFUPolicy, LRUPolicy, WTinyLFUPolicy, create_policy
+)
+from agv_system.core.exceptions import InvalidConfigurationError
+
+pytestmark = pytest.mark.unit
+
+
+def replay(policy, capacity, trace, resident=None):
+    """Reproduz o trace como o MemoryCache (get; em falta, evicção se cheio e set)."""
+    resident = set() if resident is None else resident
+    for key in trace:
+        if key in resident:
+            policy.record_access(key)
+            continue
+        policy.record_miss(key)
+        if len(resident) >= capacity:
+            victim = policy.evict()
+            assert victim in resident, f"vítima {victim!r} não está no cache"
+            resident.discard(victim)
+        policy.record_insert(key)
+        resident.add(key)
+    return resident
+
+
+@pytest.mark.parametrize("policy_name", list(EVICTION_POLICIES))
+def test_policy_tracks_exactly_the_resident_keys(policy_name, policy_keys):
+    rng = random.Random(7)
+    policy = create_policy(policy_name, 20)
+    resident = set()
+    for _ in range(2_000):
+        operation = rng.random()
+        key = f"k{rng.randrange(60)}"
+        if operation < 0.1 and resident:
+            removed = rng.choice(sorted(resident))
+            policy.remove(removed)
+            resident.discard(removed)
+        else:
+            replay(policy, 20, [key], resident)
+        assert policy_keys(policy) == resident
+        assert len(resident) <= 20
+
+
+@pytest.mark.parametrize("policy_name", list(EVICTION_POLICIES))
+def test_evict_drains_policy_and_returns_none_when_empty(policy_name, policy_keys):
+    policy = create_policy(policy_name, 10)
+    resident = replay(policy, 10, [f"k{index}" for index in range(10)])
+    evicted = set()
+    while True:
+        victim = policy.evict()
+        if victim is None:
+            break
+        assert victim not in evicted
+        evicted.add(victim)
+    assert evicted == resident
+    assert policy_keys(policy) == set()
+
+
+@pytest.mark.parametrize("policy_name", list(EVICTION_POLICIES))
+def test_clear_forgets_every_key(policy_name, policy_keys):
+    policy = create_policy(policy_name, 10)
+    replay(policy, 10, [f"k{index}" for index in range(25)])
+    policy.clear()
+    assert policy_keys(policy) == set()
+    assert policy.evict() is None
+
+
+def test_create_policy_accepts_instance_and_rejects_unknown_name():
+    policy = LFUPolicy(5)
+    assert create_policy(policy, 100) is policy
+    assert isinstance(create_policy("LRU", 5), LRUPolicy)
+    with pytest.raises(InvalidConfigurationError):
+        create_policy("fifo", 5)
+
+
+def test_lru_evicts_least_recently_used():
+    policy = LRUPolicy(3)
+    replay(policy, 3, ["a", "b", "c", "a"])
+    assert policy.evict() == "b"
+    assert policy.evict() == "c"
+    assert policy.evict() == "a"
+
+
+def test_lfu_evicts_least_frequent_with_lru_tie_break():
+    policy = LFUPolicy(3)
+    replay(policy, 3, ["a", "b", "c", "a", "a", "b"])
+    assert policy._min_frequency == 1
+    assert policy.evict() == "c"
+    # a (3 acessos) e b (2): a mínima passa a ser a de b
+    assert policy.evict() == "b"
+    assert policy.evict() == "a"
+
+    replay(policy, 3, ["x", "y", "z"])
+    assert policy.evict() == "x"
+
+
+def test_lfu_min_frequency_follows_accesses():
+    policy = LFUPolicy(3)
+    replay(policy, 3, ["a", "a"])
+    # Única chave do bucket mínimo foi promovida: o mínimo sobe junto
+    assert policy._min_frequency == 2
+    assert list(policy._buckets) == [2]
+
+    policy.record_insert("b")
+    assert policy._min_frequency == 1
+    assert policy.evict() == "b"
+
+
+def test_lfu_recovers_min_frequency_after_remove_empties_bucket(policy_keys):
+    policy = LFUPolicy(3)
+    replay(policy, 3, ["a", "b", "c", "a", "a"])
+    policy.remove("b")
+    policy.remove("c")
+    assert 1 not in policy._buckets
+    assert policy.evict() == "a"
+    assert policy_keys(policy) == set()
+
+
+def test_wtinylfu_window_overflow_goes_to_probation():
+    policy = WTinyLFUPolicy(10)
+    assert policy.window_capacity == 1
+    replay(policy, 10, ["a", "b"])
+    assert list(policy._window) == ["b"]
+    assert list(policy._probation) == ["a"]
+
+
+def test_wtinylfu_probation_hit_promotes_and_protected_overflow_demotes():
+    policy = WTinyLFUPolicy(10)
+    keys = [f"k{index}" for index in range(9)]
+    replay(policy, 10, keys)
+    assert list(policy._probation) == keys[:8]
+
+    policy.record_access("k0")
+    assert list(policy._protected) == ["k0"]
+    assert "k0" not in policy._probation
+
+    for key in keys[1:8]:
+        policy.record_access(key)
+    # protected_capacity = 7: a chave protegida mais antiga volta para probation
+    assert len(policy._protected) == policy.protected_capacity == 7
+    assert list(policy._probation) == ["k0"]
+
+
+def test_wtinylfu_rejects_cold_candidate():
+    policy = WTinyLFUPolicy(10)
+    replay(policy, 10, [f"k{index}" for index in range(10)])
+    assert list(policy._window) == ["k9"]
+    # k9 (candidata da janela) não é mais frequente que k0 (vítima de probation)
+    assert policy.evict() == "k9"
+    assert "k0" in policy._probation
+
+
+def test_wtinylfu_admits_frequent_candidate():
+    policy = WTinyLFUPolicy(10)
+    replay(policy, 10, [f"k{index}" for index in range(10)])
+    for _ in range(10):
+        policy.record_miss("k9")
+    assert policy.evict() == "k0"
+    assert "k9" in policy._probation
+    assert not policy._window
+
+
+def test_wtinylfu_hot_set_survives_scan():
+    capacity = 100
+    hot = [f"hot{index}" for index in range(20)]
+    trace = hot * 10 + [f"scan{index}" for index in range(1_000)]
+
+    lru, tinylfu = LRUPolicy(capacity), WTinyLFUPolicy(capacity)
+    lru_resident = replay(lru, capacity, trace)
+    tinylfu_resident = replay(tinylfu, capacity, trace)
+
+    assert not lru_resident & set(hot)
+    # Só as chaves quentes que ainda estavam na janela LRU podem ter saído
+    assert len(set(hot) & tinylfu_resident) >= len(hot) - tinylfu.window_capacity
@@ -0,0 +1,178 @@
+"""Testes do MemoryCache e da ExpirationQueue (core/cache_system.py)."""
+
+import random
+import time
+
+import pytest
+
+from agv_system.core.cache_policies import EVICTION_POLICIES
+from agv_system.core.cache_system import ExpirationQueue, MemoryCache
+
+pytestmark = pytest.mark.unit
+
+
+def assert_consistent(cache, policy_keys):
+    """Invariantes do MemoryCache: mesmas chaves no dicionário, na política e na fila de expiração."""
+    assert policy_keys(cache._policy) == set(cache._cache)
+    assert cache._bytes == sum(entry.size_bytes for entry in cache._cache.values())
+    assert len(cache._cache) <= cache.max_size
+    if cache.max_bytes is not None:
+        assert cache._bytes <= cache.max_bytes
+    expiring = {key for key, entry in cache._cache.items() if entry.expires_at is not None}
+    assert set(cache._expirations._deadlines) == expiring
+
+
+# ExpirationQueue
+
+def test_expiration_queue_pops_only_current_deadlines():
+    queue = ExpirationQueue()
+    queue.schedule("a", 10.0)
+    queue.schedule("b", 20.0)
+    queue.schedule("a", 30.0)  # reagendada: o prazo 10.0 fica obsoleto no heap
+    queue.schedule("c", 5.0)
+    queue.discard("c")
+
+    assert queue.pop_due(15.0) == []
+    assert queue.pop_due(25.0) == ["b"]
+    assert queue.pop_due(30.0) == []  # prazo vence estritamente antes de now
+    assert queue.pop_due(31.0) == ["a"]
+    assert len(queue) == 0
+
+
+def test_expiration_queue_schedule_none_cancels():
+    queue = ExpirationQueue()
+    queue.schedule("a", 1.0)
+    queue.schedule("a", None)
+    assert len(queue) == 0
+    assert queue.pop_due(2.0) == []
+
+
+def test_expiration_queue_compacts_obsolete_items():
+    queue = ExpirationQueue()
+    for round_number in range(1_000):
+        queue.schedule("hot", float(round_number))
+        assert len(queue._heap) <= 2 * len(queue._deadlines) + 64 + 1
+    assert len(queue) == 1
+    assert queue.pop_due(float("inf")) == ["hot"]
+
+    for index in range(500):
+        queue.schedule(f"k{index}", float(index))
+    for index in range(500):
+        queue.discard(f"k{index}")
+    assert len(queue._heap) <= 64 + 1
+    assert queue.pop_due(float("inf")) == []
+
+
+# MemoryCache: chaves e política
+
+@pytest.mark.parametrize("policy_name", list(EVICTION_POLICIES))
+def test_cache_and_policy_keep_the_same_keys(policy_name, policy_keys):
+    rng = random.Random(11)
+    cache = MemoryCache(max_size=25, policy=policy_name, max_bytes=4_000, sizer=len)
+    for _ in range(3_000):
+        key = f"k{rng.randrange(80)}"
+        operation = rng.random()
+        if operation < 0.5:
+            cache.get(key)
+        elif operation < 0.9:
+            cache.set(key, "x" * rng.randrange(1, 400))
+        else:
+            cache.delete(key)
+        assert_consistent(cache, policy_keys)
+
+    cache.clear()
+    assert_consistent(cache, policy_keys)
+    assert cache.get_size() == 0
+
+
+@pytest.mark.parametrize("policy_name", list(EVICTION_POLICIES))
+def test_count_eviction_keeps_max_size(policy_name, policy_keys):
+    cache = MemoryCache(max_size=10, policy=policy_name)
+    for index in range(100):
+        cache.set(f"k{index}", index)
+        assert_consistent(cache, policy_keys)
+    assert cache.get_size() == 10
+    assert cache.get_stats().evictions == 90
+
+
+def test_expired_entries_leave_cache_policy_and_queue(policy_keys):
+    cache = MemoryCache(max_size=10, policy="w-tinylfu", sizer=len)
+    cache.set("short", "abc", ttl=0.01)
+    cache.set("long", "defg", ttl=60)
+    cache.set("forever", "hi")
+    time.sleep(0.02)
+
+    assert cache.purge_expired() == 1
+    assert set(cache._cache) == {"long", "forever"}
+    assert cache.get_size_bytes() == 6
+    assert_consistent(cache, policy_keys)
+
+    cache.set("short", "abc", ttl=0.01)
+    time.sleep(0.02)
+    assert cache.get("short") is None
+    assert_consistent(cache, policy_keys)
+
+
+# MemoryCache: contabilidade em bytes
+
+def test_bytes_follow_set_update_delete_and_clear():
+    cache = MemoryCache(max_size=10, sizer=len)
+    cache.set("a", "x" * 10)
+    cache.set("b", "x" * 20)
+    assert cache.get_size_bytes() == 30
+
+    cache.set("a", "x" * 5)  # atualização substitui o tamanho anterior
+    assert cache.get_size_bytes() == 25
+
+    assert cache.delete("b")
+    assert not cache.delete("b")
+    assert cache.get_size_bytes() == 5
+
+    cache.clear()
+    assert cache.get_size_bytes() == 0
+
+
+def test_byte_budget_evicts_by_policy_order(policy_keys):
+    cache = MemoryCache(max_size=100, max_bytes=100, policy="lru", sizer=len)
+    for key in "abcd":
+        cache.set(key, "x" * 25)
+    assert cache.get_size_bytes() == 100
+
+    cache.get("a")  # a passa a ser a mais recente: b e depois c são as vítimas
+    cache.set("e", "x" * 30)
+    assert set(cache._cache) == {"a", "d", "e"}
+    assert cache.get_size_bytes() == 80
+    assert_consistent(cache, policy_keys)
+
+
+def test_byte_budget_update_can_evict_the_updated_key(policy_keys):
+    cache = MemoryCache(max_size=100, max_bytes=100, policy="lru", sizer=len)
+    cache.set("a", "x" * 40)
+    cache.set("b", "x" * 40)
+    # Crescer a exige espaço: a política escolhe a própria a (a mais antiga), que reentra como nova
+    cache.set("a", "x" * 70)
+    assert set(cache._cache) == {"a"}
+    assert cache.get_size_bytes() == 70
+    assert_consistent(cache, policy_keys)
+
+
+def test_value_larger_than_budget_is_not_stored_and_drops_old_value(policy_keys):
+    cache = MemoryCache(max_size=10, max_bytes=50, sizer=len)
+    cache.set("a", "x" * 10)
+    cache.set("b", "x" * 10)
+    cache.set("a", "x" * 51)
+
+    assert cache.get("a") is None
+    assert cache.get("b") == "x" * 10
+    assert cache.get_size_bytes() == 10
+    assert_consistent(cache, policy_keys)
+
+
+def test_failing_sizer_falls_back_to_shallow_size():
+    def broken_sizer(value):
+        raise RuntimeError("sizer quebrado")
+
+    cache = MemoryCache(max_size=10, sizer=broken_sizer)
+    cache.set("a", [1, 2, 3])
+    assert cache.get("a") == [1, 2, 3]
+    assert cache.get_size_bytes() > 0
@@ -0,0 +1,138 @@
+"""Testes do grafo de migrações Django usado pelos validadores (validation_runtime.MigrationGraph)."""
+
+from pathlib import Path
+
+import pytest
+
+from agv_system.validation_runtime import MigrationGraph
+
+pytestmark = pytest.mark.unit
+
+
+def write_migration(root: Path, app: str, name: str, dependencies=(), operations=(), replaces=()) -> Path:
+    """Grava <app>/migrations/<name>.py com a classe Migration informada."""
+    path = root / app / "migrations" / f"{name}.py"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(
+        "from django.db import migrations, models\n\n\n"
+        "class Migration(migrations.Migration):\n"
+        f"    replaces = {list(replaces)!r}\n"
+        f"    dependencies = {list(dependencies)!r}\n"
+        "    operations = [\n"
+        + "".join(f"        {operation},\n" for operation in operations)
+        + "    ]\n",
+        encoding="utf-8",
+    )
+    return path
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    """Projeto com leaf duplicada (core), dependência ausente (billing) e ciclo (loop)."""
+    monkeypatch.chdir(tmp_path)
+    root = Path(".")
+    files = [
+        write_migration(root, "core", "0001_initial",
+                        operations=["migrations.CreateModel(name='Tenant', fields=[])"]),
+        write_migration(root, "core", "0002_user", [("core", "0001_initial"), ("auth", "0012_alter_user")],
+                        ["migrations.CreateModel(name='User', fields=[])"]),
+        write_migration(root, "core", "0003_profile", [("core", "0002_user")],
+                        ["migrations.RenameModel(old_name='User', new_name='Account')"]),
+        write_migration(root, "core", "0003_seed", [("core", "0002_user")],
+                        ["migrations.RunPython(seed_users)"]),
+        write_migration(root, "billing", "0001_initial", [("core", "0002_user"), ("billing", "0000_missing")],
+                        ["migrations.CreateModel(name='Invoice', fields=[])"]),
+        write_migration(root, "loop", "0001_first", [("loop", "0002_second")]),
+        write_migration(root, "loop", "0002_second", [("loop", "0001_first")]),
+    ]
+    return files
+
+
+def test_nodes_and_apps(project):
+    graph = MigrationGraph(project)
+    assert graph.apps == {
+        "core": ["0001_initial", "0002_user", "0003_profile", "0003_seed"],
+        "billing": ["0001_initial"],
+        "loop": ["0001_first", "0002_second"],
+    }
+    # Dependências de apps externos (auth) não viram arestas; entre apps do projeto, sim
+    assert graph.parents[("core", "0002_user")] == {("core", "0001_initial")}
+    assert graph.children[("core", "0002_user")] == {
+        ("core", "0003_profile"), ("core", "0003_seed"), ("billing", "0001_initial")
+    }
+
+
+def test_leaves_and_conflicts(project):
+    graph = MigrationGraph(project)
+    assert graph.leaves("core") == ["0003_profile", "0003_seed"]
+    assert graph.leaves("billing") == ["0001_initial"]
+    assert graph.leaves("unknown") == []
+    # Em loop cada migração depende da outra: nenhuma é final
+    assert graph.conflicts() == {"core": ["0003_profile", "0003_seed"]}
+
+
+def test_missing_dependency_is_reported(project):
+    graph = MigrationGraph(project)
+    assert [(migration.key, dependency) for migration, dependency in graph.missing] == [
+        (("billing", "0001_initial"), ("billing", "0000_missing"))
+    ]
+
+
+def test_order_is_topological_and_reports_cycles(project):
+    graph = MigrationGraph(project)
+    ordered, cyclic = graph.order()
+    assert cyclic == [("loop", "0001_first"), ("loop", "0002_second")]
+    position = {key: index for index, key in enumerate(ordered)}
+    for child, parents in graph.parents.items():
+        if child in position:
+            assert all(position[parent] < position[child] for parent in parents)
+    assert set(ordered) | set(cyclic) == set(graph.nodes)
+
+
+def test_model_coverage_follows_renames(project):
+    graph = MigrationGraph(project)
+    assert graph.has_model("Tenant")
+    assert graph.has_model("account")
+    assert not graph.has_model("User")
+    assert graph.model_migrations()["invoice"] == ("billing", "0001_initial")
+    assert [migration.key for migration in graph.data_migrations()] == [("core", "0003_seed")]
+
+
+def test_squash_replaces_its_migrations(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    root = Path(".")
+    files = [
+        write_migration(root, "shop", "0001_initial"),
+        write_migration(root, "shop", "0002_price", [("shop", "0001_initial")]),
+        write_migration(root, "shop", "0001_squashed_0002_price",
+                        replaces=[("shop", "0001_initial"), ("shop", "0002_price")]),
+        write_migration(root, "shop", "0003_stock", [("shop", "0002_price")]),
+    ]
+    graph = MigrationGraph(files)
+    assert graph.parents[("shop", "0003_stock")] == {("shop", "0001_squashed_0002_price")}
+    assert graph.leaves("shop") == ["0003_stock"]
+    assert not graph.conflicts()
+    assert graph.order()[1] == []
+
+
+def test_unparsable_migration_is_skipped(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    good = write_migration(Path("."), "core", "0001_initial")
+    broken = Path("core/migrations/0002_broken.py")
+    broken.write_text("class Migration(:\n", encoding="utf-8")
+    graph = MigrationGraph([good, broken])
+    assert graph.unparsed == [broken]
+    assert graph.leaves("core") == ["0001_initial"]
+
+
+def test_parse_cache_gives_the_same_graph(project, tmp_path):
+    cache_path = tmp_path / "cache" / "migration_index.json"
+    parsed = MigrationGraph(project, cache_path)
+    assert cache_path.exists()
+    cached = MigrationGraph(project, cache_path)
+
+    assert cached.nodes == parsed.nodes
+    assert cached.parents == parsed.parents
+    assert cached.conflicts() == parsed.conflicts()
+    assert cached.order() == parsed.order()
+    assert [dependency for _, dependency in cached.missing] == [dependency for _, dependency in parsed.missing]
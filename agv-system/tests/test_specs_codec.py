@@ -0,0 +1,121 @@
+"""Testes da codificação binária de ProjectSpecs (core/specs_codec.py)."""
+
+import pickle
+from dataclasses import asdict, fields
+
+import pytest
+
+from agv_system.core.blueprint_parser import LazyProjectSpecs, ProjectSpecs, PARSER_SCHEMA_VERSION
+from agv_system.core.specs_codec import (
+    decode_specs, encode_specs, load_shared_specs, read_metadata, read_specs_file,
+    share_specs, write_specs_file
+)
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def specs():
+    """ProjectSpecs com todos os tipos de valor suportados pelo codec."""
+    return ProjectSpecs(
+        project_name="Fábrica de Software",
+        project_description="Plataforma multi-tenant — com acentuação e emoji 🚀",
+        backend_framework="Django",
+        frontend_framework="React",
+        database="PostgreSQL",
+        architecture_type="Monolito modular",
+        backend_apps=["tenants", "users", "billing"],
+        directory_structure={"backend": {"apps": {"users": {}}, "manage.py": None}, "frontend/": {}},
+        configuration_files=["pyproject.toml", ".env.example"],
+        documentation_files=[],
+        dependencies={"backend": ["django", "djangorestframework"], "frontend": ["react"]},
+        models={"User": {"fields": ["email", "tenant"], "meta": {"ordering": ["-id"], "abstract": False}}},
+        api_patterns=["/api/v1/users/"],
+        testing_framework="pytest",
+        ci_cd_pipeline=["lint", "test"],
+        docker_files=["Dockerfile"],
+        django_apps=["tenants", "users"],
+        model_relationships={"User": ["Tenant"]},
+        authentication_method="JWT",
+        multi_tenancy=True,
+        base_model_class="TenantAwareModel",
+        specific_dependencies={"django": "4.2", "celery": "5.3"},
+        file_content_validations={"settings.py": ["INSTALLED_APPS"]},
+        directory_paths=["backend/", "backend/manage.py", "frontend/"],
+    )
+
+
+def test_encode_decode_roundtrip(specs):
+    decoded = decode_specs(encode_specs(specs))
+    assert type(decoded) is ProjectSpecs
+    assert decoded == specs
+    assert asdict(decoded) == asdict(specs)
+
+
+def test_roundtrip_of_edge_values(specs):
+    specs.models = {"Stats": {"ratio": 0.25, "count": 2 ** 40, "offset": -17, "empty": "", "none": None,
+                              "flags": [True, False], "nested": [[1, "a"], {"k": []}]}}
+    specs.multi_tenancy = False
+    assert decode_specs(encode_specs(specs)) == specs
+
+
+def test_repeated_strings_are_stored_once(specs):
+    encoded = encode_specs(specs)
+    specs.django_apps = specs.django_apps * 50
+    repeated = encode_specs(specs)
+    # 100 referências a mais custam bytes de índice, não cópias das strings
+    assert len(repeated) - len(encoded) < 100 * 4
+
+
+def test_lazy_decode_resolves_fields_on_access(specs):
+    lazy = decode_specs(encode_specs(specs), lazy=True)
+    assert isinstance(lazy, LazyProjectSpecs)
+    assert lazy.resolved_fields == []
+
+    assert lazy.models == specs.models
+    assert lazy.resolved_fields == ["models"]
+
+    assert lazy == specs
+    assert set(lazy.resolved_fields) == {spec_field.name for spec_field in fields(ProjectSpecs)}
+
+
+def test_lazy_decode_materializes_and_pickles_as_plain_specs(specs):
+    lazy = decode_specs(encode_specs(specs), lazy=True)
+    materialized = lazy.materialize()
+    assert type(materialized) is ProjectSpecs
+    assert materialized == specs
+
+    restored = pickle.loads(pickle.dumps(decode_specs(encode_specs(specs), lazy=True)))
+    assert type(restored) is ProjectSpecs
+    assert restored == specs
+
+
+def test_metadata_roundtrip(specs):
+    encoded = encode_specs(specs, {"blueprint_hash": "abc123", "segments": 3})
+    assert read_metadata(encoded) == {"blueprint_hash": "abc123", "segments": 3, "schema": PARSER_SCHEMA_VERSION}
+    assert decode_specs(encoded) == specs
+
+
+def test_invalid_buffers_are_rejected(specs):
+    encoded = encode_specs(specs)
+    with pytest.raises(ValueError):
+        decode_specs(b"XXXX" + encoded[4:])
+    with pytest.raises(ValueError):
+        decode_specs(encoded[:10])
+    with pytest.raises(ValueError):
+        decode_specs(encoded[:-1])
+
+
+def test_file_roundtrip(specs, tmp_path):
+    path = write_specs_file(tmp_path / "specs.agvs", specs, {"source": "test"})
+    assert read_specs_file(path) == specs
+    assert read_specs_file(path, lazy=True) == specs
+
+
+def test_shared_memory_roundtrip(specs):
+    segment = share_specs(specs)
+    try:
+        assert load_shared_specs(segment.name) == specs
+    finally:
+        segment.close()
+        segment.unlink()